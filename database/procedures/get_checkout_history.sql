@@ -3,7 +3,11 @@ GO
 
 CREATE PROCEDURE GetCheckoutHistory
     @start_date DATETIME,
-    @end_date DATETIME
+    @end_date DATETIME,
+    -- Rows per page, newest first; NULL returns the whole range
+    @page_size INT = NULL,
+    -- page_cursor of the last row of the previous page
+    @cursor NVARCHAR(100) = NULL
 AS
 BEGIN
     -- Validate date range
@@ -13,6 +17,86 @@ BEGIN
         RETURN;
     END
 
+    IF @page_size < 1
+    BEGIN
+        RAISERROR('Page size must be at least 1', 16, 1);
+        RETURN;
+    END
+
+    -- The cursor is the (transaction_date, id) of the row to continue after
+    DECLARE @after_date DATETIME;
+    DECLARE @after_id UNIQUEIDENTIFIER;
+
+    IF @cursor IS NOT NULL
+    BEGIN
+        DECLARE @separator INT = CHARINDEX('|', @cursor);
+
+        IF @separator > 0
+        BEGIN
+            SET @after_date = TRY_CONVERT(DATETIME, LEFT(@cursor, @separator - 1), 126);
+            SET @after_id = TRY_CONVERT(UNIQUEIDENTIFIER, SUBSTRING(@cursor, @separator + 1, 36));
+        END
+
+        IF @after_date IS NULL OR @after_id IS NULL
+        BEGIN
+            RAISERROR('Invalid cursor', 16, 1);
+            RETURN;
+        END
+    END;
+
+    WITH History AS (
+        SELECT TOP (ISNULL(@page_size, 2147483647)) id
+        FROM Transactions
+        WHERE [transaction_date] >= @start_date
+            AND [transaction_date] <= @end_date
+            AND [transaction_type] IN (SELECT id FROM TransactionTypes WHERE transaction_type IN ('CHECKOUT', 'CHECKOUT_EDIT'))
+            -- Only rows the outer joins keep, so TOP counts what is returned
+            AND EXISTS (
+                SELECT 1
+                FROM Residents
+                INNER JOIN Units ON Residents.unit_id = Units.id
+                INNER JOIN Buildings ON Units.building_id = Buildings.id
+                WHERE Residents.id = Transactions.resident_id
+            )
+            AND (
+                @after_date IS NULL
+                OR [transaction_date] < @after_date
+                OR ([transaction_date] = @after_date AND id > @after_id)
+            )
+        ORDER BY [transaction_date] DESC, id
+    ),
+    -- Items of each transaction plus those of the CHECKOUT_EDIT corrections pointing at it
+    NetItems AS (
+        SELECT lines.transaction_id, lines.item_id, SUM(ISNULL(lines.quantity, 0)) AS net_qty
+        FROM (
+            SELECT History.id AS transaction_id, ti.item_id, ti.quantity
+            FROM History
+            INNER JOIN TransactionItems ti ON ti.transaction_id = History.id
+            UNION ALL
+            SELECT History.id, ti.item_id, ti.quantity
+            FROM History
+            INNER JOIN Transactions AS corrections ON corrections.parent_transaction_id = History.id
+            INNER JOIN TransactionItems ti ON ti.transaction_id = corrections.id
+        ) AS lines
+        GROUP BY lines.transaction_id, lines.item_id
+        HAVING SUM(ISNULL(lines.quantity, 0)) > 0
+    ),
+    Totals AS (
+        SELECT transaction_id, SUM(net_qty) AS total_quantity
+        FROM NetItems
+        GROUP BY transaction_id
+    ),
+    -- Item IDs 171 (Twin-size Sheet Set) and 172 (Full-size Sheet Set) identify welcome basket transactions
+    WelcomeBaskets AS (
+        SELECT
+            ti.transaction_id,
+            MAX(ti.item_id) AS welcome_basket_item_id,
+            MAX(ti.quantity) AS welcome_basket_quantity
+        FROM History
+        INNER JOIN TransactionItems ti ON ti.transaction_id = History.id
+        WHERE ti.item_id IN (171, 172)
+        GROUP BY ti.transaction_id
+    )
     SELECT
         Transactions.user_id,
         Transactions.id AS transaction_id,
@@ -25,42 +109,18 @@ BEGIN
         Buildings.code AS building_code,
         Buildings.name AS building_name,
         Transactions.transaction_date,
-        (
-            SELECT ISNULL(SUM(net_qty), 0)
-            FROM (
-                SELECT ti2.item_id, SUM(ISNULL(ti2.quantity, 0)) AS net_qty
-                FROM TransactionItems ti2
-                WHERE ti2.transaction_id = Transactions.id
-                  OR ti2.transaction_id IN (
-                      SELECT corrections.id FROM Transactions AS corrections
-                      WHERE corrections.parent_transaction_id = Transactions.id
-                  )
-                GROUP BY ti2.item_id
-                HAVING SUM(ISNULL(ti2.quantity, 0)) > 0
-            ) AS per_item_sums
-        ) AS total_quantity,
-        -- Item IDs 171 (Twin-size Sheet Set) and 172 (Full-size Sheet Set) identify welcome basket transactions
-        MAX(CASE WHEN ti.item_id IN (171, 172) THEN ti.item_id ELSE NULL END) AS welcome_basket_item_id,
-        MAX(CASE WHEN ti.item_id IN (171, 172) THEN ti.quantity ELSE NULL END) AS welcome_basket_quantity
-    FROM Transactions
+        ISNULL(Totals.total_quantity, 0) AS total_quantity,
+        WelcomeBaskets.welcome_basket_item_id,
+        WelcomeBaskets.welcome_basket_quantity,
+        CONVERT(VARCHAR(23), Transactions.transaction_date, 126) + '|' + CAST(Transactions.id AS VARCHAR(36)) AS page_cursor
+    FROM History
+    INNER JOIN Transactions ON Transactions.id = History.id
     INNER JOIN Residents ON Transactions.resident_id = Residents.id
     INNER JOIN Units ON Residents.unit_id = Units.id
     INNER JOIN Buildings ON Units.building_id = Buildings.id
-    LEFT JOIN TransactionItems ti ON ti.transaction_id = Transactions.id
-    WHERE [transaction_date] >= @start_date
-        AND [transaction_date] <= @end_date
-        AND [transaction_type] IN (SELECT id FROM TransactionTypes WHERE transaction_type IN ('CHECKOUT', 'CHECKOUT_EDIT'))
-    GROUP BY
-        Transactions.user_id,
-        Transactions.id,
-        Transactions.transaction_type,
-        Transactions.parent_transaction_id,
-        Transactions.resident_id,
-        Residents.name,
-        Units.unit_number,
-        Buildings.id,
-        Buildings.code,
-        Buildings.name,
-        Transactions.transaction_date
-    ORDER BY Transactions.transaction_date DESC, Transactions.id;
+    LEFT JOIN Totals ON Totals.transaction_id = History.id
+    LEFT JOIN WelcomeBaskets ON WelcomeBaskets.transaction_id = History.id
+    ORDER BY Transactions.transaction_date DESC, Transactions.id
+    -- Plan for the actual cursor, so a later page seeks past it
+    OPTION (RECOMPILE);
 END;
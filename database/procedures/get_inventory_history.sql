@@ -3,7 +3,11 @@ GO
 
 CREATE PROCEDURE GetInventoryHistory
     @start_date DATETIME2(3),
-    @end_date DATETIME2(3)
+    @end_date DATETIME2(3),
+    -- Rows per page, newest first; NULL returns the whole range
+    @page_size INT = NULL,
+    -- page_cursor of the last row of the previous page
+    @cursor NVARCHAR(100) = NULL
 AS
 BEGIN
     -- Validate date range
@@ -13,6 +17,33 @@ BEGIN
         RETURN;
     END
 
+    IF @page_size < 1
+    BEGIN
+        RAISERROR('Page size must be at least 1', 16, 1);
+        RETURN;
+    END
+
+    -- The cursor is the (transaction_date, id) of the row to continue after
+    DECLARE @after_date DATETIME;
+    DECLARE @after_id UNIQUEIDENTIFIER;
+
+    IF @cursor IS NOT NULL
+    BEGIN
+        DECLARE @separator INT = CHARINDEX('|', @cursor);
+
+        IF @separator > 0
+        BEGIN
+            SET @after_date = TRY_CONVERT(DATETIME, LEFT(@cursor, @separator - 1), 126);
+            SET @after_id = TRY_CONVERT(UNIQUEIDENTIFIER, SUBSTRING(@cursor, @separator + 1, 36));
+        END
+
+        IF @after_date IS NULL OR @after_id IS NULL
+        BEGIN
+            RAISERROR('Invalid cursor', 16, 1);
+            RETURN;
+        END
+    END
+
     -- Query for the inventory transaction type IDs
     DECLARE @RestockTransactionType INT;
     SELECT @RestockTransactionType = id FROM TransactionTypes WHERE transaction_type = 'RESTOCK';
@@ -20,14 +51,15 @@ BEGIN
     DECLARE @CorrectionTransactionType INT;
     SELECT @CorrectionTransactionType = id FROM TransactionTypes WHERE transaction_type = 'CORRECTION';
 
-    SELECT
+    SELECT TOP (ISNULL(@page_size, 2147483647))
         Transactions.user_id,
         Transactions.id AS transaction_id,
         Transactions.transaction_type,
         Transactions.transaction_date,
         MAX(i.name) AS item_name,
         MAX(c.name) AS category_name,
-        SUM(ti.quantity) AS quantity
+        SUM(ti.quantity) AS quantity,
+        CONVERT(VARCHAR(23), Transactions.transaction_date, 126) + '|' + CAST(Transactions.id AS VARCHAR(36)) AS page_cursor
     FROM Transactions
     INNER JOIN TransactionItems ti ON ti.transaction_id = Transactions.id
     INNER JOIN Items i ON ti.item_id = i.id
@@ -35,10 +67,17 @@ BEGIN
     WHERE [transaction_date] >= @start_date
         AND [transaction_date] <= @end_date
         AND [transaction_type] IN (@RestockTransactionType, @CorrectionTransactionType)
+        AND (
+            @after_date IS NULL
+            OR [transaction_date] < @after_date
+            OR ([transaction_date] = @after_date AND Transactions.id > @after_id)
+        )
     GROUP BY
         Transactions.user_id,
         Transactions.id,
         Transactions.transaction_type,
         Transactions.transaction_date
-    ORDER BY Transactions.transaction_date DESC, Transactions.id;
+    ORDER BY Transactions.transaction_date DESC, Transactions.id
+    -- Plan for the actual cursor, so a later page seeks past it
+    OPTION (RECOMPILE);
 END;
@@ -24,13 +24,17 @@ BEGIN
     -- Create a table variable to hold our parsed JSON items
     DECLARE @CartItems CartItemsType
     
-    -- Parse the JSON array into our table variable
+    -- Parse the JSON array into our table variable in one typed projection.
+    -- Notes stay NVARCHAR(4000), the type JSON_VALUE returned, so notes longer
+    -- than CartItemsType allows still fail here as they always have.
     INSERT INTO @CartItems (ItemId, Quantity, AdditionalNotes)
-    SELECT 
-        ItemId = JSON_VALUE([value], '$.id'),
-        Quantity = JSON_VALUE([value], '$.quantity'),
-        AdditionalNotes = JSON_VALUE([value], '$.additional_notes')
+    SELECT ItemId, Quantity, AdditionalNotes
     FROM OPENJSON(@items, '$')
+    WITH (
+        ItemId INT '$.id',
+        Quantity INT '$.quantity',
+        AdditionalNotes NVARCHAR(4000) '$.additional_notes'
+    )
 
     -- Check if the cart exceeds the item limit
     -- Plymouth no longer wants to enforce limits. Commenting out for now. 
@@ -95,18 +99,9 @@ BEGIN
         FROM Items i
         JOIN @CartItems ci ON i.id = ci.ItemId
         
-        -- Log each item in the transaction
-        DECLARE @CurrentItemId INT
-        DECLARE @CurrentQuantity INT
-        DECLARE @CurrentAdditionalNotes NVARCHAR(255)
+        -- Log the transaction, then all of its items at once
         DECLARE @transaction_type INT = CASE WHEN @original_transaction_id IS NOT NULL THEN 4 ELSE 1 END
 
-        DECLARE item_cursor CURSOR FOR
-        SELECT ItemId, Quantity, AdditionalNotes FROM @CartItems
-
-        OPEN item_cursor
-        FETCH NEXT FROM item_cursor INTO @CurrentItemId, @CurrentQuantity, @CurrentAdditionalNotes
-
         EXEC LogTransaction
             @user_id = @user_id,
             @transaction_type = @transaction_type,
@@ -114,20 +109,9 @@ BEGIN
             @new_transaction_id = @new_transaction_id,
             @parent_transaction_id = @original_transaction_id;
 
-        WHILE @@FETCH_STATUS = 0
-        BEGIN
-            EXEC LogTransactionItem
-                @transaction_id = @new_transaction_id,
-                @item_id = @CurrentItemId,
-                @quantity = @CurrentQuantity,
-                @additional_notes = @CurrentAdditionalNotes;
-                
-            FETCH NEXT FROM item_cursor INTO @CurrentItemId, @CurrentQuantity, @CurrentAdditionalNotes
-            
-        END
-        
-        CLOSE item_cursor
-        DEALLOCATE item_cursor
+        INSERT INTO TransactionItems (transaction_id, item_id, quantity, additional_notes)
+        SELECT @new_transaction_id, ItemId, Quantity, AdditionalNotes
+        FROM @CartItems;
         
         COMMIT TRANSACTION
         
@@ -142,13 +126,6 @@ BEGIN
         IF @@TRANCOUNT > 0
             ROLLBACK TRANSACTION
             
-        -- Clean up cursor if still open
-        IF CURSOR_STATUS('local', 'item_cursor') >= 0
-        BEGIN
-            CLOSE item_cursor
-            DEALLOCATE item_cursor
-        END
-        
         SELECT 
             'Error' AS Status,
             CONCAT(
@@ -18,13 +18,16 @@ BEGIN
     -- Create a table variable to hold our parsed JSON items
     DECLARE @CartItems CartItemsType
 
-    -- Parse the JSON array into our table variable
+    -- Parse the JSON array into our table variable in one typed projection
+    -- (notes as NVARCHAR(4000), what JSON_VALUE returned, see ProcessCheckout)
     INSERT INTO @CartItems (ItemId, Quantity, AdditionalNotes)
-    SELECT 
-        ItemId = JSON_VALUE([value], '$.id'),
-        Quantity = JSON_VALUE([value], '$.quantity'),
-        AdditionalNotes = JSON_VALUE([value], '$.additional_notes')
+    SELECT ItemId, Quantity, AdditionalNotes
     FROM OPENJSON(@item, '$')
+    WITH (
+        ItemId INT '$.id',
+        Quantity INT '$.quantity',
+        AdditionalNotes NVARCHAR(4000) '$.additional_notes'
+    )
     
     BEGIN TRANSACTION
     
@@ -40,16 +43,6 @@ BEGIN
             RETURN;
         END
 
-        DECLARE @CurrentItemId INT
-        DECLARE @CurrentQuantity INT
-        DECLARE @CurrentAdditionalNotes NVARCHAR(255)
-        
-        DECLARE item_cursor CURSOR FOR
-        SELECT ItemId, Quantity, AdditionalNotes FROM @CartItems
-        
-        OPEN item_cursor
-        FETCH NEXT FROM item_cursor INTO @CurrentItemId, @CurrentQuantity, @CurrentAdditionalNotes
-        
         -- Log to Transaction Table 
         EXEC LogTransaction
             @user_id = @user_id,
@@ -57,26 +50,20 @@ BEGIN
             @resident_id = NULL,
             @new_transaction_id = @new_transaction_id;
         
-        -- Log to Transaction Item Table
-        WHILE @@FETCH_STATUS = 0
-        BEGIN
-            EXEC LogTransactionItem
-                @transaction_id = @new_transaction_id,
-                @item_id = @CurrentItemId,
-                @quantity = @CurrentQuantity,
-                @additional_notes = @CurrentAdditionalNotes;
-                
-            FETCH NEXT FROM item_cursor INTO @CurrentItemId, @CurrentQuantity, @CurrentAdditionalNotes
-        END
+        -- Log to Transaction Item Table, all lines at once
+        INSERT INTO TransactionItems (transaction_id, item_id, quantity, additional_notes)
+        SELECT @new_transaction_id, ItemId, Quantity, AdditionalNotes
+        FROM @CartItems;
 
-        -- Update inventory
+        -- Update inventory; an item listed twice gets both quantities, as logged
         UPDATE i
         SET i.quantity = i.quantity + ci.Quantity
         FROM Items i
-        JOIN @CartItems ci ON i.id = ci.ItemId
-        
-        CLOSE item_cursor
-        DEALLOCATE item_cursor
+        JOIN (
+            SELECT ItemId, SUM(Quantity) AS Quantity
+            FROM @CartItems
+            GROUP BY ItemId
+        ) ci ON i.id = ci.ItemId
         
         COMMIT TRANSACTION
         
@@ -91,13 +78,6 @@ BEGIN
         IF @@TRANCOUNT > 0
             ROLLBACK TRANSACTION
             
-        -- Clean up cursor if still open
-        IF CURSOR_STATUS('local', 'item_cursor') >= 0
-        BEGIN
-            CLOSE item_cursor
-            DEALLOCATE item_cursor
-        END
-        
         SELECT 
             'Error' AS Status,
             CONCAT(
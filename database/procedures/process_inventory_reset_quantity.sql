@@ -3,41 +3,89 @@ GO
 
 CREATE PROCEDURE ProcessInventoryResetQuantity
     @user_id INT,
-    @item_id INT,
-    @new_quantity INT,
-    @additional_notes NVARCHAR(MAX),
-    @new_transaction_id UNIQUEIDENTIFIER
+    @item_id INT = NULL,
+    @new_quantity INT = NULL,
+    @additional_notes NVARCHAR(MAX) = NULL,
+    @new_transaction_id UNIQUEIDENTIFIER,
+    -- JSON array of {"id", "quantity", "additional_notes"} to reset many items
+    -- in one CORRECTION (a stock count); otherwise @item_id is reset
+    @items NVARCHAR(MAX) = NULL
 AS
 BEGIN
     SET NOCOUNT ON;
     SET XACT_ABORT ON;
 
+    DECLARE @Resets TABLE (
+        ItemId INT,
+        NewQuantity INT,
+        AdditionalNotes NVARCHAR(MAX)
+    );
+
     BEGIN TRY
+        IF @items IS NULL
+        BEGIN
+        INSERT INTO @Resets (ItemId, NewQuantity, AdditionalNotes)
+        VALUES (@item_id, @new_quantity, @additional_notes);
+    END
+        ELSE
+        BEGIN
+        IF ISJSON(@items) = 0
+        BEGIN
+            SELECT 'Error' AS Status, 'Invalid JSON format' AS message;
+            RETURN;
+        END
+
+        INSERT INTO @Resets (ItemId, NewQuantity, AdditionalNotes)
+        SELECT ItemId, NewQuantity, AdditionalNotes
+        FROM OPENJSON(@items, '$')
+        WITH (
+            ItemId INT '$.id',
+            NewQuantity INT '$.quantity',
+            AdditionalNotes NVARCHAR(MAX) '$.additional_notes'
+        );
+    END
+
         -- Validate inputs
-        IF @item_id IS NULL
+        IF NOT EXISTS (SELECT 1 FROM @Resets)
+        OR EXISTS (SELECT 1 FROM @Resets WHERE ItemId IS NULL)
         BEGIN
         SELECT 'Error' AS Status, 'Invalid item id' AS message;
         RETURN;
     END
 
-        IF @new_quantity IS NULL
-        OR @new_quantity < 0
+        IF EXISTS (
+            SELECT 1
+    FROM @Resets
+    WHERE NewQuantity IS NULL OR NewQuantity < 0
+        )
         BEGIN
         SELECT 'Error' AS Status, 'Invalid quantity (must be non-negative)' AS message;
         RETURN;
     END
 
-        -- Check item exists
-        IF NOT EXISTS (
+        -- Check items exist
+        IF EXISTS (
             SELECT 1
-    FROM Items
-    WHERE id = @item_id
+    FROM @Resets r
+    WHERE NOT EXISTS (SELECT 1 FROM Items WHERE id = r.ItemId)
         )
         BEGIN
         SELECT 'Error' AS Status, 'Item not found' AS message;
         RETURN;
     END
 
+        -- An item can only be set to one quantity per transaction
+        IF EXISTS (
+            SELECT ItemId
+    FROM @Resets
+    GROUP BY ItemId
+    HAVING COUNT(*) > 1
+        )
+        BEGIN
+        SELECT 'Error' AS Status, 'Duplicate item id' AS message;
+        RETURN;
+    END
+
         -- Check for duplicate transaction BEFORE starting transaction.
         -- There is theoretically a race condition, but we generate the GUID on the client side so it's extremely unlikely.
         IF EXISTS (
@@ -53,16 +101,22 @@ BEGIN
         RETURN;
     END
 
+        DECLARE @expected INT = (SELECT COUNT(*) FROM @Resets);
+        DECLARE @updated INT;
+
         -- NOW start the transaction (only after all validations pass)
         BEGIN TRANSACTION;
 
             -- Update inventory
-            UPDATE Items
-            SET quantity = @new_quantity
-            WHERE id = @item_id;
+            UPDATE i
+            SET i.quantity = r.NewQuantity
+            FROM Items i
+            JOIN @Resets r ON i.id = r.ItemId;
+
+            SET @updated = @@ROWCOUNT;
 
             -- Verify update succeeded
-            IF @@ROWCOUNT <> 1
+            IF @updated <> @expected
                 BEGIN
         -- Force an error - XACT_ABORT will auto-rollback with error 11 or above
         RAISERROR('Item update failed', 16, 1);
@@ -75,11 +129,9 @@ BEGIN
                 @resident_id = NULL,
                 @new_transaction_id = @new_transaction_id;
 
-            EXEC LogTransactionItem
-                @transaction_id = @new_transaction_id,
-                @item_id = @item_id,
-                @quantity = @new_quantity,
-                @additional_notes = @additional_notes;
+            INSERT INTO TransactionItems (transaction_id, item_id, quantity, additional_notes)
+            SELECT @new_transaction_id, ItemId, NewQuantity, AdditionalNotes
+            FROM @Resets;
 
         COMMIT TRANSACTION;
 
@@ -98,4 +150,4 @@ BEGIN
                 ', Number: ', ERROR_NUMBER()
             ) AS message;
     END CATCH
-END
\ No newline at end of file
+END
@@ -1,14 +1,38 @@
 DROP TABLE IF EXISTS [dbo].[Transactions];
 GO
 
+-- id is generated by the client (new_transaction_id) and stays the primary
+-- key that TransactionItems and parent_transaction_id refer to, and that
+-- the DUPLICATE_TRANSACTION checks look up. It is not clustered: random
+-- GUIDs would put every insert on a random page.
 CREATE TABLE Transactions (
-    id UNIQUEIDENTIFIER PRIMARY KEY,
+    id UNIQUEIDENTIFIER NOT NULL CONSTRAINT PK_Transactions PRIMARY KEY NONCLUSTERED,
     user_id INT NOT NULL,
     resident_id INT,
     transaction_type INT NOT NULL,
     transaction_date DATETIME DEFAULT GETDATE() NOT NULL,
     building_id INT,
     parent_transaction_id UNIQUEIDENTIFIER NULL,
+    -- Breaks ties between rows logged in the same DATETIME tick
+    sequence_id BIGINT IDENTITY(1,1) NOT NULL,
 );
 
+GO
+
+-- Rows are stored in transaction_date order: new rows are appended at the
+-- end, and the history pages' date ranges are contiguous reads
+-- (GetCheckoutHistory, GetInventoryHistory)
+CREATE UNIQUE CLUSTERED INDEX CX_Transactions_TransactionDate_SequenceId
+    ON Transactions (transaction_date, sequence_id);
+
+-- A resident's visits, newest first (GetLastResidentVisit, CheckPastCheckout)
+CREATE NONCLUSTERED INDEX IX_Transactions_ResidentId_TransactionDate
+    ON Transactions (resident_id, transaction_date)
+    INCLUDE (transaction_type);
+
+-- CHECKOUT_EDIT corrections of a checkout (GetCheckoutHistory, GetTransaction)
+CREATE NONCLUSTERED INDEX IX_Transactions_ParentTransactionId
+    ON Transactions (parent_transaction_id)
+    INCLUDE (transaction_date);
+
 GO
\ No newline at end of file
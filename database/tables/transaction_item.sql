@@ -9,4 +9,11 @@ CREATE TABLE TransactionItems (
     additional_notes NVARCHAR(MAX)
 );
 
+GO
+
+-- Items of a transaction; quantity makes it covering for the history totals
+CREATE NONCLUSTERED INDEX IX_TransactionItems_TransactionId_ItemId
+    ON TransactionItems (transaction_id, item_id)
+    INCLUDE (quantity);
+
 GO
\ No newline at end of file
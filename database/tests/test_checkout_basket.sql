@@ -542,6 +542,62 @@ IF @stored_parent <> @original_transaction_id
 PRINT 'Test 16 PASSED: Checkout edit sets transaction_type = 4 and parent_transaction_id correctly';
 GO
 
+-- Test 17: Every cart line is logged with its quantity and notes
+PRINT 'Test 17: Every cart line is logged with its quantity and notes'
+DECLARE @new_transaction_id UNIQUEIDENTIFIER = NEWID();
+DECLARE @logged_count INT;
+
+EXEC ProcessCheckout
+    @user_id = 1,
+    @resident_id = 1,
+    @new_transaction_id = @new_transaction_id,
+    @items = N'[{"id": 2, "quantity": 1, "additional_notes": "Blue"}, {"id": 3, "quantity": 2}, {"id": 4, "quantity": 3, "additional_notes": ""}]';
+
+SELECT @logged_count = COUNT(*) FROM TransactionItems WHERE transaction_id = @new_transaction_id;
+
+-- Assert: One row per cart line
+IF @logged_count <> 3
+    THROW 50017, 'Test 17 FAILED: Expected one TransactionItems row per cart line', 1;
+
+-- Assert: Quantities and notes as sent
+IF NOT EXISTS (SELECT 1 FROM TransactionItems WHERE transaction_id = @new_transaction_id AND item_id = 2 AND quantity = 1 AND additional_notes = 'Blue')
+    OR NOT EXISTS (SELECT 1 FROM TransactionItems WHERE transaction_id = @new_transaction_id AND item_id = 3 AND quantity = 2 AND additional_notes IS NULL)
+    OR NOT EXISTS (SELECT 1 FROM TransactionItems WHERE transaction_id = @new_transaction_id AND item_id = 4 AND quantity = 3 AND additional_notes = '')
+    THROW 50017, 'Test 17 FAILED: Cart lines not logged as sent', 1;
+
+PRINT 'Test 17 PASSED: Every cart line logged';
+GO
+
+-- Test 18: An unknown item rolls the whole checkout back
+PRINT 'Test 18: An unknown item rolls the whole checkout back'
+DECLARE @new_transaction_id UNIQUEIDENTIFIER = NEWID();
+DECLARE @initial_quantity INT;
+DECLARE @final_quantity INT;
+
+SELECT @initial_quantity = quantity FROM Items WHERE id = 2;
+
+-- Returns an Error status row (the CATCH block rolls back, so no INSERT ... EXEC here)
+EXEC ProcessCheckout
+    @user_id = 1,
+    @resident_id = 1,
+    @new_transaction_id = @new_transaction_id,
+    @items = N'[{"id": 2, "quantity": 1}, {"id": 999999, "quantity": 1}]';
+
+SELECT @final_quantity = quantity FROM Items WHERE id = 2;
+
+-- Assert: Nothing was kept
+IF @final_quantity <> @initial_quantity
+    THROW 50018, 'Test 18 FAILED: Item 2 quantity should be unchanged', 1;
+
+IF EXISTS (SELECT 1 FROM Transactions WHERE id = @new_transaction_id)
+    THROW 50018, 'Test 18 FAILED: Transaction should be rolled back', 1;
+
+IF EXISTS (SELECT 1 FROM TransactionItems WHERE transaction_id = @new_transaction_id)
+    THROW 50018, 'Test 18 FAILED: No items should be logged', 1;
+
+PRINT 'Test 18 PASSED: Unknown item rolled the checkout back';
+GO
+
 PRINT '';
 PRINT '========================================';
 PRINT 'ALL TESTS PASSED for ProcessCheckout';
@@ -0,0 +1,273 @@
+-- Unit tests for GetCheckoutHistory Stored Procedure
+-- Rows are dated 2001-01-xx so other tests' transactions fall outside the range
+
+-- Setup: a checkout corrected twice, a welcome basket, a checkout without items and a restock
+DELETE FROM TransactionItems WHERE transaction_id IN (SELECT id FROM Transactions WHERE transaction_date < '2001-02-01');
+DELETE FROM Transactions WHERE transaction_date < '2001-02-01' AND parent_transaction_id IS NOT NULL;
+DELETE FROM Transactions WHERE transaction_date < '2001-02-01';
+
+INSERT INTO Transactions (id, user_id, resident_id, transaction_type, transaction_date, parent_transaction_id) VALUES
+    ('00000000-0000-0000-0000-000000000201', 1, 1, 1, '2001-01-10 10:00:00', NULL),
+    ('00000000-0000-0000-0000-000000000202', 1, 1, 4, '2001-01-11 10:00:00', '00000000-0000-0000-0000-000000000201'),
+    ('00000000-0000-0000-0000-000000000203', 1, 1, 4, '2001-01-12 10:00:00', '00000000-0000-0000-0000-000000000201'),
+    ('00000000-0000-0000-0000-000000000204', 1, 1, 1, '2001-01-13 10:00:00', NULL),
+    ('00000000-0000-0000-0000-000000000205', 1, 1, 1, '2001-01-14 10:00:00', NULL),
+    ('00000000-0000-0000-0000-000000000206', 1, NULL, 2, '2001-01-15 10:00:00', NULL);
+
+INSERT INTO TransactionItems (transaction_id, item_id, quantity) VALUES
+    -- Checkout: 3 of item 2, 1 of item 3
+    ('00000000-0000-0000-0000-000000000201', 2, 3),
+    ('00000000-0000-0000-0000-000000000201', 3, 1),
+    -- First edit: one item 2 fewer, two of item 4 added
+    ('00000000-0000-0000-0000-000000000202', 2, -1),
+    ('00000000-0000-0000-0000-000000000202', 4, 2),
+    -- Second edit: item 3 removed
+    ('00000000-0000-0000-0000-000000000203', 3, -1),
+    -- Welcome basket: twin sheet set plus a basket item
+    ('00000000-0000-0000-0000-000000000204', 171, 1),
+    ('00000000-0000-0000-0000-000000000204', 167, 2),
+    ('00000000-0000-0000-0000-000000000206', 2, 10);
+
+CREATE TABLE #History (
+    user_id INT,
+    transaction_id UNIQUEIDENTIFIER,
+    transaction_type INT,
+    parent_transaction_id UNIQUEIDENTIFIER,
+    resident_id INT,
+    resident_name NVARCHAR(255),
+    unit_number VARCHAR(50),
+    building_id INT,
+    building_code NVARCHAR(7),
+    building_name NVARCHAR(255),
+    transaction_date DATETIME,
+    total_quantity INT,
+    welcome_basket_item_id INT,
+    welcome_basket_quantity INT,
+    page_cursor NVARCHAR(100)
+);
+
+INSERT INTO #History
+EXEC GetCheckoutHistory @start_date = '2001-01-01', @end_date = '2001-01-31';
+GO
+
+-- Test 1: Only checkouts and their edits, newest first
+PRINT 'Test 1: Only checkouts and their edits, newest first';
+
+IF (SELECT COUNT(*) FROM #History) <> 5
+    THROW 50201, 'Test 1 FAILED: Expected 5 checkout rows (the restock must be left out)', 1;
+
+IF EXISTS (SELECT 1 FROM #History WHERE transaction_type NOT IN (1, 4))
+    THROW 50201, 'Test 1 FAILED: Only CHECKOUT and CHECKOUT_EDIT rows should be returned', 1;
+
+IF (SELECT TOP 1 transaction_id FROM #History) <> '00000000-0000-0000-0000-000000000205'
+    THROW 50201, 'Test 1 FAILED: The newest transaction should come first', 1;
+
+PRINT 'Test 1 PASSED: Checkouts and edits returned newest first';
+GO
+
+-- Test 2: total_quantity nets the corrections per item and drops items at zero
+PRINT 'Test 2: total_quantity of a corrected checkout';
+
+-- Item 2: 3 - 1, item 3: 1 - 1 (dropped), item 4: + 2
+IF (SELECT total_quantity FROM #History WHERE transaction_id = '00000000-0000-0000-0000-000000000201') <> 4
+    THROW 50202, 'Test 2 FAILED: Corrected checkout should total 4', 1;
+
+-- An edit only counts its own positive deltas
+IF (SELECT total_quantity FROM #History WHERE transaction_id = '00000000-0000-0000-0000-000000000202') <> 2
+    THROW 50202, 'Test 2 FAILED: First edit should total 2', 1;
+
+IF (SELECT total_quantity FROM #History WHERE transaction_id = '00000000-0000-0000-0000-000000000203') <> 0
+    THROW 50202, 'Test 2 FAILED: Second edit should total 0', 1;
+
+IF (SELECT parent_transaction_id FROM #History WHERE transaction_id = '00000000-0000-0000-0000-000000000203')
+    <> '00000000-0000-0000-0000-000000000201'
+    THROW 50202, 'Test 2 FAILED: Edit should point at the original checkout', 1;
+
+PRINT 'Test 2 PASSED: total_quantity nets corrections per item';
+GO
+
+-- Test 3: Welcome basket columns
+PRINT 'Test 3: Welcome basket columns';
+
+IF NOT EXISTS (
+    SELECT 1 FROM #History
+    WHERE transaction_id = '00000000-0000-0000-0000-000000000204'
+      AND welcome_basket_item_id = 171
+      AND welcome_basket_quantity = 1
+      AND total_quantity = 3
+)
+    THROW 50203, 'Test 3 FAILED: Welcome basket should report sheet set 171 x 1 and 3 items', 1;
+
+IF EXISTS (
+    SELECT 1 FROM #History
+    WHERE transaction_id = '00000000-0000-0000-0000-000000000201'
+      AND (welcome_basket_item_id IS NOT NULL OR welcome_basket_quantity IS NOT NULL)
+)
+    THROW 50203, 'Test 3 FAILED: A general checkout has no welcome basket columns', 1;
+
+PRINT 'Test 3 PASSED: Welcome basket columns set only for baskets';
+GO
+
+-- Test 4: A checkout without items is listed with total 0
+PRINT 'Test 4: Checkout without items';
+
+IF NOT EXISTS (
+    SELECT 1 FROM #History
+    WHERE transaction_id = '00000000-0000-0000-0000-000000000205'
+      AND total_quantity = 0
+      AND welcome_basket_item_id IS NULL
+      AND resident_name IS NOT NULL
+)
+    THROW 50204, 'Test 4 FAILED: Checkout without items should be listed with total_quantity 0', 1;
+
+PRINT 'Test 4 PASSED: Checkout without items listed with total 0';
+GO
+
+-- Test 5: Corrections outside the date range still count towards the original
+PRINT 'Test 5: Corrections outside the date range';
+DELETE FROM #History;
+
+INSERT INTO #History
+EXEC GetCheckoutHistory @start_date = '2001-01-10', @end_date = '2001-01-10 23:59:59';
+
+IF (SELECT COUNT(*) FROM #History) <> 1
+    OR (SELECT total_quantity FROM #History) <> 4
+    THROW 50205, 'Test 5 FAILED: Original checkout alone should still total 4', 1;
+
+PRINT 'Test 5 PASSED: Corrections counted regardless of their date';
+GO
+
+-- Test 6: Start date after end date
+PRINT 'Test 6: Start date after end date';
+DECLARE @failed BIT = 0;
+
+BEGIN TRY
+    EXEC GetCheckoutHistory @start_date = '2001-02-01', @end_date = '2001-01-01';
+END TRY
+BEGIN CATCH
+    SET @failed = 1;
+END CATCH
+
+IF @failed = 0
+    THROW 50206, 'Test 6 FAILED: An inverted date range should raise an error', 1;
+
+PRINT 'Test 6 PASSED: Inverted date range rejected';
+GO
+
+-- Test 7: Pages of 2 walked by cursor return the whole range in order
+PRINT 'Test 7: Walk the range two rows at a time';
+DELETE FROM #History;
+
+CREATE TABLE #Walked (position INT IDENTITY(1,1), transaction_id UNIQUEIDENTIFIER);
+DECLARE @cursor NVARCHAR(100) = NULL;
+DECLARE @pages INT = 0;
+DECLARE @page_rows INT = 1;
+
+WHILE @page_rows > 0
+BEGIN
+    DELETE FROM #History;
+
+    INSERT INTO #History
+    EXEC GetCheckoutHistory @start_date = '2001-01-01', @end_date = '2001-01-31', @page_size = 2, @cursor = @cursor;
+
+    SET @page_rows = @@ROWCOUNT;
+
+    IF @page_rows > 2
+        THROW 50207, 'Test 7 FAILED: A page should hold at most page_size rows', 1;
+
+    IF @page_rows > 0
+    BEGIN
+        SET @pages += 1;
+
+        INSERT INTO #Walked (transaction_id)
+        SELECT transaction_id FROM #History ORDER BY transaction_date DESC, transaction_id;
+
+        SET @cursor = (SELECT TOP 1 page_cursor FROM #History ORDER BY transaction_date, transaction_id DESC);
+    END
+END
+
+IF @pages <> 3 OR (SELECT COUNT(*) FROM #Walked) <> 5
+    THROW 50207, 'Test 7 FAILED: 5 rows should come back in 3 pages', 1;
+
+IF (SELECT COUNT(DISTINCT transaction_id) FROM #Walked) <> 5
+    THROW 50207, 'Test 7 FAILED: No row should appear on two pages', 1;
+
+IF (SELECT transaction_id FROM #Walked WHERE position = 1) <> '00000000-0000-0000-0000-000000000205'
+    OR (SELECT transaction_id FROM #Walked WHERE position = 5) <> '00000000-0000-0000-0000-000000000201'
+    THROW 50207, 'Test 7 FAILED: Pages should continue newest first', 1;
+
+DROP TABLE #Walked;
+PRINT 'Test 7 PASSED: Cursor walk returns every row once, in order';
+GO
+
+-- Test 8: A checkout on a later page still nets the corrections of earlier pages
+PRINT 'Test 8: Paged checkout keeps its corrections';
+DELETE FROM #History;
+
+DECLARE @after_edit NVARCHAR(100) = '2001-01-11T10:00:00|00000000-0000-0000-0000-000000000202';
+
+INSERT INTO #History
+EXEC GetCheckoutHistory @start_date = '2001-01-01', @end_date = '2001-01-31', @page_size = 2, @cursor = @after_edit;
+
+IF (SELECT COUNT(*) FROM #History) <> 1
+    OR (SELECT total_quantity FROM #History WHERE transaction_id = '00000000-0000-0000-0000-000000000201') <> 4
+    THROW 50208, 'Test 8 FAILED: The last page should hold the original checkout, totalling 4', 1;
+
+PRINT 'Test 8 PASSED: Corrections counted across pages';
+GO
+
+-- Test 9: Bad page parameters
+PRINT 'Test 9: Invalid cursor and page size';
+DECLARE @bad_cursor BIT = 0;
+DECLARE @bad_page_size BIT = 0;
+
+BEGIN TRY
+    EXEC GetCheckoutHistory @start_date = '2001-01-01', @end_date = '2001-01-31', @page_size = 2, @cursor = 'not a cursor';
+END TRY
+BEGIN CATCH
+    SET @bad_cursor = 1;
+END CATCH
+
+BEGIN TRY
+    EXEC GetCheckoutHistory @start_date = '2001-01-01', @end_date = '2001-01-31', @page_size = 0;
+END TRY
+BEGIN CATCH
+    SET @bad_page_size = 1;
+END CATCH
+
+IF @bad_cursor = 0
+    THROW 50209, 'Test 9 FAILED: A malformed cursor should raise an error', 1;
+
+IF @bad_page_size = 0
+    THROW 50209, 'Test 9 FAILED: A page size below 1 should raise an error', 1;
+
+PRINT 'Test 9 PASSED: Bad page parameters rejected';
+GO
+
+-- Test 10: Checkouts without a resident do not use up a page
+PRINT 'Test 10: Full pages past rows the joins drop';
+DELETE FROM #History;
+
+INSERT INTO Transactions (id, user_id, resident_id, transaction_type, transaction_date, parent_transaction_id) VALUES
+    ('00000000-0000-0000-0000-000000000207', 1, NULL, 1, '2001-01-20 10:00:00', NULL),
+    ('00000000-0000-0000-0000-000000000208', 1, NULL, 1, '2001-01-21 10:00:00', NULL);
+
+INSERT INTO #History
+EXEC GetCheckoutHistory @start_date = '2001-01-01', @end_date = '2001-01-31', @page_size = 2;
+
+IF (SELECT COUNT(*) FROM #History) <> 2
+    OR EXISTS (SELECT 1 FROM #History WHERE resident_id IS NULL)
+    THROW 50210, 'Test 10 FAILED: A page should hold page_size rows that have a resident', 1;
+
+IF (SELECT TOP 1 transaction_id FROM #History ORDER BY transaction_date DESC) <> '00000000-0000-0000-0000-000000000205'
+    THROW 50210, 'Test 10 FAILED: The page should start at the newest checkout with a resident', 1;
+
+PRINT 'Test 10 PASSED: Rows without a resident skipped before the page is cut';
+GO
+
+-- Cleanup
+DROP TABLE #History;
+DELETE FROM TransactionItems WHERE transaction_id IN (SELECT id FROM Transactions WHERE transaction_date < '2001-02-01');
+DELETE FROM Transactions WHERE transaction_date < '2001-02-01' AND parent_transaction_id IS NOT NULL;
+DELETE FROM Transactions WHERE transaction_date < '2001-02-01';
+GO
@@ -362,6 +362,38 @@ IF @final_quantity <> @initial_quantity + @large_quantity
 PRINT 'Test 10 PASSED: Large quantity values handled correctly';
 GO
 
+-- Test 11: Restock of many items, one listed twice
+PRINT 'Test 11: Restock of many items, one listed twice'
+DECLARE @new_transaction_id UNIQUEIDENTIFIER = NEWID();
+DECLARE @initial_item2 INT;
+DECLARE @initial_item3 INT;
+DECLARE @initial_item4 INT;
+
+SELECT @initial_item2 = quantity FROM Items WHERE id = 2;
+SELECT @initial_item3 = quantity FROM Items WHERE id = 3;
+SELECT @initial_item4 = quantity FROM Items WHERE id = 4;
+
+EXEC ProcessInventoryChange
+    @user_id = 1,
+    @item = N'[{"id": 2, "quantity": 5}, {"id": 3, "quantity": 7}, {"id": 2, "quantity": 1}, {"id": 4, "quantity": 9, "additional_notes": "Truck"}]',
+    @new_transaction_id = @new_transaction_id;
+
+-- Assert: Every line logged
+IF (SELECT COUNT(*) FROM TransactionItems WHERE transaction_id = @new_transaction_id) <> 4
+    THROW 50011, 'Test 11 FAILED: Expected one TransactionItems row per line', 1;
+
+-- Assert: Quantities match what was logged (item 2 gets both lines)
+IF (SELECT quantity FROM Items WHERE id = 2) <> @initial_item2 + 6
+    OR (SELECT quantity FROM Items WHERE id = 3) <> @initial_item3 + 7
+    OR (SELECT quantity FROM Items WHERE id = 4) <> @initial_item4 + 9
+    THROW 50011, 'Test 11 FAILED: Quantities do not match the logged lines', 1;
+
+IF NOT EXISTS (SELECT 1 FROM TransactionItems WHERE transaction_id = @new_transaction_id AND item_id = 4 AND additional_notes = 'Truck')
+    THROW 50011, 'Test 11 FAILED: Notes not logged', 1;
+
+PRINT 'Test 11 PASSED: Restock of many items applied as logged';
+GO
+
 PRINT '';
 PRINT '========================================';
 PRINT 'ALL TESTS PASSED for ProcessInventoryChange';
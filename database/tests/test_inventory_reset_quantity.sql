@@ -459,6 +459,88 @@ IF @final_qty <> 50
 PRINT 'Test 15 PASSED: Duplicate transaction ID rejected correctly';
 GO
 
+-- Test 16: Reset many items in one correction
+PRINT 'Test 16: Reset many items in one correction'
+DECLARE @new_transaction_id UNIQUEIDENTIFIER = NEWID();
+
+EXEC ProcessInventoryResetQuantity
+    @user_id = 1,
+    @new_transaction_id = @new_transaction_id,
+    @items = N'[{"id": 2, "quantity": 12}, {"id": 3, "quantity": 0}, {"id": 4, "quantity": 34, "additional_notes": "Stock count"}]';
+
+-- Assert: Quantities set
+IF (SELECT quantity FROM Items WHERE id = 2) <> 12
+    OR (SELECT quantity FROM Items WHERE id = 3) <> 0
+    OR (SELECT quantity FROM Items WHERE id = 4) <> 34
+    THROW 50016, 'Test 16 FAILED: Quantities not set', 1;
+
+-- Assert: One CORRECTION with a line per item
+IF NOT EXISTS (SELECT 1 FROM Transactions WHERE id = @new_transaction_id AND transaction_type = 3)
+    THROW 50016, 'Test 16 FAILED: Correction transaction not created', 1;
+
+IF (SELECT COUNT(*) FROM TransactionItems WHERE transaction_id = @new_transaction_id) <> 3
+    THROW 50016, 'Test 16 FAILED: Expected one TransactionItems row per item', 1;
+
+IF NOT EXISTS (SELECT 1 FROM TransactionItems WHERE transaction_id = @new_transaction_id AND item_id = 4 AND quantity = 34 AND additional_notes = 'Stock count')
+    THROW 50016, 'Test 16 FAILED: Line not logged as sent', 1;
+
+PRINT 'Test 16 PASSED: Many items reset in one correction';
+GO
+
+-- Test 17: An unknown item rejects the whole batch
+PRINT 'Test 17: An unknown item rejects the whole batch'
+DECLARE @new_transaction_id UNIQUEIDENTIFIER = NEWID();
+DECLARE @initial_quantity INT;
+
+SELECT @initial_quantity = quantity FROM Items WHERE id = 2;
+
+CREATE TABLE #BatchUnknownResult (
+    Status NVARCHAR(50),
+    message NVARCHAR(MAX)
+);
+
+INSERT INTO #BatchUnknownResult
+EXEC ProcessInventoryResetQuantity
+    @user_id = 1,
+    @new_transaction_id = @new_transaction_id,
+    @items = N'[{"id": 2, "quantity": 77}, {"id": 999999, "quantity": 1}]';
+
+IF NOT EXISTS (SELECT 1 FROM #BatchUnknownResult WHERE Status = 'Error' AND message = 'Item not found')
+    THROW 50017, 'Test 17 FAILED: Expected Item not found', 1;
+
+IF (SELECT quantity FROM Items WHERE id = 2) <> @initial_quantity
+    OR EXISTS (SELECT 1 FROM Transactions WHERE id = @new_transaction_id)
+    THROW 50017, 'Test 17 FAILED: Nothing should be changed', 1;
+
+DROP TABLE #BatchUnknownResult;
+PRINT 'Test 17 PASSED: Unknown item rejected the batch';
+GO
+
+-- Test 18: The same item twice in a batch should fail
+PRINT 'Test 18: The same item twice in a batch should fail'
+DECLARE @new_transaction_id UNIQUEIDENTIFIER = NEWID();
+
+CREATE TABLE #BatchDuplicateResult (
+    Status NVARCHAR(50),
+    message NVARCHAR(MAX)
+);
+
+INSERT INTO #BatchDuplicateResult
+EXEC ProcessInventoryResetQuantity
+    @user_id = 1,
+    @new_transaction_id = @new_transaction_id,
+    @items = N'[{"id": 2, "quantity": 1}, {"id": 2, "quantity": 3}]';
+
+IF NOT EXISTS (SELECT 1 FROM #BatchDuplicateResult WHERE Status = 'Error' AND message = 'Duplicate item id')
+    THROW 50018, 'Test 18 FAILED: Expected Duplicate item id', 1;
+
+IF EXISTS (SELECT 1 FROM Transactions WHERE id = @new_transaction_id)
+    THROW 50018, 'Test 18 FAILED: No transaction should be logged', 1;
+
+DROP TABLE #BatchDuplicateResult;
+PRINT 'Test 18 PASSED: Duplicate item rejected';
+GO
+
 PRINT '';
 PRINT '========================================';
 PRINT 'ALL TESTS PASSED for ProcessInventoryResetQuantity';
@@ -205,6 +205,51 @@ IF @count_with_id <> 1
 PRINT 'Test 6 PASSED: Duplicate transaction_id correctly rejected (Primary Key constraint enforced)';
 GO
 
+-- Test 7: Transactions is clustered on transaction_date, id stays the nonclustered primary key
+PRINT 'Test 7: Clustered on transaction_date, id is the primary key';
+
+IF NOT EXISTS (
+    SELECT 1
+    FROM sys.indexes i
+    JOIN sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id AND ic.key_ordinal = 1
+    JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+    WHERE i.object_id = OBJECT_ID('dbo.Transactions')
+      AND i.type_desc = 'CLUSTERED'
+      AND i.is_unique = 1
+      AND c.name = 'transaction_date'
+)
+    THROW 50107, 'Test 7 FAILED: Transactions should be clustered on transaction_date first', 1;
+
+IF NOT EXISTS (
+    SELECT 1
+    FROM sys.indexes i
+    JOIN sys.index_columns ic ON ic.object_id = i.object_id AND ic.index_id = i.index_id
+    JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+    WHERE i.object_id = OBJECT_ID('dbo.Transactions')
+      AND i.is_primary_key = 1
+      AND i.type_desc = 'NONCLUSTERED'
+      AND c.name = 'id'
+)
+    THROW 50107, 'Test 7 FAILED: id should be the nonclustered primary key', 1;
+
+PRINT 'Test 7 PASSED: Clustered on transaction_date, id is the primary key';
+GO
+
+-- Test 8: Rows logged later sort after earlier ones, even within one DATETIME tick
+PRINT 'Test 8: Rows logged later sort after earlier ones';
+DECLARE @first_id UNIQUEIDENTIFIER = NEWID();
+DECLARE @second_id UNIQUEIDENTIFIER = NEWID();
+
+EXEC LogTransaction @user_id = 1, @transaction_type = 1, @resident_id = 1, @new_transaction_id = @first_id;
+EXEC LogTransaction @user_id = 1, @transaction_type = 1, @resident_id = 1, @new_transaction_id = @second_id;
+
+IF (SELECT sequence_id FROM Transactions WHERE id = @second_id) <= (SELECT sequence_id FROM Transactions WHERE id = @first_id)
+    OR (SELECT transaction_date FROM Transactions WHERE id = @second_id) < (SELECT transaction_date FROM Transactions WHERE id = @first_id)
+    THROW 50108, 'Test 8 FAILED: The later row should have a later key', 1;
+
+PRINT 'Test 8 PASSED: Rows logged later sort after earlier ones';
+GO
+
 PRINT '';
 PRINT 'ALL TESTS PASSED for LogTransaction';
 GO
\ No newline at end of file
@@ -70,6 +70,7 @@ const baseRow: CheckoutRow = {
   total_quantity: 7,
   welcome_basket_item_id: null,
   welcome_basket_quantity: null,
+  page_cursor: '2025-01-01T00:00:00|txn-1',
 };
 
 const editRow = (
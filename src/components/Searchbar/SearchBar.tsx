@@ -1,7 +1,8 @@
-import React, { useState } from 'react';
+import React, { useEffect, useState } from 'react';
 import { TextField, InputAdornment } from '@mui/material';
 import { Search, Close } from '@mui/icons-material';
 import { CategoryProps } from '../../types/interfaces';
+import { markSearchSettled } from '../../utils/e2eReadiness';
 
 interface SearchBarProps {
   data?: CategoryProps[];
@@ -27,6 +28,11 @@ const SearchBar: React.FC<SearchBarProps> = ({
   // Use searchValue as search term for generic search and use 
   const searchTerm = searchValue !== undefined ? searchValue : internalSearchTerm;
 
+  // Runs after the filtered results for this term have been committed
+  useEffect(() => {
+    markSearchSettled(searchTerm);
+  }, [searchTerm]);
+
   const searchChangeHandler = (e: React.ChangeEvent<HTMLInputElement>) => {
     const newValue = e.target.value;
     
@@ -1,5 +1,6 @@
-import { useState } from 'react';
+import { useEffect, useState } from 'react';
 import { CategoryProps, CheckoutItemProp } from '../types/interfaces';
+import { markCartChanged } from '../utils/e2eReadiness';
 
 interface UseCartOperationsProps {
   checkoutItems: CategoryProps[];
@@ -11,6 +12,10 @@ export function useCartOperations({ checkoutItems, setCheckoutItems }: UseCartOp
   // Now that the checkout page is split into separate pages, this is dead logic and can be removed.
   const [activeSection, setActiveSection] = useState<string>('');
 
+  useEffect(() => {
+    markCartChanged();
+  }, [checkoutItems]);
+
   const addItemToCart = (
     item: CheckoutItemProp,
     quantity: number,
@@ -1,10 +1,28 @@
-import { useState, useEffect, useMemo } from 'react';
-import type { ClientPrincipal, CheckoutTransaction, InventoryTransaction } from '../types/interfaces';
+import { useState, useEffect, useMemo, useRef, useCallback } from 'react';
+import type {
+  ClientPrincipal,
+  CheckoutRow,
+  CheckoutTransaction,
+  InventoryRow,
+  InventoryTransaction,
+} from '../types/interfaces';
 import {
   getCheckoutHistory,
   getInventoryHistory,
 } from '../services/historyService';
-import { processTransactionsByUser } from '../components/History/transactionProcessors';
+import {
+  mapCheckoutRows,
+  mapInventoryRows,
+  processTransactionsByUser,
+} from '../components/History/transactionProcessors';
+import { markHistoryLoaded } from '../utils/e2eReadiness';
+
+type HistoryType = 'checkout' | 'inventory';
+
+// Rows loaded so far, tagged with the history type they were loaded for
+type LoadedHistory =
+  | { historyType: 'checkout'; rows: CheckoutRow[] }
+  | { historyType: 'inventory'; rows: InventoryRow[] };
 
 interface UseHistoryDataProps {
   user: ClientPrincipal | null;
@@ -12,11 +30,13 @@ interface UseHistoryDataProps {
     startDate: string;
     endDate: string;
   };
-  historyType: 'checkout' | 'inventory';
+  historyType: HistoryType;
   loggedInUserId: number | null;
   onError: (message: string) => void;
 }
 
+// Loads the first page of history for the date range; loadMore appends the next
+// page (the History page calls it when the end of the list scrolls into view)
 export function useHistoryData({
   user,
   formattedDateRange,
@@ -24,41 +44,109 @@ export function useHistoryData({
   loggedInUserId,
   onError,
 }: UseHistoryDataProps) {
-  const [userHistory, setUserHistory] = useState<
-    CheckoutTransaction[] | InventoryTransaction[] | null
-  >(null);
+  const [history, setHistory] = useState<LoadedHistory | null>(null);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [isLoading, setIsLoading] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+
+  // Bumped whenever the query changes, so pages of an earlier query are dropped
+  const querySeq = useRef(0);
+  const loadingMore = useRef(false);
+
+  const fetchPage = useCallback(
+    async (cursor: string | null): Promise<[LoadedHistory, string | null]> => {
+      const { startDate, endDate } = formattedDateRange;
+      if (historyType === 'checkout') {
+        const page = await getCheckoutHistory(
+          user,
+          startDate,
+          endDate,
+          cursor,
+        );
+        return [{ historyType, rows: page.rows }, page.nextCursor];
+      }
+      const page = await getInventoryHistory(
+        user,
+        startDate,
+        endDate,
+        cursor,
+      );
+      return [{ historyType, rows: page.rows }, page.nextCursor];
+    },
+    [formattedDateRange, historyType, user],
+  );
 
   useEffect(() => {
-    let mounted = true;
+    const query = ++querySeq.current;
+    loadingMore.current = false;
 
     async function findUserHistoryForSelectedDate() {
       try {
         setIsLoading(true);
-        const response =
-          historyType === 'checkout'
-            ? await getCheckoutHistory(
-                user,
-                formattedDateRange.startDate,
-                formattedDateRange.endDate,
-              )
-            : await getInventoryHistory(
-                user,
-                formattedDateRange.startDate,
-                formattedDateRange.endDate,
-              );
-        if (mounted) setUserHistory(response);
+        setIsLoadingMore(false);
+        setNextCursor(null);
+        const [firstPage, cursor] = await fetchPage(null);
+        if (querySeq.current === query) {
+          setHistory(firstPage);
+          setNextCursor(cursor);
+        }
       } catch (error) {
-        if (mounted) onError('Error fetching history: ' + error);
+        if (querySeq.current === query) {
+          onError('Error fetching history: ' + error);
+        }
       } finally {
-        if (mounted) setIsLoading(false);
+        if (querySeq.current === query) setIsLoading(false);
       }
     }
     findUserHistoryForSelectedDate();
     return () => {
-      mounted = false;
+      querySeq.current++;
     };
-  }, [formattedDateRange, historyType, user, onError]);
+  }, [fetchPage, onError]);
+
+  const loadMore = useCallback(async () => {
+    if (!nextCursor || isLoading || loadingMore.current) return;
+
+    const query = querySeq.current;
+    loadingMore.current = true;
+    setIsLoadingMore(true);
+    try {
+      const [page, cursor] = await fetchPage(nextCursor);
+      if (querySeq.current !== query) return;
+      setHistory((loaded) =>
+        loaded && loaded.historyType === page.historyType
+          ? ({
+              historyType: page.historyType,
+              rows: [...loaded.rows, ...page.rows],
+            } as LoadedHistory)
+          : page,
+      );
+      setNextCursor(cursor);
+    } catch (error) {
+      if (querySeq.current === query) {
+        onError('Error fetching history: ' + error);
+      }
+    } finally {
+      if (querySeq.current === query) {
+        loadingMore.current = false;
+        setIsLoadingMore(false);
+      }
+    }
+  }, [fetchPage, isLoading, nextCursor, onError]);
+
+  const userHistory = useMemo<
+    CheckoutTransaction[] | InventoryTransaction[] | null
+  >(() => {
+    if (!history) return null;
+    // Mapped together: an edit may have been loaded a page before its checkout
+    return history.historyType === 'checkout'
+      ? mapCheckoutRows(history.rows)
+      : mapInventoryRows(history.rows);
+  }, [history]);
+
+  useEffect(() => {
+    if (!isLoading) markHistoryLoaded();
+  }, [isLoading, userHistory]);
 
   const transactionsByUser = useMemo(
     () => processTransactionsByUser(userHistory ?? [], loggedInUserId ?? 0),
@@ -69,5 +157,8 @@ export function useHistoryData({
     userHistory,
     transactionsByUser,
     isLoading,
+    isLoadingMore,
+    hasMore: nextCursor !== null,
+    loadMore,
   };
 }
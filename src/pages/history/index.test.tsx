@@ -17,8 +17,9 @@ import * as residentService from '../../services/residentService';
 import * as itemsService from '../../services/itemsService';
 import {
   TransactionType,
-  CheckoutTransaction,
-  InventoryTransaction,
+  CheckoutRow,
+  InventoryRow,
+  HistoryPageResult,
   Building,
 } from '../../types/interfaces';
 
@@ -50,7 +51,7 @@ vi.mock('../../components/History/GeneralCheckoutCard', () => ({
     <div
       data-testid={`general-checkout-card-${checkoutTransaction.transaction_id}`}
     >
-      General Checkout
+      General Checkout{checkoutTransaction.is_edited && ' (edited)'}
     </div>
   ),
 }));
@@ -107,9 +108,12 @@ const mockCategorizedItems = [
   },
 ];
 
-const mockCheckoutTransactions: CheckoutTransaction[] = [
-  {
+// A checkout row as GetCheckoutHistory returns it
+const checkoutRow = (overrides: Partial<CheckoutRow> = {}): CheckoutRow => {
+  const row = {
     transaction_id: '1',
+    transaction_type: TransactionType.Checkout,
+    parent_transaction_id: null,
     user_id: 1,
     building_id: 1,
     building_code: 'A',
@@ -118,15 +122,25 @@ const mockCheckoutTransactions: CheckoutTransaction[] = [
     resident_id: 1,
     resident_name: 'Resident A',
     transaction_date: new Date().toISOString(),
-    item_type: 'general',
     total_quantity: 2,
     welcome_basket_item_id: null,
     welcome_basket_quantity: null,
-    is_edited: false,
-  },
-];
+    ...overrides,
+  };
+  return {
+    page_cursor: `${row.transaction_date}|${row.transaction_id}`,
+    ...row,
+  };
+};
 
-const mockInventoryTransactions: InventoryTransaction[] = [
+const page = <T,>(
+  rows: T[],
+  nextCursor: string | null = null,
+): HistoryPageResult<T> => ({ rows, nextCursor });
+
+const mockCheckoutRows: CheckoutRow[] = [checkoutRow()];
+
+const mockInventoryRows: InventoryRow[] = [
   {
     transaction_id: '2',
     user_id: 1,
@@ -135,6 +149,7 @@ const mockInventoryTransactions: InventoryTransaction[] = [
     item_name: 'Bread',
     category_name: 'Food',
     quantity: 10,
+    page_cursor: '2025-01-01T00:00:00|2',
   },
 ];
 
@@ -165,13 +180,13 @@ describe('HistoryPage Component', () => {
     vi.spyOn(historyService, 'getCheckoutHistory').mockImplementation(
       () =>
         new Promise((resolve) =>
-          setTimeout(() => resolve(mockCheckoutTransactions), 50),
+          setTimeout(() => resolve(page(mockCheckoutRows)), 50),
         ),
     );
     vi.spyOn(historyService, 'getInventoryHistory').mockImplementation(
       () =>
         new Promise((resolve) =>
-          setTimeout(() => resolve(mockInventoryTransactions), 50),
+          setTimeout(() => resolve(page(mockInventoryRows)), 50),
         ),
     );
     vi.spyOn(userService, 'getUsers').mockImplementation(
@@ -241,6 +256,7 @@ describe('HistoryPage Component', () => {
         mockUser,
         expect.any(String),
         expect.any(String),
+        null,
       );
     });
 
@@ -260,12 +276,13 @@ describe('HistoryPage Component', () => {
       mockUser,
       expect.any(String),
       expect.any(String),
+      null,
     );
   });
 
   test('fetches and displays checkout transactions', async () => {
     vi.spyOn(historyService, 'getCheckoutHistory').mockResolvedValue(
-      mockCheckoutTransactions,
+      page(mockCheckoutRows),
     );
 
     render(
@@ -309,7 +326,7 @@ describe('HistoryPage Component', () => {
   });
 
   test('handles empty transaction history', async () => {
-    vi.spyOn(historyService, 'getCheckoutHistory').mockResolvedValue([]);
+    vi.spyOn(historyService, 'getCheckoutHistory').mockResolvedValue(page([]));
 
     render(
       <Wrapper>
@@ -425,28 +442,20 @@ describe('HistoryPage Component', () => {
   });
 
   test('displays user-specific transaction grouping', async () => {
-    const multiUserTransactions: CheckoutTransaction[] = [
-      ...mockCheckoutTransactions,
-      {
+    const multiUserRows: CheckoutRow[] = [
+      ...mockCheckoutRows,
+      checkoutRow({
         transaction_id: '2',
         user_id: 2,
-        building_id: 1,
-        building_code: 'A',
-        building_name: 'Building A',
         unit_number: '102',
         resident_id: 2,
         resident_name: 'Resident B',
-        transaction_date: new Date().toISOString(),
-        item_type: 'general',
         total_quantity: 1,
-        welcome_basket_item_id: null,
-        welcome_basket_quantity: null,
-        is_edited: false,
-      },
+      }),
     ];
 
     vi.spyOn(historyService, 'getCheckoutHistory').mockResolvedValue(
-      multiUserTransactions,
+      page(multiUserRows),
     );
 
     render(
@@ -461,27 +470,8 @@ describe('HistoryPage Component', () => {
   });
 
   test('displays "You" for current user transactions', async () => {
-    const currentUserTransactions: CheckoutTransaction[] = [
-      {
-        transaction_id: '1',
-        user_id: 1,
-        building_id: 1,
-        building_code: 'A',
-        building_name: 'Building A',
-        unit_number: '101',
-        resident_id: 1,
-        resident_name: 'Resident A',
-        transaction_date: new Date().toISOString(),
-        item_type: 'general',
-        total_quantity: 2,
-        welcome_basket_item_id: null,
-        welcome_basket_quantity: null,
-        is_edited: false,
-      },
-    ];
-
     vi.spyOn(historyService, 'getCheckoutHistory').mockResolvedValue(
-      currentUserTransactions,
+      page([checkoutRow({ user_id: 1 })]),
     );
 
     render(
@@ -497,27 +487,8 @@ describe('HistoryPage Component', () => {
   });
 
   test('displays "(Admin)" prefix for admin user transactions', async () => {
-    const adminTransactions: CheckoutTransaction[] = [
-      {
-        transaction_id: '3',
-        user_id: 3,
-        building_id: 1,
-        building_code: 'A',
-        building_name: 'Building A',
-        unit_number: '101',
-        resident_id: 1,
-        resident_name: 'Resident A',
-        transaction_date: new Date().toISOString(),
-        item_type: 'general',
-        total_quantity: 2,
-        welcome_basket_item_id: null,
-        welcome_basket_quantity: null,
-        is_edited: false,
-      },
-    ];
-
     vi.spyOn(historyService, 'getCheckoutHistory').mockResolvedValue(
-      adminTransactions,
+      page([checkoutRow({ transaction_id: '3', user_id: 3 })]),
     );
 
     render(
@@ -543,13 +514,14 @@ describe('HistoryPage Component', () => {
         mockUser,
         expect.stringMatching(/^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$/),
         expect.stringMatching(/^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}\.\d{3}Z$/),
+        null,
       );
     });
   });
 
   test('displays total record count after loading', async () => {
     vi.spyOn(historyService, 'getCheckoutHistory').mockResolvedValue(
-      mockCheckoutTransactions,
+      page(mockCheckoutRows),
     );
 
     render(
@@ -564,28 +536,20 @@ describe('HistoryPage Component', () => {
   });
 
   test('displays total record count across multiple users', async () => {
-    const multiUserTransactions: CheckoutTransaction[] = [
-      ...mockCheckoutTransactions,
-      {
+    const multiUserRows: CheckoutRow[] = [
+      ...mockCheckoutRows,
+      checkoutRow({
         transaction_id: '2',
         user_id: 2,
-        building_id: 1,
-        building_code: 'A',
-        building_name: 'Building A',
         unit_number: '102',
         resident_id: 2,
         resident_name: 'Resident B',
-        transaction_date: new Date().toISOString(),
-        item_type: 'general',
         total_quantity: 1,
-        welcome_basket_item_id: null,
-        welcome_basket_quantity: null,
-        is_edited: false,
-      },
+      }),
     ];
 
     vi.spyOn(historyService, 'getCheckoutHistory').mockResolvedValue(
-      multiUserTransactions,
+      page(multiUserRows),
     );
 
     render(
@@ -625,4 +589,78 @@ describe('HistoryPage Component', () => {
       ).toBeGreaterThan(callCount);
     });
   });
+
+  test('loads the next page when Load more is clicked', async () => {
+    const firstPage = [checkoutRow()];
+    const secondPage = [
+      checkoutRow({
+        transaction_id: '2',
+        user_id: 2,
+        unit_number: '102',
+        resident_id: 2,
+        resident_name: 'Resident B',
+      }),
+    ];
+    vi.spyOn(historyService, 'getCheckoutHistory')
+      .mockResolvedValueOnce(page(firstPage, firstPage[0].page_cursor))
+      .mockResolvedValueOnce(page(secondPage));
+
+    render(
+      <Wrapper>
+        <HistoryPage />
+      </Wrapper>,
+    );
+
+    await waitFor(() => {
+      expect(
+        screen.getByText(/Showing 1 record so far, scroll for more/i),
+      ).toBeInTheDocument();
+    });
+
+    fireEvent.click(screen.getByRole('button', { name: /Load more/i }));
+
+    await waitFor(() => {
+      expect(screen.getByText(/Showing 2 records total/i)).toBeInTheDocument();
+    });
+    expect(historyService.getCheckoutHistory).toHaveBeenLastCalledWith(
+      mockUser,
+      expect.any(String),
+      expect.any(String),
+      firstPage[0].page_cursor,
+    );
+    expect(
+      screen.queryByRole('button', { name: /Load more/i }),
+    ).not.toBeInTheDocument();
+  });
+
+  test('marks a checkout edited by a row loaded a page earlier', async () => {
+    const checkout = checkoutRow({
+      transaction_id: 'checkout-1',
+      transaction_date: '2025-01-01T10:00:00.000Z',
+    });
+    const edit = checkoutRow({
+      transaction_id: 'edit-1',
+      transaction_type: TransactionType.CheckoutEdit,
+      parent_transaction_id: 'checkout-1',
+      transaction_date: '2025-01-01T11:00:00.000Z',
+    });
+    vi.spyOn(historyService, 'getCheckoutHistory')
+      .mockResolvedValueOnce(page([edit], edit.page_cursor))
+      .mockResolvedValueOnce(page([checkout]));
+
+    render(
+      <Wrapper>
+        <HistoryPage />
+      </Wrapper>,
+    );
+
+    fireEvent.click(await screen.findByRole('button', { name: /Load more/i }));
+
+    await waitFor(() => {
+      expect(screen.getByText(/Showing 1 record total/i)).toBeInTheDocument();
+    });
+    expect(
+      screen.getByTestId('general-checkout-card-checkout-1'),
+    ).toHaveTextContent('General Checkout (edited)');
+  });
 });
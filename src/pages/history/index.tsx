@@ -1,4 +1,4 @@
-import React, { useState, useContext } from 'react';
+import React, { useState, useContext, useEffect, useRef } from 'react';
 import {
   Button,
   Stack,
@@ -43,7 +43,13 @@ const HistoryPage: React.FC = () => {
     'checkout',
   );
 
-  const { transactionsByUser, isLoading: isLoadingHistory } = useHistoryData({
+  const {
+    transactionsByUser,
+    isLoading: isLoadingHistory,
+    isLoadingMore,
+    hasMore,
+    loadMore,
+  } = useHistoryData({
     user,
     formattedDateRange,
     historyType,
@@ -53,6 +59,25 @@ const HistoryPage: React.FC = () => {
 
   const isLoading = isLoadingReferenceData || isLoadingHistory;
 
+  // Load the next page as the end of the list scrolls into view; the button
+  // stays as a fallback where IntersectionObserver is unavailable. Re-run on
+  // isLoading: the button only mounts once the first page has rendered
+  const loadMoreRef = useRef<HTMLButtonElement | null>(null);
+  useEffect(() => {
+    const trigger = loadMoreRef.current;
+    if (!trigger || !hasMore || typeof IntersectionObserver === 'undefined') {
+      return;
+    }
+    const observer = new IntersectionObserver(
+      (entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) loadMore();
+      },
+      { rootMargin: '200px' },
+    );
+    observer.observe(trigger);
+    return () => observer.disconnect();
+  }, [hasMore, isLoading, loadMore]);
+
   return (
     <Stack sx={{ gap: 4, paddingY: 5 }}>
       <SnackbarAlert
@@ -181,7 +206,8 @@ const HistoryPage: React.FC = () => {
           );
           return (
             <Typography variant="body1">
-              Showing {totalRecords} {totalRecords === 1 ? 'record' : 'records'} total
+              Showing {totalRecords} {totalRecords === 1 ? 'record' : 'records'}{' '}
+              {hasMore ? 'so far, scroll for more' : 'total'}
             </Typography>
           );
         })()}
@@ -196,6 +222,16 @@ const HistoryPage: React.FC = () => {
             loggedInUserId={loggedInUserId}
             historyType={historyType}
           />
+          {hasMore && (
+            <Button
+              ref={loadMoreRef}
+              onClick={loadMore}
+              disabled={isLoadingMore}
+              sx={{ alignSelf: 'center' }}
+            >
+              {isLoadingMore ? 'Loading more...' : 'Load more'}
+            </Button>
+          )}
         </>
       )}
     </Stack>
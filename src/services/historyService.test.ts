@@ -1,24 +1,25 @@
 import { describe, it, expect, vi, beforeEach, type Mock } from 'vitest';
 import { getCheckoutHistory, getInventoryHistory } from './historyService';
-import { API_HEADERS, ENDPOINTS } from '../types/constants';
+import { API_HEADERS, ENDPOINTS, SETTINGS } from '../types/constants';
 import { getRole } from '../utils/userUtils';
-import { mapCheckoutRows, mapInventoryRows } from '../components/History/transactionProcessors';
 
 vi.mock('../utils/userUtils', () => ({
   getRole: vi.fn(),
 }));
 
-vi.mock('../components/History/transactionProcessors', () => ({
-  mapCheckoutRows: vi.fn(),
-  mapInventoryRows: vi.fn(),
-}));
-
 global.fetch = vi.fn();
 
 describe('historyService', () => {
   const user = { userDetails: 'testuser' } as any;
   const startDate = '2025-01-01';
   const endDate = '2025-01-31';
+  const pageSize = SETTINGS.history_page_size;
+
+  const rowsWithCursors = (count: number) =>
+    Array.from({ length: count }, (_, i) => ({
+      transaction_id: `txn-${i}`,
+      page_cursor: `2025-01-31T00:00:00|txn-${i}`,
+    }));
 
   beforeEach(() => {
     vi.clearAllMocks();
@@ -26,24 +27,51 @@ describe('historyService', () => {
   });
 
   describe('getCheckoutHistory', () => {
-    it('should fetch and map checkout history successfully', async () => {
-      const rawRows = [{ id: 1, resident_name: 'Alice' }];
-      const mappedRows = [{ id: 1, residentName: 'Alice' }];
+    it('should fetch the first page of checkout history successfully', async () => {
+      const rawRows = [{ transaction_id: 'txn-1', page_cursor: '2025-01-31T00:00:00|txn-1' }];
+      (fetch as Mock).mockResolvedValue({
+        ok: true,
+        json: () => Promise.resolve({ value: rawRows }),
+      });
+
+      const result = await getCheckoutHistory(user, startDate, endDate);
+
+      expect(fetch).toHaveBeenCalledWith(ENDPOINTS.GET_CHECKOUT_HISTORY, {
+        headers: { ...API_HEADERS, 'X-MS-API-ROLE': 'admin' },
+        method: 'POST',
+        body: JSON.stringify({ start_date: startDate, end_date: endDate, page_size: pageSize + 1 }),
+      });
+      expect(result).toEqual({ rows: rawRows, nextCursor: null });
+    });
+
+    it('should return a cursor when a row beyond the page comes back', async () => {
+      const rawRows = rowsWithCursors(pageSize + 1);
       (fetch as Mock).mockResolvedValue({
         ok: true,
         json: () => Promise.resolve({ value: rawRows }),
       });
-      (mapCheckoutRows as Mock).mockReturnValue(mappedRows);
 
       const result = await getCheckoutHistory(user, startDate, endDate);
 
+      expect(result.rows).toEqual(rawRows.slice(0, pageSize));
+      expect(result.nextCursor).toBe(rawRows[pageSize - 1].page_cursor);
+    });
+
+    it('should send the cursor for a later page', async () => {
+      const cursor = '2025-01-31T00:00:00|txn-9';
+      (fetch as Mock).mockResolvedValue({
+        ok: true,
+        json: () => Promise.resolve({ value: [] }),
+      });
+
+      const result = await getCheckoutHistory(user, startDate, endDate, cursor);
+
       expect(fetch).toHaveBeenCalledWith(ENDPOINTS.GET_CHECKOUT_HISTORY, {
         headers: { ...API_HEADERS, 'X-MS-API-ROLE': 'admin' },
         method: 'POST',
-        body: JSON.stringify({ start_date: startDate, end_date: endDate }),
+        body: JSON.stringify({ start_date: startDate, end_date: endDate, page_size: pageSize + 1, cursor }),
       });
-      expect(mapCheckoutRows).toHaveBeenCalledWith(rawRows);
-      expect(result).toEqual(mappedRows);
+      expect(result).toEqual({ rows: [], nextCursor: null });
     });
 
     it('should throw an error if the request fails', async () => {
@@ -60,24 +88,34 @@ describe('historyService', () => {
   });
 
   describe('getInventoryHistory', () => {
-    it('should fetch and map inventory history successfully', async () => {
-      const rawRows = [{ id: 1, item_name: 'Blanket' }];
-      const mappedRows = [{ id: 1, itemName: 'Blanket' }];
+    it('should fetch the first page of inventory history successfully', async () => {
+      const rawRows = [{ transaction_id: 'txn-1', item_name: 'Blanket', page_cursor: '2025-01-31T00:00:00|txn-1' }];
       (fetch as Mock).mockResolvedValue({
         ok: true,
         json: () => Promise.resolve({ value: rawRows }),
       });
-      (mapInventoryRows as Mock).mockReturnValue(mappedRows);
 
       const result = await getInventoryHistory(user, startDate, endDate);
 
       expect(fetch).toHaveBeenCalledWith(ENDPOINTS.GET_INVENTORY_HISTORY, {
         headers: { ...API_HEADERS, 'X-MS-API-ROLE': 'admin' },
         method: 'POST',
-        body: JSON.stringify({ start_date: startDate, end_date: endDate }),
+        body: JSON.stringify({ start_date: startDate, end_date: endDate, page_size: pageSize + 1 }),
+      });
+      expect(result).toEqual({ rows: rawRows, nextCursor: null });
+    });
+
+    it('should return a cursor when a row beyond the page comes back', async () => {
+      const rawRows = rowsWithCursors(pageSize + 1);
+      (fetch as Mock).mockResolvedValue({
+        ok: true,
+        json: () => Promise.resolve({ value: rawRows }),
       });
-      expect(mapInventoryRows).toHaveBeenCalledWith(rawRows);
-      expect(result).toEqual(mappedRows);
+
+      const result = await getInventoryHistory(user, startDate, endDate);
+
+      expect(result.rows).toEqual(rawRows.slice(0, pageSize));
+      expect(result.nextCursor).toBe(rawRows[pageSize - 1].page_cursor);
     });
 
     it('should throw an error if the request fails', async () => {
@@ -1,34 +1,63 @@
 import { getRole } from '../utils/userUtils';
-import { ENDPOINTS } from '../types/constants';
+import { ENDPOINTS, SETTINGS } from '../types/constants';
 import {
   ClientPrincipal,
   CheckoutRow,
-  CheckoutTransaction,
+  HistoryPageResult,
   InventoryRow,
-  InventoryTransaction,
 } from '../types/interfaces';
-import {
-  mapCheckoutRows,
-  mapInventoryRows,
-} from '../components/History/transactionProcessors';
 import { apiRequest } from './apiRequest';
 
+// Rows come back newest first. One row beyond the page is requested to tell
+// whether another page follows; the page ends at the row before it
+async function getHistoryPage<T extends { page_cursor: string }>(
+  url: string,
+  user: ClientPrincipal | null,
+  startDate: string,
+  endDate: string,
+  cursor: string | null,
+): Promise<HistoryPageResult<T>> {
+  const pageSize = SETTINGS.history_page_size;
+  const body: Record<string, string | number> = {
+    start_date: startDate,
+    end_date: endDate,
+    page_size: pageSize + 1,
+  };
+  if (cursor) {
+    body.cursor = cursor;
+  }
+
+  const result = await apiRequest<T[]>({
+    url,
+    role: getRole(user),
+    method: 'POST',
+    body,
+  });
+  const rows = result.value.slice(0, pageSize);
+  const hasMore = result.value.length > pageSize;
+
+  return {
+    rows,
+    nextCursor: hasMore ? rows[rows.length - 1].page_cursor : null,
+  };
+}
+
+// Raw rows: a CHECKOUT_EDIT row comes before (is newer than) the checkout it
+// edits, possibly a page earlier, so rows are mapped once loaded together
 export async function getCheckoutHistory(
   user: ClientPrincipal | null,
   startDate: string,
   endDate: string,
-): Promise<CheckoutTransaction[]> {
+  cursor: string | null = null,
+): Promise<HistoryPageResult<CheckoutRow>> {
   try {
-    const result = await apiRequest<CheckoutRow[]>({
-      url: ENDPOINTS.GET_CHECKOUT_HISTORY,
-      role: getRole(user),
-      method: 'POST',
-      body: {
-        start_date: startDate,
-        end_date: endDate,
-      },
-    });
-    return mapCheckoutRows(result.value);
+    return await getHistoryPage<CheckoutRow>(
+      ENDPOINTS.GET_CHECKOUT_HISTORY,
+      user,
+      startDate,
+      endDate,
+      cursor,
+    );
   } catch (error) {
     console.error('Error fetching checkout history:', error);
     throw error;
@@ -39,18 +68,16 @@ export async function getInventoryHistory(
   user: ClientPrincipal | null,
   startDate: string,
   endDate: string,
-): Promise<InventoryTransaction[]> {
+  cursor: string | null = null,
+): Promise<HistoryPageResult<InventoryRow>> {
   try {
-    const result = await apiRequest<InventoryRow[]>({
-      url: ENDPOINTS.GET_INVENTORY_HISTORY,
-      role: getRole(user),
-      method: 'POST',
-      body: {
-        start_date: startDate,
-        end_date: endDate,
-      },
-    });
-    return mapInventoryRows(result.value);
+    return await getHistoryPage<InventoryRow>(
+      ENDPOINTS.GET_INVENTORY_HISTORY,
+      user,
+      startDate,
+      endDate,
+      cursor,
+    );
   } catch (error) {
     console.error('Error fetching inventory history:', error);
     throw error;
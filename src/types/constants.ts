@@ -40,6 +40,7 @@ export const ENDPOINTS = {
 
 export const SETTINGS = {
   itemsPerPage: 10,
+  history_page_size: 50,
   checkout_item_limit: 10,
   api_fetch_limit_items: 10000,
   api_fetch_limit_units: 1000,
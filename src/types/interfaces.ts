@@ -241,6 +241,7 @@ export type CheckoutRow = {
   total_quantity: number;
   welcome_basket_item_id: number | null;
   welcome_basket_quantity: number | null;
+  page_cursor: string;
 };
 
 export type TransactionHistoryRow = {
@@ -266,6 +267,14 @@ export type InventoryRow = {
   item_name: string;
   category_name: string;
   quantity: number;
+  page_cursor: string;
+};
+
+// One page of GetCheckoutHistory / GetInventoryHistory rows, newest first.
+// nextCursor is opaque: pass it back to get the following page (null on the last page)
+export type HistoryPageResult<T> = {
+  rows: T[];
+  nextCursor: string | null;
 };
 
 // ─── Context Types ────────────────────────────────────────────────────────────
@@ -0,0 +1,47 @@
+/**
+ * @copyright 2026 Digital Aid Seattle
+ */
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import {
+  READINESS_ATTRIBUTES,
+  markCartChanged,
+  markHistoryLoaded,
+  markSearchSettled,
+} from './e2eReadiness';
+
+const root = () => document.documentElement;
+
+describe('e2eReadiness', () => {
+  beforeEach(() => {
+    Object.values(READINESS_ATTRIBUTES).forEach((name) => root().removeAttribute(name));
+  });
+
+  afterEach(() => {
+    vi.unstubAllEnvs();
+  });
+
+  it('increments the cart version on every change', () => {
+    markCartChanged();
+    markCartChanged();
+    expect(root().getAttribute(READINESS_ATTRIBUTES.CART_VERSION)).toBe('2');
+    expect(root().getAttribute(READINESS_ATTRIBUTES.ENABLED)).toBe('on');
+  });
+
+  it('records the last settled search term', () => {
+    markSearchSettled('curt');
+    markSearchSettled('Curtains');
+    expect(root().getAttribute(READINESS_ATTRIBUTES.SEARCH_TERM)).toBe('Curtains');
+  });
+
+  it('increments the history loaded sequence', () => {
+    markHistoryLoaded();
+    expect(root().getAttribute(READINESS_ATTRIBUTES.HISTORY_LOADED_SEQ)).toBe('1');
+  });
+
+  it('publishes nothing outside dev unless enabled', () => {
+    vi.stubEnv('DEV', false);
+    vi.stubEnv('VITE_E2E_READINESS', 'false');
+    markCartChanged();
+    expect(root().hasAttribute(READINESS_ATTRIBUTES.CART_VERSION)).toBe(false);
+  });
+});
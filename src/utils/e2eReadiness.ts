@@ -0,0 +1,48 @@
+/**
+ * @copyright 2026 Digital Aid Seattle
+ *
+ * Readiness signals for the Selenium e2e suite (tests/pages). Page objects wait on these
+ * attributes of the <html> element instead of sleeping. Attributes are used (rather than a
+ * window global) so the suite's MutationObserver waits see every change immediately.
+ *
+ * Only published in dev or when the build sets VITE_E2E_READINESS=true (staging).
+ */
+export const READINESS_ATTRIBUTES = {
+  ENABLED: 'data-ph-readiness',
+  CART_VERSION: 'data-ph-cart-version',
+  SEARCH_TERM: 'data-ph-search-term',
+  HISTORY_LOADED_SEQ: 'data-ph-history-seq',
+} as const;
+
+const isEnabled = (): boolean =>
+  import.meta.env.VITE_E2E_READINESS === 'true' || import.meta.env.DEV;
+
+function readinessRoot(): HTMLElement | null {
+  if (!isEnabled() || typeof document === 'undefined') return null;
+  const root = document.documentElement;
+  root.setAttribute(READINESS_ATTRIBUTES.ENABLED, 'on');
+  return root;
+}
+
+function increment(attribute: string): void {
+  const root = readinessRoot();
+  if (!root) return;
+  const current = Number(root.getAttribute(attribute) ?? 0);
+  root.setAttribute(attribute, String(current + 1));
+}
+
+// Bumped after every committed change to the checkout cart
+export function markCartChanged(): void {
+  increment(READINESS_ATTRIBUTES.CART_VERSION);
+}
+
+// Set after the results for a search term have been rendered
+export function markSearchSettled(term: string): void {
+  readinessRoot()?.setAttribute(READINESS_ATTRIBUTES.SEARCH_TERM, term);
+}
+
+// Bumped each time a history query finishes, or a later page is appended, and
+// its results are rendered
+export function markHistoryLoaded(): void {
+  increment(READINESS_ATTRIBUTES.HISTORY_LOADED_SEQ);
+}
@@ -1,8 +1,10 @@
+import json
 import os
+from pathlib import Path
+
 import allure
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
@@ -12,47 +14,730 @@ from tests.pages.home_page import HomePage
 from tests.pages.login_page import LoginPage
 from tests.pages.history_page import HistoryPage
 
+from tests.local_dab import DATABASE_COOKIE, LocalDataApi, SnapshotClient
+from tests.local_swa import AuthStub, LocalSwa, load_principals
+
+from tests.utilities.api_client import ApiSession
+from tests.utilities.auth_snapshot import AuthSnapshotStore
+from tests.utilities.data_namespace import DataNamespace, WorkerData
+from tests.utilities.browser_pool import (
+    LOGIN_ORIGIN,
+    BrowserPool,
+    ChromeLauncher,
+    origin_of,
+    reset_browser_state,
+)
+from tests.utilities.command_profiler import (
+    HOT_SPOT_LIMIT,
+    WORKER_REPORT_GLOB,
+    CommandProfiler,
+    write_run_report,
+)
+from tests.utilities.har_replay import HarStore
+from tests.utilities.network_capture import (
+    HOT_FLOW_LIMIT,
+    WORKER_NETWORK_GLOB,
+    NetworkCapture,
+    write_run_network,
+)
+from tests.utilities.page_metrics import (
+    BUDGET_MODES,
+    PAGE_METRICS,
+    WORKER_METRICS_GLOB,
+    write_run_metrics,
+)
+from tests.utilities.round_trips import ROUND_TRIP_STATS
+from tests.utilities.serial_scheduling import (
+    SERIAL_MODES,
+    SerialAwareScheduling,
+    tag_serial_items,
+)
 from tests.utilities.data import (
     URL,
+    BROWSER_MODE,
+    AUTH_SNAPSHOT_TTL,
+    PERF_BUDGETS_FILE,
+    PERF_BUDGET_MODE,
+    CPU_THROTTLE,
+    LOCAL_API,
+    LOCAL_API_PORT,
+    LOCAL_DB_RESET,
+    AUTH_STUB,
+    AUTH_STUB_PORT,
+    AUTH_STUB_PRINCIPALS,
+    APP_DEVSERVER_URL,
+    DATA_API_URL,
+    LOCAL_VOLUNTEER,
+    E2E_DATA_PREFIX,
     ADMIN_USERNAME,
     ADMIN_PASSWORD,
     VOLUNTEER_USERNAME,
     VOLUNTEER_PASSWORD,
 )
 
+CHROME_LAUNCHER_KEY = pytest.StashKey[ChromeLauncher]()
+CHROME_LAUNCH_TOTALS_KEY = pytest.StashKey[dict]()
+COMMAND_PROFILER_KEY = pytest.StashKey[CommandProfiler]()
+COMMAND_REPORT_KEY = pytest.StashKey[dict]()
+PAGE_METRICS_REPORT_KEY = pytest.StashKey[dict]()
+NETWORK_CAPTURE_KEY = pytest.StashKey[NetworkCapture]()
+NETWORK_REPORT_KEY = pytest.StashKey[dict]()
+LOCAL_API_KEY = pytest.StashKey[LocalDataApi]()
+LOCAL_SWA_KEY = pytest.StashKey[LocalSwa]()
+
+DB_RESET_MODES = ("off", "function", "module", "session")
+
+
+# ---------------------------------------------------
+# Command Line Options
+# ---------------------------------------------------
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-mode",
+        choices=("pooled", "per-test"),
+        default=BROWSER_MODE,
+        help=(
+            "pooled: reuse one Chrome per worker and reset its state "
+            "between tests; per-test: launch a new Chrome for every test"
+        ),
+    )
+    parser.addoption(
+        "--no-auth-snapshot",
+        action="store_true",
+        default=False,
+        help="always run the full Microsoft login (and PIN) flow",
+    )
+    parser.addoption(
+        "--profile-commands",
+        metavar="DIR",
+        default=None,
+        help=(
+            "record every WebDriver command per test and page-object "
+            "method and write a hot-spot report to DIR"
+        ),
+    )
+    parser.addoption(
+        "--perf-metrics",
+        metavar="DIR",
+        default=None,
+        help="write page timing / Web Vitals of every page load point to DIR",
+    )
+    parser.addoption(
+        "--perf-budget-mode",
+        choices=BUDGET_MODES,
+        default=PERF_BUDGET_MODE,
+        help=(
+            "how every page reports budget overruns; by default each "
+            "page uses the mode in its budget entry"
+        ),
+    )
+    parser.addoption(
+        "--cpu-throttle",
+        type=float,
+        default=CPU_THROTTLE,
+        help="slow Chrome's CPU down by this factor (kiosk emulation)",
+    )
+    parser.addoption(
+        "--network-capture",
+        metavar="DIR",
+        default=None,
+        help=(
+            "record every data-api request per test from Chrome's "
+            "performance log and write a waterfall / N+1 report to DIR"
+        ),
+    )
+    parser.addoption(
+        "--har-record",
+        metavar="DIR",
+        default=None,
+        help=(
+            "record each test's data-api traffic (browser and api_client) "
+            "to a HAR file in DIR"
+        ),
+    )
+    parser.addoption(
+        "--har-replay",
+        metavar="DIR",
+        default=None,
+        help=(
+            "serve data-api responses from the HAR files in DIR instead "
+            "of the backend; tests without a recording are skipped"
+        ),
+    )
+    parser.addoption(
+        "--local-api",
+        action="store_true",
+        default=LOCAL_API,
+        help=(
+            "serve dab/dab-config.json from a seeded in-memory SQLite "
+            "database (tests/local_dab) for the whole run"
+        ),
+    )
+    parser.addoption(
+        "--local-api-port",
+        type=int,
+        default=LOCAL_API_PORT,
+        help="port of the local data API (the one the SWA CLI proxies /data-api to)",
+    )
+    parser.addoption(
+        "--local-db-reset",
+        choices=DB_RESET_MODES,
+        default=LOCAL_DB_RESET,
+        help=(
+            "with --local-api: put the worker's database back after every "
+            "test (function), test module (module) or the run (session)"
+        ),
+    )
+    parser.addoption(
+        "--auth-stub",
+        action="store_true",
+        default=AUTH_STUB,
+        help=(
+            "serve the app through tests/local_swa with stubbed SWA "
+            "authentication (set URL to its address)"
+        ),
+    )
+    parser.addoption(
+        "--auth-stub-port",
+        type=int,
+        default=AUTH_STUB_PORT,
+        help="port of the local SWA auth stub",
+    )
+    parser.addoption(
+        "--serial-scheduling",
+        choices=SERIAL_MODES,
+        default="after",
+        help=(
+            "with -n and --dist load: run serial tests on one worker "
+            "after the parallel tests (after), on a dedicated worker "
+            "alongside them (isolated), or not at all (off)"
+        ),
+    )
+
+
+# ---------------------------------------------------
+# xdist Serial Scheduling
+# ---------------------------------------------------
+
+def _serial_scheduling_enabled(config):
+    # Workers always run with dist "no": the controller decides for them
+    if hasattr(config, "workerinput"):
+        return config.workerinput.get("serial_scheduling", False)
+
+    return (
+        config.getoption("--serial-scheduling") != "off"
+        and config.getoption("dist", "no") == "load"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    # Workers tag serial tests so the controller's scheduler can see them
+    if hasattr(config, "workerinput") and _serial_scheduling_enabled(config):
+        tag_serial_items(items)
+
+
+def pytest_xdist_make_scheduler(config, log):
+    if not _serial_scheduling_enabled(config):
+        return None
+
+    return SerialAwareScheduling(
+        config,
+        log,
+        mode=config.getoption("--serial-scheduling"),
+    )
+
+
+# ---------------------------------------------------
+# Local Data API & Auth Stub
+# ---------------------------------------------------
+
+def pytest_configure(config):
+    if config.getoption("--har-record") and config.getoption("--har-replay"):
+        raise pytest.UsageError("--har-record and --har-replay cannot be combined")
+
+    # One server each for the run: xdist workers share the controller's,
+    # as every browser reaches them through the same app URL
+    if hasattr(config, "workerinput"):
+        return
+
+    data_api_url = DATA_API_URL
+
+    if config.getoption("--local-api"):
+        api = LocalDataApi(port=config.getoption("--local-api-port")).start()
+        config.stash[LOCAL_API_KEY] = api
+        data_api_url = api.url
+
+    if config.getoption("--auth-stub"):
+        auth = AuthStub(
+            load_principals(AUTH_STUB_PRINCIPALS),
+            logins={ADMIN_USERNAME: "admin", VOLUNTEER_USERNAME: "volunteer"},
+        )
+        config.stash[LOCAL_SWA_KEY] = LocalSwa(
+            port=config.getoption("--auth-stub-port"),
+            app_url=APP_DEVSERVER_URL,
+            data_api_url=data_api_url,
+            auth=auth,
+        ).start()
+
+
+def pytest_unconfigure(config):
+    for key in (LOCAL_SWA_KEY, LOCAL_API_KEY):
+        server = config.stash.get(key, None)
+
+        if server is not None:
+            server.stop()
+
+
+def pytest_configure_node(node):
+    # Workers tag serial tests only if the controller schedules them
+    node.workerinput["serial_scheduling"] = _serial_scheduling_enabled(node.config)
+
+    # Workers talk to the controller's data API for snapshots
+    api = node.config.stash.get(LOCAL_API_KEY, None)
+
+    if api is not None:
+        node.workerinput["local_api_url"] = api.url
+
+
+def worker_name():
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+def local_api_url(config):
+    """URL of the --local-api server in this process or the controller."""
+    if hasattr(config, "workerinput"):
+        return config.workerinput.get("local_api_url")
+
+    api = config.stash.get(LOCAL_API_KEY, None)
+    return api.url if api is not None else None
+
+
+@pytest.fixture(scope="session")
+def local_api(pytestconfig):
+    """The running LocalDataApi, or None when --local-api is off."""
+    return pytestconfig.stash.get(LOCAL_API_KEY, None)
+
+
+# ---------------------------------------------------
+# Local Database Snapshots
+# ---------------------------------------------------
+
+@pytest.fixture(scope="session")
+def local_db(pytestconfig):
+    """
+    This worker's database in the local data API (each worker gets its
+    own copy of the seed data), or None without --local-api.
+    """
+    url = local_api_url(pytestconfig)
+
+    if url is None:
+        return None
+
+    return SnapshotClient(url, worker_name())
+
+
+def database_scope(local_db, data_namespace, snapshot):
+    """Snapshot on entry, restore on exit: the scope leaves no data behind."""
+    if local_db is None:
+        yield
+        return
+
+    local_db.take(snapshot)
+
+    yield
+
+    local_db.restore(snapshot)
+    local_db.drop(snapshot)
+
+    # Rows it provisioned inside the scope are gone
+    data_namespace.forget()
+
+
+@pytest.fixture(scope="function")
+def db_snapshot(local_db, data_namespace):
+    yield from database_scope(local_db, data_namespace, "function")
+
+
+@pytest.fixture(scope="module")
+def module_db_snapshot(local_db, data_namespace):
+    yield from database_scope(local_db, data_namespace, "module")
+
+
+@pytest.fixture(scope="session")
+def session_db_snapshot(local_db, data_namespace):
+    yield from database_scope(local_db, data_namespace, "session")
+
+
+DB_RESET_FIXTURES = {
+    "function": "db_snapshot",
+    "module": "module_db_snapshot",
+    "session": "session_db_snapshot",
+}
+
+
+@pytest.fixture(autouse=True)
+def local_db_reset(request):
+    mode = request.config.getoption("--local-db-reset")
+
+    if mode != "off":
+        request.getfixturevalue(DB_RESET_FIXTURES[mode])
+
 
 # ---------------------------------------------------
 # WebDriver Fixture (Stable + CI-ready)
 # ---------------------------------------------------
 
+@pytest.fixture(scope="session")
+def chrome_launcher(pytestconfig):
+    launcher = ChromeLauncher(
+        performance_log=bool(pytestconfig.getoption("--network-capture"))
+    )
+    pytestconfig.stash[CHROME_LAUNCHER_KEY] = launcher
+
+    return launcher
+
+
+@pytest.fixture(scope="session")
+def browser_pool(chrome_launcher):
+    pool = BrowserPool(
+        chrome_launcher,
+        origins=[origin_of(URL), LOGIN_ORIGIN],
+    )
+
+    yield pool
+
+    pool.close()
+
+
 @pytest.fixture(scope="function")
-def driver():
-    options = Options()
+def driver(request, chrome_launcher, command_profiler, network_capture, har_store):
+    if har_store is not None and not har_store.has_recording(request.node.nodeid):
+        pytest.skip("No HAR recording for this test")
 
-    if os.getenv("CI") == "true":
-        options.add_argument("--headless=new")
-        options.add_argument("--window-size=1920,1080")
-        options.add_argument("--disable-gpu")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        options.add_argument("--disable-extensions")
-        options.add_argument("--disable-notifications")
-        options.add_argument("--disable-infobars")
-        options.add_argument("--disable-blink-features=AutomationControlled")
+    pooled = (
+        request.config.getoption("--browser-mode") == "pooled"
+        and request.node.get_closest_marker("fresh_browser") is None
+    )
 
-    # Faster page loading strategy
-    options.page_load_strategy = "eager"
+    if not pooled:
+        driver = chrome_launcher.launch()
+        open_test_driver(driver, request, command_profiler, network_capture, har_store)
 
-    driver = webdriver.Chrome(options=options)
+        yield driver
 
-    if os.getenv("CI") != "true":
-        driver.maximize_window()
+        close_test_driver(driver, request, command_profiler, network_capture, har_store)
+        driver.quit()
+        return
 
-    driver.get(URL)
+    pool = request.getfixturevalue("browser_pool")
+    driver = pool.acquire()
+    open_test_driver(driver, request, command_profiler, network_capture, har_store)
 
     yield driver
 
-    driver.quit()
+    close_test_driver(driver, request, command_profiler, network_capture, har_store)
+    pool.release(driver)
+
+
+def open_test_driver(driver, request, command_profiler, network_capture, har_store):
+    start_command_profile(command_profiler, driver, request)
+    start_network_capture(network_capture, driver)
+    PAGE_METRICS.current_test = request.node.nodeid
+
+    # Per page target, so pooled browsers need it again after a reset
+    rate = request.config.getoption("--cpu-throttle")
+
+    if rate > 1:
+        driver.execute_cdp_cmd("Emulation.setCPUThrottlingRate", {"rate": rate})
+
+    # Point the app (and api_client) at this worker's local database;
+    # CDP sets it without first loading a page on the origin
+    if local_api_url(request.config):
+        driver.execute_cdp_cmd("Network.setCookie", {
+            "name": DATABASE_COOKIE, "value": worker_name(), "url": URL, "path": "/",
+        })
+
+    # Before the first page load, so the app's first calls are covered
+    start_har(har_store, driver, request)
+
+    driver.get(URL)
+
+
+def close_test_driver(driver, request, command_profiler, network_capture, har_store):
+    # Before the command profile closes, so the log read is not profiled
+    finish_network_capture(network_capture, driver, request)
+    finish_har(har_store)
+    finish_command_profile(command_profiler)
+
+
+# ---------------------------------------------------
+# WebDriver Command Profiler
+# ---------------------------------------------------
+
+@pytest.fixture(scope="session")
+def command_profiler(pytestconfig):
+    if not pytestconfig.getoption("--profile-commands"):
+        return None
+
+    profiler = CommandProfiler()
+    pytestconfig.stash[COMMAND_PROFILER_KEY] = profiler
+
+    return profiler
+
+
+def start_command_profile(profiler, driver, request):
+    if profiler is None:
+        return
+
+    profiler.attach(driver)
+    profiler.start_test(request.node.nodeid)
+
+
+def finish_command_profile(profiler):
+    if profiler is None:
+        return
+
+    report = profiler.finish_test()
+
+    if report:
+        allure.attach(
+            json.dumps(report, indent=2),
+            name="webdriver_command_profile",
+            attachment_type=allure.attachment_type.JSON
+        )
+
+
+# ---------------------------------------------------
+# Network Capture
+# ---------------------------------------------------
+
+@pytest.fixture(scope="session")
+def network_capture(pytestconfig):
+    if not pytestconfig.getoption("--network-capture"):
+        return None
+
+    capture = NetworkCapture()
+    pytestconfig.stash[NETWORK_CAPTURE_KEY] = capture
+
+    return capture
+
+
+def start_network_capture(capture, driver):
+    if capture is None:
+        return
+
+    capture.start_test(driver)
+
+
+def finish_network_capture(capture, driver, request):
+    if capture is None:
+        return
+
+    try:
+        flow = capture.finish_test(driver, request.node.nodeid)
+
+    except WebDriverException as err:
+        print(f"[WARN] Network capture failed: {err.msg}")
+        return
+
+    allure.attach(
+        json.dumps(flow, indent=2),
+        name="data_api_network",
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
+# ---------------------------------------------------
+# HAR Record / Replay
+# ---------------------------------------------------
+
+@pytest.fixture(scope="session")
+def har_store(pytestconfig):
+    for option, mode in (("--har-record", "record"), ("--har-replay", "replay")):
+        directory = pytestconfig.getoption(option)
+
+        if directory:
+            return HarStore(directory, mode)
+
+    return None
+
+
+def start_har(store, driver, request):
+    if store is None:
+        return
+
+    store.start_test(driver, request.node.nodeid)
+
+
+def finish_har(store):
+    if store is None:
+        return
+
+    result = store.finish_test()
+
+    if not result:
+        return
+
+    for miss in result.get("misses", []):
+        print(f"[WARN] No recorded response for {miss['method']} {miss['endpoint']}")
+
+    allure.attach(
+        json.dumps(result, indent=2),
+        name="har_" + store.mode,
+        attachment_type=allure.attachment_type.JSON
+    )
+
+
+# ---------------------------------------------------
+# Run Reports (command profile, page metrics, network)
+# ---------------------------------------------------
+
+def pytest_sessionstart(session):
+    config = session.config
+
+    PAGE_METRICS.configure(
+        budgets_file=PERF_BUDGETS_FILE,
+        mode_override=config.getoption("--perf-budget-mode"),
+    )
+
+    if hasattr(config, "workerinput"):
+        return
+
+    # Leftover worker files from an interrupted run would be merged in
+    for option, pattern in (
+        ("--profile-commands", WORKER_REPORT_GLOB),
+        ("--perf-metrics", WORKER_METRICS_GLOB),
+        ("--network-capture", WORKER_NETWORK_GLOB),
+    ):
+        directory = config.getoption(option)
+
+        if directory:
+            for path in Path(directory).glob(pattern):
+                path.unlink()
+
+
+def pytest_sessionfinish(session):
+    config = session.config
+    worker = worker_name()
+    is_controller = not hasattr(config, "workerinput")
+
+    profile_dir = config.getoption("--profile-commands")
+
+    if profile_dir:
+        profiler = config.stash.get(COMMAND_PROFILER_KEY, None)
+
+        if profiler is not None:
+            profiler.write(Path(profile_dir) / f"command-profile-{worker}.json")
+
+        # Controller (or the only process) combines the worker files
+        if is_controller:
+            config.stash[COMMAND_REPORT_KEY] = write_run_report(profile_dir)
+
+    metrics_dir = config.getoption("--perf-metrics")
+
+    if metrics_dir:
+        if PAGE_METRICS.records:
+            PAGE_METRICS.write(Path(metrics_dir) / f"page-metrics-{worker}.json")
+
+        if is_controller:
+            config.stash[PAGE_METRICS_REPORT_KEY] = write_run_metrics(metrics_dir)
+
+    network_dir = config.getoption("--network-capture")
+
+    if network_dir:
+        capture = config.stash.get(NETWORK_CAPTURE_KEY, None)
+
+        if capture is not None:
+            capture.write(Path(network_dir) / f"network-{worker}.json")
+
+        if is_controller:
+            config.stash[NETWORK_REPORT_KEY] = write_run_network(network_dir)
+
+    # Each worker launches its own Chrome and counts its own clicks:
+    # hand the totals to the controller
+    launcher = config.stash.get(CHROME_LAUNCHER_KEY, None)
+
+    if not is_controller and launcher is not None:
+        config.workeroutput["chrome_launches"] = {
+            "launches": launcher.launches,
+            "launch_seconds": launcher.launch_seconds,
+        }
+
+    if not is_controller:
+        config.workeroutput["round_trips"] = ROUND_TRIP_STATS.as_dict()
+
+
+def pytest_testnodedown(node, error):
+    workeroutput = getattr(node, "workeroutput", {})
+    launches = workeroutput.get("chrome_launches")
+    round_trips = workeroutput.get("round_trips")
+
+    if round_trips is not None:
+        ROUND_TRIP_STATS.merge(round_trips["calls"], round_trips["round_trips"])
+
+    if launches is None:
+        return
+
+    totals = node.config.stash.setdefault(
+        CHROME_LAUNCH_TOTALS_KEY, {"launches": 0, "launch_seconds": 0.0}
+    )
+    totals["launches"] += launches["launches"]
+    totals["launch_seconds"] += launches["launch_seconds"]
+
+
+# ---------------------------------------------------
+# Authenticated Session Snapshots
+# ---------------------------------------------------
+
+@pytest.fixture(scope="session")
+def auth_snapshots(pytestconfig):
+    if pytestconfig.getoption("--no-auth-snapshot"):
+        return None
+
+    return AuthSnapshotStore(URL, ttl=AUTH_SNAPSHOT_TTL)
+
+
+def restore_login(driver, auth_snapshots, role, username, har_store=None):
+    """
+    Reuse this worker's snapshot for the role when possible.
+    Returns the loaded HomePage, or None after leaving a clean
+    browser on the login redirect so the full flow can run.
+    """
+    if auth_snapshots is None or auth_snapshots.get(role, username) is None:
+        return None
+
+    home_page = HomePage(driver)
+
+    try:
+        if auth_snapshots.restore(driver, role, username):
+            home_page.wait_for_homepage_loaded()
+            return home_page
+
+    except TimeoutException:
+        print(f"[WARN] Restored {role} session did not reach home page")
+
+    auth_snapshots.invalidate(role)
+
+    reset_browser_state(driver, [origin_of(URL), LOGIN_ORIGIN])
+
+    # The reset moved the browser to a new tab
+    if har_store is not None:
+        har_store.reattach(driver)
+
+    driver.get(URL)
+
+    return None
+
+
+def stub_login(login_page, principal, volunteer=None):
+    """Local auth stub: sign in without the Microsoft pages."""
+    login_page.stub_login(principal, volunteer=volunteer)
+
+    home_page = HomePage(login_page.driver)
+    home_page.wait_for_homepage_loaded()
+
+    return home_page
 
 
 # ---------------------------------------------------
@@ -60,9 +745,18 @@ def driver():
 # ---------------------------------------------------
 
 @pytest.fixture(scope="function")
-def login_with_volunteer(driver):
+def login_with_volunteer(driver, auth_snapshots, har_store):
     login_page = LoginPage(driver)
 
+    if login_page.is_auth_stub():
+        return stub_login(login_page, "volunteer", volunteer=LOCAL_VOLUNTEER)
+
+    home_page = restore_login(
+        driver, auth_snapshots, "volunteer", VOLUNTEER_USERNAME, har_store
+    )
+    if home_page:
+        return home_page
+
     # Enter username (never log credentials)
     login_page.enter_username(VOLUNTEER_USERNAME)
     login_page.click_next_button()
@@ -92,6 +786,9 @@ def login_with_volunteer(driver):
     home_page = HomePage(driver)
     home_page.wait_for_homepage_loaded()
 
+    if auth_snapshots is not None:
+        auth_snapshots.capture(driver, "volunteer", VOLUNTEER_USERNAME)
+
     return home_page
 
 
@@ -100,9 +797,18 @@ def login_with_volunteer(driver):
 # ---------------------------------------------------
 
 @pytest.fixture(scope="function")
-def admin_home_page(driver):
+def admin_home_page(driver, auth_snapshots, har_store):
     login_page = LoginPage(driver)
 
+    if login_page.is_auth_stub():
+        return stub_login(login_page, "admin")
+
+    home_page = restore_login(
+        driver, auth_snapshots, "admin", ADMIN_USERNAME, har_store
+    )
+    if home_page:
+        return home_page
+
     login_page.enter_username(ADMIN_USERNAME)
     login_page.click_next_button()
 
@@ -121,9 +827,64 @@ def admin_home_page(driver):
     home_page = HomePage(driver)
     home_page.wait_for_homepage_loaded()
 
+    if auth_snapshots is not None:
+        auth_snapshots.capture(driver, "admin", ADMIN_USERNAME)
+
     return home_page
 
 
+# ---------------------------------------------------
+# Data API Client (test state without the UI)
+# ---------------------------------------------------
+
+@pytest.fixture(scope="session")
+def api_session():
+    """One pooled requests.Session per worker."""
+    session = ApiSession()
+
+    yield session
+
+    session.close()
+
+
+@pytest.fixture(scope="function")
+def api_client(driver, api_session, har_store):
+    """
+    Data API as the browser's signed-in user: seed checkouts and read
+    history counts directly. Cookies are taken from the browser on
+    first call, so list it after the login fixture.
+    """
+    if har_store is None:
+        yield api_session.for_browser(driver)
+        return
+
+    # Into (or from) the same HAR file as the browser's calls
+    api_session.use_har(har_store.cassette)
+
+    yield api_session.for_browser(driver)
+
+    api_session.use_har(None)
+
+
+@pytest.fixture(scope="session")
+def data_namespace():
+    """This worker's own household and item copies (see data_namespace.py)."""
+    return DataNamespace(worker_name(), prefix=E2E_DATA_PREFIX)
+
+
+@pytest.fixture(scope="function")
+def test_data(data_namespace, api_client, har_store):
+    """
+    test_data.household / test_data.item("Curtains"): provisioned
+    through api_client on first use in the worker, so after login.
+    """
+    # Every HAR file has to hold its own provisioning calls
+    if har_store is not None:
+        data_namespace.forget()
+
+    return WorkerData(data_namespace, api_client)
+
+
 # ---------------------------------------------------
 # Page Fixtures
 # ---------------------------------------------------
@@ -187,4 +948,98 @@ def pytest_runtest_makereport(item, call):
 
     except Exception as e:
         # Never allow screenshot failure to break the test run
-        print(f"[WARN] Screenshot capture failed: {e}")
\ No newline at end of file
+        print(f"[WARN] Screenshot capture failed: {e}")
+
+
+
+# ---------------------------------------------------
+# Terminal Summary
+# ---------------------------------------------------
+
+def pytest_terminal_summary(terminalreporter, config):
+    report = config.stash.get(COMMAND_REPORT_KEY, None)
+
+    if report:
+        write_command_hot_spots(terminalreporter, config, report)
+
+    metrics = config.stash.get(PAGE_METRICS_REPORT_KEY, None)
+
+    if metrics:
+        write_page_metrics(terminalreporter, metrics)
+
+    network = config.stash.get(NETWORK_REPORT_KEY, None)
+
+    if network:
+        write_network_patterns(terminalreporter, network)
+
+    # Summed over the workers under xdist, else this process's launcher
+    totals = config.stash.get(CHROME_LAUNCH_TOTALS_KEY, None)
+    launcher = config.stash.get(CHROME_LAUNCHER_KEY, None)
+
+    if totals is None and launcher is not None:
+        totals = {
+            "launches": launcher.launches,
+            "launch_seconds": launcher.launch_seconds,
+        }
+
+    if not totals or totals["launches"] == 0:
+        return
+
+    terminalreporter.write_line(
+        f"Browser mode: {config.getoption('--browser-mode')} — "
+        f"{totals['launches']} Chrome launch(es), "
+        f"{totals['launch_seconds']:.1f}s spent launching"
+    )
+
+    clicks = ROUND_TRIP_STATS.calls.get("click", 0)
+
+    if clicks:
+        terminalreporter.write_line(
+            f"Clicks: {clicks}, "
+            f"{ROUND_TRIP_STATS.average('click'):.1f} WebDriver round trips per click"
+        )
+
+
+def write_command_hot_spots(terminalreporter, config, report):
+    totals = report["totals"]
+
+    terminalreporter.write_sep("-", "WebDriver command hot spots")
+    terminalreporter.write_line(
+        f"{totals['commands']} commands, {totals['seconds']:.1f}s "
+        f"over {totals['tests']} test(s) — full report in "
+        f"{config.getoption('--profile-commands')}"
+    )
+
+    for row in report["hot_methods"][:HOT_SPOT_LIMIT]:
+        growth = "  grows with data" if row["grows_with_data"] else ""
+        terminalreporter.write_line(
+            f"{row['seconds']:8.2f}s {row['commands']:6d} cmds "
+            f"{row['calls']:4d} calls  {row['method']}{growth}"
+        )
+
+
+def write_page_metrics(terminalreporter, metrics):
+    terminalreporter.write_sep("-", "Page time-to-usable")
+
+    for page, row in metrics["pages"].items():
+        terminalreporter.write_line(
+            f"{page:<10} median {row['median_ms']:.0f}ms  "
+            f"p90 {row['p90_ms']:.0f}ms  max {row['max_ms']:.0f}ms  "
+            f"({row['samples']} samples, {row['violations']} over budget)"
+        )
+
+
+def write_network_patterns(terminalreporter, network):
+    totals = network["totals"]
+
+    terminalreporter.write_sep("-", "Data API requests")
+    terminalreporter.write_line(
+        f"{totals['requests']} requests, {totals['bytes'] / 1024:.0f} KiB "
+        f"over {totals['flows']} test(s)"
+    )
+
+    for pattern in network["patterns"][:HOT_FLOW_LIMIT]:
+        terminalreporter.write_line(
+            f"{pattern['kind']:<9} {pattern['method']:<5} {pattern['endpoint']} "
+            f"({len(pattern['tests'])} test(s))"
+        )
@@ -0,0 +1,32 @@
+"""
+Benchmarks for the stored procedures in database/procedures, run
+against a SQL Server database (DATABASE_CONNECTION_STRING, as for
+database/bootstrap_db.ps1) with ``python -m tests.db_benchmarks``.
+
+They create and remove their own rows, but put real load on the
+server: use a development or CI database. ``volume`` fills one with
+years of synthetic history for the benchmarks that need it.
+"""
+from tests.db_benchmarks.batches import CheckoutBenchmark, InventoryChangeBenchmark, InventoryResetBenchmark
+from tests.db_benchmarks.connection import BenchmarkError, connect
+from tests.db_benchmarks.contention import ContentionBenchmark
+from tests.db_benchmarks.history import HistoryBenchmark
+from tests.db_benchmarks.indexes import IndexBenchmark
+from tests.db_benchmarks.layout import LayoutBenchmark
+from tests.db_benchmarks.volume import BulkLoader, VolumeGenerator, delete_generated, load_volume
+
+__all__ = [
+    "BenchmarkError",
+    "BulkLoader",
+    "CheckoutBenchmark",
+    "ContentionBenchmark",
+    "HistoryBenchmark",
+    "IndexBenchmark",
+    "InventoryChangeBenchmark",
+    "InventoryResetBenchmark",
+    "LayoutBenchmark",
+    "VolumeGenerator",
+    "connect",
+    "delete_generated",
+    "load_volume",
+]
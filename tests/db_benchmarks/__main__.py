@@ -0,0 +1,251 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from tests.db_benchmarks import BenchmarkError, ContentionBenchmark, connect
+from tests.db_benchmarks import batches, contention, history, indexes, layout, volume
+
+
+def run_contention(args):
+    report = ContentionBenchmark(
+        args.connection_string,
+        connections=args.connections,
+        operations=args.operations,
+        hot_items=args.hot_items,
+        restock_rate=args.restock_rate,
+        reset_rate=args.reset_rate,
+        seed=args.seed,
+        keep_data=args.keep_data,
+    ).run()
+
+    return report, contention.format_report(report)
+
+
+def run_batches(benchmark):
+    def run(args):
+        report = benchmark(
+            args.connection_string,
+            sizes=args.sizes,
+            calls=args.calls,
+            seed=args.seed,
+            keep_data=args.keep_data,
+        ).run()
+
+        return report, batches.format_report(report)
+
+    return run
+
+
+def run_history(args):
+    report = history.HistoryBenchmark(
+        args.connection_string,
+        volumes=args.volumes,
+        repeat=args.repeat,
+        days=args.days,
+        seed=args.seed,
+        keep_data=args.keep_data,
+    ).run()
+    text = history.format_report(report)
+
+    if not all(window["identical"] for step in report["steps"] for window in step["windows"].values()):
+        raise BenchmarkError(f"the queries returned different rows\n{text}")
+
+    return report, text
+
+
+def run_indexes(args):
+    report = indexes.IndexBenchmark(
+        args.connection_string,
+        volumes=args.volumes,
+        residents=args.residents,
+        repeat=args.repeat,
+        days=args.days,
+        seed=args.seed,
+        keep_data=args.keep_data,
+    ).run()
+    text = indexes.format_report(report)
+
+    if not all(step["identical"] for step in report["steps"]):
+        raise BenchmarkError(f"the queries returned different rows with and without the indexes\n{text}")
+
+    return report, text
+
+
+def run_layout(args):
+    report = layout.LayoutBenchmark(
+        args.connection_string,
+        transactions=args.transactions,
+        inserts=args.inserts,
+        repeat=args.repeat,
+        days=args.days,
+        seed=args.seed,
+        keep_data=args.keep_data,
+    ).run()
+    text = layout.format_report(report)
+
+    if not all(scan["identical"] for scan in report["scans"].values()):
+        raise BenchmarkError(f"the two layouts returned different rows\n{text}")
+
+    return report, text
+
+
+def run_volume(args):
+    connection = connect(args.connection_string, autocommit=False)
+
+    try:
+        if args.delete:
+            report = volume.delete_generated(connection)
+            return report, f"Deleted {report['transactions']} transactions, {report['items']} items"
+
+        def progress(totals, seconds):
+            print(f"{totals['transactions']} transactions, {totals['items']} items ({seconds:.0f}s)", file=sys.stderr)
+
+        generator = volume.VolumeGenerator(
+            volume.Catalog.load(connection),
+            transactions=args.transactions,
+            days=args.days,
+            welcome_basket_rate=args.welcome_basket_rate,
+            restock_rate=args.restock_rate,
+            correction_rate=args.correction_rate,
+            edit_rate=args.edit_rate,
+            seed=args.seed,
+        )
+        report = volume.BulkLoader(connection, batch_size=args.batch_size, progress=progress).load(generator)
+    finally:
+        connection.close()
+
+    return report, (
+        f"Loaded {report['transactions']} transactions, {report['items']} items in "
+        f"{report['seconds']:.1f}s ({report['rows_per_second']} rows/s)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.db_benchmarks",
+        description="Benchmark the inventory stored procedures on SQL Server.",
+    )
+    parser.add_argument(
+        "--connection-string",
+        default=None,
+        help="defaults to DATABASE_CONNECTION_STRING (ADO.NET or ODBC syntax)",
+    )
+    parser.add_argument("--json", metavar="PATH", default=None, help="also write the report as JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    contention_parser = commands.add_parser(
+        "contention",
+        help="checkouts, restocks and resets on the same hot items from many connections",
+    )
+    contention_parser.add_argument("--connections", type=int, default=16)
+    contention_parser.add_argument("--operations", type=int, default=2000, help="procedure calls in total")
+    contention_parser.add_argument("--hot-items", type=int, default=4)
+    contention_parser.add_argument("--restock-rate", type=float, default=contention.RESTOCK_RATE)
+    contention_parser.add_argument("--reset-rate", type=float, default=contention.RESET_RATE)
+    contention_parser.add_argument("--seed", type=int, default=None)
+    contention_parser.add_argument("--keep-data", action="store_true", help="leave the hot items and their transactions")
+    contention_parser.set_defaults(run=run_contention)
+
+    checkout_parser = commands.add_parser(
+        "checkout",
+        help="ProcessCheckout against its cursor-based predecessor, carts of 1-50 lines",
+    )
+    checkout_parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(batches.CheckoutBenchmark.SIZES), help="cart lines per step",
+    )
+    checkout_parser.add_argument("--calls", type=int, default=batches.CALLS, help="timed calls per version and size")
+    checkout_parser.add_argument("--seed", type=int, default=None)
+    checkout_parser.add_argument("--keep-data", action="store_true", help="leave the batch items and their transactions")
+    checkout_parser.set_defaults(run=run_batches(batches.CheckoutBenchmark))
+
+    for name, benchmark, help_text in (
+        ("inventory-change", batches.InventoryChangeBenchmark,
+         "ProcessInventoryChange against its cursor-based predecessor, restocks of 1-1000 lines"),
+        ("inventory-reset", batches.InventoryResetBenchmark,
+         "ProcessInventoryResetQuantity with @items against one single-item call per item"),
+    ):
+        inventory_parser = commands.add_parser(name, help=help_text)
+        inventory_parser.add_argument(
+            "--sizes", type=int, nargs="+", default=list(benchmark.SIZES), help="items per step",
+        )
+        inventory_parser.add_argument(
+            "--calls", type=int, default=benchmark.CALLS, help="timed calls per version and size",
+        )
+        inventory_parser.add_argument("--seed", type=int, default=None)
+        inventory_parser.add_argument("--keep-data", action="store_true", help="leave the batch items and their transactions")
+        inventory_parser.set_defaults(run=run_batches(benchmark))
+
+    history_parser = commands.add_parser(
+        "history",
+        help="GetCheckoutHistory against its correlated-subquery predecessor on growing volumes",
+    )
+    history_parser.add_argument(
+        "--volumes", type=int, nargs="+", default=list(history.VOLUMES), help="generated transactions per step",
+    )
+    history_parser.add_argument("--repeat", type=int, default=history.REPEAT, help="timed runs per query")
+    history_parser.add_argument("--days", type=int, default=volume.DEFAULT_DAYS)
+    history_parser.add_argument("--seed", type=int, default=0)
+    history_parser.add_argument("--keep-data", action="store_true", help="leave the generated transactions")
+    history_parser.set_defaults(run=run_history)
+
+    indexes_parser = commands.add_parser(
+        "indexes",
+        help="history and resident lookups without and with the secondary indexes",
+    )
+    indexes_parser.add_argument(
+        "--volumes", type=int, nargs="+", default=list(history.VOLUMES), help="generated transactions per step",
+    )
+    indexes_parser.add_argument("--residents", type=int, default=indexes.RESIDENTS, help="residents to spread checkouts over")
+    indexes_parser.add_argument("--repeat", type=int, default=history.REPEAT, help="timed runs per query")
+    indexes_parser.add_argument("--days", type=int, default=volume.DEFAULT_DAYS)
+    indexes_parser.add_argument("--seed", type=int, default=0)
+    indexes_parser.add_argument("--keep-data", action="store_true", help="leave the generated transactions and residents")
+    indexes_parser.set_defaults(run=run_indexes)
+
+    layout_parser = commands.add_parser(
+        "layout",
+        help="inserts and date-range scans with Transactions clustered on its GUID or on transaction_date",
+    )
+    layout_parser.add_argument(
+        "--transactions", type=int, default=layout.TRANSACTIONS, help="generated history loaded into both tables",
+    )
+    layout_parser.add_argument("--inserts", type=int, default=layout.INSERTS, help="single-row inserts per table")
+    layout_parser.add_argument("--repeat", type=int, default=history.REPEAT, help="timed runs per query")
+    layout_parser.add_argument("--days", type=int, default=volume.DEFAULT_DAYS)
+    layout_parser.add_argument("--seed", type=int, default=0)
+    layout_parser.add_argument("--keep-data", action="store_true", help="leave the two scratch tables")
+    layout_parser.set_defaults(run=run_layout)
+
+    volume_parser = commands.add_parser(
+        "volume",
+        help="bulk-load years of synthetic checkouts, edits, baskets and restocks",
+    )
+    volume_parser.add_argument("--transactions", type=int, default=100_000, help="transactions before edits")
+    volume_parser.add_argument("--days", type=int, default=volume.DEFAULT_DAYS, help="spread over this many days up to now")
+    volume_parser.add_argument("--welcome-basket-rate", type=float, default=volume.WELCOME_BASKET_RATE)
+    volume_parser.add_argument("--restock-rate", type=float, default=volume.RESTOCK_RATE)
+    volume_parser.add_argument("--correction-rate", type=float, default=volume.CORRECTION_RATE)
+    volume_parser.add_argument("--edit-rate", type=float, default=volume.EDIT_RATE, help="share of checkouts edited later")
+    volume_parser.add_argument("--batch-size", type=int, default=volume.BATCH_SIZE)
+    volume_parser.add_argument("--seed", type=int, default=None)
+    volume_parser.add_argument("--delete", action="store_true", help="remove previously generated transactions instead")
+    volume_parser.set_defaults(run=run_volume)
+
+    args = parser.parse_args()
+
+    try:
+        report, text = args.run(args)
+    except BenchmarkError as error:
+        sys.exit(f"error: {error}")
+
+    print(text)
+
+    if args.json:
+        path = Path(args.json)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2, default=str))
+
+
+if __name__ == "__main__":
+    main()
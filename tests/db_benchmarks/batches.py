@@ -0,0 +1,607 @@
+import json
+import random
+import time
+import uuid
+
+from tests.db_benchmarks.connection import BenchmarkError, connect, procedure_result, pyodbc, rows
+from tests.load_test.stats import EndpointStats
+
+
+BATCH_ITEM_PREFIX = "Bench Batch"
+BATCH_ITEM_STOCK = 1_000_000
+
+CALLS = 200
+# Restocks and stock counts of up to 1000 lines take long enough that
+# fewer calls give stable percentiles
+INVENTORY_CALLS = 20
+WARMUP_CALLS = 5
+
+# ProcessCheckout as it was before the set-based rewrite: JSON_VALUE per
+# field and a cursor calling LogTransactionItem once per cart line.
+# Created under its own name for the comparison and dropped afterwards.
+LEGACY_PROCESS_CHECKOUT = "BenchLegacyProcessCheckout"
+LEGACY_PROCESS_CHECKOUT_SQL = f"""
+CREATE PROCEDURE {LEGACY_PROCESS_CHECKOUT}
+    @user_id INT,
+    @items NVARCHAR(MAX),
+    @message NVARCHAR(MAX) = NULL OUTPUT,
+    @resident_id INT,
+    @new_transaction_id UNIQUEIDENTIFIER,
+    @original_transaction_id UNIQUEIDENTIFIER = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    IF ISJSON(@items) = 0
+    BEGIN
+        THROW 51002, 'Invalid JSON format', 1;
+    END
+
+    DECLARE @CartItems CartItemsType
+
+    INSERT INTO @CartItems (ItemId, Quantity, AdditionalNotes)
+    SELECT
+        ItemId = JSON_VALUE([value], '$.id'),
+        Quantity = JSON_VALUE([value], '$.quantity'),
+        AdditionalNotes = JSON_VALUE([value], '$.additional_notes')
+    FROM OPENJSON(@items, '$')
+
+    BEGIN TRANSACTION
+
+    BEGIN TRY
+        IF EXISTS (SELECT 1 FROM Transactions WHERE id = @new_transaction_id)
+        BEGIN
+            ROLLBACK TRANSACTION;
+            SELECT
+                'Error' AS Status,
+                'DUPLICATE_TRANSACTION' AS ErrorCode,
+                'Transaction with this ID already exists.' AS message;
+            RETURN;
+        END
+
+        UPDATE i
+        SET i.quantity = i.quantity - ci.Quantity
+        FROM Items i
+        JOIN @CartItems ci ON i.id = ci.ItemId
+
+        DECLARE @CurrentItemId INT
+        DECLARE @CurrentQuantity INT
+        DECLARE @CurrentAdditionalNotes NVARCHAR(255)
+        DECLARE @transaction_type INT = CASE WHEN @original_transaction_id IS NOT NULL THEN 4 ELSE 1 END
+
+        DECLARE item_cursor CURSOR FOR
+        SELECT ItemId, Quantity, AdditionalNotes FROM @CartItems
+
+        OPEN item_cursor
+        FETCH NEXT FROM item_cursor INTO @CurrentItemId, @CurrentQuantity, @CurrentAdditionalNotes
+
+        EXEC LogTransaction
+            @user_id = @user_id,
+            @transaction_type = @transaction_type,
+            @resident_id = @resident_id,
+            @new_transaction_id = @new_transaction_id,
+            @parent_transaction_id = @original_transaction_id;
+
+        WHILE @@FETCH_STATUS = 0
+        BEGIN
+            EXEC LogTransactionItem
+                @transaction_id = @new_transaction_id,
+                @item_id = @CurrentItemId,
+                @quantity = @CurrentQuantity,
+                @additional_notes = @CurrentAdditionalNotes;
+
+            FETCH NEXT FROM item_cursor INTO @CurrentItemId, @CurrentQuantity, @CurrentAdditionalNotes
+        END
+
+        CLOSE item_cursor
+        DEALLOCATE item_cursor
+
+        COMMIT TRANSACTION
+
+        SELECT
+            'Success' as Status,
+            @new_transaction_id AS message
+    END TRY
+    BEGIN CATCH
+        IF @@TRANCOUNT > 0
+            ROLLBACK TRANSACTION
+
+        IF CURSOR_STATUS('local', 'item_cursor') >= 0
+        BEGIN
+            CLOSE item_cursor
+            DEALLOCATE item_cursor
+        END
+
+        SELECT
+            'Error' AS Status,
+            CONCAT(
+                'Error: ', ERROR_MESSAGE(),
+                ', Error Number: ', ERROR_NUMBER(),
+                ', State: ', ERROR_STATE()
+            ) AS message;
+    END CATCH
+END
+"""
+
+_CHECKOUT_PARAMS = "@user_id = ?, @items = ?, @resident_id = ?, @new_transaction_id = ?"
+
+# ProcessInventoryChange before the set-based rewrite, as above
+LEGACY_PROCESS_INVENTORY_CHANGE = "BenchLegacyProcessInventoryChange"
+LEGACY_PROCESS_INVENTORY_CHANGE_SQL = f"""
+CREATE PROCEDURE {LEGACY_PROCESS_INVENTORY_CHANGE}
+    @user_id INT,
+    @item NVARCHAR(MAX),
+    @new_transaction_id UNIQUEIDENTIFIER
+AS
+BEGIN
+    SET NOCOUNT ON;
+
+    IF ISJSON(@item) = 0
+    BEGIN
+        THROW 51002, 'Invalid JSON format', 1;
+    END
+
+    DECLARE @CartItems CartItemsType
+
+    INSERT INTO @CartItems (ItemId, Quantity, AdditionalNotes)
+    SELECT
+        ItemId = JSON_VALUE([value], '$.id'),
+        Quantity = JSON_VALUE([value], '$.quantity'),
+        AdditionalNotes = JSON_VALUE([value], '$.additional_notes')
+    FROM OPENJSON(@item, '$')
+
+    BEGIN TRANSACTION
+
+    BEGIN TRY
+        IF EXISTS (SELECT 1 FROM Transactions WHERE id = @new_transaction_id)
+        BEGIN
+            ROLLBACK TRANSACTION;
+            SELECT
+                'Error' AS Status,
+                'DUPLICATE_TRANSACTION' AS ErrorCode,
+                'Transaction with this ID already exists.' AS message;
+            RETURN;
+        END
+
+        DECLARE @CurrentItemId INT
+        DECLARE @CurrentQuantity INT
+        DECLARE @CurrentAdditionalNotes NVARCHAR(255)
+
+        DECLARE item_cursor CURSOR FOR
+        SELECT ItemId, Quantity, AdditionalNotes FROM @CartItems
+
+        OPEN item_cursor
+        FETCH NEXT FROM item_cursor INTO @CurrentItemId, @CurrentQuantity, @CurrentAdditionalNotes
+
+        EXEC LogTransaction
+            @user_id = @user_id,
+            @transaction_type = 2,
+            @resident_id = NULL,
+            @new_transaction_id = @new_transaction_id;
+
+        WHILE @@FETCH_STATUS = 0
+        BEGIN
+            EXEC LogTransactionItem
+                @transaction_id = @new_transaction_id,
+                @item_id = @CurrentItemId,
+                @quantity = @CurrentQuantity,
+                @additional_notes = @CurrentAdditionalNotes;
+
+            FETCH NEXT FROM item_cursor INTO @CurrentItemId, @CurrentQuantity, @CurrentAdditionalNotes
+        END
+
+        UPDATE i
+        SET i.quantity = i.quantity + ci.Quantity
+        FROM Items i
+        JOIN @CartItems ci ON i.id = ci.ItemId
+
+        CLOSE item_cursor
+        DEALLOCATE item_cursor
+
+        COMMIT TRANSACTION
+
+        SELECT
+            'Success' as Status,
+            @new_transaction_id AS message
+    END TRY
+    BEGIN CATCH
+        IF @@TRANCOUNT > 0
+            ROLLBACK TRANSACTION
+
+        IF CURSOR_STATUS('local', 'item_cursor') >= 0
+        BEGIN
+            CLOSE item_cursor
+            DEALLOCATE item_cursor
+        END
+
+        SELECT
+            'Error' AS Status,
+            CONCAT(
+                'Error: ', ERROR_MESSAGE(),
+                ', Error Number: ', ERROR_NUMBER(),
+                ', State: ', ERROR_STATE()
+            ) AS message;
+    END CATCH
+END
+"""
+
+_INVENTORY_CHANGE_PARAMS = "@user_id = ?, @item = ?, @new_transaction_id = ?"
+
+# ProcessInventoryResetQuantity before it took @items: one item per call,
+# so a stock count of N items was N calls and N CORRECTION transactions
+LEGACY_PROCESS_INVENTORY_RESET = "BenchLegacyProcessInventoryResetQuantity"
+LEGACY_PROCESS_INVENTORY_RESET_SQL = f"""
+CREATE PROCEDURE {LEGACY_PROCESS_INVENTORY_RESET}
+    @user_id INT,
+    @item_id INT,
+    @new_quantity INT,
+    @additional_notes NVARCHAR(MAX),
+    @new_transaction_id UNIQUEIDENTIFIER
+AS
+BEGIN
+    SET NOCOUNT ON;
+    SET XACT_ABORT ON;
+
+    BEGIN TRY
+        IF @item_id IS NULL
+        BEGIN
+            SELECT 'Error' AS Status, 'Invalid item id' AS message;
+            RETURN;
+        END
+
+        IF @new_quantity IS NULL OR @new_quantity < 0
+        BEGIN
+            SELECT 'Error' AS Status, 'Invalid quantity (must be non-negative)' AS message;
+            RETURN;
+        END
+
+        IF NOT EXISTS (SELECT 1 FROM Items WHERE id = @item_id)
+        BEGIN
+            SELECT 'Error' AS Status, 'Item not found' AS message;
+            RETURN;
+        END
+
+        IF EXISTS (SELECT 1 FROM Transactions WHERE id = @new_transaction_id)
+        BEGIN
+            SELECT
+                'Error' AS Status,
+                'DUPLICATE_TRANSACTION' AS ErrorCode,
+                'Transaction with this ID already exists.' AS message;
+            RETURN;
+        END
+
+        BEGIN TRANSACTION;
+
+            UPDATE Items
+            SET quantity = @new_quantity
+            WHERE id = @item_id;
+
+            IF @@ROWCOUNT <> 1
+            BEGIN
+                RAISERROR('Item update failed', 16, 1);
+            END
+
+            EXEC LogTransaction
+                @user_id = @user_id,
+                @transaction_type = 3,
+                @resident_id = NULL,
+                @new_transaction_id = @new_transaction_id;
+
+            EXEC LogTransactionItem
+                @transaction_id = @new_transaction_id,
+                @item_id = @item_id,
+                @quantity = @new_quantity,
+                @additional_notes = @additional_notes;
+
+        COMMIT TRANSACTION;
+
+        SELECT
+            'Success' AS Status,
+            CAST(@new_transaction_id AS NVARCHAR(36)) AS message;
+    END TRY
+    BEGIN CATCH
+        SELECT
+            'Error' AS Status,
+            CONCAT(
+                'Error: ', ERROR_MESSAGE(),
+                ', Number: ', ERROR_NUMBER()
+            ) AS message;
+    END CATCH
+END
+"""
+
+_RESET_ITEM_PARAMS = "@user_id = ?, @item_id = ?, @new_quantity = ?, @additional_notes = ?, @new_transaction_id = ?"
+
+
+def _items_json(items):
+    return json.dumps([
+        {"id": item_id, "quantity": quantity, "additional_notes": notes}
+        for item_id, quantity, notes in items
+    ])
+
+
+class BatchBenchmark:
+    """
+    Latency of procedure versions that log a batch of items, for each
+    batch size in turn. Calls to the versions are interleaved, one
+    connection, ``calls`` per version and size after a few warm-ups.
+
+    Subclasses name the versions (VERSIONS: label -> EXEC statement),
+    the legacy procedures to create for the run (LEGACY: name -> CREATE
+    PROCEDURE text) and build each call's parameters. A version that
+    takes several round trips for one batch overrides ``statements``.
+
+    Afterwards every successful call must have logged one
+    TransactionItems row per batch line. The batch items are created
+    for the run and deleted with their transactions afterwards unless
+    ``keep_data``.
+    """
+
+    SIZES = ()
+    VERSIONS = {}
+    LEGACY = {}
+    CALLS = CALLS
+
+    def __init__(self, connection_string=None, sizes=None, calls=None, seed=None, keep_data=False):
+        self.connection_string = connection_string
+        self.sizes = sorted(sizes or self.SIZES)
+        self.calls = calls or self.CALLS
+        self.random = random.Random(seed)
+        self.keep_data = keep_data
+        self.run_id = uuid.uuid4().hex[:8]
+
+    @property
+    def settings(self):
+        return {
+            "sizes": self.sizes,
+            "calls": self.calls,
+            "versions": list(self.VERSIONS),
+        }
+
+    def run(self):
+        connection = connect(self.connection_string)
+
+        try:
+            fixture = self._setup(connection)
+
+            try:
+                return self._measure(connection, fixture)
+            finally:
+                if not self.keep_data:
+                    self._cleanup(connection, fixture)
+        finally:
+            connection.close()
+
+    def params(self, fixture, items, transaction_id):
+        """Parameters of one call logging ``items`` [(item_id, quantity, notes)]."""
+        raise NotImplementedError
+
+    def statements(self, version, fixture, items, transaction_id):
+        """
+        [(sql, params, transaction id, lines logged)] that ``version`` runs
+        for one batch; one call of its EXEC statement unless overridden.
+        """
+        return [(self.VERSIONS[version], self.params(fixture, items, transaction_id), transaction_id, len(items))]
+
+    # ---------------------------------------------------
+    # Fixture
+    # ---------------------------------------------------
+
+    def _setup(self, connection):
+        cursor = connection.cursor()
+
+        cursor.execute("SELECT TOP 1 id FROM Users ORDER BY id")
+        users = rows(cursor)
+        cursor.execute("SELECT TOP 1 id FROM Residents ORDER BY id")
+        residents = rows(cursor)
+        cursor.execute("SELECT TOP 1 id FROM Categories ORDER BY id")
+        categories = rows(cursor)
+
+        if not (users and residents and categories):
+            raise BenchmarkError("The database needs a user, a resident and a category (run data_seed / data_test)")
+
+        for name, sql in self.LEGACY.items():
+            cursor.execute(f"DROP PROCEDURE IF EXISTS {name}")
+            cursor.execute(sql)
+
+        # Items are found again by name, so no statement needs one
+        # parameter per item (SQL Server allows 2100)
+        item_names = f"{BATCH_ITEM_PREFIX} % ({self.run_id})"
+        cursor.fast_executemany = True
+        cursor.executemany(
+            "INSERT INTO Items (name, type, category_id, quantity, threshold, items_per_basket) "
+            "VALUES (?, 'General', ?, ?, 0, 0)",
+            [
+                (f"{BATCH_ITEM_PREFIX} {index + 1} ({self.run_id})", categories[0]["id"], BATCH_ITEM_STOCK)
+                for index in range(max(self.sizes))
+            ],
+        )
+        cursor.execute("SELECT id FROM Items WHERE name LIKE ? ORDER BY id", item_names)
+
+        return {
+            "user_id": users[0]["id"],
+            "resident_id": residents[0]["id"],
+            "item_names": item_names,
+            "item_ids": [row["id"] for row in rows(cursor)],
+        }
+
+    def _cleanup(self, connection, fixture):
+        cursor = connection.cursor()
+        batch_items = "SELECT id FROM Items WHERE name LIKE ?"
+
+        cursor.execute(
+            f"SELECT DISTINCT transaction_id FROM TransactionItems WHERE item_id IN ({batch_items})",
+            fixture["item_names"],
+        )
+        transaction_ids = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute(f"DELETE FROM TransactionItems WHERE item_id IN ({batch_items})", fixture["item_names"])
+
+        for start in range(0, len(transaction_ids), 500):
+            chunk = transaction_ids[start:start + 500]
+            cursor.execute(
+                f"DELETE FROM Transactions WHERE id IN ({', '.join('?' for _ in chunk)})", *chunk
+            )
+
+        cursor.execute("DELETE FROM Items WHERE name LIKE ?", fixture["item_names"])
+
+        for name in self.LEGACY:
+            cursor.execute(f"DROP PROCEDURE IF EXISTS {name}")
+
+    # ---------------------------------------------------
+    # Calls
+    # ---------------------------------------------------
+
+    def _batch(self, fixture, size):
+        return [
+            (item_id, self.random.randint(1, 3), self.random.choice((None, "", "Bench note")))
+            for item_id in self.random.sample(fixture["item_ids"], size)
+        ]
+
+    def _measure(self, connection, fixture):
+        cursor = connection.cursor()
+        stats = {}
+        failed = 0
+        # transaction id -> lines sent, for the ledger check
+        expected = {}
+
+        for size in self.sizes:
+            for call in range(WARMUP_CALLS + self.calls):
+                versions = list(self.VERSIONS.items())
+                self.random.shuffle(versions)
+
+                for version, _ in versions:
+                    statements = self.statements(version, fixture, self._batch(fixture, size), str(uuid.uuid4()))
+                    logged = {}
+                    started = time.perf_counter()
+
+                    for sql, params, transaction_id, lines in statements:
+                        try:
+                            cursor.execute(sql, *params)
+                            result = procedure_result(cursor)
+
+                            while cursor.nextset():
+                                pass
+                        except pyodbc.Error as error:
+                            result = {"Status": "Error", "message": str(error)}
+
+                        if result.get("Status") != "Success":
+                            break
+
+                        logged[transaction_id] = lines
+
+                    latency_ms = (time.perf_counter() - started) * 1000
+                    ok = len(logged) == len(statements)
+                    expected.update(logged)
+
+                    if not ok:
+                        failed += 1
+
+                    if call >= WARMUP_CALLS:
+                        stats.setdefault((version, size), EndpointStats()).add(latency_ms, ok)
+
+        results = {}
+
+        for size in self.sizes:
+            results[size] = {
+                version: stats[(version, size)].summary(seconds=0) for version in self.VERSIONS
+            }
+
+        return {
+            "settings": self.settings,
+            "failed": failed,
+            "sizes": results,
+            "ledger_mismatches": self._check_ledger(connection, fixture, expected),
+        }
+
+    @staticmethod
+    def _check_ledger(connection, fixture, expected):
+        """Successful calls that did not log one row per batch line."""
+        cursor = connection.cursor()
+        cursor.execute(
+            "SELECT transaction_id, COUNT(*) AS lines FROM TransactionItems "
+            "WHERE item_id IN (SELECT id FROM Items WHERE name LIKE ?) GROUP BY transaction_id",
+            fixture["item_names"],
+        )
+        logged = {str(row["transaction_id"]).lower(): row["lines"] for row in rows(cursor)}
+
+        return sum(1 for transaction_id, lines in expected.items() if logged.get(transaction_id) != lines)
+
+
+class CheckoutBenchmark(BatchBenchmark):
+    """ProcessCheckout against its cursor-based predecessor, carts of 1-50 lines."""
+
+    SIZES = (1, 2, 5, 10, 20, 50)
+    VERSIONS = {
+        "cursor": f"EXEC {LEGACY_PROCESS_CHECKOUT} {_CHECKOUT_PARAMS}",
+        "set-based": f"EXEC ProcessCheckout {_CHECKOUT_PARAMS}",
+    }
+    LEGACY = {LEGACY_PROCESS_CHECKOUT: LEGACY_PROCESS_CHECKOUT_SQL}
+
+    def params(self, fixture, items, transaction_id):
+        return fixture["user_id"], _items_json(items), fixture["resident_id"], transaction_id
+
+
+class InventoryChangeBenchmark(BatchBenchmark):
+    """ProcessInventoryChange against its cursor-based predecessor, restocks of 1-1000 lines."""
+
+    SIZES = (1, 100, 1000)
+    VERSIONS = {
+        "cursor": f"EXEC {LEGACY_PROCESS_INVENTORY_CHANGE} {_INVENTORY_CHANGE_PARAMS}",
+        "set-based": f"EXEC ProcessInventoryChange {_INVENTORY_CHANGE_PARAMS}",
+    }
+    LEGACY = {LEGACY_PROCESS_INVENTORY_CHANGE: LEGACY_PROCESS_INVENTORY_CHANGE_SQL}
+    CALLS = INVENTORY_CALLS
+
+    def params(self, fixture, items, transaction_id):
+        return fixture["user_id"], _items_json(items), transaction_id
+
+
+class InventoryResetBenchmark(BatchBenchmark):
+    """
+    A stock count of 1-1000 items: one single-item call per item, as
+    before ProcessInventoryResetQuantity took @items, against one call
+    with all of them.
+    """
+
+    SIZES = (1, 100, 1000)
+    VERSIONS = {
+        "per item": f"EXEC {LEGACY_PROCESS_INVENTORY_RESET} {_RESET_ITEM_PARAMS}",
+        "set-based": "EXEC ProcessInventoryResetQuantity @user_id = ?, @items = ?, @new_transaction_id = ?",
+    }
+    LEGACY = {LEGACY_PROCESS_INVENTORY_RESET: LEGACY_PROCESS_INVENTORY_RESET_SQL}
+    CALLS = INVENTORY_CALLS
+
+    def params(self, fixture, items, transaction_id):
+        return fixture["user_id"], _items_json(items), transaction_id
+
+    def statements(self, version, fixture, items, transaction_id):
+        if version != "per item":
+            return super().statements(version, fixture, items, transaction_id)
+
+        statements = []
+
+        for item_id, quantity, notes in items:
+            transaction_id = str(uuid.uuid4())
+            params = (fixture["user_id"], item_id, quantity, notes, transaction_id)
+            statements.append((self.VERSIONS[version], params, transaction_id, 1))
+
+        return statements
+
+
+def format_report(report):
+    versions = report["settings"]["versions"]
+    lines = [
+        f"{report['failed']} failed calls, {report['ledger_mismatches']} transactions logged wrongly",
+        "",
+        f"{'lines':>5} " + " ".join(f"{version + ' p50':>16} {'p95':>9}" for version in versions),
+    ]
+
+    for size, results in report["sizes"].items():
+        lines.append(
+            f"{size:>5} " + " ".join(
+                f"{results[version]['p50_ms']:>14.2f}ms {results[version]['p95_ms']:>7.2f}ms" for version in versions
+            )
+        )
+
+    return "\n".join(lines)
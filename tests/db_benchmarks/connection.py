@@ -0,0 +1,173 @@
+import os
+import re
+
+try:
+    import pyodbc
+except ImportError:  # pragma: no cover - optional, see requirements.txt
+    pyodbc = None
+
+
+# Same variable database/bootstrap_db.ps1 reads
+CONNECTION_STRING_ENV = "DATABASE_CONNECTION_STRING"
+
+# Used when the connection string names no ODBC driver (the ADO.NET
+# strings in docs/database-setup.md don't)
+DEFAULT_DRIVER = os.getenv("ODBC_DRIVER", "ODBC Driver 18 for SQL Server")
+
+# ADO.NET keywords the ODBC driver spells differently
+_ODBC_KEYWORDS = {
+    "user id": "UID",
+    "password": "PWD",
+    "initial catalog": "Database",
+    "integrated security": "Trusted_Connection",
+}
+
+DEADLOCK_ERROR = 1205
+
+# "Error Number: 1205" (ProcessCheckout / ProcessInventoryChange CATCH)
+# or "Number: 1205" (ProcessInventoryResetQuantity)
+_ERROR_NUMBER = re.compile(r"Number: (\d+)")
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def odbc_connection_string(connection_string):
+    parts = []
+
+    for part in filter(None, (p.strip() for p in connection_string.split(";"))):
+        key, _, value = part.partition("=")
+        key = _ODBC_KEYWORDS.get(key.strip().lower(), key.strip())
+
+        if key == "Trusted_Connection" and value.strip().lower() in ("sspi", "true"):
+            value = "yes"
+
+        parts.append(f"{key}={value.strip()}")
+
+    if not any(part.lower().startswith("driver=") for part in parts):
+        parts.insert(0, f"Driver={{{DEFAULT_DRIVER}}}")
+
+    return ";".join(parts)
+
+
+def connect(connection_string=None, autocommit=True):
+    """
+    New connection to the Inventory database. Procedures manage their
+    own transactions, so connections default to autocommit.
+    """
+    if pyodbc is None:
+        raise BenchmarkError("pyodbc is not installed: pip install -r tests/db_benchmarks/requirements.txt")
+
+    connection_string = connection_string or os.getenv(CONNECTION_STRING_ENV)
+
+    if not connection_string:
+        raise BenchmarkError(f"Set {CONNECTION_STRING_ENV} or pass --connection-string")
+
+    return pyodbc.connect(odbc_connection_string(connection_string), autocommit=autocommit)
+
+
+def error_number(message):
+    """SQL Server error number in a procedure's Status = 'Error' message."""
+    match = _ERROR_NUMBER.search(message or "")
+    return int(match.group(1)) if match else None
+
+
+def is_deadlock(error):
+    """A pyodbc error for SQL Server's 1205 (SQLSTATE 40001)."""
+    return bool(error.args) and error.args[0] == "40001"
+
+
+def rows(cursor):
+    columns = [column[0] for column in cursor.description or ()]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def procedure_result(cursor):
+    """First row of the first result set a procedure returned, as a dict."""
+    while cursor.description is None:
+        if not cursor.nextset():
+            return {}
+
+    result = rows(cursor)
+    return result[0] if result else {}
+
+
+# ---------------------------------------------------
+# Server Counters
+# ---------------------------------------------------
+
+_LOCK_WAITS_SQL = """
+SELECT SUM(waiting_tasks_count) AS waits, SUM(wait_time_ms) AS wait_ms
+FROM {view}
+WHERE wait_type LIKE 'LCK[_]M[_]%'
+"""
+
+_DEADLOCKS_SQL = """
+SELECT cntr_value AS deadlocks
+FROM sys.dm_os_performance_counters
+WHERE counter_name = 'Number of Deadlocks/sec' AND instance_name = '_Total'
+"""
+
+_INDEX_LOCKS_SQL = """
+SELECT OBJECT_NAME(s.object_id) AS table_name,
+       SUM(s.row_lock_wait_count) AS row_lock_waits,
+       SUM(s.row_lock_wait_in_ms) AS row_lock_wait_ms,
+       SUM(s.page_lock_wait_count) AS page_lock_waits,
+       SUM(s.page_lock_wait_in_ms) AS page_lock_wait_ms
+FROM sys.dm_db_index_operational_stats(DB_ID(), NULL, NULL, NULL) s
+WHERE s.object_id IN (OBJECT_ID('dbo.Items'), OBJECT_ID('dbo.Transactions'), OBJECT_ID('dbo.TransactionItems'))
+GROUP BY s.object_id
+"""
+
+
+def lock_counters(connection):
+    """
+    Cumulative lock waits, deadlocks and per-table row/page lock waits.
+    Values the login may not read (VIEW SERVER STATE) are None; Azure
+    SQL Database only has the database-scoped wait view.
+    """
+    cursor = connection.cursor()
+    counters = {"lock_waits": None, "lock_wait_ms": None, "deadlocks": None, "tables": {}}
+
+    for view in ("sys.dm_os_wait_stats", "sys.dm_db_wait_stats"):
+        try:
+            cursor.execute(_LOCK_WAITS_SQL.format(view=view))
+            row = rows(cursor)[0]
+            counters["lock_waits"], counters["lock_wait_ms"] = row["waits"], row["wait_ms"]
+            break
+        except pyodbc.Error:
+            continue
+
+    try:
+        cursor.execute(_DEADLOCKS_SQL)
+        result = rows(cursor)
+        counters["deadlocks"] = result[0]["deadlocks"] if result else None
+    except pyodbc.Error:
+        pass
+
+    try:
+        cursor.execute(_INDEX_LOCKS_SQL)
+        counters["tables"] = {row.pop("table_name"): row for row in rows(cursor)}
+    except pyodbc.Error:
+        pass
+
+    return counters
+
+
+def counter_delta(before, after):
+    def minus(a, b):
+        return None if a is None or b is None else a - b
+
+    tables = {}
+
+    for table, row in after["tables"].items():
+        base = before["tables"].get(table, {})
+        tables[table] = {key: minus(value, base.get(key, 0)) for key, value in row.items()}
+
+    return {
+        "lock_waits": minus(after["lock_waits"], before["lock_waits"]),
+        "lock_wait_ms": minus(after["lock_wait_ms"], before["lock_wait_ms"]),
+        "deadlocks": minus(after["deadlocks"], before["deadlocks"]),
+        "tables": tables,
+    }
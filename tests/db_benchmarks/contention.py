@@ -0,0 +1,415 @@
+import random
+import threading
+import time
+import uuid
+
+from tests.db_benchmarks.connection import (
+    DEADLOCK_ERROR,
+    BenchmarkError,
+    connect,
+    counter_delta,
+    error_number,
+    is_deadlock,
+    lock_counters,
+    procedure_result,
+    pyodbc,
+    rows,
+)
+from tests.load_test.stats import EndpointStats
+
+
+# TransactionTypes (database/data_seed/transaction_type_data.sql)
+CHECKOUT = 1
+RESTOCK = 2
+CORRECTION = 3
+
+HOT_ITEM_PREFIX = "Bench Hot"
+HOT_ITEM_STOCK = 1_000_000
+
+# Share of operations per procedure; the rest are checkouts
+RESTOCK_RATE = 0.2
+RESET_RATE = 0.05
+
+MAX_CART_ITEMS = 5
+MAX_QUANTITY = 3
+
+_CHECKOUT_SQL = (
+    "EXEC ProcessCheckout @user_id = ?, @items = ?, @resident_id = ?, @new_transaction_id = ?"
+)
+_RESTOCK_SQL = "EXEC ProcessInventoryChange @user_id = ?, @item = ?, @new_transaction_id = ?"
+_RESET_SQL = (
+    "EXEC ProcessInventoryResetQuantity @user_id = ?, @item_id = ?, @new_quantity = ?, "
+    "@additional_notes = ?, @new_transaction_id = ?"
+)
+
+
+class Outcomes:
+    """What the clients saw, per procedure; shared by the worker threads."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.stats = {}
+        self.committed = 0
+        self.deadlocks = 0
+        self.aborted = 0
+        # transaction ids the procedures reported as committed
+        self.transaction_ids = set()
+
+    def add(self, procedure, latency_ms, status, transaction_id):
+        with self.lock:
+            self.stats.setdefault(procedure, EndpointStats()).add(latency_ms, status == "committed")
+
+            if status == "committed":
+                self.committed += 1
+                self.transaction_ids.add(transaction_id)
+            elif status == "deadlock":
+                self.deadlocks += 1
+            else:
+                self.aborted += 1
+
+
+class ContentionBenchmark:
+    """
+    Many connections running ProcessCheckout, ProcessInventoryChange
+    and ProcessInventoryResetQuantity against the same few "hot" items,
+    in random item order so row locks are taken in conflicting orders.
+
+    Reports, besides latency per procedure:
+    - lock waits and deadlocks from the server's counters (when the
+      login may read them) and as seen by the clients;
+    - aborted calls (Status = 'Error' or a driver error);
+    - the ledger check: every committed call left exactly one
+      Transactions row, and each hot item's final quantity equals its
+      last CORRECTION plus the CHECKOUT / RESTOCK rows logged after it.
+
+    The hot items are created for the run (and deleted with their
+    transactions afterwards unless ``keep_data``): run it against a
+    development or CI database, not production.
+    """
+
+    def __init__(self, connection_string=None, connections=16, operations=2000,
+                 hot_items=4, restock_rate=RESTOCK_RATE, reset_rate=RESET_RATE,
+                 seed=None, keep_data=False):
+        self.connection_string = connection_string
+        self.connections = connections
+        self.operations = operations
+        self.hot_items = hot_items
+        self.restock_rate = restock_rate
+        self.reset_rate = reset_rate
+        self.seed = seed
+        self.keep_data = keep_data
+        self.run_id = uuid.uuid4().hex[:8]
+        self._remaining = operations
+        self._remaining_lock = threading.Lock()
+
+    @property
+    def settings(self):
+        return {
+            "connections": self.connections,
+            "operations": self.operations,
+            "hot_items": self.hot_items,
+            "restock_rate": self.restock_rate,
+            "reset_rate": self.reset_rate,
+        }
+
+    def run(self):
+        admin = connect(self.connection_string)
+
+        try:
+            fixture = self._setup(admin)
+
+            try:
+                return self._measure(admin, fixture)
+            finally:
+                if not self.keep_data:
+                    self._cleanup(admin, fixture)
+        finally:
+            admin.close()
+
+    # ---------------------------------------------------
+    # Fixture
+    # ---------------------------------------------------
+
+    def _setup(self, connection):
+        cursor = connection.cursor()
+
+        cursor.execute("SELECT TOP 1 id FROM Users ORDER BY id")
+        users = rows(cursor)
+        cursor.execute("SELECT TOP 1 id FROM Residents ORDER BY id")
+        residents = rows(cursor)
+        cursor.execute("SELECT TOP 1 id FROM Categories ORDER BY id")
+        categories = rows(cursor)
+
+        if not (users and residents and categories):
+            raise BenchmarkError("The database needs a user, a resident and a category (run data_seed / data_test)")
+
+        item_ids = []
+
+        for index in range(self.hot_items):
+            cursor.execute(
+                "INSERT INTO Items (name, type, category_id, quantity, threshold, items_per_basket) "
+                "OUTPUT inserted.id VALUES (?, 'General', ?, ?, 0, 0)",
+                f"{HOT_ITEM_PREFIX} {index + 1} ({self.run_id})", categories[0]["id"], HOT_ITEM_STOCK,
+            )
+            item_ids.append(cursor.fetchone()[0])
+
+        return {
+            "user_id": users[0]["id"],
+            "resident_id": residents[0]["id"],
+            "item_ids": item_ids,
+        }
+
+    def _cleanup(self, connection, fixture):
+        cursor = connection.cursor()
+        marks = ", ".join("?" for _ in fixture["item_ids"])
+
+        cursor.execute(
+            f"SELECT DISTINCT transaction_id FROM TransactionItems WHERE item_id IN ({marks})",
+            *fixture["item_ids"],
+        )
+        transaction_ids = [row[0] for row in cursor.fetchall()]
+
+        cursor.execute(f"DELETE FROM TransactionItems WHERE item_id IN ({marks})", *fixture["item_ids"])
+
+        for start in range(0, len(transaction_ids), 500):
+            chunk = transaction_ids[start:start + 500]
+            cursor.execute(
+                f"DELETE FROM Transactions WHERE id IN ({', '.join('?' for _ in chunk)})", *chunk
+            )
+
+        cursor.execute(f"DELETE FROM Items WHERE id IN ({marks})", *fixture["item_ids"])
+
+    # ---------------------------------------------------
+    # Load
+    # ---------------------------------------------------
+
+    def _measure(self, admin, fixture):
+        outcomes = Outcomes()
+        connections = [connect(self.connection_string) for _ in range(self.connections)]
+        before = lock_counters(admin)
+        started = time.perf_counter()
+
+        threads = [
+            threading.Thread(
+                target=self._worker,
+                args=(connection, fixture, outcomes, random.Random(None if self.seed is None else self.seed + index)),
+                name=f"contention-{index}",
+            )
+            for index, connection in enumerate(connections)
+        ]
+
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        seconds = time.perf_counter() - started
+        server = counter_delta(before, lock_counters(admin))
+
+        for connection in connections:
+            connection.close()
+
+        operations = outcomes.committed + outcomes.deadlocks + outcomes.aborted
+
+        return {
+            "settings": self.settings,
+            "seconds": round(seconds, 2),
+            "operations_per_second": round(operations / seconds, 1) if seconds else 0.0,
+            "committed": outcomes.committed,
+            "deadlocks": outcomes.deadlocks,
+            "aborted": outcomes.aborted,
+            "server": server,
+            "procedures": {
+                procedure: stats.summary(seconds)
+                for procedure, stats in sorted(outcomes.stats.items())
+            },
+            "ledger": self._check_ledger(admin, fixture, outcomes),
+        }
+
+    def _take(self):
+        with self._remaining_lock:
+            if self._remaining <= 0:
+                return False
+
+            self._remaining -= 1
+            return True
+
+    def _worker(self, connection, fixture, outcomes, rng):
+        cursor = connection.cursor()
+
+        while self._take():
+            transaction_id = str(uuid.uuid4())
+            roll = rng.random()
+
+            if roll < self.reset_rate:
+                procedure = "ProcessInventoryResetQuantity"
+                sql = _RESET_SQL
+                params = (
+                    fixture["user_id"], rng.choice(fixture["item_ids"]),
+                    rng.randint(HOT_ITEM_STOCK // 2, HOT_ITEM_STOCK), "contention benchmark", transaction_id,
+                )
+            else:
+                # Random order: conflicting lock orders between carts
+                items = rng.sample(fixture["item_ids"], rng.randint(1, min(MAX_CART_ITEMS, len(fixture["item_ids"]))))
+                cart = ", ".join(
+                    f'{{"id": {item_id}, "quantity": {rng.randint(1, MAX_QUANTITY)}}}' for item_id in items
+                )
+
+                if roll < self.reset_rate + self.restock_rate:
+                    procedure = "ProcessInventoryChange"
+                    sql = _RESTOCK_SQL
+                    params = (fixture["user_id"], f"[{cart}]", transaction_id)
+                else:
+                    procedure = "ProcessCheckout"
+                    sql = _CHECKOUT_SQL
+                    params = (fixture["user_id"], f"[{cart}]", fixture["resident_id"], transaction_id)
+
+            started = time.perf_counter()
+            status = self._call(cursor, sql, params)
+            outcomes.add(procedure, (time.perf_counter() - started) * 1000, status, transaction_id)
+
+    @staticmethod
+    def _call(cursor, sql, params):
+        """committed, deadlock or aborted."""
+        try:
+            cursor.execute(sql, *params)
+            result = procedure_result(cursor)
+
+            while cursor.nextset():
+                pass
+
+        except pyodbc.Error as error:
+            return "deadlock" if is_deadlock(error) else "aborted"
+
+        if result.get("Status") == "Success":
+            return "committed"
+
+        if error_number(result.get("message")) == DEADLOCK_ERROR:
+            return "deadlock"
+
+        return "aborted"
+
+    # ---------------------------------------------------
+    # Ledger
+    # ---------------------------------------------------
+
+    def _check_ledger(self, connection, fixture, outcomes):
+        cursor = connection.cursor()
+        marks = ", ".join("?" for _ in fixture["item_ids"])
+
+        cursor.execute(
+            f"""
+            SELECT ti.item_id, ti.quantity, t.id AS transaction_id,
+                   t.transaction_type, t.transaction_date
+            FROM TransactionItems ti
+            JOIN Transactions t ON t.id = ti.transaction_id
+            WHERE ti.item_id IN ({marks})
+            """,
+            *fixture["item_ids"],
+        )
+        ledger = rows(cursor)
+
+        cursor.execute(f"SELECT id, quantity FROM Items WHERE id IN ({marks})", *fixture["item_ids"])
+        actual = {row["id"]: row["quantity"] for row in rows(cursor)}
+
+        logged = {str(row["transaction_id"]).lower() for row in ledger}
+        reported = {transaction_id.lower() for transaction_id in outcomes.transaction_ids}
+
+        return {
+            # Committed calls without a ledger row, and ledger rows of calls that reported an error
+            "missing_transactions": len(reported - logged),
+            "unreported_transactions": len(logged - reported),
+            "items": [
+                item_ledger(item_id, [row for row in ledger if row["item_id"] == item_id], actual[item_id])
+                for item_id in fixture["item_ids"]
+            ],
+        }
+
+
+def item_ledger(item_id, entries, actual, initial=HOT_ITEM_STOCK):
+    """
+    Expected quantity of one item from its ledger rows.
+
+    Rows are applied in transaction_date order. transaction_date is a
+    DATETIME (3 ms ticks) taken when the Transactions row is inserted,
+    so rows in the same tick as the last CORRECTION may have been
+    applied before or after it: the check accepts the whole range.
+    """
+    def delta(entry):
+        return -entry["quantity"] if entry["transaction_type"] == CHECKOUT else entry["quantity"]
+
+    resets = [entry for entry in entries if entry["transaction_type"] == CORRECTION]
+    base, cutoff = initial, None
+
+    if resets:
+        last = max(resets, key=lambda entry: entry["transaction_date"])
+        base, cutoff = last["quantity"], last["transaction_date"]
+
+    after = sum(
+        delta(entry) for entry in entries
+        if entry["transaction_type"] != CORRECTION and (cutoff is None or entry["transaction_date"] > cutoff)
+    )
+    ties = [
+        delta(entry) for entry in entries
+        if entry["transaction_type"] != CORRECTION and cutoff is not None and entry["transaction_date"] == cutoff
+    ]
+
+    low = base + after + sum(value for value in ties if value < 0)
+    high = base + after + sum(value for value in ties if value > 0)
+
+    return {
+        "item_id": item_id,
+        "actual": actual,
+        "expected": base + after if not ties else [low, high],
+        "resets": len(resets),
+        "matches": low <= actual <= high,
+    }
+
+
+def format_report(report):
+    server = report["server"]
+    ledger = report["ledger"]
+
+    def value(number):
+        return "n/a" if number is None else f"{number:,}"
+
+    lines = [
+        f"{report['committed'] + report['deadlocks'] + report['aborted']} calls in {report['seconds']:.1f}s "
+        f"({report['operations_per_second']:.0f}/s) over {report['settings']['connections']} connections, "
+        f"{report['settings']['hot_items']} hot items",
+        f"committed {report['committed']}, deadlocks {report['deadlocks']}, aborted {report['aborted']}",
+        f"server: lock waits {value(server['lock_waits'])} ({value(server['lock_wait_ms'])} ms), "
+        f"deadlocks {value(server['deadlocks'])}",
+    ]
+
+    for table, row in sorted(server["tables"].items()):
+        lines.append(
+            f"  {table:<17} row lock waits {value(row['row_lock_waits'])} ({value(row['row_lock_wait_ms'])} ms), "
+            f"page lock waits {value(row['page_lock_waits'])} ({value(row['page_lock_wait_ms'])} ms)"
+        )
+
+    lines.append("")
+    lines.append(f"{'procedure':<31} {'calls':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'failed':>7}")
+
+    for procedure, row in report["procedures"].items():
+        lines.append(
+            f"{procedure:<31} {row['requests']:>7} {row['p50_ms']:>7.1f}ms {row['p95_ms']:>7.1f}ms "
+            f"{row['p99_ms']:>7.1f}ms {row['errors']:>7}"
+        )
+
+    mismatched = [item for item in ledger["items"] if not item["matches"]]
+    lines.append("")
+    lines.append(
+        f"ledger: {len(ledger['items']) - len(mismatched)}/{len(ledger['items'])} items match, "
+        f"{ledger['missing_transactions']} committed calls not logged, "
+        f"{ledger['unreported_transactions']} logged calls reported as failed"
+    )
+
+    for item in mismatched:
+        lines.append(
+            f"  item {item['item_id']}: quantity {item['actual']}, ledger says {item['expected']} "
+            f"({item['resets']} resets)"
+        )
+
+    return "\n".join(lines)
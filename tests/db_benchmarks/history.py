@@ -0,0 +1,219 @@
+import hashlib
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from tests.db_benchmarks.connection import connect
+from tests.db_benchmarks.volume import DEFAULT_DAYS, BulkLoader, Catalog, VolumeGenerator, delete_generated
+
+
+VOLUMES = (10_000, 100_000, 1_000_000)
+
+# Date ranges the History page asks for, counted back from the end of
+# the generated history; None is all of it
+WINDOWS = {"7 days": 7, "90 days": 90, "all": None}
+
+REPEAT = 5
+
+CHECKOUT_HISTORY_SQL = "EXEC GetCheckoutHistory @start_date = ?, @end_date = ?"
+
+# GetCheckoutHistory before the set-based rewrite, to compare against:
+# total_quantity as a correlated subquery per transaction (plus the
+# page_cursor column added since, so the rows stay comparable)
+LEGACY_CHECKOUT_HISTORY_SQL = """
+SELECT
+    Transactions.user_id,
+    Transactions.id AS transaction_id,
+    Transactions.transaction_type,
+    Transactions.parent_transaction_id,
+    Transactions.resident_id,
+    Residents.name AS resident_name,
+    Units.unit_number,
+    Buildings.id AS building_id,
+    Buildings.code AS building_code,
+    Buildings.name AS building_name,
+    Transactions.transaction_date,
+    (
+        SELECT ISNULL(SUM(net_qty), 0)
+        FROM (
+            SELECT ti2.item_id, SUM(ISNULL(ti2.quantity, 0)) AS net_qty
+            FROM TransactionItems ti2
+            WHERE ti2.transaction_id = Transactions.id
+              OR ti2.transaction_id IN (
+                  SELECT corrections.id FROM Transactions AS corrections
+                  WHERE corrections.parent_transaction_id = Transactions.id
+              )
+            GROUP BY ti2.item_id
+            HAVING SUM(ISNULL(ti2.quantity, 0)) > 0
+        ) AS per_item_sums
+    ) AS total_quantity,
+    MAX(CASE WHEN ti.item_id IN (171, 172) THEN ti.item_id ELSE NULL END) AS welcome_basket_item_id,
+    MAX(CASE WHEN ti.item_id IN (171, 172) THEN ti.quantity ELSE NULL END) AS welcome_basket_quantity,
+    CONVERT(VARCHAR(23), Transactions.transaction_date, 126) + '|' + CAST(Transactions.id AS VARCHAR(36)) AS page_cursor
+FROM Transactions
+INNER JOIN Residents ON Transactions.resident_id = Residents.id
+INNER JOIN Units ON Residents.unit_id = Units.id
+INNER JOIN Buildings ON Units.building_id = Buildings.id
+LEFT JOIN TransactionItems ti ON ti.transaction_id = Transactions.id
+WHERE [transaction_date] >= ?
+    AND [transaction_date] <= ?
+    AND [transaction_type] IN (SELECT id FROM TransactionTypes WHERE transaction_type IN ('CHECKOUT', 'CHECKOUT_EDIT'))
+GROUP BY
+    Transactions.user_id,
+    Transactions.id,
+    Transactions.transaction_type,
+    Transactions.parent_transaction_id,
+    Transactions.resident_id,
+    Residents.name,
+    Units.unit_number,
+    Buildings.id,
+    Buildings.code,
+    Buildings.name,
+    Transactions.transaction_date
+ORDER BY Transactions.transaction_date DESC, Transactions.id
+"""
+
+QUERIES = {
+    "legacy": LEGACY_CHECKOUT_HISTORY_SQL,
+    "GetCheckoutHistory": CHECKOUT_HISTORY_SQL,
+}
+
+
+def result_digest(cursor, ordered=True):
+    """
+    Row count and a hash of every row of the first result set, in order
+    unless ``ordered`` is False (for queries without an ORDER BY).
+    """
+    while cursor.description is None:
+        if not cursor.nextset():
+            return 0, None
+
+    values = [repr(tuple(row)) for row in cursor.fetchall()]
+    digest = hashlib.sha256()
+
+    for value in values if ordered else sorted(values):
+        digest.update(value.encode())
+
+    return len(values), digest.hexdigest()
+
+
+def time_query(connection, sql, params, repeat=REPEAT, ordered=True):
+    """
+    One warm-up run, then ``repeat`` timed ones (including fetching every
+    row). Returns the timings and the digest of the last result.
+    """
+    cursor = connection.cursor()
+    timings = []
+
+    for run in range(repeat + 1):
+        started = time.perf_counter()
+        cursor.execute(sql, params)
+        count, digest = result_digest(cursor, ordered)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        if run:
+            timings.append(elapsed)
+
+    return {
+        "rows": count,
+        "digest": digest,
+        "median_ms": round(statistics.median(timings), 2),
+        "min_ms": round(min(timings), 2),
+    }
+
+
+class HistoryBenchmark:
+    """
+    Times history queries on growing volumes of synthetic transactions
+    (see volume.py): generated rows are added up to each of ``volumes``
+    in turn, and every query is run over each of WINDOWS.
+
+    Queries of a step must return the same rows in the same order; the
+    report flags a step where they do not.
+    """
+
+    def __init__(self, connection_string=None, volumes=VOLUMES, queries=None, windows=None,
+                 repeat=REPEAT, days=DEFAULT_DAYS, seed=0, keep_data=False):
+        self.connection_string = connection_string
+        self.volumes = sorted(volumes)
+        self.queries = queries or QUERIES
+        self.windows = windows or WINDOWS
+        self.repeat = repeat
+        self.days = days
+        self.seed = seed
+        self.keep_data = keep_data
+        self.end = datetime.now().replace(microsecond=0)
+
+    @property
+    def settings(self):
+        return {
+            "volumes": self.volumes,
+            "queries": list(self.queries),
+            "windows": list(self.windows),
+            "repeat": self.repeat,
+            "days": self.days,
+            "seed": self.seed,
+        }
+
+    def run(self):
+        connection = connect(self.connection_string, autocommit=False)
+        steps = []
+
+        try:
+            catalog = Catalog.load(connection)
+            loaded = 0
+
+            for volume in self.volumes:
+                generator = VolumeGenerator(
+                    catalog, volume - loaded, days=self.days, end=self.end, seed=self.seed + volume,
+                )
+                loading = BulkLoader(connection).load(generator)
+                loaded = volume
+                self._update_statistics(connection)
+
+                steps.append({"volume": volume, "loading": loading, "windows": self._measure(connection)})
+        finally:
+            try:
+                if not self.keep_data:
+                    delete_generated(connection)
+            finally:
+                connection.close()
+
+        return {"settings": self.settings, "steps": steps}
+
+    @staticmethod
+    def _update_statistics(connection):
+        cursor = connection.cursor()
+        cursor.execute("UPDATE STATISTICS Transactions; UPDATE STATISTICS TransactionItems;")
+        connection.commit()
+
+    def _measure(self, connection):
+        windows = {}
+
+        for window, days in self.windows.items():
+            start = self.end - timedelta(days=days) if days else datetime(2000, 1, 1)
+            params = (start, self.end)
+            results = {name: time_query(connection, sql, params, self.repeat) for name, sql in self.queries.items()}
+            connection.commit()
+
+            identical = len({(result["rows"], result["digest"]) for result in results.values()}) == 1
+            windows[window] = {"identical": identical, "queries": results}
+
+        return windows
+
+
+def format_report(report):
+    lines = [f"{'transactions':>12} {'window':<8} {'query':<32} {'rows':>8} {'median':>10} {'min':>10}"]
+
+    for step in report["steps"]:
+        for window, measured in step["windows"].items():
+            for name, result in measured["queries"].items():
+                lines.append(
+                    f"{step['volume']:>12,} {window:<8} {name:<32} {result['rows']:>8} "
+                    f"{result['median_ms']:>8.1f}ms {result['min_ms']:>8.1f}ms"
+                )
+
+            if not measured["identical"]:
+                lines.append(f"{'':>12} {window:<8} results differ")
+
+    return "\n".join(lines)
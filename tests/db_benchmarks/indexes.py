@@ -0,0 +1,200 @@
+import re
+from datetime import datetime, timedelta
+
+from tests.db_benchmarks.connection import BenchmarkError, connect, rows
+from tests.db_benchmarks.history import REPEAT, VOLUMES, time_query
+from tests.db_benchmarks.volume import DEFAULT_DAYS, BulkLoader, Catalog, VolumeGenerator, delete_generated
+from tests.local_dab.config import REPO_ROOT
+
+
+# Table scripts whose CREATE INDEX statements are benchmarked; they are
+# read from the scripts so the benchmark always measures what ships
+INDEX_SCRIPTS = (
+    REPO_ROOT / "database" / "tables" / "transaction.sql",
+    REPO_ROOT / "database" / "tables" / "transaction_item.sql",
+)
+
+# Residents the generated checkouts are spread over (the test data has
+# only a handful, which no resident lookup would need an index for)
+RESIDENTS = 2000
+RESIDENT_PREFIX = "Bench Resident"
+
+STATES = ("without indexes", "with indexes")
+
+_CREATE_INDEX = re.compile(
+    r"^CREATE\s+(?:UNIQUE\s+)?(?:NONCLUSTERED\s+)?INDEX\s+(?P<name>\w+)\s+ON\s+(?:dbo\.)?(?P<table>\w+)\b.*?;",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL,
+)
+
+
+def index_statements(scripts=INDEX_SCRIPTS):
+    """[(name, table, CREATE INDEX statement)] from the table scripts."""
+    return [
+        (match["name"], match["table"], match.group(0))
+        for script in scripts
+        for match in _CREATE_INDEX.finditer(script.read_text(encoding="utf-8-sig"))
+    ]
+
+
+class IndexBenchmark:
+    """
+    The procedures that look up Transactions by date, resident or parent
+    timed without and with the secondary indexes of database/tables, on
+    growing volumes of synthetic history (see volume.py).
+
+    At each volume every query runs in both states and must return the
+    same rows. The indexes are (re)created at the end whatever happens.
+    """
+
+    def __init__(self, connection_string=None, volumes=VOLUMES, residents=RESIDENTS,
+                 repeat=REPEAT, days=DEFAULT_DAYS, seed=0, keep_data=False):
+        self.connection_string = connection_string
+        self.volumes = sorted(volumes)
+        self.residents = residents
+        self.repeat = repeat
+        self.days = days
+        self.seed = seed
+        self.keep_data = keep_data
+        self.end = datetime.now().replace(microsecond=0)
+        self.indexes = index_statements()
+
+        if not self.indexes:
+            raise BenchmarkError("No CREATE INDEX statements in " + ", ".join(map(str, INDEX_SCRIPTS)))
+
+    @property
+    def settings(self):
+        return {
+            "volumes": self.volumes,
+            "residents": self.residents,
+            "repeat": self.repeat,
+            "days": self.days,
+            "seed": self.seed,
+            "indexes": [name for name, _, _ in self.indexes],
+        }
+
+    def run(self):
+        connection = connect(self.connection_string, autocommit=False)
+        steps = []
+
+        try:
+            catalog = Catalog.load(connection)
+            catalog.residents = self._add_residents(connection)
+            loaded = 0
+
+            for volume in self.volumes:
+                generator = VolumeGenerator(
+                    catalog, volume - loaded, days=self.days, end=self.end, seed=self.seed + volume,
+                )
+                loading = BulkLoader(connection).load(generator)
+                loaded = volume
+                queries = self._queries(connection, catalog)
+                states = {}
+
+                for state in STATES:
+                    self._set_indexes(connection, state == "with indexes")
+                    states[state] = {
+                        # CheckPastCheckout has no ORDER BY: its row order may change with the plan
+                        name: time_query(connection, sql, params, self.repeat, ordered=name != "CheckPastCheckout")
+                        for name, sql, params in queries
+                    }
+                    connection.commit()
+
+                steps.append({
+                    "volume": volume,
+                    "loading": loading,
+                    "states": states,
+                    "identical": all(
+                        len({(states[state][name]["rows"], states[state][name]["digest"]) for state in STATES}) == 1
+                        for name, _, _ in queries
+                    ),
+                })
+        finally:
+            try:
+                self._set_indexes(connection, True)
+
+                if not self.keep_data:
+                    delete_generated(connection)
+                    self._delete_residents(connection)
+            finally:
+                connection.close()
+
+        return {"settings": self.settings, "steps": steps}
+
+    def _queries(self, connection, catalog):
+        """(name, sql, params) for a resident and a corrected checkout of the current data."""
+        cursor = connection.cursor()
+        cursor.execute(
+            "SELECT TOP 1 parent_transaction_id AS id FROM Transactions "
+            "WHERE parent_transaction_id IS NOT NULL ORDER BY transaction_date DESC"
+        )
+        corrected = rows(cursor)
+        connection.commit()
+        resident_id = catalog.residents[len(catalog.residents) // 2]
+        week, quarter = self.end - timedelta(days=7), self.end - timedelta(days=90)
+
+        queries = [
+            ("GetCheckoutHistory 7 days", "EXEC GetCheckoutHistory @start_date = ?, @end_date = ?", (week, self.end)),
+            ("GetCheckoutHistory 90 days", "EXEC GetCheckoutHistory @start_date = ?, @end_date = ?", (quarter, self.end)),
+            ("GetInventoryHistory 90 days", "EXEC GetInventoryHistory @start_date = ?, @end_date = ?", (quarter, self.end)),
+            ("GetLastResidentVisit", "EXEC GetLastResidentVisit @resident_id = ?", (resident_id,)),
+            ("CheckPastCheckout", "EXEC CheckPastCheckout @resident_id = ?", (resident_id,)),
+        ]
+
+        if corrected:
+            queries.append(("GetTransaction (with edits)", "EXEC GetTransaction @id = ?", (str(corrected[0]["id"]),)))
+
+        return queries
+
+    def _set_indexes(self, connection, present):
+        cursor = connection.cursor()
+
+        for name, table, statement in self.indexes:
+            cursor.execute(f"DROP INDEX IF EXISTS {name} ON {table}")
+
+            if present:
+                cursor.execute(statement)
+
+        cursor.execute("UPDATE STATISTICS Transactions; UPDATE STATISTICS TransactionItems;")
+        connection.commit()
+
+    # ---------------------------------------------------
+    # Residents
+    # ---------------------------------------------------
+
+    def _add_residents(self, connection):
+        cursor = connection.cursor()
+        cursor.execute("SELECT id FROM Units")
+        units = [row["id"] for row in rows(cursor)]
+
+        cursor.fast_executemany = True
+        cursor.executemany(
+            "INSERT INTO Residents (name, unit_id) VALUES (?, ?)",
+            [(f"{RESIDENT_PREFIX} {n}", units[n % len(units)]) for n in range(self.residents)],
+        )
+        cursor.execute("SELECT id FROM Residents WHERE name LIKE ? ORDER BY id", (f"{RESIDENT_PREFIX} %",))
+        residents = [row["id"] for row in rows(cursor)]
+        connection.commit()
+
+        return residents
+
+    @staticmethod
+    def _delete_residents(connection):
+        cursor = connection.cursor()
+        cursor.execute("DELETE FROM Residents WHERE name LIKE ?", (f"{RESIDENT_PREFIX} %",))
+        connection.commit()
+
+
+def format_report(report):
+    lines = [f"{'transactions':>12} {'query':<30} {'rows':>7} " + " ".join(f"{state:>16}" for state in STATES)]
+
+    for step in report["steps"]:
+        states = step["states"]
+
+        for name, first in states[STATES[0]].items():
+            timings = " ".join(f"{states[state][name]['median_ms']:>14.1f}ms" for state in STATES)
+            lines.append(f"{step['volume']:>12,} {name:<30} {first['rows']:>7} {timings}")
+
+        if not step["identical"]:
+            lines.append(f"{'':>12} results differ between the two states")
+
+    return "\n".join(lines)
@@ -0,0 +1,308 @@
+import random
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from tests.db_benchmarks.connection import connect, rows
+from tests.db_benchmarks.history import REPEAT, WINDOWS, time_query
+from tests.db_benchmarks.volume import BATCH_SIZE, DEFAULT_DAYS, Catalog, VolumeGenerator
+from tests.load_test.stats import EndpointStats
+
+
+TRANSACTIONS = 1_000_000
+INSERTS = 5000
+
+# Transactions as database/tables/transaction.sql created it before and
+# after clustering on transaction_date, under their own names so both
+# can be filled with the same rows side by side
+LAYOUTS = {
+    "guid clustered": ("BenchTransactionsGuid", """
+CREATE TABLE BenchTransactionsGuid (
+    id UNIQUEIDENTIFIER PRIMARY KEY,
+    user_id INT NOT NULL,
+    resident_id INT,
+    transaction_type INT NOT NULL,
+    transaction_date DATETIME DEFAULT GETDATE() NOT NULL,
+    building_id INT,
+    parent_transaction_id UNIQUEIDENTIFIER NULL
+);
+CREATE NONCLUSTERED INDEX IX_BenchTransactionsGuid_TransactionDate_TransactionType
+    ON BenchTransactionsGuid (transaction_date, transaction_type)
+    INCLUDE (user_id, resident_id, parent_transaction_id);
+"""),
+    "date clustered": ("BenchTransactionsDate", """
+CREATE TABLE BenchTransactionsDate (
+    id UNIQUEIDENTIFIER NOT NULL CONSTRAINT PK_BenchTransactionsDate PRIMARY KEY NONCLUSTERED,
+    user_id INT NOT NULL,
+    resident_id INT,
+    transaction_type INT NOT NULL,
+    transaction_date DATETIME DEFAULT GETDATE() NOT NULL,
+    building_id INT,
+    parent_transaction_id UNIQUEIDENTIFIER NULL,
+    sequence_id BIGINT IDENTITY(1,1) NOT NULL
+);
+CREATE UNIQUE CLUSTERED INDEX CX_BenchTransactionsDate_TransactionDate_SequenceId
+    ON BenchTransactionsDate (transaction_date, sequence_id);
+"""),
+}
+
+_INSERT_SQL = (
+    "INSERT INTO {table} (id, user_id, resident_id, transaction_type, transaction_date, parent_transaction_id) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+# What the history pages read: checkouts and their edits in a date range
+_SCAN_SQL = (
+    "SELECT id, user_id, resident_id, transaction_type, transaction_date, parent_transaction_id FROM {table} "
+    "WHERE transaction_date >= ? AND transaction_date <= ? AND transaction_type IN (1, 4) "
+    "ORDER BY transaction_date DESC, id"
+)
+
+# The DUPLICATE_TRANSACTION check every logging procedure starts with
+_LOOKUP_SQL = "SELECT CASE WHEN EXISTS (SELECT 1 FROM {table} WHERE id = ?) THEN 1 ELSE 0 END"
+
+
+class LayoutBenchmark:
+    """
+    Transactions clustered on its random GUID against clustered on
+    (transaction_date, sequence_id), as two scratch tables given the same
+    rows:
+
+    - ``transactions`` synthetic ones (see volume.py) bulk-loaded in date
+      order, as years of history would have accumulated;
+    - ``inserts`` single-row, autocommitted inserts of new transactions
+      with client-generated GUIDs, as LogTransaction runs them, the two
+      layouts alternating;
+    - the pages and fragmentation this left in each index;
+    - date-range scans over WINDOWS and the id lookup of the
+      DUPLICATE_TRANSACTION check, which must return the same rows from
+      both tables.
+
+    The tables are dropped afterwards unless ``keep_data``.
+    """
+
+    def __init__(self, connection_string=None, transactions=TRANSACTIONS, inserts=INSERTS, repeat=REPEAT,
+                 days=DEFAULT_DAYS, seed=0, keep_data=False):
+        self.connection_string = connection_string
+        self.transactions = transactions
+        self.inserts = inserts
+        self.repeat = repeat
+        self.days = days
+        self.seed = seed
+        self.keep_data = keep_data
+        self.random = random.Random(seed)
+        self.end = datetime.now().replace(microsecond=0)
+
+    @property
+    def settings(self):
+        return {
+            "transactions": self.transactions,
+            "inserts": self.inserts,
+            "repeat": self.repeat,
+            "days": self.days,
+            "seed": self.seed,
+            "layouts": list(LAYOUTS),
+        }
+
+    def run(self):
+        connection = connect(self.connection_string, autocommit=False)
+
+        try:
+            self._create(connection)
+
+            try:
+                catalog = Catalog.load(connection)
+                loading = self._load(connection, catalog)
+                inserts = self._insert(connection, catalog)
+                fragmentation = self._fragmentation(connection)
+                scans = self._scan(connection)
+            finally:
+                if not self.keep_data:
+                    self._drop(connection)
+        finally:
+            connection.close()
+
+        return {
+            "settings": self.settings,
+            "loading": loading,
+            "inserts": inserts,
+            "fragmentation": fragmentation,
+            "scans": scans,
+        }
+
+    # ---------------------------------------------------
+    # Tables
+    # ---------------------------------------------------
+
+    @staticmethod
+    def _create(connection):
+        cursor = connection.cursor()
+
+        for table, ddl in LAYOUTS.values():
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+            cursor.execute(ddl)
+
+        connection.commit()
+
+    @staticmethod
+    def _drop(connection):
+        cursor = connection.cursor()
+
+        for table, _ in LAYOUTS.values():
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
+
+        connection.commit()
+
+    # ---------------------------------------------------
+    # Writes
+    # ---------------------------------------------------
+
+    def _load(self, connection, catalog):
+        """Bulk-load the same generated history into each table, batch by batch."""
+        cursor = connection.cursor()
+        cursor.fast_executemany = True
+        seconds = dict.fromkeys(LAYOUTS, 0.0)
+        batch = []
+        loaded = 0
+
+        def flush():
+            for layout, (table, _) in LAYOUTS.items():
+                started = time.perf_counter()
+                cursor.executemany(_INSERT_SQL.format(table=table), batch)
+                connection.commit()
+                seconds[layout] += time.perf_counter() - started
+
+        generator = VolumeGenerator(catalog, self.transactions, days=self.days, end=self.end, seed=self.seed)
+
+        for transaction, _ in generator:
+            batch.append(transaction)
+
+            if len(batch) >= BATCH_SIZE:
+                flush()
+                loaded += len(batch)
+                batch = []
+
+        if batch:
+            flush()
+            loaded += len(batch)
+
+        return {
+            layout: {"rows": loaded, "seconds": round(elapsed, 2), "rows_per_second": round(loaded / elapsed) if elapsed else 0}
+            for layout, elapsed in seconds.items()
+        }
+
+    def _insert(self, connection, catalog):
+        """Single autocommitted inserts after the history, dated from its end on."""
+        connection.autocommit = True
+        cursor = connection.cursor()
+        stats = {layout: EndpointStats() for layout in LAYOUTS}
+        seconds = dict.fromkeys(LAYOUTS, 0.0)
+
+        try:
+            for n in range(self.inserts):
+                when = self.end + timedelta(seconds=n + 1)
+                layouts = list(LAYOUTS.items())
+                self.random.shuffle(layouts)
+
+                for layout, (table, _) in layouts:
+                    transaction = (
+                        str(uuid.uuid4()), self.random.choice(catalog.volunteers),
+                        self.random.choice(catalog.residents), 1, when, None,
+                    )
+                    started = time.perf_counter()
+                    cursor.execute(_INSERT_SQL.format(table=table), *transaction)
+                    elapsed = time.perf_counter() - started
+                    seconds[layout] += elapsed
+                    stats[layout].add(elapsed * 1000, True)
+        finally:
+            connection.autocommit = False
+
+        return {
+            layout: {
+                **stats[layout].summary(seconds=0),
+                "inserts_per_second": round(self.inserts / seconds[layout]) if seconds[layout] else 0,
+            }
+            for layout in LAYOUTS
+        }
+
+    # ---------------------------------------------------
+    # Reads
+    # ---------------------------------------------------
+
+    @staticmethod
+    def _fragmentation(connection):
+        cursor = connection.cursor()
+        result = {}
+
+        for layout, (table, _) in LAYOUTS.items():
+            cursor.execute(
+                "SELECT i.name AS index_name, s.page_count AS pages, "
+                "ROUND(s.avg_fragmentation_in_percent, 1) AS fragmentation_percent "
+                "FROM sys.dm_db_index_physical_stats(DB_ID(), OBJECT_ID(?), NULL, NULL, 'LIMITED') s "
+                "JOIN sys.indexes i ON i.object_id = s.object_id AND i.index_id = s.index_id "
+                "WHERE s.index_level = 0 ORDER BY s.index_id",
+                table,
+            )
+            result[layout] = rows(cursor)
+
+        connection.commit()
+        return result
+
+    def _scan(self, connection):
+        cursor = connection.cursor()
+        cursor.execute(f"SELECT TOP 1 id FROM {LAYOUTS['guid clustered'][0]} ORDER BY transaction_date")
+        first = rows(cursor)
+        connection.commit()
+
+        queries = {
+            f"{window} range": (_SCAN_SQL, (self.end - timedelta(days=days) if days else datetime(2000, 1, 1), self.end))
+            for window, days in WINDOWS.items()
+        }
+
+        if first:
+            queries["id lookup"] = (_LOOKUP_SQL, (str(first[0]["id"]),))
+
+        scans = {}
+
+        for name, (sql, params) in queries.items():
+            results = {
+                layout: time_query(connection, sql.format(table=table), params, self.repeat)
+                for layout, (table, _) in LAYOUTS.items()
+            }
+            connection.commit()
+            scans[name] = {
+                "identical": len({(result["rows"], result["digest"]) for result in results.values()}) == 1,
+                "layouts": results,
+            }
+
+        return scans
+
+
+def format_report(report):
+    layouts = report["settings"]["layouts"]
+    lines = [f"{'':<24} " + " ".join(f"{layout:>16}" for layout in layouts)]
+
+    def line(label, values):
+        lines.append(f"{label:<24} " + " ".join(f"{value:>16}" for value in values))
+
+    line("bulk load rows/s", (f"{report['loading'][layout]['rows_per_second']:,}" for layout in layouts))
+    line("inserts/s", (f"{report['inserts'][layout]['inserts_per_second']:,}" for layout in layouts))
+    line("insert p50", (f"{report['inserts'][layout]['p50_ms']:.2f}ms" for layout in layouts))
+    line("insert p99", (f"{report['inserts'][layout]['p99_ms']:.2f}ms" for layout in layouts))
+
+    for name, scan in report["scans"].items():
+        line(f"{name} median", (f"{scan['layouts'][layout]['median_ms']:.1f}ms" for layout in layouts))
+
+        if not scan["identical"]:
+            lines.append(f"{'':<24} {name}: results differ")
+
+    lines.append("")
+
+    for layout in layouts:
+        for index in report["fragmentation"][layout]:
+            lines.append(
+                f"{layout:<16} {index['index_name'] or '(heap)':<56} "
+                f"{index['pages']:>9,} pages {index['fragmentation_percent']:>6}% fragmented"
+            )
+
+    return "\n".join(lines)
@@ -0,0 +1,326 @@
+import heapq
+import random
+import sqlite3
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from tests.db_benchmarks.connection import BenchmarkError, rows
+
+
+# TransactionTypes (database/data_seed/transaction_type_data.sql)
+CHECKOUT = 1
+RESTOCK = 2
+CORRECTION = 3
+CHECKOUT_EDIT = 4
+
+# WELCOME_BASKET_ITEMS in src/types/constants.ts: the sheet set picked
+# by mattress size, which GetCheckoutHistory uses to spot a basket
+SHEET_SET_ITEMS = (171, 172)
+
+# First GUID group of every generated transaction, so a run can be
+# told apart from real data and deleted again
+GENERATED_ID_PREFIX = "5ca1ab1e"
+
+DEFAULT_DAYS = 3 * 365
+
+# Share of root transactions per kind; the rest are general checkouts
+WELCOME_BASKET_RATE = 0.05
+RESTOCK_RATE = 0.10
+CORRECTION_RATE = 0.01
+# Share of general checkouts corrected afterwards, with up to MAX_EDITS
+EDIT_RATE = 0.05
+MAX_EDITS = 3
+
+# Relative activity per weekday (Mon..Sun) and the hours sessions fall in
+WEEKDAY_WEIGHTS = (1.0, 1.0, 1.0, 1.0, 1.0, 0.4, 0.2)
+OPENING_HOUR = 9
+CLOSING_HOUR = 17
+
+# Cart sizes 1-10, mostly small
+CART_SIZE_WEIGHTS = (30, 22, 15, 10, 7, 5, 4, 3, 2, 2)
+
+BATCH_SIZE = 10_000
+
+_TRANSACTION_SQL = (
+    "INSERT INTO Transactions (id, user_id, resident_id, transaction_type, transaction_date, parent_transaction_id) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_ITEM_SQL = (
+    "INSERT INTO TransactionItems (transaction_id, item_id, quantity, additional_notes) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+
+class Catalog:
+    """Users, residents and items the generated transactions refer to."""
+
+    def __init__(self, volunteers, admins, residents, general_items, basket_items, sheet_sets):
+        self.volunteers = volunteers
+        self.admins = admins or volunteers
+        self.residents = residents
+        self.general_items = general_items
+        # [(item id, items_per_basket)]
+        self.basket_items = basket_items
+        self.sheet_sets = sheet_sets
+
+    @classmethod
+    def load(cls, connection):
+        """Read from a pyodbc or sqlite3 connection to a seeded database."""
+        cursor = connection.cursor()
+
+        def column(sql):
+            cursor.execute(sql)
+            return [row[0] for row in cursor.fetchall()]
+
+        cursor.execute("SELECT id, items_per_basket FROM Items WHERE type = 'Welcome Basket' AND items_per_basket > 0")
+        basket_items = [(row["id"], row["items_per_basket"]) for row in rows(cursor)]
+
+        catalog = cls(
+            volunteers=column("SELECT id FROM Users WHERE role = 'volunteer'"),
+            admins=column("SELECT id FROM Users WHERE role = 'admin'"),
+            residents=column("SELECT id FROM Residents"),
+            general_items=column("SELECT id FROM Items WHERE type = 'General'"),
+            basket_items=basket_items,
+            sheet_sets=[
+                item_id for item_id in column("SELECT id FROM Items WHERE type = 'Welcome Basket'")
+                if item_id in SHEET_SET_ITEMS
+            ],
+        )
+
+        if not (catalog.volunteers and catalog.residents and catalog.general_items):
+            raise BenchmarkError("The database needs users, residents and items (run data_seed / data_test)")
+
+        return catalog
+
+
+class VolumeGenerator:
+    """
+    Streams years of plausible Transactions / TransactionItems rows in
+    transaction_date order, as
+
+        (id, user_id, resident_id, transaction_type, transaction_date, parent_transaction_id),
+        [(item_id, quantity, additional_notes), ...]
+
+    - CHECKOUT: 1-10 general items (mostly few), 1-3 of each;
+    - welcome baskets (CHECKOUT): every basket item times its
+      items_per_basket plus one sheet set (171 or 172), as
+      ProcessWelcomeBasketCheckout logs them;
+    - CHECKOUT_EDIT: delta rows pointing at the original checkout
+      through parent_transaction_id, minutes to days after it, as
+      the History page's edit dialog saves them;
+    - RESTOCK by admins and the odd CORRECTION (absolute quantity).
+
+    Only pending edits are held in memory, so any volume can be
+    generated; the same seed gives the same rows.
+    """
+
+    def __init__(self, catalog, transactions=100_000, days=DEFAULT_DAYS, end=None,
+                 welcome_basket_rate=WELCOME_BASKET_RATE, restock_rate=RESTOCK_RATE,
+                 correction_rate=CORRECTION_RATE, edit_rate=EDIT_RATE, seed=None):
+        self.catalog = catalog
+        self.transactions = transactions
+        self.days = days
+        self.end = (end or datetime.now()).replace(microsecond=0)
+        self.welcome_basket_rate = welcome_basket_rate if catalog.sheet_sets else 0
+        self.restock_rate = restock_rate
+        self.correction_rate = correction_rate
+        self.edit_rate = edit_rate
+        self.random = random.Random(seed)
+        self._edit_sequence = 0
+
+    def __iter__(self):
+        rng = self.random
+        first_day = (self.end - timedelta(days=self.days - 1)).date()
+        weights = [WEEKDAY_WEIGHTS[(first_day + timedelta(days=n)).weekday()] for n in range(self.days)]
+        per_weight = self.transactions / sum(weights)
+        # (date, sequence, transaction, items) of edits not yet due
+        pending = []
+
+        for offset, weight in enumerate(weights):
+            day = datetime.combine(first_day + timedelta(days=offset), datetime.min.time())
+            expected = weight * per_weight
+            count = int(expected) + (rng.random() < expected - int(expected))
+
+            # Whole milliseconds: DATETIME has no more and fast_executemany
+            # rejects datetimes finer than the column
+            times = sorted(
+                day + timedelta(milliseconds=rng.randrange(OPENING_HOUR * 3_600_000, CLOSING_HOUR * 3_600_000))
+                for _ in range(count)
+            )
+
+            for when in times:
+                if when > self.end:
+                    break
+
+                while pending and pending[0][0] <= when:
+                    yield heapq.heappop(pending)[2:]
+
+                transaction, items = self._root(when)
+                yield transaction, items
+
+                if transaction[3] == CHECKOUT and items[0][0] not in SHEET_SET_ITEMS and rng.random() < self.edit_rate:
+                    for edit in self._edits(transaction, items):
+                        heapq.heappush(pending, edit)
+
+        while pending and pending[0][0] <= self.end:
+            yield heapq.heappop(pending)[2:]
+
+    # ---------------------------------------------------
+    # Rows
+    # ---------------------------------------------------
+
+    def _id(self):
+        return str(uuid.UUID(int=(int(GENERATED_ID_PREFIX, 16) << 96) | self.random.getrandbits(96)))
+
+    def _root(self, when):
+        rng = self.random
+        roll = rng.random()
+        catalog = self.catalog
+
+        if roll < self.correction_rate:
+            transaction = (self._id(), rng.choice(catalog.admins), None, CORRECTION, when, None)
+            return transaction, [(rng.choice(catalog.general_items), rng.randint(0, 200), "Stock count")]
+
+        if roll < self.correction_rate + self.restock_rate:
+            transaction = (self._id(), rng.choice(catalog.admins), None, RESTOCK, when, None)
+            items = rng.sample(catalog.general_items, min(rng.randint(1, 15), len(catalog.general_items)))
+            return transaction, [(item_id, rng.randint(1, 50), None) for item_id in items]
+
+        transaction = (self._id(), rng.choice(catalog.volunteers), rng.choice(catalog.residents), CHECKOUT, when, None)
+
+        if roll < self.correction_rate + self.restock_rate + self.welcome_basket_rate:
+            # Sheet set first: the edit check above looks at items[0]
+            items = [(rng.choice(catalog.sheet_sets), 1, None)]
+            items += [(item_id, per_basket, None) for item_id, per_basket in catalog.basket_items]
+            return transaction, items
+
+        size = rng.choices(range(1, len(CART_SIZE_WEIGHTS) + 1), CART_SIZE_WEIGHTS)[0]
+        items = rng.sample(catalog.general_items, min(size, len(catalog.general_items)))
+        return transaction, [(item_id, rng.randint(1, 3), None) for item_id in items]
+
+    def _edits(self, original, items):
+        """1-MAX_EDITS corrections of a checkout, as heap entries."""
+        rng = self.random
+        effective = {item_id: quantity for item_id, quantity, _ in items}
+        when = original[4]
+        edits = []
+
+        for _ in range(rng.randint(1, MAX_EDITS)):
+            when += timedelta(minutes=rng.randint(5, 3 * 24 * 60))
+            deltas = []
+
+            for item_id in rng.sample(sorted(effective), min(len(effective), rng.randint(1, 2))):
+                delta = rng.choice((-1, 1)) if effective[item_id] > 0 else 1
+                effective[item_id] += delta
+                deltas.append((item_id, delta, None))
+
+            if rng.random() < 0.3:
+                added = rng.choice(self.catalog.general_items)
+                effective[added] = effective.get(added, 0) + 1
+                deltas.append((added, 1, None))
+
+            transaction = (self._id(), original[1], original[2], CHECKOUT_EDIT, when, original[0])
+            self._edit_sequence += 1
+            edits.append((when, self._edit_sequence, transaction, deltas))
+
+        return edits
+
+
+# ---------------------------------------------------
+# Loading
+# ---------------------------------------------------
+
+class BulkLoader:
+    """
+    Inserts a VolumeGenerator's rows in batches of ``batch_size``
+    transactions, one database transaction per batch. On SQL Server
+    (pyodbc) the batches go through fast_executemany, which sends each
+    as a single parameter array.
+    """
+
+    def __init__(self, connection, batch_size=BATCH_SIZE, progress=None):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.progress = progress
+        self.sqlite = isinstance(connection, sqlite3.Connection)
+
+    def load(self, generated):
+        cursor = self.connection.cursor()
+
+        if not self.sqlite:
+            cursor.fast_executemany = True
+
+        transactions, items = [], []
+        totals = {"transactions": 0, "items": 0}
+        started = time.perf_counter()
+
+        for transaction, transaction_items in generated:
+            transactions.append(self._transaction_row(transaction))
+            items.extend((transaction[0], *item) for item in transaction_items)
+
+            if len(transactions) >= self.batch_size:
+                self._flush(cursor, transactions, items, totals, started)
+                transactions, items = [], []
+
+        if transactions:
+            self._flush(cursor, transactions, items, totals, started)
+
+        seconds = time.perf_counter() - started
+        total_rows = totals["transactions"] + totals["items"]
+
+        return {
+            **totals,
+            "seconds": round(seconds, 2),
+            "rows_per_second": round(total_rows / seconds) if seconds else 0,
+        }
+
+    def _transaction_row(self, transaction):
+        if not self.sqlite:
+            return transaction
+
+        # local_dab stores DATETIME as text (tests/local_dab/database.py)
+        transaction_id, user_id, resident_id, transaction_type, when, parent_id = transaction
+        return transaction_id, user_id, resident_id, transaction_type, when.isoformat(timespec="milliseconds"), parent_id
+
+    def _flush(self, cursor, transactions, items, totals, started):
+        if self.sqlite and not self.connection.in_transaction:
+            cursor.execute("BEGIN")
+
+        # Parents first: items and edits reference them
+        cursor.executemany(_TRANSACTION_SQL, transactions)
+        cursor.executemany(_ITEM_SQL, items)
+        self.connection.commit()
+
+        totals["transactions"] += len(transactions)
+        totals["items"] += len(items)
+
+        if self.progress:
+            self.progress(totals, time.perf_counter() - started)
+
+
+def delete_generated(connection):
+    """Remove every generated transaction (GENERATED_ID_PREFIX) and its items."""
+    cursor = connection.cursor()
+    generated = f"LOWER(CAST(id AS CHAR(36))) LIKE '{GENERATED_ID_PREFIX}-%'"
+    deleted = {}
+
+    cursor.execute(
+        f"DELETE FROM TransactionItems WHERE transaction_id IN (SELECT id FROM Transactions WHERE {generated})"
+    )
+    deleted["items"] = cursor.rowcount
+
+    # Edits before the checkouts they point at
+    cursor.execute(f"DELETE FROM Transactions WHERE {generated} AND parent_transaction_id IS NOT NULL")
+    deleted["transactions"] = cursor.rowcount
+    cursor.execute(f"DELETE FROM Transactions WHERE {generated}")
+    deleted["transactions"] += cursor.rowcount
+
+    connection.commit()
+    return deleted
+
+
+def load_volume(connection, transactions, seed=None, **settings):
+    """Generate and bulk-load ``transactions`` root transactions into a seeded database."""
+    generator = VolumeGenerator(Catalog.load(connection), transactions, seed=seed, **settings)
+    return BulkLoader(connection).load(generator)
@@ -0,0 +1,13 @@
+"""
+Load generator for the volunteer checkout path.
+
+Simulates concurrent volunteer sessions (building, unit, resident,
+past-checkout check, checkout) against the data API, by default a
+tests/local_dab server started in-process, and reports throughput,
+p50/p95/p99 latency per endpoint and error / duplicate-transaction
+rates. Run it with ``python -m tests.load_test``.
+"""
+from tests.load_test.generator import LoadTest
+from tests.load_test.stats import LoadStats, format_report
+
+__all__ = ["LoadStats", "LoadTest", "format_report"]
@@ -0,0 +1,69 @@
+import argparse
+import asyncio
+import json
+from pathlib import Path
+
+from tests.local_dab import LocalDataApi
+from tests.load_test import LoadTest, format_report
+from tests.load_test.client import DIRECT_PREFIX
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.load_test",
+        description="Run concurrent volunteer checkout sessions against the data API.",
+    )
+    parser.add_argument(
+        "--url",
+        default=None,
+        help=(
+            "data API base URL, e.g. http://127.0.0.1:5000/api; by default a "
+            "seeded tests/local_dab server is started in this process"
+        ),
+    )
+    parser.add_argument("--concurrency", type=int, default=10, help="volunteers working at once")
+    parser.add_argument("--sessions", type=int, default=200, help="checkout sessions to run in total")
+    parser.add_argument("--duration", type=float, default=None, help="run for this many seconds instead")
+    parser.add_argument("--buildings", type=int, default=None, help="spread volunteers over this many buildings")
+    parser.add_argument("--welcome-basket-rate", type=float, default=0.1, help="share of welcome basket checkouts")
+    parser.add_argument("--retry-rate", type=float, default=0.05, help="share of checkouts sent twice")
+    parser.add_argument("--think-ms", type=float, default=0, help="average pause between session steps")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--json", metavar="PATH", default=None, help="also write the report as JSON")
+    args = parser.parse_args()
+
+    local_api = None
+    url = args.url
+
+    if url is None:
+        local_api = LocalDataApi(port=0).start()
+        url = local_api.url + DIRECT_PREFIX
+
+    load_test = LoadTest(
+        url,
+        concurrency=args.concurrency,
+        sessions=args.sessions,
+        duration=args.duration,
+        buildings=args.buildings,
+        welcome_basket_rate=args.welcome_basket_rate,
+        retry_rate=args.retry_rate,
+        think_ms=args.think_ms,
+        seed=args.seed,
+    )
+
+    try:
+        report = asyncio.run(load_test.run())
+    finally:
+        if local_api is not None:
+            local_api.stop()
+
+    print(format_report(report))
+
+    if args.json:
+        path = Path(args.json)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
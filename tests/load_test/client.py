@@ -0,0 +1,122 @@
+import asyncio
+import json
+from urllib.parse import urlencode, urlsplit
+
+
+# Data API prefixes as in tests/utilities/api_client.py: DAB (or the
+# local stand-in) answers /api, the SWA CLI proxies /data-api/api
+DIRECT_PREFIX = "/api"
+
+TIMEOUT_SECONDS = 30
+
+
+class HttpError(Exception):
+    pass
+
+
+class Connection:
+    """
+    One keep-alive HTTP/1.1 connection, like a volunteer's browser
+    holds to the API. Requests on it are sequential; it reconnects
+    when the server closes it.
+    """
+
+    def __init__(self, base_url, headers=None):
+        parts = urlsplit(base_url)
+
+        if parts.scheme != "http":
+            raise HttpError(f"Only http:// is supported: {base_url}")
+
+        self.host = parts.hostname
+        self.port = parts.port or 80
+        self.prefix = parts.path.rstrip("/")
+        self.headers = headers or {}
+        self._reader = None
+        self._writer = None
+
+    async def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._reader = self._writer = None
+
+    async def request(self, method, path, params=None, body=None):
+        """(status, parsed JSON body or None)."""
+        target = self.prefix + path
+
+        if params:
+            target += "?" + urlencode(params)
+
+        payload = json.dumps(body).encode() if body is not None else b""
+        head = (
+            f"{method} {target} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            f"Content-Length: {len(payload)}\r\n"
+            "Content-Type: application/json\r\n"
+            "Accept: application/json\r\n"
+            + "".join(f"{name}: {value}\r\n" for name, value in self.headers.items())
+            + "\r\n"
+        )
+
+        # A keep-alive connection the server dropped fails on first use
+        for attempt in (1, 2):
+            try:
+                if self._writer is None:
+                    self._reader, self._writer = await asyncio.open_connection(self.host, self.port)
+
+                self._writer.write(head.encode("latin-1") + payload)
+                await self._writer.drain()
+
+                status, data = await asyncio.wait_for(self._read_response(), TIMEOUT_SECONDS)
+                break
+
+            except (ConnectionError, asyncio.IncompleteReadError) as err:
+                await self.close()
+
+                if attempt == 2:
+                    raise HttpError(f"{method} {path}: {err}")
+
+        try:
+            return status, json.loads(data) if data else None
+        except ValueError:
+            raise HttpError(f"{method} {path} -> {status}: body is not JSON")
+
+    async def _read_response(self):
+        line = await self._reader.readline()
+
+        if not line:
+            raise ConnectionError("connection closed")
+
+        status = int(line.split()[1])
+        headers = {}
+
+        while True:
+            line = await self._reader.readline()
+
+            if line in (b"\r\n", b"\n", b""):
+                break
+
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            data = await self._read_chunked()
+        else:
+            data = await self._reader.readexactly(int(headers.get("content-length", "0")))
+
+        if headers.get("connection", "").lower() == "close":
+            await self.close()
+
+        return status, data
+
+    async def _read_chunked(self):
+        chunks = []
+
+        while True:
+            size = int((await self._reader.readline()).split(b";")[0], 16)
+
+            if size == 0:
+                await self._reader.readline()
+                return b"".join(chunks)
+
+            chunks.append(await self._reader.readexactly(size))
+            await self._reader.readline()
@@ -0,0 +1,270 @@
+import asyncio
+import random
+import time
+import uuid
+
+from tests.load_test.client import Connection, HttpError
+from tests.load_test.stats import LoadStats
+
+
+ROLE = "volunteer"
+
+# Cart sizes the checkout step draws from (CheckoutDialog has no limit)
+MIN_CART_ITEMS = 1
+MAX_CART_ITEMS = 10
+MAX_ITEM_QUANTITY = 3
+
+DUPLICATE_TRANSACTION = "DUPLICATE_TRANSACTION"
+
+
+class LoadTestError(Exception):
+    pass
+
+
+class Catalog:
+    """What sessions pick from, read once before the clock starts."""
+
+    def __init__(self, buildings, general_items, sheet_sets, user_ids):
+        self.buildings = buildings
+        self.general_items = general_items
+        self.sheet_sets = sheet_sets
+        self.user_ids = user_ids
+
+    @classmethod
+    async def load(cls, connection):
+        async def get(path, **params):
+            status, body = await connection.request("GET", path, params={"$first": 1000, **params})
+
+            if status != 200:
+                raise LoadTestError(f"GET {path} -> {status}: {body}")
+
+            return body["value"]
+
+        buildings = [row["id"] for row in await get("/building", **{"$select": "id"})]
+        general = [row["id"] for row in await get("/items", **{"$filter": "type eq 'General'", "$select": "id"})]
+        # Sheet sets are the welcome basket items added by mattress size
+        sheet_sets = [row["id"] for row in await get("/items", **{
+            "$filter": "type eq 'Welcome Basket' and items_per_basket eq 0", "$select": "id",
+        })]
+        users = [row["id"] for row in await get("/users", **{
+            "$filter": f"role eq '{ROLE}' and active eq true", "$select": "id",
+        })]
+
+        if not (buildings and general and users):
+            raise LoadTestError("The data API has no buildings, general items or active volunteers")
+
+        return cls(buildings, general, sheet_sets, users)
+
+
+class LoadTest:
+    """
+    Volunteers checking residents out at the same time, as on a
+    distribution day in several buildings. Each of ``concurrency``
+    volunteers works in one building over its own keep-alive
+    connection and runs sessions the way the app does:
+
+        GET  /building                      BuildingCodeSelect
+        GET  /units?$filter=building_id     unit autocomplete
+        GET  /residents?$filter=unit_id     resident autofill (POST one if the unit is empty)
+        POST /check-past-checkout           tracked items warning
+        POST /checkout-general-items        1-10 items (or /checkout-welcome-basket)
+
+    A ``retry_rate`` share of checkouts is sent twice with the same
+    new_transaction_id (a double click or a client retry): the second
+    call must come back DUPLICATE_TRANSACTION.
+    """
+
+    def __init__(self, base_url, concurrency=10, sessions=200, duration=None,
+                 buildings=None, welcome_basket_rate=0.1, retry_rate=0.05,
+                 think_ms=0, seed=None):
+        self.base_url = base_url
+        self.concurrency = concurrency
+        self.sessions = sessions
+        self.duration = duration
+        self.buildings = buildings
+        self.welcome_basket_rate = welcome_basket_rate
+        self.retry_rate = retry_rate
+        self.think_ms = think_ms
+        self.random = random.Random(seed)
+        self.stats = LoadStats()
+        self._started = 0
+        self._deadline = None
+
+    @property
+    def settings(self):
+        return {
+            "base_url": self.base_url,
+            "concurrency": self.concurrency,
+            "sessions": self.sessions,
+            "duration": self.duration,
+            "buildings": self.buildings,
+            "welcome_basket_rate": self.welcome_basket_rate,
+            "retry_rate": self.retry_rate,
+            "think_ms": self.think_ms,
+        }
+
+    def _connection(self):
+        return Connection(self.base_url, headers={"X-MS-API-ROLE": ROLE})
+
+    async def run(self):
+        """Runs the load and returns the report (see LoadStats.report)."""
+        setup = self._connection()
+
+        try:
+            catalog = await Catalog.load(setup)
+        finally:
+            await setup.close()
+
+        buildings = catalog.buildings[:self.buildings] if self.buildings else catalog.buildings
+        started = time.perf_counter()
+
+        if self.duration:
+            self._deadline = started + self.duration
+
+        await asyncio.gather(*(
+            self._volunteer(catalog, buildings[index % len(buildings)], index)
+            for index in range(self.concurrency)
+        ))
+
+        return self.stats.report(time.perf_counter() - started, self.settings)
+
+    def _next_session(self):
+        if self._deadline is not None:
+            return time.perf_counter() < self._deadline
+
+        if self._started >= self.sessions:
+            return False
+
+        self._started += 1
+        return True
+
+    async def _volunteer(self, catalog, building_id, index):
+        connection = self._connection()
+        user_id = catalog.user_ids[index % len(catalog.user_ids)]
+
+        try:
+            while self._next_session():
+                try:
+                    await self._session(connection, catalog, building_id, user_id)
+                except (HttpError, LoadTestError):
+                    self.stats.failed_sessions += 1
+
+                self.stats.sessions += 1
+        finally:
+            await connection.close()
+
+    # ---------------------------------------------------
+    # One Session
+    # ---------------------------------------------------
+
+    async def _call(self, connection, method, path, endpoint=None, params=None, body=None):
+        endpoint = f"{method} {endpoint or path}"
+        started = time.perf_counter()
+
+        try:
+            status, data = await connection.request(method, path, params=params, body=body)
+        except HttpError:
+            self.stats.record(endpoint, (time.perf_counter() - started) * 1000, False)
+            raise
+
+        rows = (data or {}).get("value") or []
+        failed = status >= 400 or any(
+            isinstance(row, dict) and row.get("Status") == "Error"
+            and row.get("ErrorCode") != DUPLICATE_TRANSACTION
+            for row in rows
+        )
+
+        self.stats.record(endpoint, (time.perf_counter() - started) * 1000, not failed)
+
+        if status >= 400:
+            raise LoadTestError(f"{method} {path} -> {status}")
+
+        return rows
+
+    async def _think(self):
+        if self.think_ms:
+            await asyncio.sleep(self.random.uniform(0.5, 1.5) * self.think_ms / 1000)
+
+    async def _session(self, connection, catalog, building_id, user_id):
+        await self._call(connection, "GET", "/building")
+        await self._think()
+
+        units = await self._call(
+            connection, "GET", "/units", endpoint="/units?building_id",
+            params={"$filter": f"building_id eq {building_id}", "$first": 1000},
+        )
+
+        if not units:
+            raise LoadTestError(f"Building {building_id} has no units")
+
+        unit = self.random.choice(units)
+        residents = await self._call(
+            connection, "GET", "/residents", endpoint="/residents?unit_id",
+            params={"$filter": f"unit_id eq {unit['id']}"},
+        )
+        await self._think()
+
+        if residents:
+            resident = self.random.choice(residents)
+        else:
+            resident = (await self._call(connection, "POST", "/residents", body={
+                "name": f"Load Test {unit['id']}", "unit_id": unit["id"],
+            }))[0]
+
+        await self._call(connection, "POST", "/check-past-checkout", body={"resident_id": resident["id"]})
+        await self._think()
+
+        if catalog.sheet_sets and self.random.random() < self.welcome_basket_rate:
+            path, body = "/checkout-welcome-basket", {
+                "mattress_size": self.random.choice(catalog.sheet_sets),
+                "quantity": 1,
+            }
+        else:
+            size = self.random.randint(MIN_CART_ITEMS, min(MAX_CART_ITEMS, len(catalog.general_items)))
+            path, body = "/checkout-general-items", {
+                "items": [
+                    {"id": item_id, "quantity": self.random.randint(1, MAX_ITEM_QUANTITY), "additional_notes": ""}
+                    for item_id in self.random.sample(catalog.general_items, size)
+                ],
+            }
+
+        body.update({
+            "new_transaction_id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "resident_id": resident["id"],
+            "message": "",
+        })
+
+        await self._checkout(connection, path, body)
+
+    async def _checkout(self, connection, path, body):
+        self.stats.checkouts += 1
+        result = await self._result(connection, path, body)
+
+        if result != "Success":
+            self.stats.checkout_errors += 1
+
+        if self.random.random() >= self.retry_rate:
+            return
+
+        self.stats.retries += 1
+        retried = await self._result(connection, path, body)
+
+        if retried == DUPLICATE_TRANSACTION:
+            self.stats.duplicates_rejected += 1
+        elif retried == "Success":
+            self.stats.duplicates_accepted += 1
+
+    async def _result(self, connection, path, body):
+        """Success, DUPLICATE_TRANSACTION or Error."""
+        try:
+            rows = await self._call(connection, "POST", path, body=body)
+        except LoadTestError:
+            return "Error"
+
+        row = rows[0] if rows else {}
+
+        if row.get("ErrorCode") == DUPLICATE_TRANSACTION:
+            return DUPLICATE_TRANSACTION
+
+        return row.get("Status", "Error")
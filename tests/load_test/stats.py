@@ -0,0 +1,111 @@
+import math
+
+
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class EndpointStats:
+    def __init__(self):
+        self.latencies_ms = []
+        self.errors = 0
+
+    def add(self, latency_ms, ok):
+        self.latencies_ms.append(latency_ms)
+
+        if not ok:
+            self.errors += 1
+
+    def summary(self, seconds):
+        values = sorted(self.latencies_ms)
+        row = {
+            "requests": len(values),
+            "errors": self.errors,
+            "error_rate": round(self.errors / len(values), 4) if values else 0.0,
+            "rps": round(len(values) / seconds, 1) if seconds else 0.0,
+        }
+
+        for pct in PERCENTILES:
+            value = percentile(values, pct)
+            row[f"p{pct}_ms"] = round(value, 2) if value is not None else None
+
+        row["max_ms"] = round(values[-1], 2) if values else None
+        return row
+
+
+class LoadStats:
+    """
+    Latencies per endpoint plus the session and checkout outcomes a
+    load run is judged on.
+    """
+
+    def __init__(self):
+        self.endpoints = {}
+        self.sessions = 0
+        self.failed_sessions = 0
+        self.checkouts = 0
+        self.checkout_errors = 0
+        # Re-sent checkouts (same new_transaction_id) and what became of them
+        self.retries = 0
+        self.duplicates_rejected = 0
+        self.duplicates_accepted = 0
+
+    def record(self, endpoint, latency_ms, ok):
+        self.endpoints.setdefault(endpoint, EndpointStats()).add(latency_ms, ok)
+
+    def report(self, seconds, settings=None):
+        requests = sum(len(stats.latencies_ms) for stats in self.endpoints.values())
+        errors = sum(stats.errors for stats in self.endpoints.values())
+        checkout_calls = self.checkouts + self.retries
+
+        return {
+            "settings": settings or {},
+            "seconds": round(seconds, 2),
+            "sessions": self.sessions,
+            "failed_sessions": self.failed_sessions,
+            "sessions_per_second": round(self.sessions / seconds, 2) if seconds else 0.0,
+            "requests": requests,
+            "requests_per_second": round(requests / seconds, 1) if seconds else 0.0,
+            "error_rate": round(errors / requests, 4) if requests else 0.0,
+            "checkouts": self.checkouts,
+            "checkout_error_rate": round(self.checkout_errors / self.checkouts, 4) if self.checkouts else 0.0,
+            "retries": self.retries,
+            # DUPLICATE_TRANSACTION answers among all checkout calls
+            "duplicate_transaction_rate": round(self.duplicates_rejected / checkout_calls, 4) if checkout_calls else 0.0,
+            # Retries that were logged a second time: must stay 0
+            "duplicates_accepted": self.duplicates_accepted,
+            "endpoints": {
+                endpoint: stats.summary(seconds)
+                for endpoint, stats in sorted(self.endpoints.items())
+            },
+        }
+
+
+def format_report(report):
+    lines = [
+        f"{report['sessions']} sessions ({report['failed_sessions']} failed) in "
+        f"{report['seconds']:.1f}s: {report['sessions_per_second']:.1f} sessions/s, "
+        f"{report['requests_per_second']:.0f} requests/s",
+        f"error rate {report['error_rate']:.2%}, checkout errors {report['checkout_error_rate']:.2%}, "
+        f"duplicate-transaction rate {report['duplicate_transaction_rate']:.2%} "
+        f"({report['retries']} retries, {report['duplicates_accepted']} logged twice)",
+        "",
+        f"{'endpoint':<40} {'requests':>8} {'rps':>7} {'p50':>8} {'p95':>8} {'p99':>8} {'errors':>7}",
+    ]
+
+    for endpoint, row in report["endpoints"].items():
+        lines.append(
+            f"{endpoint:<40} {row['requests']:>8} {row['rps']:>7.1f} "
+            f"{row['p50_ms']:>6.1f}ms {row['p95_ms']:>6.1f}ms {row['p99_ms']:>6.1f}ms "
+            f"{row['errors']:>7}"
+        )
+
+    return "\n".join(lines)
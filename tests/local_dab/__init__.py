@@ -0,0 +1,13 @@
+"""
+Offline stand-in for the Data API Builder runtime.
+
+Serves the REST entities and stored-procedure routes declared in
+dab/dab-config.json from an in-memory SQLite database loaded with
+database/data_seed and database/data_test, so the e2e suite can run
+without the Azure SQL backend.
+"""
+from tests.local_dab.database import Database
+from tests.local_dab.server import DataApi, LocalDataApi
+from tests.local_dab.snapshots import DATABASE_COOKIE, DatabaseStore, SnapshotClient
+
+__all__ = ["DATABASE_COOKIE", "DataApi", "Database", "DatabaseStore", "LocalDataApi", "SnapshotClient"]
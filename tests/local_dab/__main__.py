@@ -0,0 +1,46 @@
+import argparse
+import asyncio
+
+from tests.db_benchmarks.volume import load_volume
+from tests.local_dab import LocalDataApi
+from tests.local_dab.database import Database
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.local_dab",
+        description="Serve dab/dab-config.json from a seeded SQLite database.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5000)
+    parser.add_argument(
+        "--volume", type=int, default=0, metavar="N",
+        help="add N synthetic transactions (tests.db_benchmarks volume) to the seed data",
+    )
+    args = parser.parse_args()
+
+    database = Database.seeded()
+
+    if args.volume:
+        with database.lock:
+            loaded = load_volume(database.connection, args.volume, seed=0)
+
+        print(f"Added {loaded['transactions']} transactions, {loaded['items']} items")
+
+    api = LocalDataApi(host=args.host, port=args.port, database=database)
+
+    async def run():
+        server = await api.serve()
+        print(f"Local Data API listening on {api.url}/api")
+
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
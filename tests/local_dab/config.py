@@ -0,0 +1,54 @@
+import json
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+DAB_CONFIG = REPO_ROOT / "dab" / "dab-config.json"
+
+# Role DAB assumes when a request carries no X-MS-API-ROLE header
+ANONYMOUS_ROLE = "anonymous"
+
+STORED_PROCEDURE = "stored-procedure"
+
+
+class Entity:
+    """One entry of dab-config.json's "entities" map."""
+
+    def __init__(self, name, definition):
+        source = definition["source"]
+        rest = definition.get("rest", {})
+
+        self.name = name
+        # "dbo.Items" -> "Items": SQLite has no schemas
+        self.object = source["object"].split(".")[-1]
+        self.type = source.get("type", "table")
+        self.key_fields = list(source.get("key-fields", []))
+        self.path = rest.get("path", f"/{name}").strip("/")
+        self.rest_enabled = rest.get("enabled", True)
+        self.permissions = {
+            permission["role"]: set(permission["actions"])
+            for permission in definition.get("permissions", [])
+        }
+
+    @property
+    def is_procedure(self):
+        return self.type == STORED_PROCEDURE
+
+    def allows(self, role, action):
+        actions = self.permissions.get(role, set())
+        return "*" in actions or action in actions
+
+    def __repr__(self):
+        return f"Entity({self.name!r}, /{self.path})"
+
+
+def load_entities(path=DAB_CONFIG):
+    """REST-enabled entities keyed by their route, e.g. "items"."""
+    config = json.loads(Path(path).read_text(encoding="utf-8-sig"))
+
+    entities = (
+        Entity(name, definition)
+        for name, definition in config["entities"].items()
+    )
+
+    return {entity.path: entity for entity in entities if entity.rest_enabled}
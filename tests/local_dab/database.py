@@ -0,0 +1,205 @@
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from tests.local_dab.config import REPO_ROOT
+
+
+SCHEMA_FILE = Path(__file__).with_name("schema.sql")
+
+# Same folders, in the same order, as database/bootstrap_db.ps1
+SEED_DIRS = (
+    REPO_ROOT / "database" / "data_seed",
+    REPO_ROOT / "database" / "data_test",
+)
+
+# BIT columns, returned as JSON booleans like DAB does
+BOOLEAN_COLUMNS = {"active", "notes_required", "IsValid"}
+
+# DATETIME columns, stored as DATETIME_FORMAT text
+DATETIME_COLUMNS = {"transaction_date", "last_signed_in", "created_at"}
+
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+_GO = re.compile(r"^\s*GO\s*;?\s*$", re.IGNORECASE | re.MULTILINE)
+_IDENTITY_INSERT = re.compile(r"^\s*SET\s+IDENTITY_INSERT\b.*$", re.IGNORECASE | re.MULTILINE)
+_DBO_SCHEMA = re.compile(r"(\[dbo\]|\bdbo)\.", re.IGNORECASE)
+
+# DECLARE @i INT = 1; DECLARE @max INT = 16;
+# WHILE @i <= @max BEGIN INSERT INTO ... VALUES (...@i...); SET @i = @i + 1; END
+# (unit_data.sql's per-building "welcome" units)
+_COUNTER_LOOP = re.compile(
+    r"DECLARE\s+@(?P<var>\w+)\s+INT\s*=\s*(?P<start>\d+)\s*;\s*"
+    r"DECLARE\s+@(?P<max>\w+)\s+INT\s*=\s*(?P<stop>\d+)\s*;\s*"
+    r"WHILE\s+@(?P=var)\s*<=\s*@(?P=max)\s*BEGIN\s*"
+    r"INSERT\s+INTO\s+(?P<target>[^;]+?)\s+VALUES\s*\((?P<values>[^;]*)\)\s*;\s*"
+    r"SET\s+@(?P=var)\s*=\s*@(?P=var)\s*\+\s*1\s*;\s*END",
+    re.IGNORECASE,
+)
+
+
+def _counter_insert(match):
+    values = re.sub(rf"@{match['var']}\b", "n", match["values"])
+
+    return (
+        f"WITH RECURSIVE counter(n) AS ("
+        f"SELECT {match['start']} UNION ALL "
+        f"SELECT n + 1 FROM counter WHERE n < {match['stop']}) "
+        f"INSERT INTO {match['target']} SELECT {values} FROM counter;"
+    )
+
+
+def translate_tsql(sql):
+    """Make a seed script from database/ runnable by SQLite."""
+    sql = sql.lstrip("\ufeff")
+    sql = _IDENTITY_INSERT.sub("", sql)
+    sql = _DBO_SCHEMA.sub("", sql)
+    sql = _COUNTER_LOOP.sub(_counter_insert, sql)
+
+    # A batch may end without a semicolon before GO
+    return _GO.sub(";", sql)
+
+
+def to_datetime_text(value):
+    """
+    ISO 8601 input ("2025-01-01T08:00:00.000Z", "2023-10-01 10:00:00")
+    as naive UTC DATETIME_FORMAT text, the way SQL Server stores a
+    DATETIME converted from a string.
+    """
+    if value is None or value == "":
+        return None
+
+    parsed = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return parsed.strftime(DATETIME_FORMAT)[:-3]
+
+
+def to_json_value(column, value):
+    if value is None:
+        return None
+
+    if column in BOOLEAN_COLUMNS:
+        return bool(value)
+
+    if column in DATETIME_COLUMNS and isinstance(value, str):
+        return value.replace(" ", "T", 1)
+
+    return value
+
+
+class Database:
+    """
+    In-memory SQLite copy of the plymouth-housing schema.
+
+    One connection shared by the server thread and fixtures; every
+    statement runs under ``lock`` so a transaction is never interleaved
+    with another request's statements.
+    """
+
+    def __init__(self, path=":memory:"):
+        # Autocommit mode: transaction() issues BEGIN/COMMIT itself
+        self.connection = sqlite3.connect(
+            path, check_same_thread=False, isolation_level=None
+        )
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.lock = threading.RLock()
+        self._columns = {}
+
+    @classmethod
+    def seeded(cls, path=":memory:", seed_dirs=SEED_DIRS):
+        database = cls(path)
+        database.create_schema()
+
+        for directory in seed_dirs:
+            database.load_seed(directory)
+
+        return database
+
+    @classmethod
+    def from_snapshot(cls, snapshot):
+        database = cls()
+        database.restore(snapshot)
+        return database
+
+    def create_schema(self):
+        with self.lock:
+            self.connection.executescript(SCHEMA_FILE.read_text())
+
+    def load_seed(self, directory):
+        with self.lock:
+            for path in sorted(Path(directory).glob("*.sql")):
+                self.connection.executescript(
+                    translate_tsql(path.read_text(encoding="utf-8-sig"))
+                )
+
+    # ---------------------------------------------------
+    # Queries
+    # ---------------------------------------------------
+
+    def query(self, sql, params=()):
+        """Rows as dicts of JSON-ready values."""
+        with self.lock:
+            cursor = self.connection.execute(sql, params)
+            names = [column[0] for column in cursor.description or ()]
+
+            return [
+                {name: to_json_value(name, value) for name, value in zip(names, row)}
+                for row in cursor.fetchall()
+            ]
+
+    def execute(self, sql, params=()):
+        with self.lock:
+            return self.connection.execute(sql, params)
+
+    def columns(self, source):
+        """Column names of a table or view, in declaration order."""
+        if source not in self._columns:
+            with self.lock:
+                rows = self.connection.execute(
+                    f'PRAGMA table_info("{source}")'
+                ).fetchall()
+
+            self._columns[source] = [row[1] for row in rows]
+
+        return self._columns[source]
+
+    # ---------------------------------------------------
+    # Snapshots
+    # ---------------------------------------------------
+
+    def snapshot(self):
+        """
+        Copy of the current contents in a private in-memory database
+        (SQLite online backup: page copy, a few ms for the seed data).
+        """
+        target = sqlite3.connect(":memory:", check_same_thread=False)
+
+        with self.lock:
+            self.connection.backup(target)
+
+        return target
+
+    def restore(self, snapshot):
+        """Replace the contents with a snapshot() copy."""
+        with self.lock:
+            snapshot.backup(self.connection)
+
+    @contextmanager
+    def transaction(self):
+        """BEGIN IMMEDIATE ... COMMIT, rolled back if the block raises."""
+        with self.lock:
+            self.connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                yield self.connection
+            except BaseException:
+                self.connection.execute("ROLLBACK")
+                raise
+
+            self.connection.execute("COMMIT")
@@ -0,0 +1,236 @@
+import base64
+import json
+import re
+
+
+# DAB's runtime defaults (runtime.pagination in dab-config.json)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 100000
+
+_COMPARISONS = {"eq": "=", "ne": "<>", "gt": ">", "ge": ">=", "lt": "<", "le": "<="}
+
+_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<string>'(?:[^']|'')*')"
+    r"|(?P<number>-?\d+(?:\.\d+)?)"
+    r"|(?P<paren>[()])"
+    r"|(?P<word>[A-Za-z_][A-Za-z0-9_]*)"
+    r")"
+)
+
+
+class QueryError(ValueError):
+    """Invalid $filter / $orderby / $select / $first / $after (HTTP 400)."""
+
+
+def _tokenize(text):
+    tokens = []
+    position = 0
+    text = text.strip()
+
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+
+        if not match or match.end() == position:
+            raise QueryError(f"Syntax error at position {position} in $filter: {text!r}")
+
+        position = match.end()
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+
+    return tokens
+
+
+class _FilterParser:
+    """
+    Recursive descent over the OData subset DAB accepts in $filter:
+
+        expr    := and_expr ("or" and_expr)*
+        and     := not_expr ("and" not_expr)*
+        not     := "not" not_expr | "(" expr ")" | operand cmp operand
+        operand := column | 'string' | number | true | false | null
+    """
+
+    def __init__(self, text, columns):
+        self.tokens = _tokenize(text)
+        self.columns = {column.lower(): column for column in columns}
+        self.position = 0
+        self.params = []
+
+    def parse(self):
+        sql = self._or()
+
+        if self.position != len(self.tokens):
+            raise QueryError(f"Unexpected {self.tokens[self.position][1]!r} in $filter")
+
+        return sql, self.params
+
+    def _peek_word(self):
+        if self.position < len(self.tokens):
+            kind, value = self.tokens[self.position]
+            if kind == "word":
+                return value.lower()
+        return None
+
+    def _take(self):
+        if self.position >= len(self.tokens):
+            raise QueryError("$filter ended unexpectedly")
+
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def _or(self):
+        parts = [self._and()]
+
+        while self._peek_word() == "or":
+            self.position += 1
+            parts.append(self._and())
+
+        return parts[0] if len(parts) == 1 else "(" + " OR ".join(parts) + ")"
+
+    def _and(self):
+        parts = [self._not()]
+
+        while self._peek_word() == "and":
+            self.position += 1
+            parts.append(self._not())
+
+        return parts[0] if len(parts) == 1 else "(" + " AND ".join(parts) + ")"
+
+    def _not(self):
+        if self._peek_word() == "not":
+            self.position += 1
+            return f"NOT {self._not()}"
+
+        if self.tokens[self.position:self.position + 1] == [("paren", "(")]:
+            self.position += 1
+            sql = self._or()
+
+            if self._take() != ("paren", ")"):
+                raise QueryError("Missing ')' in $filter")
+
+            return f"({sql})"
+
+        return self._comparison()
+
+    def _comparison(self):
+        left = self._operand()
+        kind, operator = self._take()
+
+        if kind != "word" or operator.lower() not in _COMPARISONS:
+            raise QueryError(f"Expected a comparison operator, got {operator!r}")
+
+        right = self._operand()
+        operator = operator.lower()
+
+        # "x eq null" is "x IS NULL" in SQL
+        if right == "NULL" or left == "NULL":
+            if operator not in ("eq", "ne"):
+                raise QueryError("null can only be compared with eq / ne")
+
+            other = left if right == "NULL" else right
+            return f"{other} IS {'NOT ' if operator == 'ne' else ''}NULL"
+
+        return f"{left} {_COMPARISONS[operator]} {right}"
+
+    def _operand(self):
+        kind, value = self._take()
+
+        if kind == "string":
+            self.params.append(value[1:-1].replace("''", "'"))
+            return "?"
+
+        if kind == "number":
+            self.params.append(float(value) if "." in value else int(value))
+            return "?"
+
+        if kind == "word":
+            lowered = value.lower()
+
+            if lowered in ("true", "false"):
+                self.params.append(1 if lowered == "true" else 0)
+                return "?"
+
+            if lowered == "null":
+                return "NULL"
+
+            if lowered in self.columns:
+                return f'"{self.columns[lowered]}"'
+
+            raise QueryError(f"Could not find a property named '{value}'")
+
+        raise QueryError(f"Unexpected {value!r} in $filter")
+
+
+def parse_filter(text, columns):
+    """$filter as a SQL WHERE fragment and its parameters."""
+    return _FilterParser(text, columns).parse()
+
+
+def parse_orderby(text, columns):
+    lookup = {column.lower(): column for column in columns}
+    terms = []
+
+    for term in text.split(","):
+        parts = term.split()
+
+        if not parts or len(parts) > 2:
+            raise QueryError(f"Invalid $orderby: {text!r}")
+
+        column = lookup.get(parts[0].lower())
+        direction = parts[1].lower() if len(parts) == 2 else "asc"
+
+        if column is None:
+            raise QueryError(f"Invalid orderby column requested: {parts[0]}")
+
+        if direction not in ("asc", "desc"):
+            raise QueryError(f"Invalid $orderby direction: {parts[1]}")
+
+        terms.append(f'"{column}" {direction.upper()}')
+
+    return ", ".join(terms)
+
+
+def parse_select(text, columns):
+    lookup = {column.lower(): column for column in columns}
+    selected = []
+
+    for name in text.split(","):
+        column = lookup.get(name.strip().lower())
+
+        if column is None:
+            raise QueryError(f"Invalid field to be returned requested: {name.strip()}")
+
+        selected.append(column)
+
+    return selected
+
+
+def parse_first(text):
+    try:
+        first = int(text)
+    except ValueError:
+        raise QueryError(f"Invalid number of items requested, $first={text}")
+
+    # -1 asks for the largest page the runtime allows
+    if first == -1:
+        return MAX_PAGE_SIZE
+
+    if first < 1 or first > MAX_PAGE_SIZE:
+        raise QueryError(f"Invalid number of items requested, $first={text}")
+
+    return first
+
+
+def encode_after(offset):
+    """Opaque $after continuation token."""
+    token = json.dumps({"offset": offset}).encode()
+    return base64.urlsafe_b64encode(token).decode()
+
+
+def decode_after(token):
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(token.encode()))["offset"])
+    except (ValueError, KeyError, TypeError):
+        raise QueryError("$after could not be parsed")
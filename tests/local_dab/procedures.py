@@ -0,0 +1,537 @@
+"""
+Python/SQLite ports of database/procedures, keyed by the procedure
+name dab-config.json points at. Each port takes the JSON parameters
+DAB would bind (names without "@") and returns the result-set rows.
+
+Keep them behaviourally in step with the T-SQL: same validation order,
+same Status/ErrorCode/message rows, same transaction types.
+"""
+import json
+import sqlite3
+import uuid
+
+from tests.local_dab.database import to_datetime_text
+
+
+# Welcome basket sheet sets (see GetCheckoutHistory)
+SHEET_SET_ITEM_IDS = (171, 172)
+
+# TransactionTypes ids (database/data_seed/transaction_type_data.sql)
+CHECKOUT = 1
+RESTOCK = 2
+CORRECTION = 3
+CHECKOUT_EDIT = 4
+
+PROCEDURES = {}
+
+
+class ProcedureError(Exception):
+    """THROW / RAISERROR / conversion failure inside a procedure (HTTP 400)."""
+
+
+def procedure(name):
+    def register(function):
+        PROCEDURES[name] = function
+        return function
+
+    return register
+
+
+# ---------------------------------------------------
+# Parameter Conversion
+# ---------------------------------------------------
+
+def _param(params, name, default=None):
+    # DAB matches parameter names case-insensitively
+    for key, value in params.items():
+        if key.lower() == name.lower():
+            return value
+
+    return default
+
+
+def _int(params, name):
+    value = _param(params, name)
+
+    if value is None or value == "":
+        return None
+
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        raise ProcedureError(f"Error converting data type nvarchar to int for @{name}.")
+
+
+def _guid(params, name):
+    value = _param(params, name)
+
+    if value is None or value == "":
+        return None
+
+    try:
+        return str(uuid.UUID(str(value)))
+    except ValueError:
+        raise ProcedureError(
+            "Conversion failed when converting from a character string to uniqueidentifier."
+        )
+
+
+def _datetime(params, name):
+    try:
+        return to_datetime_text(_param(params, name))
+    except ValueError:
+        raise ProcedureError("Conversion failed when converting date and/or time from character string.")
+
+
+def _cart_items(params, name):
+    """OPENJSON(@items) into CartItemsType rows (ItemId, Quantity, AdditionalNotes)."""
+    value = _param(params, name)
+
+    # DAB passes a JSON array body value through as its JSON text
+    if not isinstance(value, str):
+        value = json.dumps(value)
+
+    try:
+        items = json.loads(value)
+    except (TypeError, ValueError):
+        raise ProcedureError("Invalid JSON format")
+
+    if isinstance(items, dict):
+        items = list(items.values())
+
+    return [
+        (item.get("id"), item.get("quantity"), item.get("additional_notes"))
+        for item in items
+        if isinstance(item, dict)
+    ]
+
+
+# ---------------------------------------------------
+# Shared Steps
+# ---------------------------------------------------
+
+def _duplicate_transaction(connection, transaction_id):
+    row = connection.execute(
+        "SELECT 1 FROM Transactions WHERE id = ?", (transaction_id,)
+    ).fetchone()
+
+    return row is not None
+
+
+_DUPLICATE_ROW = {
+    "Status": "Error",
+    "ErrorCode": "DUPLICATE_TRANSACTION",
+    "message": "Transaction with this ID already exists.",
+}
+
+
+def _log_transaction(connection, user_id, transaction_type, resident_id,
+                     transaction_id, parent_transaction_id=None):
+    connection.execute(
+        "INSERT INTO Transactions "
+        "(id, user_id, transaction_type, resident_id, parent_transaction_id) "
+        "VALUES (?, ?, ?, ?, ?)",
+        (transaction_id, user_id, transaction_type, resident_id, parent_transaction_id),
+    )
+
+
+def _log_transaction_items(connection, transaction_id, cart):
+    connection.executemany(
+        "INSERT INTO TransactionItems (transaction_id, item_id, quantity, additional_notes) "
+        "VALUES (?, ?, ?, ?)",
+        [(transaction_id, item_id, quantity, notes) for item_id, quantity, notes in cart],
+    )
+
+
+def _adjust_quantities(connection, cart, sign):
+    connection.executemany(
+        "UPDATE Items SET quantity = quantity + ? WHERE id = ?",
+        [(sign * quantity, item_id) for item_id, quantity, _ in cart],
+    )
+
+
+def _error_row(error):
+    return {"Status": "Error", "message": f"Error: {error}"}
+
+
+def _cart_transaction(database, cart, transaction_id, log):
+    """
+    The BEGIN TRANSACTION / TRY ... CATCH shape shared by the checkout
+    and restock procedures. ``log(connection)`` does the writes.
+    """
+    try:
+        with database.transaction() as connection:
+            if _duplicate_transaction(connection, transaction_id):
+                return [_DUPLICATE_ROW]
+
+            log(connection)
+
+    except sqlite3.Error as error:
+        return [_error_row(error)]
+
+    return [{"Status": "Success", "message": transaction_id}]
+
+
+# ---------------------------------------------------
+# Procedures
+# ---------------------------------------------------
+
+@procedure("ProcessCheckout")
+def process_checkout(database, params):
+    cart = _cart_items(params, "items")
+    user_id = _int(params, "user_id")
+    resident_id = _int(params, "resident_id")
+    transaction_id = _guid(params, "new_transaction_id")
+    original_id = _guid(params, "original_transaction_id")
+
+    transaction_type = CHECKOUT_EDIT if original_id else CHECKOUT
+
+    def log(connection):
+        _adjust_quantities(connection, cart, -1)
+        _log_transaction(
+            connection, user_id, transaction_type, resident_id, transaction_id, original_id
+        )
+        _log_transaction_items(connection, transaction_id, cart)
+
+    return _cart_transaction(database, cart, transaction_id, log)
+
+
+@procedure("ProcessInventoryChange")
+def process_inventory_change(database, params):
+    cart = _cart_items(params, "item")
+    user_id = _int(params, "user_id")
+    transaction_id = _guid(params, "new_transaction_id")
+
+    def log(connection):
+        _log_transaction(connection, user_id, RESTOCK, None, transaction_id)
+        _log_transaction_items(connection, transaction_id, cart)
+        _adjust_quantities(connection, cart, 1)
+
+    return _cart_transaction(database, cart, transaction_id, log)
+
+
+@procedure("ProcessWelcomeBasketCheckout")
+def process_welcome_basket_checkout(database, params):
+    user_id = _int(params, "user_id")
+    mattress_size = _int(params, "mattress_size")
+    quantity = _int(params, "quantity")
+    resident_id = _int(params, "resident_id")
+    transaction_id = _guid(params, "new_transaction_id")
+
+    # Sheet sets have items_per_basket = 0 and are added by mattress size
+    basket = database.execute(
+        "SELECT id, ? * items_per_basket FROM Items "
+        "WHERE type = 'Welcome Basket' AND items_per_basket > 0",
+        (quantity,),
+    ).fetchall()
+
+    cart = [(item_id, amount, None) for item_id, amount in basket]
+    cart.append((mattress_size, quantity, None))
+
+    def log(connection):
+        _adjust_quantities(connection, cart, -1)
+        _log_transaction(connection, user_id, CHECKOUT, resident_id, transaction_id)
+        _log_transaction_items(connection, transaction_id, cart)
+
+    return _cart_transaction(database, cart, transaction_id, log)
+
+
+@procedure("ProcessInventoryResetQuantity")
+def process_inventory_reset_quantity(database, params):
+    user_id = _int(params, "user_id")
+    transaction_id = _guid(params, "new_transaction_id")
+
+    if _param(params, "items") is None:
+        resets = [(_int(params, "item_id"), _int(params, "new_quantity"), _param(params, "additional_notes"))]
+    else:
+        try:
+            resets = _cart_items(params, "items")
+        except ProcedureError as error:
+            return [{"Status": "Error", "message": str(error)}]
+
+    if not resets or any(item_id is None for item_id, _, _ in resets):
+        return [{"Status": "Error", "message": "Invalid item id"}]
+
+    if any(quantity is None or quantity < 0 for _, quantity, _ in resets):
+        return [{"Status": "Error", "message": "Invalid quantity (must be non-negative)"}]
+
+    item_ids = [item_id for item_id, _, _ in resets]
+    marks = ", ".join("?" for _ in item_ids)
+
+    if len(database.query(f"SELECT id FROM Items WHERE id IN ({marks})", item_ids)) < len(set(item_ids)):
+        return [{"Status": "Error", "message": "Item not found"}]
+
+    if len(set(item_ids)) < len(item_ids):
+        return [{"Status": "Error", "message": "Duplicate item id"}]
+
+    if database.query("SELECT 1 FROM Transactions WHERE id = ?", (transaction_id,)):
+        return [_DUPLICATE_ROW]
+
+    try:
+        with database.transaction() as connection:
+            updated = connection.executemany(
+                "UPDATE Items SET quantity = ? WHERE id = ?",
+                [(quantity, item_id) for item_id, quantity, _ in resets],
+            ).rowcount
+
+            if updated != len(resets):
+                raise sqlite3.OperationalError("Item update failed")
+
+            _log_transaction(connection, user_id, CORRECTION, None, transaction_id)
+            _log_transaction_items(connection, transaction_id, resets)
+
+    except sqlite3.Error as error:
+        return [_error_row(error)]
+
+    return [{"Status": "Success", "message": transaction_id}]
+
+
+@procedure("CheckPastCheckout")
+def check_past_checkout(database, params):
+    return database.query(
+        """
+        SELECT * FROM TransactionItems WHERE transaction_id IN
+            (SELECT id FROM Transactions WHERE resident_id = ?)
+            AND item_id IN
+            (SELECT item_id FROM Tracking)
+        """,
+        (_int(params, "resident_id"),),
+    )
+
+
+def _date_range(params):
+    start = _datetime(params, "start_date")
+    end = _datetime(params, "end_date")
+
+    if start is not None and end is not None and start > end:
+        raise ProcedureError("Start date must be before or equal to end date")
+
+    return start, end
+
+
+def _page(params):
+    """
+    (LIMIT, after date, after id) from @page_size and @cursor, the
+    page_cursor ("<transaction_date>|<id>") of the previous page's last row.
+    """
+    page_size = _int(params, "page_size")
+    cursor = _param(params, "cursor")
+
+    if page_size is not None and page_size < 1:
+        raise ProcedureError("Page size must be at least 1")
+
+    # SQLite reads LIMIT -1 as no limit
+    limit = -1 if page_size is None else page_size
+
+    if cursor is None or cursor == "":
+        return limit, None, None
+
+    after_date, _, after_id = str(cursor).partition("|")
+
+    try:
+        after_date = to_datetime_text(after_date)
+        uuid.UUID(after_id)
+    except ValueError:
+        raise ProcedureError("Invalid cursor")
+
+    return limit, after_date, after_id
+
+
+# Keyset condition on (transaction_date DESC, id): rows after the cursor's
+_AFTER_CURSOR = "(? IS NULL OR t.transaction_date < ? OR (t.transaction_date = ? AND t.id > ?))"
+
+
+@procedure("GetCheckoutHistory")
+def get_checkout_history(database, params):
+    start, end = _date_range(params)
+    limit, after_date, after_id = _page(params)
+
+    return database.query(
+        f"""
+        WITH History AS (
+            SELECT t.id
+            FROM Transactions t
+            WHERE t.transaction_date >= ?
+                AND t.transaction_date <= ?
+                AND t.transaction_type IN (
+                    SELECT id FROM TransactionTypes WHERE transaction_type IN ('CHECKOUT', 'CHECKOUT_EDIT')
+                )
+                AND EXISTS (
+                    SELECT 1
+                    FROM Residents r
+                    INNER JOIN Units u ON r.unit_id = u.id
+                    INNER JOIN Buildings b ON u.building_id = b.id
+                    WHERE r.id = t.resident_id
+                )
+                AND {_AFTER_CURSOR}
+            ORDER BY t.transaction_date DESC, t.id
+            LIMIT ?
+        ),
+        NetItems AS (
+            SELECT lines.transaction_id, lines.item_id, SUM(IFNULL(lines.quantity, 0)) AS net_qty
+            FROM (
+                SELECT h.id AS transaction_id, ti.item_id, ti.quantity
+                FROM History h
+                INNER JOIN TransactionItems ti ON ti.transaction_id = h.id
+                UNION ALL
+                SELECT h.id, ti.item_id, ti.quantity
+                FROM History h
+                INNER JOIN Transactions corrections ON corrections.parent_transaction_id = h.id
+                INNER JOIN TransactionItems ti ON ti.transaction_id = corrections.id
+            ) AS lines
+            GROUP BY lines.transaction_id, lines.item_id
+            HAVING SUM(IFNULL(lines.quantity, 0)) > 0
+        ),
+        Totals AS (
+            SELECT transaction_id, SUM(net_qty) AS total_quantity
+            FROM NetItems
+            GROUP BY transaction_id
+        ),
+        WelcomeBaskets AS (
+            SELECT
+                ti.transaction_id,
+                MAX(ti.item_id) AS welcome_basket_item_id,
+                MAX(ti.quantity) AS welcome_basket_quantity
+            FROM History h
+            INNER JOIN TransactionItems ti ON ti.transaction_id = h.id
+            WHERE ti.item_id IN {SHEET_SET_ITEM_IDS}
+            GROUP BY ti.transaction_id
+        )
+        SELECT
+            t.user_id,
+            t.id AS transaction_id,
+            t.transaction_type,
+            t.parent_transaction_id,
+            t.resident_id,
+            r.name AS resident_name,
+            u.unit_number,
+            b.id AS building_id,
+            b.code AS building_code,
+            b.name AS building_name,
+            t.transaction_date,
+            IFNULL(totals.total_quantity, 0) AS total_quantity,
+            wb.welcome_basket_item_id,
+            wb.welcome_basket_quantity,
+            t.transaction_date || '|' || t.id AS page_cursor
+        FROM History h
+        INNER JOIN Transactions t ON t.id = h.id
+        INNER JOIN Residents r ON t.resident_id = r.id
+        INNER JOIN Units u ON r.unit_id = u.id
+        INNER JOIN Buildings b ON u.building_id = b.id
+        LEFT JOIN Totals totals ON totals.transaction_id = h.id
+        LEFT JOIN WelcomeBaskets wb ON wb.transaction_id = h.id
+        ORDER BY t.transaction_date DESC, t.id
+        """,
+        (start, end, after_date, after_date, after_date, after_id, limit),
+    )
+
+
+@procedure("GetInventoryHistory")
+def get_inventory_history(database, params):
+    start, end = _date_range(params)
+    limit, after_date, after_id = _page(params)
+
+    return database.query(
+        f"""
+        SELECT
+            t.user_id,
+            t.id AS transaction_id,
+            t.transaction_type,
+            t.transaction_date,
+            MAX(i.name) AS item_name,
+            MAX(c.name) AS category_name,
+            SUM(ti.quantity) AS quantity,
+            t.transaction_date || '|' || t.id AS page_cursor
+        FROM Transactions t
+        INNER JOIN TransactionItems ti ON ti.transaction_id = t.id
+        INNER JOIN Items i ON ti.item_id = i.id
+        INNER JOIN Categories c ON i.category_id = c.id
+        WHERE t.transaction_date >= ?
+            AND t.transaction_date <= ?
+            AND t.transaction_type IN (
+                SELECT id FROM TransactionTypes WHERE transaction_type IN ('RESTOCK', 'CORRECTION')
+            )
+            AND {_AFTER_CURSOR}
+        GROUP BY t.id
+        ORDER BY t.transaction_date DESC, t.id
+        LIMIT ?
+        """,
+        (start, end, after_date, after_date, after_date, after_id, limit),
+    )
+
+
+@procedure("GetLastResidentVisit")
+def get_last_resident_visit(database, params):
+    return database.query(
+        "SELECT transaction_date FROM Transactions WHERE resident_id = ? "
+        "ORDER BY transaction_date DESC LIMIT 1",
+        (_int(params, "resident_id"),),
+    )
+
+
+@procedure("GetTransaction")
+def get_transaction(database, params):
+    transaction_id = _param(params, "id")
+    transaction_id = str(transaction_id).lower() if transaction_id is not None else None
+
+    return database.query(
+        """
+        SELECT
+            T.id AS transaction_id,
+            T.user_id,
+            T.transaction_type,
+            T.parent_transaction_id,
+            T.resident_id,
+            R.name AS resident_name,
+            U.unit_number,
+            B.id AS building_id,
+            B.code AS building_code,
+            B.name AS building_name,
+            T.transaction_date,
+            IFNULL((
+                SELECT json_group_array(json(json_patch('{}', json_object(
+                    'id', TI.id,
+                    'item_id', TI.item_id,
+                    'quantity', TI.quantity,
+                    'transaction_id', TI.transaction_id,
+                    'additional_notes', TI.additional_notes
+                ))))
+                FROM (
+                    SELECT * FROM TransactionItems
+                    WHERE transaction_id = T.id
+                    ORDER BY item_id
+                ) TI
+                HAVING COUNT(*) > 0
+            ), '[]') AS items
+        FROM Transactions T
+        LEFT JOIN Residents R ON T.resident_id = R.id
+        LEFT JOIN Units U ON R.unit_id = U.id
+        LEFT JOIN Buildings B ON U.building_id = B.id
+        WHERE T.id = :id OR T.parent_transaction_id = :id
+        ORDER BY CASE WHEN T.id = :id THEN 0 ELSE 1 END, T.transaction_date
+        """,
+        {"id": transaction_id},
+    )
+
+
+@procedure("VerifyVolunteerPin")
+def verify_volunteer_pin(database, params):
+    volunteer_id = _int(params, "VolunteerId")
+    entered_pin = _param(params, "EnteredPin")
+
+    def result(is_valid, message):
+        return [{"IsValid": is_valid, "ErrorMessage": message}]
+
+    if entered_pin is None or len(str(entered_pin).strip()) != 4:
+        return result(False, "Entered PIN is invalid")
+
+    rows = database.query("SELECT PIN FROM Users WHERE id = ?", (volunteer_id,))
+    stored_pin = rows[0]["PIN"] if rows else None
+
+    if stored_pin is None:
+        return result(False, "Volunteer ID not found")
+
+    if stored_pin == str(entered_pin):
+        return result(True, "PIN is valid")
+
+    return result(False, "Entered PIN does not match stored PIN")
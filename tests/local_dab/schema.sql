@@ -0,0 +1,155 @@
+-- SQLite mirror of database/tables and database/views for the local
+-- Data API stand-in. Keep column names and order in step with the
+-- T-SQL definitions; the seed files in database/data_seed load as-is.
+--
+-- Type notes:
+--   BIT              -> BOOLEAN (returned to clients as true/false)
+--   DATETIME         -> TEXT 'YYYY-MM-DDTHH:MM:SS.fff' (UTC), so string
+--                       comparison orders the same way as the dates
+--   UNIQUEIDENTIFIER -> TEXT, lower case
+--   FOR JSON PATH    -> json_group_array(json_patch('{}', json_object(...))),
+--                       json_patch dropping NULL members like FOR JSON does
+
+CREATE TABLE Buildings (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    code TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE Categories (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    checkout_limit INTEGER NOT NULL
+);
+
+CREATE TABLE Items (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    category_id INTEGER NOT NULL,
+    description TEXT,
+    quantity INTEGER NOT NULL,
+    threshold INTEGER NOT NULL,
+    items_per_basket INTEGER
+);
+
+CREATE TABLE Residents (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    unit_id INTEGER NOT NULL
+);
+
+CREATE TABLE Tracking (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    item_id INTEGER NOT NULL,
+    notes_required BOOLEAN NOT NULL DEFAULT 0
+);
+
+CREATE TABLE Transactions (
+    id TEXT PRIMARY KEY,
+    user_id INTEGER NOT NULL,
+    resident_id INTEGER,
+    transaction_type INTEGER NOT NULL,
+    transaction_date TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%f', 'now')),
+    building_id INTEGER,
+    parent_transaction_id TEXT NULL
+);
+
+CREATE TABLE TransactionItems (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    transaction_id TEXT NOT NULL,
+    item_id INTEGER NOT NULL,
+    quantity INTEGER NOT NULL,
+    additional_notes TEXT
+);
+
+-- Same secondary indexes as database/tables/transaction.sql and transaction_item.sql.
+-- SQLite keeps Transactions in rowid order, so a date index stands in for
+-- the clustered CX_Transactions_TransactionDate_SequenceId there.
+CREATE INDEX IX_Transactions_TransactionDate_TransactionType ON Transactions (transaction_date, transaction_type);
+CREATE INDEX IX_Transactions_ResidentId_TransactionDate ON Transactions (resident_id, transaction_date);
+CREATE INDEX IX_Transactions_ParentTransactionId ON Transactions (parent_transaction_id);
+CREATE INDEX IX_TransactionItems_TransactionId_ItemId ON TransactionItems (transaction_id, item_id, quantity);
+
+CREATE TABLE TransactionTypes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    transaction_type TEXT NOT NULL
+);
+
+CREATE TABLE Units (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    building_id INTEGER,
+    unit_number TEXT NOT NULL,
+    FOREIGN KEY (building_id) REFERENCES Buildings(id)
+);
+
+CREATE TABLE Users (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL UNIQUE,
+    email TEXT NOT NULL UNIQUE,
+    PIN CHAR(4) NULL,
+    last_signed_in TEXT,
+    created_at TEXT NOT NULL,
+    active BOOLEAN NOT NULL,
+    role TEXT NOT NULL CHECK (role IN ('volunteer', 'admin')),
+    CHECK (role = 'admin' OR (PIN IS NOT NULL))
+);
+
+CREATE VIEW ItemsWithCategory
+AS
+    SELECT
+        i.id,
+        i.name,
+        i.type,
+        c.name AS category,
+        i.description,
+        i.quantity,
+        CASE
+            WHEN i.quantity = 0 THEN 'Out of Stock'
+            WHEN i.quantity > 0 AND i.quantity <= i.threshold THEN 'Low Stock'
+            WHEN i.quantity < 0 THEN 'Needs Review'
+            ELSE 'Normal Stock'
+        END AS status
+    FROM
+        Items i
+    LEFT JOIN
+        Categories c ON c.id = i.category_id;
+
+CREATE VIEW ItemsByCategory
+AS
+    SELECT
+        Categories.id,
+        Categories.checkout_limit,
+        Categories.name AS category,
+        (
+        SELECT
+            json_group_array(json(json_patch('{}', json_object(
+                'id', Items.id,
+                'name', Items.name,
+                'description', Items.description,
+                'quantity', Items.quantity
+            ))))
+        FROM
+            Items
+        WHERE
+            Items.category_id = Categories.id
+        HAVING
+            COUNT(*) > 0
+    ) AS items
+    FROM
+        Categories;
+
+CREATE VIEW ResidentsByBuilding
+AS
+    SELECT
+        r.id,
+        r.name,
+        u.id AS unit_id,
+        u.unit_number,
+        b.id AS building_id,
+        b.name AS building_name,
+        b.code AS building_code
+    FROM
+        Residents r
+        JOIN Units u ON r.unit_id = u.id
+        JOIN Buildings b ON u.building_id = b.id;
@@ -0,0 +1,330 @@
+import base64
+import json
+import sqlite3
+from urllib.parse import parse_qsl, quote, unquote, urlsplit
+
+from tests.local_dab import odata
+from tests.local_dab.config import ANONYMOUS_ROLE, load_entities
+from tests.local_dab.database import DATETIME_COLUMNS, Database, to_datetime_text
+from tests.local_dab.procedures import PROCEDURES, ProcedureError
+from tests.local_dab.snapshots import CONTROL_URL, DatabaseStore, SnapshotError, database_name
+from tests.utilities.http_server import BackgroundServer, Response
+
+
+# Requests reach DAB as /api/... directly and as /data-api/api/...
+# through the SWA CLI proxy (src/types/constants.ts API_PREFIX)
+API_PREFIXES = ("/data-api/api/", "/api/")
+
+# Snapshot / restore endpoints for the test fixtures (snapshots.py)
+CONTROL_PREFIX = CONTROL_URL + "/"
+
+
+class ApiError(Exception):
+    """Turned into DAB's {"error": {"code", "message", "status"}} body."""
+
+    def __init__(self, status, code, message):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+class DataApi:
+    """
+    Routes DAB REST requests (tables, views and stored procedures from
+    dab-config.json) to a Database. Synchronous: the server calls
+    handle() on its event loop thread.
+
+    Requests carrying the LocalDabDatabase cookie use that copy of the
+    database (see DatabaseStore); all others use ``database``.
+    """
+
+    def __init__(self, database, entities=None):
+        self.database = database
+        self.store = DatabaseStore(database)
+        self.entities = entities if entities is not None else load_entities()
+
+    def handle(self, method, target, headers, body):
+        try:
+            return self._dispatch(method, target, headers, body)
+
+        except ApiError as error:
+            return self._error(error.status, error.code, error.message)
+
+        except (odata.QueryError, ProcedureError, SnapshotError) as error:
+            code = "DatabaseOperationFailed" if isinstance(error, ProcedureError) else "BadRequest"
+            return self._error(400, code, str(error))
+
+        except Exception as error:  # noqa: BLE001 - mirror DAB's 500 body
+            return self._error(500, "UnexpectedError", f"{type(error).__name__}: {error}")
+
+    @staticmethod
+    def _error(status, code, message):
+        return Response(status, {"error": {"code": code, "message": message, "status": status}})
+
+    # ---------------------------------------------------
+    # Routing
+    # ---------------------------------------------------
+
+    def _dispatch(self, method, target, headers, body):
+        parts = urlsplit(target)
+        path = parts.path
+
+        if path.startswith(CONTROL_PREFIX):
+            segments = [unquote(s) for s in path[len(CONTROL_PREFIX):].split("/") if s]
+            return Response(*self.store.control(method, segments))
+
+        prefix = next((p for p in API_PREFIXES if path.startswith(p)), None)
+
+        if prefix is None:
+            raise ApiError(404, "EntityNotFound", "Invalid URL.")
+
+        segments = [unquote(s) for s in path[len(prefix):].split("/") if s]
+
+        if not segments or segments[0] not in self.entities:
+            raise ApiError(404, "EntityNotFound", f"Invalid Entity path: {path}.")
+
+        entity = self.entities[segments[0]]
+        database = self.store.get(database_name(headers.get("cookie")))
+        role = headers.get("x-ms-api-role") or ANONYMOUS_ROLE
+        self._check_client_role(headers.get("x-ms-client-principal"), role)
+        query = dict(parse_qsl(parts.query, keep_blank_values=True))
+
+        if entity.is_procedure:
+            self._authorize(entity, role, "execute")
+            params = query if method == "GET" else self._json_body(body)
+            return Response(200, {"value": PROCEDURES[entity.object](database, params)})
+
+        key = self._primary_key(entity, segments[1:])
+
+        if method == "GET":
+            self._authorize(entity, role, "read")
+            return self._read(database, entity, key, query, parts.path)
+
+        if method == "POST":
+            self._authorize(entity, role, "create")
+            return self._create(database, entity, self._json_body(body))
+
+        if method in ("PATCH", "PUT"):
+            self._authorize(entity, role, "update")
+            return self._update(database, entity, key, self._json_body(body), upsert=method == "PUT")
+
+        if method == "DELETE":
+            self._authorize(entity, role, "delete")
+            return self._delete(database, entity, key)
+
+        raise ApiError(405, "BadRequest", f"Method {method} not allowed.")
+
+    @staticmethod
+    def _check_client_role(principal_header, role):
+        """
+        Behind SWA, X-MS-API-ROLE must be one of the signed-in
+        principal's roles (sent base64 JSON in X-MS-CLIENT-PRINCIPAL).
+        """
+        if not principal_header or role == ANONYMOUS_ROLE:
+            return
+
+        try:
+            roles = json.loads(base64.b64decode(principal_header)).get("userRoles", [])
+        except (ValueError, AttributeError):
+            raise ApiError(400, "BadRequest", "Invalid X-MS-CLIENT-PRINCIPAL header.")
+
+        if role not in roles:
+            raise ApiError(403, "AuthorizationCheckFailed", "The client role header value does not match any of the user's roles.")
+
+    @staticmethod
+    def _authorize(entity, role, action):
+        if not entity.allows(role, action):
+            raise ApiError(403, "AuthorizationCheckFailed", "Authorization Failure: Access Not Allowed.")
+
+    @staticmethod
+    def _json_body(body):
+        if not body:
+            return {}
+
+        try:
+            value = json.loads(body)
+        except ValueError:
+            raise ApiError(400, "BadRequest", "The request body is not valid JSON.")
+
+        if not isinstance(value, dict):
+            raise ApiError(400, "BadRequest", "The request body must be a JSON object.")
+
+        return value
+
+    def _primary_key(self, entity, segments):
+        """/id/5 (or /k1/v1/k2/v2 for compound keys) as {column: value}."""
+        if not segments:
+            return None
+
+        if len(segments) % 2:
+            raise ApiError(400, "BadRequest", "Support for url template with implicit primary key field names is not yet added.")
+
+        key = dict(zip(segments[::2], segments[1::2]))
+
+        if sorted(key) != sorted(entity.key_fields):
+            raise ApiError(400, "BadRequest", "Primary key column(s) provided do not match DB schema.")
+
+        return key
+
+    # ---------------------------------------------------
+    # Table / View Operations
+    # ---------------------------------------------------
+
+    def _read(self, database, entity, key, query, path):
+        columns = database.columns(entity.object)
+        where, params = [], []
+
+        if key:
+            where.append(" AND ".join(f'"{name}" = ?' for name in key))
+            params.extend(key.values())
+
+        if query.get("$filter"):
+            clause, filter_params = odata.parse_filter(query["$filter"], columns)
+            where.append(clause)
+            params.extend(filter_params)
+
+        selected = columns
+        if query.get("$select"):
+            selected = odata.parse_select(query["$select"], columns)
+
+        # DAB orders by the primary key when $orderby is absent
+        if query.get("$orderby"):
+            order = odata.parse_orderby(query["$orderby"], columns)
+        else:
+            order = ", ".join(f'"{name}"' for name in entity.key_fields)
+
+        first = odata.parse_first(query["$first"]) if "$first" in query else odata.DEFAULT_PAGE_SIZE
+        offset = odata.decode_after(query["$after"]) if query.get("$after") else 0
+
+        sql = "SELECT " + ", ".join(f'"{name}"' for name in selected) + f' FROM "{entity.object}"'
+
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        if order:
+            sql += f" ORDER BY {order}"
+
+        # One extra row tells whether there is a next page
+        sql += " LIMIT ? OFFSET ?"
+        rows = database.query(sql, [*params, first + 1, offset])
+
+        if key and not rows:
+            raise ApiError(404, "EntityNotFound", "Not Found")
+
+        body = {"value": rows[:first]}
+
+        if len(rows) > first:
+            next_query = {k: v for k, v in query.items() if k != "$after"}
+            next_query["$after"] = odata.encode_after(offset + first)
+            body["nextLink"] = path + "?" + "&".join(
+                f"{name}={quote(value, safe='$,')}" for name, value in next_query.items()
+            )
+
+        return Response(200, body)
+
+    @staticmethod
+    def _writable(database, entity, values):
+        columns = {column.lower(): column for column in database.columns(entity.object)}
+        row = {}
+
+        for name, value in values.items():
+            column = columns.get(name.lower())
+
+            if column is None:
+                raise ApiError(400, "BadRequest", f"Invalid request body. Contained unexpected fields in body: {name}")
+
+            if column in DATETIME_COLUMNS:
+                value = to_datetime_text(value)
+
+            row[column] = value
+
+        return row
+
+    @staticmethod
+    def _fetch(database, entity, key):
+        where = " AND ".join(f'"{name}" = ?' for name in key)
+
+        return database.query(
+            f'SELECT * FROM "{entity.object}" WHERE {where}', list(key.values())
+        )
+
+    def _create(self, database, entity, values):
+        row = self._writable(database, entity, values)
+        names = ", ".join(f'"{name}"' for name in row)
+        marks = ", ".join("?" for _ in row)
+
+        try:
+            cursor = database.execute(
+                f'INSERT INTO "{entity.object}" ({names}) VALUES ({marks})', list(row.values())
+            )
+        except sqlite3.IntegrityError as error:
+            raise ApiError(400, "DatabaseInputError", str(error))
+
+        key = {name: row.get(name, cursor.lastrowid) for name in entity.key_fields}
+        location = "/".join(f"{name}/{value}" for name, value in key.items())
+
+        return Response(201, {"value": self._fetch(database, entity, key)}, {"Location": location})
+
+    def _update(self, database, entity, key, values, upsert=False):
+        if not key:
+            raise ApiError(400, "BadRequest", "Primary Key for UPSERT requests is required.")
+
+        row = self._writable(database, entity, values)
+
+        if not row:
+            return Response(200, {"value": self._fetch(database, entity, key)})
+
+        assignments = ", ".join(f'"{name}" = ?' for name in row)
+        where = " AND ".join(f'"{name}" = ?' for name in key)
+
+        try:
+            cursor = database.execute(
+                f'UPDATE "{entity.object}" SET {assignments} WHERE {where}',
+                [*row.values(), *key.values()],
+            )
+        except sqlite3.IntegrityError as error:
+            raise ApiError(400, "DatabaseInputError", str(error))
+
+        if cursor.rowcount == 0:
+            if not upsert:
+                raise ApiError(404, "EntityNotFound", "No Update could be performed, record not found")
+
+            return self._create(database, entity, {**values, **key})
+
+        return Response(200, {"value": self._fetch(database, entity, key)})
+
+    def _delete(self, database, entity, key):
+        if not key:
+            raise ApiError(400, "BadRequest", "Primary Key for DELETE requests is required.")
+
+        where = " AND ".join(f'"{name}" = ?' for name in key)
+        cursor = database.execute(
+            f'DELETE FROM "{entity.object}" WHERE {where}', list(key.values())
+        )
+
+        if cursor.rowcount == 0:
+            raise ApiError(404, "EntityNotFound", "Not Found")
+
+        return Response(204)
+
+
+class LocalDataApi(BackgroundServer):
+    """
+    DataApi over HTTP/1.1 (asyncio, keep-alive).
+
+        api = LocalDataApi(port=5000).start()   # background thread
+        ...
+        api.stop()
+
+    or in the foreground with ``python -m tests.local_dab``.
+    """
+
+    thread_name = "local-data-api"
+
+    def __init__(self, host="127.0.0.1", port=5000, database=None, entities=None):
+        super().__init__(host, port)
+        self.database = database or Database.seeded()
+        self.api = DataApi(self.database, entities)
+
+    async def respond(self, request, reader, writer):
+        return self.api.handle(request.method, request.target, request.headers, request.body)
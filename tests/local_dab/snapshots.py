@@ -0,0 +1,167 @@
+import re
+import time
+from http.cookies import SimpleCookie
+
+import requests
+
+from tests.local_dab.database import Database
+
+
+# Database a request without DATABASE_COOKIE uses
+DEFAULT_DATABASE = "main"
+
+# Snapshot every database starts from and can always go back to
+BASELINE = "baseline"
+
+# Set in each worker's browser (and sent by its api_client) so the
+# worker reads and writes its own copy of the data
+DATABASE_COOKIE = "LocalDabDatabase"
+
+# Where DataApi serves DatabaseStore.control()
+CONTROL_URL = "/_local"
+
+_NAME = re.compile(r"^[\w.:-]{1,100}$")
+
+
+class SnapshotError(ValueError):
+    pass
+
+
+def database_name(cookie_header):
+    cookie = SimpleCookie()
+    cookie.load(cookie_header or "")
+
+    if DATABASE_COOKIE not in cookie:
+        return DEFAULT_DATABASE
+
+    return cookie[DATABASE_COOKIE].value
+
+
+def _check_name(kind, name):
+    if not _NAME.match(name or ""):
+        raise SnapshotError(f"Invalid {kind} name {name!r}")
+
+
+class DatabaseStore:
+    """
+    The seeded database plus one copy of it per xdist worker (created
+    on the worker's first request), each with named snapshots.
+
+    Snapshots and restores are SQLite online backups between in-memory
+    databases: copying the whole seed data takes well under 1 ms.
+    """
+
+    def __init__(self, seeded):
+        self.baseline = seeded.snapshot()
+        self.databases = {DEFAULT_DATABASE: seeded}
+        # (database, snapshot) -> connection
+        self.snapshots = {}
+
+    def get(self, name=DEFAULT_DATABASE):
+        if name not in self.databases:
+            _check_name("database", name)
+            self.databases[name] = Database.from_snapshot(self.baseline)
+
+        return self.databases[name]
+
+    def take(self, database, snapshot):
+        _check_name("snapshot", snapshot)
+
+        if snapshot == BASELINE:
+            raise SnapshotError(f"{BASELINE!r} is read-only")
+
+        previous = self.snapshots.pop((database, snapshot), None)
+
+        if previous is not None:
+            previous.close()
+
+        self.snapshots[(database, snapshot)] = self.get(database).snapshot()
+
+    def restore(self, database, snapshot=BASELINE):
+        if snapshot == BASELINE:
+            source = self.baseline
+        else:
+            source = self.snapshots.get((database, snapshot))
+
+        if source is None:
+            raise SnapshotError(f"No snapshot {snapshot!r} of database {database!r}")
+
+        self.get(database).restore(source)
+
+    def drop(self, database, snapshot):
+        connection = self.snapshots.pop((database, snapshot), None)
+
+        if connection is None:
+            raise SnapshotError(f"No snapshot {snapshot!r} of database {database!r}")
+
+        connection.close()
+
+    # ---------------------------------------------------
+    # Control Endpoints
+    # ---------------------------------------------------
+
+    def control(self, method, segments):
+        """
+        /_local/databases/{db}/snapshots/{name}           POST take, DELETE drop
+        /_local/databases/{db}/snapshots/{name}/restore   POST restore
+
+        Returns (status, body).
+        """
+        if len(segments) not in (4, 5) or segments[0] != "databases" or segments[2] != "snapshots":
+            raise SnapshotError("Unknown control URL")
+
+        database, snapshot = segments[1], segments[3]
+        started = time.perf_counter()
+
+        if len(segments) == 5 and segments[4] == "restore" and method == "POST":
+            self.restore(database, snapshot)
+            status = 200
+        elif len(segments) == 4 and method == "POST":
+            self.take(database, snapshot)
+            status = 201
+        elif len(segments) == 4 and method == "DELETE":
+            self.drop(database, snapshot)
+            status = 200
+        else:
+            raise SnapshotError(f"Method {method} not allowed")
+
+        return status, {
+            "database": database,
+            "snapshot": snapshot,
+            "ms": round((time.perf_counter() - started) * 1000, 3),
+        }
+
+
+class SnapshotClient:
+    """
+    One worker's handle on its database in a LocalDataApi, possibly in
+    another process (the xdist controller):
+
+        client = SnapshotClient(api_url, "gw0")
+        client.take("module")
+        ...
+        client.restore("module")     # or client.restore() for the seed data
+    """
+
+    def __init__(self, api_url, database=DEFAULT_DATABASE, http=None):
+        self.api_url = api_url.rstrip("/")
+        self.database = database
+        self.http = http or requests.Session()
+
+    def _call(self, method, snapshot, action=""):
+        url = f"{self.api_url}{CONTROL_URL}/databases/{self.database}/snapshots/{snapshot}{action}"
+        response = self.http.request(method, url, timeout=10)
+
+        if not response.ok:
+            raise SnapshotError(f"{method} {url} -> {response.status_code}: {response.text[:200]}")
+
+        return response.json()
+
+    def take(self, snapshot):
+        return self._call("POST", snapshot)
+
+    def restore(self, snapshot=BASELINE):
+        return self._call("POST", snapshot, "/restore")
+
+    def drop(self, snapshot):
+        return self._call("DELETE", snapshot)
@@ -0,0 +1,18 @@
+"""
+Local stand-in for the Static Web Apps host: SWA authentication
+(/.auth/me, /.auth/login/aad, /.auth/logout) with configurable client
+principals, staticwebapp.config.json route roles, and a proxy to the
+Vite dev server and the data API.
+"""
+from tests.local_swa.auth import AUTH_COOKIE, STUB_HEADER, AuthStub, load_principals
+from tests.local_swa.routes import RouteRules
+from tests.local_swa.server import LocalSwa
+
+__all__ = [
+    "AUTH_COOKIE",
+    "STUB_HEADER",
+    "AuthStub",
+    "LocalSwa",
+    "RouteRules",
+    "load_principals",
+]
@@ -0,0 +1,46 @@
+import argparse
+import asyncio
+
+from tests.local_swa import AuthStub, LocalSwa, load_principals
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.local_swa",
+        description="Serve the app with stubbed SWA authentication.",
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=4280)
+    parser.add_argument("--app-url", default="http://localhost:3000")
+    parser.add_argument("--data-api-url", default="http://127.0.0.1:5000")
+    parser.add_argument("--principals", default=None, help="principals JSON file")
+    parser.add_argument(
+        "--default-principal",
+        default=None,
+        help="sign in as this principal without showing the chooser",
+    )
+    args = parser.parse_args()
+
+    swa = LocalSwa(
+        host=args.host,
+        port=args.port,
+        app_url=args.app_url,
+        data_api_url=args.data_api_url,
+        auth=AuthStub(load_principals(args.principals), default_principal=args.default_principal),
+    )
+
+    async def run():
+        server = await swa.serve()
+        print(f"Local SWA listening on {swa.url} (app {args.app_url}, data API {args.data_api_url})")
+
+        async with server:
+            await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import base64
+import html
+import json
+from http.cookies import SimpleCookie
+from pathlib import Path
+from urllib.parse import parse_qs, quote, urlsplit
+
+from tests.utilities.http_server import Response
+
+
+# Cookie Static Web Apps keeps the signed-in principal in
+AUTH_COOKIE = "StaticWebAppsAuthCookie"
+
+# Present on every /.auth response so tests can tell the stub from SWA
+STUB_HEADER = "X-Auth-Stub"
+
+DEFAULT_PRINCIPALS_FILE = Path(__file__).with_name("principals.json")
+
+
+def load_principals(path=None):
+    """Client principals by name, e.g. {"admin": {...}, "volunteer": {...}}."""
+    return json.loads(Path(path or DEFAULT_PRINCIPALS_FILE).read_text())
+
+
+def encode_principal(principal):
+    """Base64 JSON, the format of SWA's x-ms-client-principal header."""
+    return base64.b64encode(json.dumps(principal).encode()).decode()
+
+
+def decode_principal(value):
+    try:
+        return json.loads(base64.b64decode(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def _local_redirect(uri):
+    """Only same-origin paths are followed, like SWA."""
+    if not uri or not uri.startswith("/") or uri.startswith("//"):
+        return "/"
+
+    return uri
+
+
+class AuthStub:
+    """
+    Local stand-in for SWA's built-in authentication:
+
+        /.auth/me                 {"clientPrincipal": {...} | null}
+        /.auth/login/<provider>   sign in as ?principal=<name>, as the
+                                  principal mapped to ?login_hint=<user>,
+                                  or as default_principal; otherwise a
+                                  page listing the principals
+        /.auth/logout             sign out
+
+    Login and logout redirect to post_login_redirect_uri /
+    post_logout_redirect_uri (default "/").
+    """
+
+    def __init__(self, principals=None, logins=None, default_principal=None):
+        self.principals = principals if principals is not None else load_principals()
+        # Microsoft usernames (.env ADMIN_USERNAME, ...) -> principal name
+        self.logins = {k.lower(): v for k, v in (logins or {}).items() if k}
+        self.default_principal = default_principal
+
+    def current(self, request):
+        """Principal signed in on this request, or None."""
+        cookie = SimpleCookie()
+        cookie.load(request.headers.get("cookie", ""))
+
+        if AUTH_COOKIE not in cookie:
+            return None
+
+        return decode_principal(cookie[AUTH_COOKIE].value)
+
+    def handle(self, request):
+        parts = urlsplit(request.target)
+        query = {name: values[-1] for name, values in parse_qs(parts.query).items()}
+        segments = [s for s in parts.path.split("/") if s]
+
+        if segments == [".auth", "me"]:
+            response = Response(200, {"clientPrincipal": self.current(request)})
+
+        elif segments[:2] == [".auth", "login"]:
+            response = self._login(query)
+
+        elif segments == [".auth", "logout"]:
+            response = Response(302, headers={
+                "Location": _local_redirect(query.get("post_logout_redirect_uri")),
+                "Set-Cookie": f"{AUTH_COOKIE}=; Path=/; Max-Age=0; HttpOnly; SameSite=Lax",
+            })
+
+        else:
+            response = Response(404, {"error": f"Unknown auth route {parts.path}"})
+
+        response.headers[STUB_HEADER] = "1"
+        response.headers["Cache-Control"] = "no-store"
+        return response
+
+    def _login(self, query):
+        name = (
+            query.get("principal")
+            or self.logins.get(query.get("login_hint", "").lower())
+            or self.default_principal
+        )
+
+        redirect = _local_redirect(query.get("post_login_redirect_uri"))
+
+        if name is None:
+            return self._chooser(redirect)
+
+        principal = self.principals.get(name)
+
+        if principal is None:
+            return Response(400, {"error": f"Unknown principal {name!r}"})
+
+        return Response(302, headers={
+            "Location": redirect,
+            "Set-Cookie": (
+                f"{AUTH_COOKIE}={encode_principal(principal)}; "
+                "Path=/; HttpOnly; SameSite=Lax"
+            ),
+        })
+
+    def _chooser(self, redirect):
+        links = "".join(
+            f'<li><a href="/.auth/login/aad?principal={quote(name)}'
+            f'&amp;post_login_redirect_uri={quote(redirect)}">'
+            f'{html.escape(name)} ({html.escape(principal.get("userDetails", ""))})</a></li>'
+            for name, principal in self.principals.items()
+        )
+
+        page = (
+            "<!DOCTYPE html><html><head><title>Local sign-in</title></head>"
+            f"<body><h1>Local sign-in</h1><ul>{links}</ul></body></html>"
+        )
+
+        return Response(200, page, content_type="text/html; charset=utf-8")
@@ -0,0 +1,79 @@
+import json
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from tests.local_dab.config import REPO_ROOT
+from tests.utilities.http_server import Response
+
+
+SWA_CONFIG = REPO_ROOT / "staticwebapp.config.json"
+
+# Roles every request has, before any from the principal
+ANONYMOUS_ROLES = ("anonymous",)
+
+
+def route_matches(pattern, path):
+    """SWA route patterns: exact, "/prefix/*" (prefix included) or globs."""
+    pattern = pattern.lower()
+    path = path.lower()
+
+    if pattern.endswith("/*"):
+        base = pattern[:-2]
+        return not base or path == base or path.startswith(base + "/")
+
+    if "*" in pattern:
+        return fnmatchcase(path, pattern)
+
+    return path == pattern
+
+
+class RouteRules:
+    """
+    The "routes" allowedRoles and "responseOverrides" sections of
+    staticwebapp.config.json. navigationFallback is left to the dev
+    server, which already serves index.html for client-side routes.
+    """
+
+    def __init__(self, config):
+        self.routes = config.get("routes", [])
+        self.overrides = config.get("responseOverrides", {})
+
+    @classmethod
+    def load(cls, path=SWA_CONFIG):
+        return cls(json.loads(Path(path).read_text(encoding="utf-8-sig")))
+
+    def match(self, path):
+        return next(
+            (route for route in self.routes if route_matches(route["route"], path)),
+            None,
+        )
+
+    def check(self, path, principal):
+        """None when the request may go through, else the response to send."""
+        route = self.match(path)
+        allowed = (route or {}).get("allowedRoles")
+
+        if not allowed:
+            return None
+
+        roles = set(ANONYMOUS_ROLES)
+
+        if principal:
+            roles.update(principal.get("userRoles", []))
+            roles.add("authenticated")
+
+        if roles & set(allowed):
+            return None
+
+        return self.error(403 if principal else 401)
+
+    def error(self, status):
+        override = self.overrides.get(str(status), {})
+
+        if "redirect" in override:
+            return Response(
+                override.get("statusCode", 302),
+                headers={"Location": override["redirect"]},
+            )
+
+        return Response(override.get("statusCode", status), {"error": f"HTTP {status}"})
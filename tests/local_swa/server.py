@@ -0,0 +1,124 @@
+import asyncio
+from urllib.parse import urlsplit
+
+from tests.local_swa.auth import AuthStub, encode_principal
+from tests.local_swa.routes import RouteRules
+from tests.utilities.http_server import BackgroundServer, Response
+
+
+DATA_API_PREFIX = "/data-api"
+
+# Not forwarded by a proxy (RFC 9110 7.6.1), plus the ones we set ourselves
+_SKIPPED_HEADERS = {
+    "connection", "keep-alive", "proxy-authenticate", "proxy-authorization",
+    "te", "trailer", "transfer-encoding", "upgrade", "host",
+    "x-ms-client-principal",
+}
+
+_CHUNK = 64 * 1024
+
+
+async def _pipe(reader, writer):
+    while True:
+        chunk = await reader.read(_CHUNK)
+
+        if not chunk:
+            break
+
+        writer.write(chunk)
+        await writer.drain()
+
+
+class LocalSwa(BackgroundServer):
+    """
+    Local Static Web Apps front door for the e2e suite:
+
+    - /.auth/* answered by AuthStub (no Microsoft login);
+    - staticwebapp.config.json route roles / 401 override applied;
+    - /data-api/* proxied to the data API with x-ms-client-principal,
+      everything else (incl. Vite's HMR websocket) to the dev server.
+    """
+
+    thread_name = "local-swa"
+
+    def __init__(self, host="127.0.0.1", port=4280, app_url="http://localhost:3000",
+                 data_api_url="http://127.0.0.1:5000", auth=None, rules=None):
+        super().__init__(host, port)
+        self.app_url = app_url
+        self.data_api_url = data_api_url
+        self.auth = auth or AuthStub()
+        self.rules = rules or RouteRules.load()
+
+    async def respond(self, request, reader, writer):
+        path = urlsplit(request.target).path
+
+        if path.startswith("/.auth/"):
+            return self.auth.handle(request)
+
+        principal = self.auth.current(request)
+        denied = self.rules.check(path, principal)
+
+        if denied is not None:
+            return denied
+
+        if path == DATA_API_PREFIX or path.startswith(DATA_API_PREFIX + "/"):
+            upstream = self.data_api_url
+            target = request.target[len(DATA_API_PREFIX):] or "/"
+        else:
+            upstream = self.app_url
+            target = request.target
+
+        try:
+            await self._proxy(upstream, target, request, principal, reader, writer)
+        except OSError as error:
+            return Response(502, {"error": f"{upstream} unreachable: {error}"})
+
+        # The upstream answered with "Connection: close"
+        return None
+
+    async def _proxy(self, upstream, target, request, principal, client_reader, client_writer):
+        parts = urlsplit(upstream)
+        reader, writer = await asyncio.open_connection(parts.hostname, parts.port or 80)
+
+        upgrade = request.headers.get("upgrade")
+
+        headers = [
+            (name, value) for name, value in request.raw_headers
+            if name.lower() not in _SKIPPED_HEADERS
+        ]
+        headers.append(("Host", parts.netloc))
+
+        if principal:
+            headers.append(("X-MS-CLIENT-PRINCIPAL", encode_principal(principal)))
+
+        if upgrade:
+            headers += [("Connection", "Upgrade"), ("Upgrade", upgrade)]
+        else:
+            headers.append(("Connection", "close"))
+
+        head = f"{request.method} {target} HTTP/1.1\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in headers
+        )
+
+        writer.write(head.encode("latin-1") + b"\r\n" + request.body)
+        await writer.drain()
+
+        try:
+            if not upgrade:
+                await _pipe(reader, client_writer)
+                return
+
+            # Websocket: relay both ways until either side hangs up
+            tasks = [
+                asyncio.ensure_future(_pipe(client_reader, writer)),
+                asyncio.ensure_future(_pipe(reader, client_writer)),
+            ]
+            _, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+
+            for task in pending:
+                task.cancel()
+
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        finally:
+            writer.close()
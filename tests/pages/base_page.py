@@ -1,4 +1,3 @@
-import time
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -6,14 +5,27 @@ from selenium.webdriver.support import expected_conditions as EC
 
 from selenium.common.exceptions import (
     TimeoutException,
-    NoSuchElementException,
+    WebDriverException,
     StaleElementReferenceException,
     ElementClickInterceptedException,
 )
 
+from tests.utilities.data import WAIT_ENGINE
+from tests.utilities.dom_query import DomQuery
+from tests.utilities.dom_wait import DomWait
+from tests.utilities.page_metrics import (
+    ACTION_MARK,
+    PAGE_METRICS,
+    harvest_page_metrics,
+)
+from tests.utilities.round_trips import (
+    ROUND_TRIP_STATS,
+    RoundTripCounter,
+)
 from tests.utilities.locators import (
     CommonLocators,
     InventoryPageLocators,
+    ReadinessSignals,
 )
 
 
@@ -24,20 +36,24 @@ class BasePage:
         self.driver = driver
         self.common_locators = CommonLocators
         self.add_locators = InventoryPageLocators
+        self.dom_wait = DomWait(driver)
+        self.dom_query = DomQuery(driver)
+        self.last_round_trips = 0
 
     # ---------------------------------------------------
     # Generic Wait
     # ---------------------------------------------------
 
-    def wait(self, seconds):
-        time.sleep(seconds)
-
     def get_wait(self, timeout=None):
         return WebDriverWait(
             self.driver,
             timeout or self.DEFAULT_TIMEOUT
         )
 
+    def uses_dom_wait(self, locator):
+        """In-page MutationObserver waits instead of wire polling"""
+        return WAIT_ENGINE == "observer" and DomWait.supports(locator)
+
     # ---------------------------------------------------
     # Page Ready
     # ---------------------------------------------------
@@ -56,6 +72,12 @@ class BasePage:
     # ---------------------------------------------------
 
     def find(self, locator, timeout=None):
+        if self.uses_dom_wait(locator):
+            return self.dom_wait.presence(
+                locator,
+                timeout or self.DEFAULT_TIMEOUT
+            )
+
         return self.get_wait(timeout).until(
             EC.presence_of_element_located(locator)
         )
@@ -63,11 +85,35 @@ class BasePage:
     def find_all(self, locator):
         return self.driver.find_elements(*locator)
 
+    # ---------------------------------------------------
+    # Batched Reads
+    # ---------------------------------------------------
+
+    def query_all(self, locator, attributes=()):
+        """
+        Visibility, text and the requested attributes of every match,
+        read in a single script call. See DomQuery for the shape.
+        """
+        return self.dom_query.all(locator, attributes)
+
+    def visible_matches(self, locator, attributes=()):
+        """Matches that are displayed and have non-empty text"""
+        return [
+            match for match in self.query_all(locator, attributes)
+            if match["visible"] and match["text"]
+        ]
+
     # ---------------------------------------------------
     # Visibility / Clickable
     # ---------------------------------------------------
 
     def wait_for_visibility(self, locator, timeout=None):
+        if self.uses_dom_wait(locator):
+            return self.dom_wait.visible(
+                locator,
+                timeout or self.DEFAULT_TIMEOUT
+            )
+
         return self.get_wait(timeout).until(
             EC.visibility_of_element_located(locator)
         )
@@ -81,9 +127,47 @@ class BasePage:
     # Safe Click
     # ---------------------------------------------------
 
-    def click(self, locator, timeout=None, retries=3):
+    def click(self, locator, timeout=None, retries=3, trusted=False):
+        """
+        Click in a single in-page script (resolve, scroll, hit-test,
+        click) when the wait engine supports the locator. Falls back to
+        a native WebDriver click for inputs, or when ``trusted=True``.
+        The wire commands used are kept in ``last_round_trips``.
+        """
         timeout = timeout or self.DEFAULT_TIMEOUT
 
+        with RoundTripCounter(self.driver) as trips:
+            try:
+                if self.uses_dom_wait(locator):
+                    self._fused_click(locator, timeout, retries, trusted)
+                else:
+                    self._native_click(locator, timeout, retries)
+            finally:
+                self.last_round_trips = trips.count
+                ROUND_TRIP_STATS.record("click", trips.count)
+
+    def _fused_click(self, locator, timeout, retries, trusted):
+        for attempt in range(retries):
+            target = self.dom_wait.click(
+                locator, timeout, trusted=trusted, mark=ACTION_MARK
+            )
+
+            if target is True:
+                return
+
+            try:
+                self._click_element(target)
+                return
+
+            except StaleElementReferenceException as err:
+
+                if attempt == retries - 1:
+                    raise TimeoutException(
+                        f"Failed to click {locator} "
+                        f"after {retries} retries"
+                    ) from err
+
+    def _native_click(self, locator, timeout, retries):
         for attempt in range(retries):
 
             try:
@@ -93,19 +177,14 @@ class BasePage:
                 )
 
                 self.driver.execute_script(
-                    "arguments[0].scrollIntoView({block:'center'});",
-                    element
+                    "arguments[0].scrollIntoView({block:'center'});"
+                    "performance.clearMarks(arguments[1]);"
+                    "performance.mark(arguments[1]);",
+                    element,
+                    ACTION_MARK
                 )
 
-                try:
-                    element.click()
-
-                except ElementClickInterceptedException:
-                    self.driver.execute_script(
-                        "arguments[0].click();",
-                        element
-                    )
-
+                self._click_element(element)
                 return
 
             except (
@@ -119,7 +198,15 @@ class BasePage:
                         f"after {retries} retries"
                     ) from err
 
-                time.sleep(1)
+    def _click_element(self, element):
+        try:
+            element.click()
+
+        except ElementClickInterceptedException:
+            self.driver.execute_script(
+                "arguments[0].click();",
+                element
+            )
 
     # ---------------------------------------------------
     # Inputs
@@ -184,6 +271,71 @@ class BasePage:
             element
         )
 
+    # ---------------------------------------------------
+    # App Readiness Signals
+    # ---------------------------------------------------
+
+    def get_signal(self, name):
+        """
+        Current value of a readiness attribute, or None when the
+        deployed build does not publish readiness signals.
+        """
+        return self.driver.execute_script(
+            "return document.documentElement.getAttribute(arguments[0]);",
+            name
+        )
+
+    def get_signal_number(self, name):
+        value = self.get_signal(name)
+        return int(value) if value and value.isdigit() else None
+
+    def wait_for_signal_above(self, name, value, timeout=None):
+        timeout = timeout or self.DEFAULT_TIMEOUT
+
+        if self.uses_dom_wait(ReadinessSignals.ROOT):
+            return self.dom_wait.attribute_number(
+                ReadinessSignals.ROOT, name, ">", value, timeout
+            )
+
+        return self.get_wait(timeout).until(
+            lambda _: (self.get_signal_number(name) or 0) > value
+        )
+
+    def wait_for_signal_equals(self, name, expected, timeout=None):
+        timeout = timeout or self.DEFAULT_TIMEOUT
+
+        if self.uses_dom_wait(ReadinessSignals.ROOT):
+            return self.dom_wait.attribute_equals(
+                ReadinessSignals.ROOT, name, expected, timeout
+            )
+
+        return self.get_wait(timeout).until(
+            lambda _: self.get_signal(name) == expected
+        )
+
+    # ---------------------------------------------------
+    # Page Metrics
+    # ---------------------------------------------------
+
+    def start_page_timing(self):
+        """In-page timestamp for an action that is not a BasePage.click"""
+        return self.driver.execute_script("return performance.now();")
+
+    def record_page_metrics(self, page, started_at=None):
+        """
+        Harvest timing and Web Vitals at the point the page is usable
+        and check them against the page's budget. A budget in "fail"
+        mode raises AssertionError, "warn" emits a pytest warning.
+        """
+        try:
+            metrics = harvest_page_metrics(self.driver, started_at)
+
+        except WebDriverException as err:
+            print(f"[WARN] Page metrics unavailable for {page}: {err.msg}")
+            return None
+
+        return PAGE_METRICS.record(page, metrics)
+
     # ---------------------------------------------------
     # Navigation
     # ---------------------------------------------------
@@ -230,6 +382,10 @@ class BasePage:
             f"//*[contains(text(), {_xpath_literal(value)})]",
         )
 
+        if self.uses_dom_wait(locator):
+            self.dom_wait.count(locator, ">", 0, timeout)
+            return
+
         self.get_wait(timeout).until(
             lambda d: (
                     len(d.find_elements(*locator)) > 0
@@ -244,8 +400,13 @@ class BasePage:
             self,
             input_locator,
             options_locator,
-            timeout=20
+            timeout=20,
+            option_text=None
     ):
+        """
+        Pick the first option, or with option_text the option showing
+        that text (exactly, else as a prefix) after typing it to filter.
+        """
 
         wait = self.get_wait(timeout)
 
@@ -266,6 +427,10 @@ class BasePage:
 
         input_el.click()
 
+        if option_text is not None:
+            input_el.send_keys(Keys.CONTROL, "a")
+            input_el.send_keys(option_text)
+
         # ---------------------------------------------------
         # Wait dropdown open
         # ---------------------------------------------------
@@ -279,40 +444,11 @@ class BasePage:
         )
 
         # ---------------------------------------------------
-        # Safe option collector
+        # Wait for options (one script call per poll)
         # ---------------------------------------------------
 
-        def visible_options(driver):
-
-            valid_options = []
-
-            elements = driver.find_elements(
-                *options_locator
-            )
-
-            for el in elements:
-
-                try:
-                    if (
-                        el.is_displayed()
-                        and el.text.strip()
-                    ):
-                        valid_options.append(el)
-
-                except (
-                    StaleElementReferenceException,
-                    NoSuchElementException,
-                ):
-                    continue
-
-            return (
-                valid_options
-                if valid_options
-                else False
-            )
-
         options = wait.until(
-            visible_options
+            lambda _: self.visible_matches(options_locator)
         )
 
         if not options:
@@ -321,34 +457,23 @@ class BasePage:
                 f"for autocomplete {input_locator}"
             )
 
-        # ---------------------------------------------------
-        # Select first option safely
-        # ---------------------------------------------------
-
-        try:
-            first_option = options[0]
-
-            selected_text = (
-                first_option.text.strip()
-            )
-
-        except StaleElementReferenceException as err:
+        # Text came back with the batch, no further reads needed
+        option = options[0]
 
-            options = visible_options(
-                self.driver
+        if option_text is not None:
+            option = next(
+                (o for o in options if o["text"] == option_text),
+                next((o for o in options if o["text"].startswith(option_text)), None)
             )
 
-            if not options:
+            if option is None:
                 raise TimeoutException(
-                    "Autocomplete options "
-                    "became stale"
-                ) from err
+                    f"No option {option_text!r} "
+                    f"for autocomplete {input_locator}"
+                )
 
-            first_option = options[0]
-
-            selected_text = (
-                first_option.text.strip()
-            )
+        first_option = option["element"]
+        selected_text = option["text"]
 
         # ---------------------------------------------------
         # Click option
@@ -412,6 +537,9 @@ class BasePage:
             timeout=20
     ):
 
+        if self.uses_dom_wait(locator):
+            return self.dom_wait.hidden(locator, timeout)
+
         wait = self.get_wait(timeout)
 
         return wait.until(
@@ -1,12 +1,12 @@
-from selenium.common.exceptions import (
-    TimeoutException,
-    NoSuchElementException,
-    StaleElementReferenceException
-)
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from tests.pages.base_page import BasePage
-from tests.utilities.locators import CheckoutPageLocators, CommonLocators
+from tests.utilities.locators import (
+    CheckoutPageLocators,
+    CommonLocators,
+    ReadinessSignals,
+)
 from selenium.webdriver.common.keys import Keys
 
 class CheckOutPage(BasePage):
@@ -32,40 +32,29 @@ class CheckOutPage(BasePage):
 
         self.wait_for_visibility(self.locators.CHECKOUT_INFO_TEXT, timeout=15)
 
+        self.record_page_metrics("checkout")
+
     # ---------------------------------------------------
     # Stable click helpers
     # ---------------------------------------------------
 
     def click_plus_button(self, item_name):
-        wait = self.get_wait(15)
-        locator = self.locators.get_add_button_locator(item_name)
-
-        for _ in range(3):
-            try:
-                btn = wait.until(lambda d: d.find_element(*locator))
-                self.driver.execute_script(
-                    "arguments[0].scrollIntoView({block:'center'});", btn
-                )
-                self.driver.execute_script("arguments[0].click();", btn)
-                return
-            except StaleElementReferenceException:
-                self.wait(0.5)
-
-        raise Exception(f"❌ Could not click plus button for {item_name}")
+        try:
+            self.click(
+                self.locators.get_add_button_locator(item_name),
+                timeout=15
+            )
+        except TimeoutException as err:
+            raise Exception(f"❌ Could not click plus button for {item_name}") from err
 
     def click_minus_button(self, item_name):
-        wait = self.get_wait(15)
-        locator = self.locators.get_minus_button_locator(item_name)
-
-        for _ in range(3):
-            try:
-                btn = wait.until(lambda d: d.find_element(*locator))
-                self.driver.execute_script("arguments[0].click();", btn)
-                return
-            except StaleElementReferenceException:
-                self.wait(0.5)
-
-        raise Exception(f"❌ Could not click minus button for {item_name}")
+        try:
+            self.click(
+                self.locators.get_minus_button_locator(item_name),
+                timeout=15
+            )
+        except TimeoutException as err:
+            raise Exception(f"❌ Could not click minus button for {item_name}") from err
 
     # ---------------------------------------------------
     # Quantity (FINAL - deterministic)
@@ -73,32 +62,90 @@ class CheckOutPage(BasePage):
 
     def increase_quantity(self, amount, item_name):
         for _ in range(amount):
-            self.click_plus_button(item_name)
-            self.wait(0.3)
+            self.change_cart(self.click_plus_button, item_name, 1)
 
     def decrease_quantity(self, amount, item_name):
         for _ in range(amount):
-            self.click_minus_button(item_name)
-            self.wait(0.3)
+            self.change_cart(self.click_minus_button, item_name, -1)
+
+    def change_cart(self, click_button, item_name, delta):
+        """
+        Click a +/- button and wait until the app has committed the
+        cart update (cart version signal), so clicks never overlap.
+        Builds without readiness signals wait for the item's quantity
+        to move by ``delta`` instead.
+        """
+        version = self.get_signal_number(ReadinessSignals.CART_VERSION)
+        quantity = None if version is not None else self.get_item_quantity(item_name)
+
+        click_button(item_name)
+
+        try:
+            if version is not None:
+                self.wait_for_signal_above(
+                    ReadinessSignals.CART_VERSION, version, timeout=10
+                )
+            else:
+                self.wait_for_item_quantity(item_name, quantity + delta, timeout=10)
+        except TimeoutException:
+            raise AssertionError(
+                f"Cart did not change after clicking a quantity button for {item_name}"
+            )
+
+    def get_item_quantity(self, item_name):
+        """Quantity shown on the item's card, 0 when it is not in the cart."""
+        matches = self.visible_matches(self.locators.get_quantity_locator(item_name))
+
+        if not matches:
+            return 0
+
+        text = matches[0]["text"].strip()
+        return int(text) if text.isdigit() else 0
+
+    def wait_for_item_quantity(self, item_name, expected, timeout=10):
+        locator = self.locators.get_quantity_locator(item_name)
+
+        if self.uses_dom_wait(locator):
+            # The count is removed along with the item at 0
+            if expected <= 0:
+                self.dom_wait.hidden(locator, timeout)
+            else:
+                self.dom_wait.number(locator, "==", expected, timeout)
+            return
+
+        self.get_wait(timeout).until(
+            lambda _: self.get_item_quantity(item_name) == max(expected, 0)
+        )
 
     # ---------------------------------------------------
     # Dropdowns
     # ---------------------------------------------------
 
     def select_first_building_option(self):
+        self.select_building_option()
+
+    def select_building_option(self, label=None):
+        """First building, or the one labelled "CODE (Name)"."""
         for attempt in range(2):
             try:
+                if label is not None:
+                    self.select_from_autocomplete(
+                        self.locators.BUILDING_CODE,
+                        self.locators.BUILDING_OPTIONS,
+                        option_text=label
+                    )
+                    return
+
                 self.click(self.locators.BUILDING_CODE)
 
                 options = self.get_wait(10).until(
-                    lambda d: [
-                        el for el in d.find_elements(*self.locators.BUILDING_OPTIONS)
-                        if el.is_displayed() and el.text.strip()
-                    ]
+                    lambda _: self.visible_matches(self.locators.BUILDING_OPTIONS)
                 )
 
                 if options:
-                    self.driver.execute_script("arguments[0].click();", options[0])
+                    self.driver.execute_script(
+                        "arguments[0].click();", options[0]["element"]
+                    )
                     return
 
             except TimeoutException:
@@ -110,11 +157,40 @@ class CheckOutPage(BasePage):
         raise Exception("❌ Building selection failed")
 
     def select_first_unit_number(self):
+        self.select_unit_number()
+
+    def select_unit_number(self, unit_number=None):
         self.select_from_autocomplete(
             self.locators.UNIT_NUMBER,
-            self.locators.UNIT_OPTIONS
+            self.locators.UNIT_OPTIONS,
+            option_text=unit_number
+        )
+
+    def select_resident(self, name):
+        """
+        The unit's last resident is autofilled; type the name when it
+        is someone else (the dialog looks residents up by name + unit).
+        """
+        self.wait_for_resident_autofill()
+
+        field = self.find(self.locators.NAME_INPUT)
+
+        if field.get_attribute("value") == name:
+            return
+
+        field.send_keys(Keys.CONTROL, "a")
+        field.send_keys(name)
+
+        self.get_wait(10).until(
+            lambda _: field.get_attribute("value") == name
         )
 
+    def select_household(self, household):
+        """Building, unit and resident of a DataNamespace household."""
+        self.select_building_option(household.building_label)
+        self.select_unit_number(household.unit_number)
+        self.select_resident(household.resident_name)
+
     # ---------------------------------------------------
     # Form actions
     # ---------------------------------------------------
@@ -160,12 +236,15 @@ class CheckOutPage(BasePage):
         # Ensure input is cleared
         wait.until(lambda d: field.get_attribute("value") == "")
 
-        #  CRITICAL: allow UI debounce/reset
-        self.wait(1)
-
         field.send_keys(item_name)
         field.send_keys(Keys.ENTER)
 
+        # Filtered results for the full term have been rendered
+        if self.get_signal(ReadinessSignals.SEARCH_TERM) is not None:
+            self.wait_for_signal_equals(
+                ReadinessSignals.SEARCH_TERM, item_name, timeout=15
+            )
+
         wait.until(lambda d: item_name.lower() in d.page_source.lower())
 
     # ---------------------------------------------------
@@ -213,13 +292,16 @@ class CheckOutPage(BasePage):
     # FLOWS
     # ---------------------------------------------------
 
-    def complete_checkout(self, item_name):
+    def complete_checkout(self, item_name, household=None):
         self.click_checkout()
 
-        self.select_first_building_option()
-        self.select_first_unit_number()
+        if household is None:
+            self.select_first_building_option()
+            self.select_first_unit_number()
+            self.wait_for_resident_autofill()
+        else:
+            self.select_household(household)
 
-        self.wait_for_resident_autofill()
         self.click_continue_button()
 
         self.search_item(item_name)
@@ -228,12 +310,13 @@ class CheckOutPage(BasePage):
         self.click_proceed_to_checkout()
         self.click_confirm()
 
-    def open_welcome_basket(self):
+    def open_welcome_basket(self, household=None):
         self.click_checkout("welcome")
 
         self.select_from_autocomplete(
             self.locators.BUILDING_CODE,
-            self.locators.BUILDING_OPTIONS
+            self.locators.BUILDING_OPTIONS,
+            option_text=household.building_label if household else None
         )
 
         self.click_continue_button()
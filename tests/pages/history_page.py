@@ -3,7 +3,11 @@ import time
 from selenium.webdriver.support.wait import WebDriverWait
 
 from tests.pages.base_page import BasePage
-from tests.utilities.locators import HistoryPageLocators, CommonLocators
+from tests.utilities.locators import (
+    HistoryPageLocators,
+    CommonLocators,
+    ReadinessSignals,
+)
 
 
 class HistoryPage(BasePage):
@@ -34,21 +38,88 @@ class HistoryPage(BasePage):
             )
         )
 
+        self.record_page_metrics("history")
+
         print("History page loaded")
 
     def go_back_home(self):
         print("Navigating back to home page...")
 
+        started_at = self.start_page_timing()
         self.driver.back()
 
         from tests.pages.home_page import HomePage
         home_page = HomePage(self.driver)
-        home_page.wait_for_homepage_loaded()
+        home_page.wait_for_homepage_loaded(started_at=started_at)
 
     def refresh_history(self):
+        readiness = self.get_signal(ReadinessSignals.HISTORY_LOADED_SEQ) is not None
+
         self.driver.refresh()
         self.wait_for_visibility(self.locators.HISTORY_HEADER)
 
+        # The reloaded page starts a new sequence: wait for its first load
+        if readiness:
+            self.wait_for_signal_above(
+                ReadinessSignals.HISTORY_LOADED_SEQ, 0, timeout=15
+            )
+            return
+
+        self.get_wait(15).until(
+            lambda d: (
+                len(d.find_elements(*self.locators.RECORD_COUNT_TEXT)) > 0
+                or len(d.find_elements(*self.locators.NO_TRANSACTIONS_MESSAGE)) > 0
+            )
+        )
+
+    # ---------------------------------------------------
+    # Paging
+    # ---------------------------------------------------
+
+    def has_more_pages(self):
+        return len(self.driver.find_elements(*self.locators.LOAD_MORE_BUTTON)) > 0
+
+    def load_next_page(self, timeout=15):
+        """
+        Scroll to the end of the list, which loads the next page (clicking
+        Load more if it is still there), and wait for it to be rendered.
+        Returns False when there was no further page.
+        """
+        buttons = self.driver.find_elements(*self.locators.LOAD_MORE_BUTTON)
+        if not buttons:
+            return False
+
+        loaded = self.get_signal_number(ReadinessSignals.HISTORY_LOADED_SEQ)
+
+        self.driver.execute_script(
+            "arguments[0].scrollIntoView({block:'center'});"
+            "if (!arguments[0].disabled) arguments[0].click();",
+            buttons[0]
+        )
+
+        if loaded is not None:
+            self.wait_for_signal_above(
+                ReadinessSignals.HISTORY_LOADED_SEQ, loaded, timeout=timeout
+            )
+            return True
+
+        # No readiness signals: wait until the page in flight has arrived
+        self.get_wait(timeout).until(
+            lambda d: not any(
+                button.text.strip() == "Loading more..."
+                for button in d.find_elements(*self.locators.LOAD_MORE_BUTTON)
+            )
+        )
+        return True
+
+    def load_all_pages(self, timeout=15, max_pages=200):
+        """Load every remaining page, so counts and cards cover the whole range."""
+        for _ in range(max_pages):
+            if not self.load_next_page(timeout):
+                return
+
+        raise AssertionError(f"History still has more pages after {max_pages} loads")
+
     # ---------------------------------------------------
     # Record Count
     # ---------------------------------------------------
@@ -59,11 +130,14 @@ class HistoryPage(BasePage):
     def get_record_count_number(self):
         """
         Extract numeric record count from text such as:
-        'You 10 records', '1,234 records', or 'Showing 1-20 of 130'
+        'You 10 records', '1,234 records', or 'Showing 1-20 of 130'.
+        Later pages are loaded first, so this is the total for the range.
         """
         if not self.is_visible(self.locators.RECORD_COUNT_TEXT, timeout=5):
             return 0
 
+        self.load_all_pages()
+
         text = self.get_record_count_text()
 
         numbers = re.findall(r"\d[\d,]*", text)
@@ -78,11 +152,27 @@ class HistoryPage(BasePage):
         return self.get_record_count_number()
 
     def wait_for_record_count_to_increase(self, initial_count, timeout=20):
+        self.load_all_pages()
+
+        if self.uses_dom_wait(self.locators.RECORD_COUNT_TEXT):
+            self.dom_wait.number(
+                self.locators.RECORD_COUNT_TEXT, ">", initial_count, timeout
+            )
+            return
+
         WebDriverWait(self.driver, timeout).until(
             lambda _: self.get_record_count_number() > initial_count
         )
 
     def wait_for_record_count_to_be(self, expected_count, timeout=20):
+        self.load_all_pages()
+
+        if self.uses_dom_wait(self.locators.RECORD_COUNT_TEXT):
+            self.dom_wait.number(
+                self.locators.RECORD_COUNT_TEXT, ">=", expected_count, timeout
+            )
+            return
+
         WebDriverWait(self.driver, timeout).until(
             lambda _: self.get_record_count_number() >= expected_count
         )
@@ -107,13 +197,41 @@ class HistoryPage(BasePage):
         if self.get_record_count_number() == 0:
             return []
 
-        cards = self.find_all(self.locators.HISTORY_CARDS)
-        return [card for card in cards if card.is_displayed()]
+        return [
+            match["element"]
+            for match in self.get_history_card_matches()
+        ]
+
+    def get_history_card_matches(self):
+        """Visible cards with their text, read in one script call"""
+        return [
+            match for match in self.query_all(self.locators.HISTORY_CARDS)
+            if match["visible"]
+        ]
 
     def get_latest_card(self):
         cards = self.get_history_cards()
         return cards[0] if cards else None
 
+    def get_latest_card_text(self):
+        cards = self.get_history_card_matches()
+        return cards[0]["text"] if cards else ""
+
+    def wait_for_transaction_card(self, transaction_id, timeout=20):
+        """Card of one checkout (e.g. seeded through api_client); returns its text."""
+        locator = self.locators.get_checkout_card_locator(transaction_id)
+
+        return self.wait_for_visibility(locator, timeout).text
+
+    def get_latest_transaction_id(self):
+        """transaction_id of the first checkout card on the page, or None."""
+        cards = self.find_all(self.locators.CHECKOUT_CARDS)
+
+        if not cards:
+            return None
+
+        return cards[0].get_attribute("id").removeprefix("checkout-card-")
+
     def verify_latest_record_exists(self):
         cards = self.get_history_cards()
 
@@ -149,10 +267,10 @@ class HistoryPage(BasePage):
     # ---------------------------------------------------
 
     def get_latest_quantity(self):
-        card = self.get_latest_card()
-        assert card, "No latest transaction card found"
+        cards = self.get_history_card_matches()
+        assert cards, "No latest transaction card found"
 
-        text = card.text
+        text = cards[0]["text"]
 
         print(f"[DEBUG CARD TEXT]\n{text}")
 
@@ -165,9 +283,12 @@ class HistoryPage(BasePage):
 
     def wait_for_latest_quantity(self, expected_qty, timeout=15):
         """
-        CI-safe retry with optional refresh
+        CI-safe retry: reload until the latest card shows the quantity.
+        Each reload waits for the history-loaded signal, not a sleep.
         """
-        for _ in range(timeout):
+        deadline = time.monotonic() + timeout
+
+        while time.monotonic() < deadline:
             try:
                 qty = self.get_latest_quantity()
                 if qty == expected_qty:
@@ -175,7 +296,6 @@ class HistoryPage(BasePage):
             except Exception:
                 pass
 
-            time.sleep(1)
             self.refresh_history()
 
         raise AssertionError(
@@ -197,10 +317,10 @@ class HistoryPage(BasePage):
     # ---------------------------------------------------
 
     def debug_print_cards(self):
-        cards = self.get_history_cards()
+        cards = self.get_history_card_matches()
         print(f"[DEBUG] Total visible cards: {len(cards)}")
 
         for i, card in enumerate(cards):
-            text = card.text.strip()
+            text = card["text"]
             preview = text[:40] + "..." if len(text) > 40 else text
             print(f"[CARD {i}] length={len(text)} preview='{preview}'")
\ No newline at end of file
@@ -18,7 +18,7 @@ class HomePage(BasePage):
     # Page Load Guard (Admin + Volunteer Safe)
     # ---------------------------------------------------
 
-    def wait_for_homepage_loaded(self):
+    def wait_for_homepage_loaded(self, started_at=None):
         # DOM ready
         self.wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
 
@@ -37,6 +37,8 @@ class HomePage(BasePage):
             )
         )
 
+        self.record_page_metrics("home", started_at)
+
     # ---------------------------------------------------
     # Common / Admin Methods
     # ---------------------------------------------------
@@ -109,6 +109,8 @@ class InventoryPage(BasePage):
             )
         )
 
+        self.record_page_metrics("inventory")
+
     # DEFENSIVE SEARCH (STABILIZED)
     def second_search_item(self, item_name: str):
 
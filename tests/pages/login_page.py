@@ -1,4 +1,4 @@
-import time
+from urllib.parse import urlencode
 
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
@@ -10,13 +10,35 @@ from selenium.common.exceptions import (
     StaleElementReferenceException
 )
 
+from tests.local_swa.auth import STUB_HEADER
 from tests.pages.base_page import BasePage
+from tests.utilities.auth_snapshot import ANONYMOUS_PAGE
+from tests.utilities.browser_pool import origin_of
 from tests.utilities.locators import LoginPageLocators
 
 
+_AUTH_STUB_PROBE_SCRIPT = """
+const header = arguments[0];
+const done = arguments[arguments.length - 1];
+fetch('/.auth/me', {credentials: 'same-origin', cache: 'no-store'})
+    .then(r => done(r.headers.get(header) === '1'))
+    .catch(() => done(false));
+"""
+
+# What PickNamePage / EnterPinPage leave in localStorage (usePersistentState)
+_SEED_VOLUNTEER_SCRIPT = """
+const volunteer = arguments[0];
+localStorage.setItem('loggedInUserId', JSON.stringify(volunteer.id));
+localStorage.setItem('activeVolunteers', JSON.stringify([volunteer]));
+"""
+
+
 class LoginPage(BasePage):
     LOGIN_WAIT_TIMEOUT = 240
 
+    # origin -> whether it serves the local auth stub (tests/local_swa)
+    _auth_stub_origins = {}
+
     def __init__(self, driver):
         super().__init__(driver)
         self.locators = LoginPageLocators
@@ -31,22 +53,70 @@ class LoginPage(BasePage):
             ]
         )
 
+        self._login_hint = None
+
     # ---------------------------------------------------
     # Helpers
     # ---------------------------------------------------
 
     def wait_for_login_page(self):
+        if self.is_auth_stub():
+            return
+
         WebDriverWait(self.driver, 20).until(
             lambda d: "login.microsoftonline.com" in d.current_url.lower()
         )
 
+    # ---------------------------------------------------
+    # Local Auth Stub
+    # ---------------------------------------------------
+
+    def is_auth_stub(self):
+        """True when the app is served by the local SWA auth stub."""
+        origin = origin_of(self.driver.current_url)
+
+        if origin not in LoginPage._auth_stub_origins:
+            LoginPage._auth_stub_origins[origin] = bool(
+                self.driver.execute_async_script(_AUTH_STUB_PROBE_SCRIPT, STUB_HEADER)
+            )
+
+        return LoginPage._auth_stub_origins[origin]
+
+    def stub_login(self, principal=None, login_hint=None, volunteer=None):
+        """
+        Sign in through the stub (one redirect sets the SWA auth
+        cookie) and open the app. ``volunteer`` ({"id", "name"}) skips
+        the pick-your-name / PIN pages as well.
+        """
+        origin = origin_of(self.driver.current_url)
+        query = {"post_login_redirect_uri": ANONYMOUS_PAGE}
+
+        if principal:
+            query["principal"] = principal
+        if login_hint:
+            query["login_hint"] = login_hint
+
+        # Lands on the anonymous page, before the app reads localStorage
+        self.driver.get(f"{origin}/.auth/login/aad?{urlencode(query)}")
+
+        if volunteer:
+            self.driver.execute_script(_SEED_VOLUNTEER_SCRIPT, volunteer)
+
+        self.driver.get(origin + "/")
+
     # ---------------------------------------------------
     # Microsoft Login
+    # (no-ops on the auth stub: the username picks the principal and
+    # click_sign_in_button signs in)
     # ---------------------------------------------------
 
     def enter_username(self, username):
-        input_el = self.wait.until(
-            EC.visibility_of_element_located(self.locators.USERNAME_INPUT)
+        if self.is_auth_stub():
+            self._login_hint = username
+            return
+
+        input_el = self.wait_for_visibility(
+            self.locators.USERNAME_INPUT, timeout=120
         )
 
         input_el.clear()
@@ -59,6 +129,9 @@ class LoginPage(BasePage):
         )
 
     def click_next_button(self):
+        if self.is_auth_stub():
+            return
+
         wait = WebDriverWait(self.driver, 20)
 
         button = wait.until(
@@ -82,8 +155,11 @@ class LoginPage(BasePage):
         )
 
     def enter_password(self, password):
-        input_el = self.wait.until(
-            EC.visibility_of_element_located(self.locators.PASSWORD_INPUT)
+        if self.is_auth_stub():
+            return
+
+        input_el = self.wait_for_visibility(
+            self.locators.PASSWORD_INPUT, timeout=120
         )
 
         input_el.clear()
@@ -95,6 +171,10 @@ class LoginPage(BasePage):
         )
 
     def click_sign_in_button(self):
+        if self.is_auth_stub():
+            self.stub_login(login_hint=self._login_hint)
+            return
+
         wait = WebDriverWait(self.driver, 20)
 
         button = wait.until(
@@ -112,6 +192,9 @@ class LoginPage(BasePage):
     # ---------------------------------------------------
 
     def handle_stay_signed_in(self):
+        if self.is_auth_stub():
+            return
+
         try:
             WebDriverWait(self.driver, 5).until(
                 EC.presence_of_element_located(
@@ -165,14 +248,11 @@ class LoginPage(BasePage):
             lambda d: len(d.find_elements(*self.locators.NAME_OPTIONS)) > 0
         )
 
-        options = self.driver.find_elements(*self.locators.NAME_OPTIONS)
-
         option = next(
             (
-                el for el in options
-                if el.is_displayed()
-                and el.text.strip()
-                and name.lower() in el.text.lower()
+                match["element"]
+                for match in self.visible_matches(self.locators.NAME_OPTIONS)
+                if name.lower() in match["text"].lower()
             ),
             None
         )
@@ -5,15 +5,13 @@ from selenium.webdriver.common.by import By
 
 @pytest.mark.regression
 @pytest.mark.serial
-def test_admin_checkout_no_user_not_found_error(admin_home_page, checkout_page):
+def test_admin_checkout_no_user_not_found_error(admin_home_page, checkout_page, test_data):
 
     # Step 1 → Navigate to checkout
     admin_home_page.go_to_checkout_general()
 
     # Step 2 → Fill required fields
-    checkout_page.select_first_building_option()
-    checkout_page.select_first_unit_number()
-    checkout_page.wait_for_resident_autofill()
+    checkout_page.select_household(test_data.household)
 
     # Step 3 → Click Continue (JS click for MUI stability)
     continue_btn = checkout_page.wait_for_clickable(
@@ -35,8 +33,10 @@ def test_admin_checkout_no_user_not_found_error(admin_home_page, checkout_page):
         )) > 0
     )
     # Step 4 → Add item
-    checkout_page.search_item("Curtains")
-    checkout_page.add_item("Curtains")
+    item = test_data.item("Curtains")
+
+    checkout_page.search_item(item)
+    checkout_page.add_item(item)
 
     # Step 5 → Proceed to checkout
     checkout_page.click_proceed_to_checkout()
@@ -63,19 +63,17 @@ def verify_home(home_page):
 # ---------------------------------------------------
 
 @when(parsers.parse('the user completes checkout with "{item}"'))
-def complete_checkout_flow(home_page, history_page, checkout_page, context, item):
+def complete_checkout_flow(home_page, api_client, test_data, checkout_page, context, item):
 
     safe_item = sanitize(item)
 
-    with allure.step("Capture initial history record count"):
-        history_page.open_history()
-        context["before_count"] = history_page.get_record_count()
-
-    with allure.step("Navigate back to home page safely"):
-        history_page.go_back_home()
+    with allure.step("Capture initial history record count (data API)"):
+        context["before_count"] = api_client.checkout_record_count()
 
     with allure.step(f"Complete checkout flow for item: {safe_item}"):
-        checkout_page.complete_checkout(item)
+        checkout_page.complete_checkout(
+            test_data.item(item), household=test_data.household
+        )
 
 
 # ---------------------------------------------------
@@ -103,12 +101,7 @@ def verify_record_count_increase(history_page, context):
 
         assert before is not None, "Missing initial record count"
 
-        after = history_page.get_record_count()
-
-        assert after > before, (
-            f"Record count did not increase. "
-            f"Before: {before}, After: {after}"
-        )
+        history_page.verify_record_count_increased(before)
 
 
 @then("the user should be redirected to the home page")
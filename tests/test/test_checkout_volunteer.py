@@ -14,7 +14,6 @@ def checkout_page(driver):
 
 
 @pytest.mark.usefixtures("login_with_volunteer")
-@pytest.mark.serial
 @pytest.mark.regression
 class TestCheckout:
 
@@ -22,7 +21,10 @@ class TestCheckout:
         "Curtains",
         "Baby Wipes"
     ])
-    def test_checkout(self, checkout_page, home_page, item):
+    def test_checkout(self, checkout_page, home_page, test_data, item):
+
+        # This worker's copy of the item and its own household
+        item = test_data.item(item)
 
         # ---------------------------------------------------
         # Step 1: Verify landing
@@ -38,9 +40,7 @@ class TestCheckout:
         # ---------------------------------------------------
         # Step 3: Fill required form fields
         # ---------------------------------------------------
-        checkout_page.select_first_building_option()
-        checkout_page.select_first_unit_number()
-        checkout_page.wait_for_resident_autofill()
+        checkout_page.select_household(test_data.household)
 
         # ---------------------------------------------------
         # Step 4: Continue to item selection
@@ -2,17 +2,14 @@ import pytest
 
 
 @pytest.mark.smoke
-@pytest.mark.serial
-def test_checkout_smoke(login_with_volunteer, checkout_page, home_page):
+def test_checkout_smoke(login_with_volunteer, checkout_page, home_page, test_data):
 
-    item = "Curtains"
+    item = test_data.item("Curtains")
 
     home_page.wait_for_homepage_loaded()
     home_page.go_to_checkout_general()
 
-    checkout_page.select_first_building_option()
-    checkout_page.select_first_unit_number()
-    checkout_page.wait_for_resident_autofill()
+    checkout_page.select_household(test_data.household)
 
     checkout_page.click_continue_button()
 
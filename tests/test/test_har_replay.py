@@ -0,0 +1,66 @@
+import uuid
+
+import pytest
+import requests
+
+from tests.local_dab import LocalDataApi
+from tests.utilities.har_replay import HarAdapter, HarCassette
+
+HEADERS = {"X-MS-API-ROLE": "volunteer"}
+
+
+def checkout_and_read_history(session, url, transaction_id):
+    """What test_checkout_reflected_in_history does through api_client."""
+    checkout = session.post(f"{url}/api/checkout-general-items", headers=HEADERS, json={
+        "new_transaction_id": transaction_id,
+        "user_id": 1,
+        "items": [{"id": 1, "quantity": 1}],
+        "resident_id": 1,
+        "message": "",
+    })
+    history = session.post(f"{url}/api/get-checkout-history", headers=HEADERS, json={
+        "start_date": "2000-01-01T00:00:00.000Z",
+        "end_date": "2100-01-01T00:00:00.000Z",
+    })
+
+    return checkout.json()["value"], history.json()["value"]
+
+
+def har_session(cassette):
+    session = requests.Session()
+    session.mount("http://", HarAdapter(cassette))
+
+    return session
+
+
+@pytest.fixture
+def recording(tmp_path):
+    """A checkout and the history read after it, recorded from the local data API."""
+    path = tmp_path / "checkout_history.har"
+    recorded_id = str(uuid.uuid4())
+    api = LocalDataApi(port=0).start()
+
+    try:
+        cassette = HarCassette(path, "record")
+        checkout_and_read_history(har_session(cassette), api.url, recorded_id)
+        cassette.save()
+    finally:
+        api.stop()
+
+    return path, api.url, recorded_id
+
+
+def test_replayed_history_shows_the_live_transaction_id(recording):
+    path, url, recorded_id = recording
+    live_id = str(uuid.uuid4())
+    cassette = HarCassette(path, "replay")
+
+    # The server is gone: every response comes from the cassette
+    result, rows = checkout_and_read_history(har_session(cassette), url, live_id)
+
+    assert cassette.misses == []
+    assert result and result[0].get("Status") != "Error", result
+
+    ids = [row["transaction_id"].lower() for row in rows]
+    assert live_id in ids
+    assert recorded_id not in ids
@@ -1,5 +1,4 @@
 import pytest
-from selenium.webdriver.support.wait import WebDriverWait
 
 
 # ---------------------------------------------------
@@ -9,22 +8,24 @@ from selenium.webdriver.support.wait import WebDriverWait
 @pytest.mark.usefixtures("login_with_volunteer")
 @pytest.mark.regression
 def test_checkout_increases_history_count(
-        checkout_page,
+        api_client,
+        test_data,
         history_page):
 
     # ---------------------------------------------------
-    # Arrange
+    # Arrange (data API: no UI round trips)
     # ---------------------------------------------------
-    history_page.open_history()
-
-    initial_count = history_page.get_record_count_number()
+    initial_count = api_client.checkout_record_count()
     print(f"[BEFORE] History count: {initial_count}")
 
+    api_client.checkout(
+        test_data.item("Curtains"),
+        resident_id=test_data.household.resident_id,
+    )
+
     # ---------------------------------------------------
     # Act
     # ---------------------------------------------------
-    checkout_page.complete_checkout("Curtains")
-
     history_page.open_history()
 
     #  deterministic wait (NO +1 assumption)
@@ -49,46 +50,34 @@ def test_checkout_increases_history_count(
 @pytest.mark.regression
 @pytest.mark.serial
 def test_checkout_reflected_in_history(
-        checkout_page,
+        api_client,
+        test_data,
         history_page):
 
     # ---------------------------------------------------
-    # Arrange
+    # Arrange (data API: no UI round trips)
     # ---------------------------------------------------
-    history_page.open_history()
-
-    previous_latest = history_page.get_latest_card()
-    previous_text = previous_latest.text.strip() if previous_latest else ""
+    transaction_id = api_client.checkout(
+        test_data.item("Curtains"),
+        resident_id=test_data.household.resident_id,
+    )
 
     # ---------------------------------------------------
     # Act
     # ---------------------------------------------------
-    checkout_page.complete_checkout("Curtains")
-
     history_page.open_history()
 
-    #  wait until NEW card appears (robust)
-    def new_card_loaded(_):
-        card = history_page.get_latest_card()
-        return (
-            card is not None and
-            card.text.strip() != "" and
-            card.text.strip() != previous_text
-        )
-
-    WebDriverWait(history_page.driver, 20).until(new_card_loaded)
-
-    latest_card = history_page.get_latest_card()
-    latest_text = latest_card.text.strip()
+    #  wait until the seeded checkout's card appears (robust)
+    latest_text = history_page.wait_for_transaction_card(transaction_id)
     latest_text_lc = latest_text.lower()
 
     print(f"[LATEST CARD]\n{latest_text}")
 
     # ---------------------------------------------------
-    # Assert 1: Card changed
+    # Assert 1: Card is the newest
     # ---------------------------------------------------
-    assert latest_text != previous_text, (
-        "Latest history card did not update after checkout"
+    assert history_page.get_latest_transaction_id() == transaction_id, (
+        "Latest history card is not the new checkout"
     )
 
     # ---------------------------------------------------
@@ -105,4 +94,4 @@ def test_checkout_reflected_in_history(
     # ---------------------------------------------------
     assert "created today at" in latest_text_lc, (
         f"History entry not from today → {latest_text}"
-    )
\ No newline at end of file
+    )
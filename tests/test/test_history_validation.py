@@ -4,7 +4,7 @@ import pytest
 @pytest.mark.usefixtures("login_with_volunteer")
 @pytest.mark.serial
 @pytest.mark.regression
-def test_checkout_updates_history(home_page, checkout_page, history_page):
+def test_checkout_updates_history(home_page, checkout_page, history_page, test_data):
 
     # ---------------------------------------------------
     # Arrange
@@ -17,14 +17,14 @@ def test_checkout_updates_history(home_page, checkout_page, history_page):
     # ---------------------------------------------------
     home_page.go_to_checkout_general()
 
-    checkout_page.select_first_building_option()
-    checkout_page.select_first_unit_number()
-    checkout_page.wait_for_resident_autofill()
+    item = test_data.item("Curtains")
+
+    checkout_page.select_household(test_data.household)
 
     checkout_page.click_continue_button()
 
-    checkout_page.search_item("Curtains")
-    checkout_page.add_item("Curtains")
+    checkout_page.search_item(item)
+    checkout_page.add_item(item)
 
     checkout_page.click_proceed_to_checkout()
     checkout_page.click_confirm()
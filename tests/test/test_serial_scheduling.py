@@ -0,0 +1,86 @@
+import os
+from pathlib import Path
+
+import pytest
+
+pytest_plugins = "pytester"
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Only the scheduling hooks of tests/conftest.py, so no browser is started
+CONFTEST = """
+from tests.conftest import (
+    pytest_addoption,
+    pytest_collection_modifyitems,
+    pytest_configure_node,
+    pytest_xdist_make_scheduler,
+)
+"""
+
+# Every test logs "<kind> <worker> <started> <finished>" to a shared file
+TESTS = """
+import os
+import time
+
+import pytest
+
+LOG = {log!r}
+
+
+def record(kind):
+    started = time.time()
+    time.sleep(0.2)
+    with open(LOG, "a") as log:
+        log.write(f"{{kind}} {{os.environ['PYTEST_XDIST_WORKER']}} {{started}} {{time.time()}}\\n")
+
+
+@pytest.mark.parametrize("n", range(8))
+def test_parallel(n):
+    record("parallel")
+
+
+@pytest.mark.serial
+@pytest.mark.parametrize("n", range(4))
+def test_serial(n):
+    record("serial")
+"""
+
+
+@pytest.fixture
+def scheduling_run(pytester, monkeypatch):
+    monkeypatch.setenv("PYTHONPATH", os.pathsep.join(
+        filter(None, [str(REPO_ROOT), os.environ.get("PYTHONPATH")])
+    ))
+    log = pytester.path / "runs.log"
+
+    pytester.makeini("[pytest]\nmarkers =\n    serial: must not run in parallel\n")
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_scheduling=TESTS.format(log=str(log)))
+
+    def run(*args):
+        result = pytester.runpytest_subprocess("-n", "2", "-p", "no:cacheprovider", *args)
+        runs = [line.split() for line in log.read_text().splitlines()]
+
+        return result, [
+            (kind, worker, float(started), float(finished))
+            for kind, worker, started, finished in runs
+        ]
+
+    return run
+
+
+def test_serial_tests_run_on_one_worker_after_parallel_ones(scheduling_run):
+    result, runs = scheduling_run()
+    result.assert_outcomes(passed=12)
+
+    parallel = [run for run in runs if run[0] == "parallel"]
+    serial = [run for run in runs if run[0] == "serial"]
+
+    assert len({worker for _, worker, _, _ in serial}) == 1, serial
+    assert min(started for _, _, started, _ in serial) >= max(
+        finished for _, _, _, finished in parallel
+    ), runs
+
+    # Parallel tests are still balanced over both workers
+    assert len({worker for _, worker, _, _ in parallel}) == 2, parallel
+
@@ -11,6 +11,8 @@ import pytest
 def test_edit_prefills_data(
     driver,
     login_with_volunteer,
+    api_client,
+    test_data,
     checkout_page,
     history_page
 ):
@@ -18,6 +20,11 @@ def test_edit_prefills_data(
     Validate edit opens with prefilled data
     """
 
+    api_client.checkout(
+        test_data.item("Curtains"),
+        resident_id=test_data.household.resident_id,
+    )
+
     history_page.open_history()
     history_page.open_latest_transaction()
     history_page.click_edit_transaction()
@@ -38,6 +45,8 @@ def test_edit_prefills_data(
 def test_edit_transaction_flow(
     driver,
     login_with_volunteer,
+    api_client,
+    test_data,
     checkout_page,
     history_page
 ):
@@ -45,10 +54,10 @@ def test_edit_transaction_flow(
     Full E2E edit transaction flow
     """
 
-    item_name = "Curtains"
+    item_name = test_data.item("Curtains")
 
-    # STEP 1: Create checkout
-    checkout_page.complete_checkout(item_name)
+    # STEP 1: Create checkout (data API)
+    api_client.checkout(item_name, resident_id=test_data.household.resident_id)
 
     # STEP 2: Go to history
     history_page.open_history()
@@ -151,10 +160,10 @@ def test_welcome_basket_not_editable(
 
     history_page.open_history()
 
-    cards = history_page.get_history_cards()
+    cards = history_page.get_history_card_matches()
 
     for card in cards:
-        if "Welcome Basket" in card.text:
+        if "Welcome Basket" in card["text"]:
             # No click here
-            assert not card.is_enabled(), \
+            assert not card["element"].is_enabled(), \
                 "Welcome Basket transactions should not be editable"
\ No newline at end of file
@@ -16,11 +16,10 @@ def return_to_home_page(driver, inventory_page):
 
 @pytest.mark.usefixtures('login_with_volunteer')
 @pytest.mark.regression
-@pytest.mark.serial
 class TestInventory:
 
     @pytest.mark.parametrize('item', ['Clothing Rack'])
-    def test_inventory(self, driver, inventory_page, item):
+    def test_inventory(self, driver, inventory_page, test_data, item):
         """
                 Verify that the inventory quantity decreases by one after a successful checkout.
 
@@ -47,6 +46,9 @@ class TestInventory:
 
                 """
 
+        # This worker's copy: no other worker changes its quantity
+        item = test_data.item(item)
+
         # ---------------------------------------------------
         # Step 1: Go to Inventory & get initial quantity
         # ---------------------------------------------------
@@ -65,14 +67,8 @@ class TestInventory:
 
         checkout_page.click_checkout()
 
-        # Building
-        checkout_page.select_first_building_option()
-
-        # Unit (dependent dropdown → MUST WAIT)
-        checkout_page.select_first_unit_number()
-
-        # Name
-        checkout_page.wait_for_resident_autofill()
+        # Building, unit (dependent dropdown) and name
+        checkout_page.select_household(test_data.household)
 
         # Continue (state-based safe)
         checkout_page.click_continue_button()
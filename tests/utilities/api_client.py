@@ -0,0 +1,344 @@
+import json
+import uuid
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from tests.utilities.browser_pool import origin_of
+from tests.utilities.har_replay import HarAdapter
+
+
+# src/types/constants.ts API_PREFIX: the SWA CLI serves the data API
+# under /data-api/api, a deployed Static Web App under /api
+API_PREFIXES = ("/data-api/api", "/api")
+
+# TransactionType in src/types/interfaces.ts
+CHECKOUT = 1
+
+POOL_SIZE = 10
+TIMEOUT_SECONDS = 30
+
+# What the app keeps in localStorage (usePersistentState) plus the
+# "today" range useDateRangeFilter sends, in the browser's timezone
+_BROWSER_STATE_SCRIPT = """
+const read = (key) => {
+    try { return JSON.parse(localStorage.getItem(key)); } catch (e) { return null; }
+};
+const start = new Date(); start.setHours(0, 0, 0, 0);
+const end = new Date(); end.setHours(23, 59, 59, 999);
+return {
+    user: read('user'),
+    loggedInUserId: read('loggedInUserId'),
+    today: {start_date: start.toISOString(), end_date: end.toISOString()},
+};
+"""
+
+
+class ApiError(Exception):
+    pass
+
+
+def role_of(principal):
+    """getRole() in src/utils/userUtils.ts: volunteer wins over admin."""
+    roles = (principal or {}).get("userRoles") or []
+
+    for role in ("volunteer", "admin"):
+        if role in roles:
+            return role
+
+    raise ApiError(f"Signed-in user has no admin or volunteer role: {roles}")
+
+
+class ApiSession:
+    """
+    Per-worker pool of keep-alive connections to the app's data API.
+    Each test borrows it through an ApiClient bound to its browser.
+    """
+
+    def __init__(self, pool_size=POOL_SIZE):
+        self.pool_size = pool_size
+        self.http = requests.Session()
+        self._mount(HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+
+        # origin -> API prefix it answers on
+        self._prefixes = {}
+
+    def close(self):
+        self.http.close()
+
+    def _mount(self, adapter):
+        self.http.mount("http://", adapter)
+        self.http.mount("https://", adapter)
+
+    def use_har(self, cassette):
+        """
+        Record into / replay from a test's HarCassette (None: back to
+        the network). The prefix probe is part of each test's traffic,
+        so a test replays on its own.
+        """
+        if cassette is None:
+            adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+        else:
+            adapter = HarAdapter(cassette, pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+
+        self.http.get_adapter("http://").close()
+        self._mount(adapter)
+        self._prefixes.clear()
+
+    def for_browser(self, driver):
+        return ApiClient(self, driver)
+
+    def use_cookies(self, cookies):
+        """Replace the session cookies with the browser's (auth included)."""
+        self.http.cookies.clear()
+
+        for cookie in cookies:
+            self.http.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+            )
+
+    def api_prefix(self, origin, role):
+        if origin not in self._prefixes:
+            self._prefixes[origin] = self._probe_prefix(origin, role)
+
+        return self._prefixes[origin]
+
+    def _probe_prefix(self, origin, role):
+        # A prefix the origin does not proxy falls through to
+        # navigationFallback (index.html), so look for DAB's JSON body
+        for prefix in API_PREFIXES:
+            try:
+                response = self.http.get(
+                    f"{origin}{prefix}/items",
+                    params={"$first": 1, "$select": "id"},
+                    headers={"Accept": "application/json", "X-MS-API-ROLE": role},
+                    timeout=TIMEOUT_SECONDS,
+                    allow_redirects=False,
+                )
+                if response.ok and "value" in response.json():
+                    return prefix
+
+            except (requests.RequestException, ValueError):
+                continue
+
+        raise ApiError(f"No data API found at {origin} (tried {', '.join(API_PREFIXES)})")
+
+
+class ApiClient:
+    """
+    Calls the data API as the user signed in to ``driver`` so tests can
+    seed transactions and read history counts without the UI.
+
+        checkout = api_client.checkout("Curtains")
+        history_page.open_history()
+
+    The browser's cookies, role and loggedInUserId are read on first
+    use, so request the fixture after the login fixture has run.
+    """
+
+    def __init__(self, session, driver):
+        self.session = session
+        self.driver = driver
+        self._state = None
+        self._resident = None
+        self._items = {}
+
+    # ---------------------------------------------------
+    # Browser State
+    # ---------------------------------------------------
+
+    @property
+    def state(self):
+        if self._state is None:
+            self.sync()
+
+        return self._state
+
+    def sync(self):
+        """(Re)read cookies and app state from the browser."""
+        state = self.driver.execute_script(_BROWSER_STATE_SCRIPT)
+
+        self.session.use_cookies(self.driver.get_cookies())
+
+        state["origin"] = origin_of(self.driver.current_url)
+        state["role"] = role_of(state["user"])
+        state["prefix"] = self.session.api_prefix(state["origin"], state["role"])
+
+        self._state = state
+        return state
+
+    @property
+    def user_id(self):
+        user_id = self.state["loggedInUserId"]
+
+        if user_id is None:
+            raise ApiError("No loggedInUserId in the browser; log in before using api_client")
+
+        return user_id
+
+    @property
+    def today(self):
+        return self.state["today"]
+
+    # ---------------------------------------------------
+    # HTTP
+    # ---------------------------------------------------
+
+    def request(self, method, path, body=None, params=None):
+        state = self.state
+
+        response = self.session.http.request(
+            method,
+            f"{state['origin']}{state['prefix']}/{path.lstrip('/')}",
+            params=params,
+            data=json.dumps(body) if body is not None else None,
+            headers={
+                "Accept": "application/json",
+                "Content-Type": "application/json;charset=utf-8",
+                "X-MS-API-ROLE": state["role"],
+            },
+            timeout=TIMEOUT_SECONDS,
+            allow_redirects=False,
+        )
+
+        if not response.ok:
+            raise ApiError(
+                f"{method} {path} -> {response.status_code}: {response.text[:200]}"
+            )
+
+        return response.json().get("value") if response.content else None
+
+    def get(self, path, **params):
+        return self.request("GET", path, params=params)
+
+    def post(self, path, body):
+        return self.request("POST", path, body=body)
+
+    def patch(self, path, body):
+        return self.request("PATCH", path, body=body)
+
+    # ---------------------------------------------------
+    # Lookups
+    # ---------------------------------------------------
+
+    def item_id(self, name):
+        if name not in self._items:
+            name_literal = name.replace("'", "''")
+            rows = self.get("items", **{"$filter": f"name eq '{name_literal}'", "$select": "id"})
+
+            if not rows:
+                raise ApiError(f"No item named {name!r}")
+
+            self._items[name] = rows[0]["id"]
+
+        return self._items[name]
+
+    def default_resident(self):
+        """
+        First resident of the first building's first occupied unit,
+        as CheckOutPage.complete_checkout() picks them.
+        (residents-by-building would do it in one call, but is admin-only.)
+        """
+        if self._resident is None:
+            buildings = self.get("building", **{"$first": 1, "$select": "id"})
+
+            for building in buildings:
+                units = self.get("units", **{"$filter": f"building_id eq {building['id']}", "$select": "id"})
+
+                for unit in units:
+                    residents = self.get("residents", **{"$filter": f"unit_id eq {unit['id']}", "$first": 1})
+
+                    if residents:
+                        self._resident = residents[0]
+                        return self._resident
+
+            raise ApiError("No residents to check out to")
+
+        return self._resident
+
+    # ---------------------------------------------------
+    # Stored Procedures
+    # ---------------------------------------------------
+
+    def checkout_general_items(self, items, resident_id, transaction_id=None,
+                               original_transaction_id=None):
+        """
+        processGeneralItems() in src/services/checkoutService.ts.
+        items: [{"id", "quantity", "additional_notes"?}, ...]
+        """
+        body = {
+            "new_transaction_id": transaction_id or str(uuid.uuid4()),
+            "user_id": self.user_id,
+            "items": items,
+            "resident_id": resident_id,
+            "message": "",
+        }
+
+        if original_transaction_id:
+            body["original_transaction_id"] = original_transaction_id
+
+        return self._procedure_result("checkout-general-items", body)
+
+    def process_inventory_change(self, items, transaction_id=None):
+        """processInventoryChange() in src/services/inventoryService.ts."""
+        return self._procedure_result("process-inventory-change", {
+            "user_id": self.user_id,
+            "item": items,
+            "new_transaction_id": transaction_id or str(uuid.uuid4()),
+        })
+
+    def get_checkout_history(self, start_date=None, end_date=None):
+        """Raw GetCheckoutHistory rows; defaults to the History page's "today"."""
+        return self.post("get-checkout-history", {
+            "start_date": start_date or self.today["start_date"],
+            "end_date": end_date or self.today["end_date"],
+        })
+
+    def _procedure_result(self, path, body):
+        rows = self.post(path, body) or []
+        result = rows[0] if rows else {}
+
+        if result.get("Status") == "Error":
+            raise ApiError(f"{path}: {result.get('ErrorCode') or result.get('message')}")
+
+        return body["new_transaction_id"]
+
+    # ---------------------------------------------------
+    # Test State
+    # ---------------------------------------------------
+
+    def checkout(self, item_name, quantity=1, resident_id=None):
+        """One general checkout; returns its transaction id."""
+        resident_id = resident_id or self.default_resident()["id"]
+
+        return self.checkout_general_items(
+            [{"id": self.item_id(item_name), "quantity": quantity, "additional_notes": ""}],
+            resident_id,
+        )
+
+    def restock(self, item_name, quantity):
+        """Inventory add for one item; returns its transaction id."""
+        return self.process_inventory_change(
+            [{"id": self.item_id(item_name), "quantity": quantity}]
+        )
+
+    def checkout_history(self, user_id=None):
+        """
+        Today's checkouts by one user (default: the signed-in one),
+        newest first: the cards under the History page's "You" header.
+        """
+        user_id = self.user_id if user_id is None else user_id
+
+        rows = [
+            row for row in self.get_checkout_history()
+            if row["transaction_type"] == CHECKOUT and row["user_id"] == user_id
+        ]
+
+        return sorted(rows, key=lambda row: row["transaction_date"], reverse=True)
+
+    def checkout_record_count(self, user_id=None):
+        """The History page's "N records" for the user."""
+        return len(self.checkout_history(user_id))
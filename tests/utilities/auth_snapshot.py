@@ -0,0 +1,166 @@
+import json
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+
+# Anonymous page on the app origin: lets us set cookies and storage
+# for the origin without triggering the AAD redirect.
+ANONYMOUS_PAGE = "/login.html"
+
+# Refresh a little before the auth cookie actually expires
+EXPIRY_MARGIN_SECONDS = 60
+
+_READ_STORAGE_SCRIPT = """
+const dump = (store) => {
+    const out = {};
+    for (let i = 0; i < store.length; i++) {
+        const key = store.key(i);
+        out[key] = store.getItem(key);
+    }
+    return out;
+};
+return {local: dump(window.localStorage), session: dump(window.sessionStorage)};
+"""
+
+_WRITE_STORAGE_SCRIPT = """
+const [local, session] = arguments;
+window.localStorage.clear();
+window.sessionStorage.clear();
+Object.entries(local).forEach(([k, v]) => window.localStorage.setItem(k, v));
+Object.entries(session).forEach(([k, v]) => window.sessionStorage.setItem(k, v));
+"""
+
+_AUTH_ME_SCRIPT = """
+const done = arguments[arguments.length - 1];
+fetch('/.auth/me', {credentials: 'same-origin'})
+    .then(r => r.ok ? r.json() : {clientPrincipal: null})
+    .then(body => done(body.clientPrincipal ? body.clientPrincipal.userRoles : []))
+    .catch(() => done([]));
+"""
+
+
+class AuthSnapshot:
+    """
+    Authenticated browser state (cookies + local/session storage)
+    for one role, captured after a full interactive login.
+    """
+
+    def __init__(self, role, username, cookies, local_storage, session_storage, ttl):
+        self.role = role
+        self.username = username
+        self.cookies = cookies
+        self.local_storage = local_storage
+        self.session_storage = session_storage
+        self.captured_at = time.time()
+        self.ttl = ttl
+
+    def is_expired(self, now=None):
+        now = now or time.time()
+
+        if now - self.captured_at > self.ttl:
+            return True
+
+        return any(
+            cookie["expiry"] - EXPIRY_MARGIN_SECONDS < now
+            for cookie in self.cookies
+            if "expiry" in cookie
+        )
+
+    def stored_roles(self):
+        """Roles of the client principal the app cached in localStorage."""
+        try:
+            user = json.loads(self.local_storage.get("user") or "null")
+        except ValueError:
+            return []
+
+        return (user or {}).get("userRoles", [])
+
+
+class AuthSnapshotStore:
+    """
+    Per-worker cache of AuthSnapshot objects keyed by role.
+    Snapshots live in memory only so credentials never touch disk.
+    """
+
+    def __init__(self, base_url, ttl):
+        self.base_url = (base_url or "").rstrip("/")
+        self.ttl = ttl
+        self._snapshots = {}
+
+    def get(self, role, username):
+        snapshot = self._snapshots.get(role)
+
+        if snapshot is None:
+            return None
+
+        if (
+            snapshot.is_expired()
+            or snapshot.username != username
+            or role not in snapshot.stored_roles()
+        ):
+            self.invalidate(role)
+            return None
+
+        return snapshot
+
+    def invalidate(self, role):
+        self._snapshots.pop(role, None)
+
+    # ---------------------------------------------------
+    # Capture / Restore
+    # ---------------------------------------------------
+
+    def capture(self, driver, role, username):
+        storage = driver.execute_script(_READ_STORAGE_SCRIPT)
+
+        snapshot = AuthSnapshot(
+            role=role,
+            username=username,
+            cookies=driver.get_cookies(),
+            local_storage=storage["local"],
+            session_storage=storage["session"],
+            ttl=self.ttl,
+        )
+
+        if role in snapshot.stored_roles():
+            self._snapshots[role] = snapshot
+
+        return snapshot
+
+    def restore(self, driver, role, username):
+        """
+        Inject a cached snapshot into the browser and open the app.
+        Returns False (and drops the snapshot) when there is nothing
+        usable to restore, in which case the caller logs in normally.
+        """
+        snapshot = self.get(role, username)
+
+        if snapshot is None:
+            return False
+
+        try:
+            driver.get(self.base_url + ANONYMOUS_PAGE)
+
+            for cookie in snapshot.cookies:
+                cookie = {k: v for k, v in cookie.items() if k != "domain"}
+                driver.add_cookie(cookie)
+
+            driver.execute_script(
+                _WRITE_STORAGE_SCRIPT,
+                snapshot.local_storage,
+                snapshot.session_storage,
+            )
+
+            # Server-side role may have changed since the snapshot was taken
+            if role not in driver.execute_async_script(_AUTH_ME_SCRIPT):
+                self.invalidate(role)
+                return False
+
+            driver.get(self.base_url)
+            return True
+
+        except WebDriverException as err:
+            print(f"[WARN] Auth snapshot restore failed for {role}: {err.msg}")
+            self.invalidate(role)
+            return False
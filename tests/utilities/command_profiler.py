@@ -0,0 +1,358 @@
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+# Frames from these modules are page-object methods
+PAGE_MODULE_PREFIX = "tests.pages."
+
+# Commands issued outside any page-object method (fixtures, test body)
+UNATTRIBUTED = "(test)"
+
+# A method "grows with data size" when, over invocations that saw at
+# least this many distinct result sizes, every extra element costs at
+# least GROWTH_MIN_SLOPE more commands and the trend is consistent.
+GROWTH_MIN_SIZES = 3
+GROWTH_MIN_SLOPE = 0.5
+GROWTH_MIN_CORRELATION = 0.8
+
+RUN_REPORT_NAME = "command-profile.json"
+WORKER_REPORT_GLOB = "command-profile-*.json"
+
+HOT_SPOT_LIMIT = 10
+
+
+def page_method_on_stack(frame):
+    """
+    Outermost page-object method on the stack, as "Class.method",
+    so BasePage helpers count towards the page method that used them.
+    """
+    found = None
+
+    while frame is not None:
+        if (
+            frame.f_globals.get("__name__", "").startswith(PAGE_MODULE_PREFIX)
+            and "self" in frame.f_locals
+        ):
+            found = frame
+
+        frame = frame.f_back
+
+    if found is None:
+        return None, None
+
+    owner = type(found.f_locals["self"]).__name__
+    return found, f"{owner}.{found.f_code.co_name}"
+
+
+def result_size(response):
+    """Number of elements / rows a command returned (0 for scalars)."""
+    value = response.get("value") if isinstance(response, dict) else None
+    return len(value) if isinstance(value, list) else 0
+
+
+class MethodStats:
+    def __init__(self):
+        self.calls = 0
+        self.commands = 0
+        self.seconds = 0.0
+        # (largest result size, commands) per invocation
+        self.samples = []
+
+    def add_invocation(self, invocation):
+        self.calls += 1
+        self.commands += invocation.commands
+        self.seconds += invocation.seconds
+        self.samples.append((invocation.data_size, invocation.commands))
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "commands": self.commands,
+            "seconds": round(self.seconds, 4),
+            "samples": self.samples,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.calls = data["calls"]
+        stats.commands = data["commands"]
+        stats.seconds = data["seconds"]
+        stats.samples = [tuple(sample) for sample in data["samples"]]
+        return stats
+
+    def merge(self, other):
+        self.calls += other.calls
+        self.commands += other.commands
+        self.seconds += other.seconds
+        self.samples.extend(other.samples)
+
+    def growth(self):
+        """Extra commands per returned element, or None if not measurable."""
+        samples = [sample for sample in self.samples if sample[0] > 0]
+
+        if len({size for size, _ in samples}) < GROWTH_MIN_SIZES:
+            return None
+
+        sizes = [size for size, _ in samples]
+        commands = [count for _, count in samples]
+
+        if len(set(commands)) < 2:
+            return 0.0
+
+        correlation = statistics.correlation(sizes, commands)
+        slope, _ = statistics.linear_regression(sizes, commands)
+
+        if correlation < GROWTH_MIN_CORRELATION:
+            return 0.0
+
+        return slope
+
+
+class Invocation:
+    """One call of a page-object method, possibly spanning many commands"""
+
+    def __init__(self, method, frame):
+        self.method = method
+        self.frame = frame
+        self.commands = 0
+        self.seconds = 0.0
+        self.data_size = 0
+
+
+class TestProfile:
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+        self.commands = 0
+        self.seconds = 0.0
+        self.methods = {}
+        self.command_names = {}
+
+    def record(self, command, seconds):
+        self.commands += 1
+        self.seconds += seconds
+
+        entry = self.command_names.setdefault(command, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def to_dict(self):
+        methods = sorted(
+            self.methods.items(),
+            key=lambda item: item[1].seconds,
+            reverse=True
+        )
+
+        return {
+            "nodeid": self.nodeid,
+            "commands": self.commands,
+            "seconds": round(self.seconds, 4),
+            "methods": [
+                {
+                    "method": name,
+                    "calls": stats.calls,
+                    "commands": stats.commands,
+                    "seconds": round(stats.seconds, 4),
+                }
+                for name, stats in methods
+            ],
+            "command_names": {
+                name: {"count": count, "seconds": round(seconds, 4)}
+                for name, (count, seconds) in sorted(self.command_names.items())
+            },
+        }
+
+
+class CommandProfiler:
+    """
+    Records every WebDriver wire command with its duration and the
+    page-object method that issued it.
+
+    attach() wraps the driver's command executor; start_test() /
+    finish_test() bracket a test. Method statistics accumulate over
+    the whole (worker) session for the run report.
+    """
+
+    def __init__(self):
+        self.methods = {}
+        self.tests = []
+        self._test = None
+        self._invocation = None
+
+    def attach(self, driver):
+        executor = driver.command_executor
+
+        if getattr(executor, "_command_profiler", None) is self:
+            return
+
+        execute = executor.execute
+
+        def profiled_execute(command, params):
+            started = time.perf_counter()
+            response = execute(command, params)
+            self._record(
+                command,
+                time.perf_counter() - started,
+                result_size(response),
+                sys._getframe(1),
+            )
+            return response
+
+        executor.execute = profiled_execute
+        executor._command_profiler = self
+
+    # ---------------------------------------------------
+    # Test Lifecycle
+    # ---------------------------------------------------
+
+    def start_test(self, nodeid):
+        self._test = TestProfile(nodeid)
+        self._invocation = None
+
+    def finish_test(self):
+        self._close_invocation()
+
+        test = self._test
+        self._test = None
+
+        if test is None:
+            return None
+
+        report = test.to_dict()
+        self.tests.append(report)
+        return report
+
+    # ---------------------------------------------------
+    # Recording
+    # ---------------------------------------------------
+
+    def _record(self, command, seconds, size, frame):
+        if self._test is None:
+            return
+
+        self._test.record(command, seconds)
+
+        page_frame, method = page_method_on_stack(frame)
+        method = method or UNATTRIBUTED
+
+        invocation = self._invocation
+
+        # Holding the frame keeps it alive, so "is" identifies the call
+        if invocation is None or invocation.frame is not page_frame:
+            self._close_invocation()
+            invocation = self._invocation = Invocation(method, page_frame)
+
+        invocation.commands += 1
+        invocation.seconds += seconds
+        invocation.data_size = max(invocation.data_size, size)
+
+    def _close_invocation(self):
+        invocation = self._invocation
+        self._invocation = None
+
+        if invocation is None or self._test is None:
+            return
+
+        self._test.methods.setdefault(
+            invocation.method, MethodStats()
+        ).add_invocation(invocation)
+
+        self.methods.setdefault(
+            invocation.method, MethodStats()
+        ).add_invocation(invocation)
+
+    # ---------------------------------------------------
+    # Reports
+    # ---------------------------------------------------
+
+    def to_dict(self):
+        return {
+            "tests": self.tests,
+            "methods": {
+                name: stats.to_dict()
+                for name, stats in self.methods.items()
+            },
+        }
+
+    def write(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+
+
+def build_run_report(partials):
+    """Merge per-worker profiles into per-test and per-method hot spots."""
+    tests = []
+    methods = {}
+
+    for partial in partials:
+        tests.extend(partial["tests"])
+
+        for name, data in partial["methods"].items():
+            methods.setdefault(name, MethodStats()).merge(
+                MethodStats.from_dict(data)
+            )
+
+    method_rows = []
+
+    for name, stats in methods.items():
+        growth = stats.growth()
+
+        method_rows.append({
+            "method": name,
+            "calls": stats.calls,
+            "commands": stats.commands,
+            "seconds": round(stats.seconds, 4),
+            "commands_per_call": round(stats.commands / stats.calls, 2),
+            "max_data_size": max(size for size, _ in stats.samples),
+            "commands_per_element": None if growth is None else round(growth, 2),
+            "grows_with_data": growth is not None and growth >= GROWTH_MIN_SLOPE,
+        })
+
+    method_rows.sort(key=lambda row: row["seconds"], reverse=True)
+    tests.sort(key=lambda test: test["seconds"], reverse=True)
+
+    return {
+        "totals": {
+            "tests": len(tests),
+            "commands": sum(test["commands"] for test in tests),
+            "seconds": round(sum(test["seconds"] for test in tests), 4),
+        },
+        "hot_methods": method_rows,
+        "hot_tests": [
+            {
+                "nodeid": test["nodeid"],
+                "commands": test["commands"],
+                "seconds": test["seconds"],
+            }
+            for test in tests
+        ],
+        "growing_methods": [
+            row["method"] for row in method_rows if row["grows_with_data"]
+        ],
+        "tests": tests,
+    }
+
+
+def write_run_report(directory):
+    """Combine the worker files in ``directory`` into RUN_REPORT_NAME."""
+    directory = Path(directory)
+    worker_files = sorted(directory.glob(WORKER_REPORT_GLOB))
+
+    if not worker_files:
+        return None
+
+    report = build_run_report(
+        json.loads(path.read_text()) for path in worker_files
+    )
+
+    for path in worker_files:
+        path.unlink()
+
+    target = directory / RUN_REPORT_NAME
+    target.write_text(json.dumps(report, indent=2))
+
+    return report
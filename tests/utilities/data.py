@@ -8,3 +8,48 @@ ADMIN_USERNAME = os.getenv("ADMIN_USERNAME")
 ADMIN_PASSWORD = os.getenv("ADMIN_PASSWORD")
 VOLUNTEER_USERNAME = os.getenv("VOLUNTEER_USERNAME")
 VOLUNTEER_PASSWORD = os.getenv("VOLUNTEER_PASSWORD")
+
+# "pooled" reuses one Chrome per worker, "per-test" launches one per test
+BROWSER_MODE = os.getenv("BROWSER_MODE", "per-test")
+
+# Seconds a captured login snapshot is reused before logging in again
+AUTH_SNAPSHOT_TTL = int(os.getenv("AUTH_SNAPSHOT_TTL", "1800"))
+
+# "observer" waits inside the page via MutationObserver, "polling" uses WebDriverWait
+WAIT_ENGINE = os.getenv("WAIT_ENGINE", "observer")
+
+# Per-page performance budgets and how exceeding them is reported:
+# "warn", "fail" or "off" for every page; unset uses each page's own "mode"
+PERF_BUDGETS_FILE = os.getenv(
+    "PERF_BUDGETS_FILE",
+    os.path.join(os.path.dirname(__file__), "performance_budgets.json")
+)
+PERF_BUDGET_MODE = os.getenv("PERF_BUDGET_MODE") or None
+
+# Chrome CPU slowdown factor (1 = none), e.g. 4 to approximate the kiosks
+CPU_THROTTLE = float(os.getenv("CPU_THROTTLE", "1"))
+
+# Serve the data API from tests/local_dab (seeded SQLite) instead of a
+# running Data API Builder; the SWA CLI proxies /data-api to this port
+LOCAL_API = os.getenv("LOCAL_API", "").lower() in ("1", "true", "yes")
+LOCAL_API_PORT = int(os.getenv("LOCAL_API_PORT", "5000"))
+
+# Serve the app through tests/local_swa: stubbed /.auth (no Microsoft
+# login) in front of the Vite dev server; point URL at AUTH_STUB_PORT
+AUTH_STUB = os.getenv("AUTH_STUB", "").lower() in ("1", "true", "yes")
+AUTH_STUB_PORT = int(os.getenv("AUTH_STUB_PORT", "4280"))
+AUTH_STUB_PRINCIPALS = os.getenv("AUTH_STUB_PRINCIPALS") or None
+APP_DEVSERVER_URL = os.getenv("APP_DEVSERVER_URL", "http://localhost:3000")
+DATA_API_URL = os.getenv("DATA_API_URL", "http://127.0.0.1:5000")
+
+# Volunteer the auth stub signs in as (first user in
+# database/data_test/users_data.sql)
+LOCAL_VOLUNTEER = {"id": 1, "name": "John Doe 1234"}
+
+# Prefix of the per-worker residents and item copies the test data
+# namespace provisions, e.g. "Curtains (E2E gw0)"
+E2E_DATA_PREFIX = os.getenv("E2E_DATA_PREFIX", "E2E")
+
+# With LOCAL_API: restore each worker's database after every "function",
+# "module" or the "session", or "off"
+LOCAL_DB_RESET = os.getenv("LOCAL_DB_RESET", "off")
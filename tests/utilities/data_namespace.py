@@ -0,0 +1,169 @@
+import re
+
+from tests.utilities.api_client import ApiError
+
+
+# Buildings and units are read-only in dab-config.json, so a worker is
+# given an existing unit; residents and items are created for it
+MIN_STOCK = 1000
+
+
+def worker_index(worker):
+    """0 for "main" (no xdist), n for "gw<n>"."""
+    match = re.search(r"(\d+)$", worker or "")
+    return int(match.group(1)) if match else 0
+
+
+def _literal(value):
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+class Household:
+    """Building / unit / resident a worker checks out to."""
+
+    def __init__(self, building, unit, resident):
+        self.building_id = building["id"]
+        # BuildingCodeSelect getOptionLabel
+        self.building_label = f"{building['code']} ({building['name']})"
+        self.unit_id = unit["id"]
+        self.unit_number = unit["unit_number"]
+        self.resident_id = resident["id"]
+        self.resident_name = resident["name"]
+
+    def __repr__(self):
+        return f"<Household {self.building_label} / {self.unit_number} / {self.resident_name}>"
+
+
+class DataNamespace:
+    """
+    Test data owned by one xdist worker, provisioned through the data
+    API on first use and reused for the rest of the worker session:
+
+    - a unit of its own: workers count down from the last building
+      (away from the "first option" the welcome basket tests use),
+      then move on to the building's next unit;
+    - a resident "<prefix> Resident <worker>" in that unit;
+    - per-worker copies of the items tests check out, e.g.
+      "Curtains (E2E gw1)", stocked to at least MIN_STOCK.
+
+    Names are stable, so reruns against the same database reuse the
+    rows instead of piling up new ones.
+    """
+
+    def __init__(self, worker, prefix="E2E", min_stock=MIN_STOCK):
+        self.worker = worker
+        self.prefix = prefix
+        self.min_stock = min_stock
+        self.index = worker_index(worker)
+        self._household = None
+        self._items = {}
+
+    @property
+    def name(self):
+        return f"{self.prefix} {self.worker}"
+
+    def forget(self):
+        """Provision again on next use (e.g. after a database restore)."""
+        self._household = None
+        self._items = {}
+
+    def item_name(self, base_name):
+        return f"{base_name} ({self.name})"
+
+    # ---------------------------------------------------
+    # Household
+    # ---------------------------------------------------
+
+    def household(self, api):
+        if self._household is None:
+            building, unit = self._allocate_unit(api)
+            resident = self._resident(api, unit, f"{self.prefix} Resident {self.worker}")
+            self._household = Household(building, unit, resident)
+
+        return self._household
+
+    def _allocate_unit(self, api):
+        buildings = api.get("building", **{"$orderby": "id", "$first": 100})
+
+        if not buildings:
+            raise ApiError("No buildings to allocate test units from")
+
+        building = buildings[-1 - self.index % len(buildings)]
+        units = api.get("units", **{
+            "$filter": f"building_id eq {building['id']}",
+            "$orderby": "id",
+            "$first": 1000,
+        })
+
+        slot = self.index // len(buildings)
+
+        if slot >= len(units):
+            raise ApiError(f"Building {building['code']} has no unit left for worker {self.worker}")
+
+        return building, units[slot]
+
+    @staticmethod
+    def _resident(api, unit, name):
+        rows = api.get("residents", **{
+            "$filter": f"unit_id eq {unit['id']} and name eq {_literal(name)}",
+        })
+
+        if rows:
+            return rows[0]
+
+        return api.post("residents", {"name": name, "unit_id": unit["id"]})[0]
+
+    # ---------------------------------------------------
+    # Items
+    # ---------------------------------------------------
+
+    def item(self, api, base_name):
+        """Name of this worker's copy of ``base_name``."""
+        if base_name not in self._items:
+            self._items[base_name] = self._provision_item(api, base_name)
+
+        return self._items[base_name]["name"]
+
+    def _provision_item(self, api, base_name):
+        name = self.item_name(base_name)
+        rows = api.get("items", **{"$filter": f"name eq {_literal(name)}"})
+
+        if rows:
+            item = rows[0]
+
+            if item["quantity"] < self.min_stock:
+                item = api.patch(f"items/id/{item['id']}", {"quantity": self.min_stock})[0]
+
+            return item
+
+        originals = api.get("items", **{"$filter": f"name eq {_literal(base_name)}"})
+
+        if not originals:
+            raise ApiError(f"No item named {base_name!r} to copy")
+
+        original = originals[0]
+
+        return api.post("items", {
+            "name": name,
+            "type": original["type"],
+            "category_id": original["category_id"],
+            "description": original["description"],
+            "quantity": self.min_stock,
+            "threshold": original["threshold"],
+            "items_per_basket": original["items_per_basket"],
+        })[0]
+
+
+class WorkerData:
+    """A DataNamespace bound to the current test's api_client."""
+
+    def __init__(self, namespace, api):
+        self.namespace = namespace
+        self.api = api
+
+    @property
+    def household(self):
+        return self.namespace.household(self.api)
+
+    def item(self, base_name):
+        return self.namespace.item(self.api, base_name)
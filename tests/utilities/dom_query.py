@@ -0,0 +1,76 @@
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
+
+from tests.utilities.dom_wait import LOCATOR_JS, SUPPORTED_BY
+
+
+_QUERY_SCRIPT = """
+const spec = arguments[0];
+const names = arguments[1];
+""" + LOCATOR_JS + """
+return resolve().map(el => {
+    const attributes = {};
+    names.forEach(name => { attributes[name] = el.getAttribute(name); });
+    return {
+        element: el,
+        visible: isVisible(el),
+        text: (el.innerText || '').trim(),
+        attributes: attributes,
+    };
+});
+"""
+
+
+class DomQuery:
+    """
+    Reads every match of a locator in one script call instead of one
+    WebDriver round trip per element and per property.
+
+    Each match is a dict:
+        {"element": WebElement, "visible": bool, "text": str,
+         "attributes": {name: value}}
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    @staticmethod
+    def supports(locator):
+        return locator[0] in SUPPORTED_BY
+
+    def all(self, locator, attributes=()):
+        names = list(attributes)
+
+        if not self.supports(locator):
+            return self._read_elements(locator, names)
+
+        return self.driver.execute_script(
+            _QUERY_SCRIPT,
+            {"by": locator[0], "value": locator[1]},
+            names,
+        )
+
+    def _read_elements(self, locator, names):
+        """Per-element fallback for strategies the page cannot resolve."""
+        matches = []
+
+        for el in self.driver.find_elements(*locator):
+            try:
+                matches.append({
+                    "element": el,
+                    "visible": el.is_displayed(),
+                    "text": el.text.strip(),
+                    "attributes": {
+                        name: el.get_attribute(name) for name in names
+                    },
+                })
+
+            except (
+                StaleElementReferenceException,
+                NoSuchElementException,
+            ):
+                continue
+
+        return matches
@@ -0,0 +1,315 @@
+import time
+
+from selenium.common.exceptions import (
+    InvalidSelectorException,
+    JavascriptException,
+    TimeoutException,
+)
+from selenium.webdriver.common.by import By
+
+
+# Locator strategies the in-page evaluator can resolve itself
+SUPPORTED_BY = (
+    By.XPATH,
+    By.CSS_SELECTOR,
+    By.ID,
+    By.NAME,
+    By.CLASS_NAME,
+    By.TAG_NAME,
+)
+
+# One async script call never outlives Selenium's default 30s script
+# timeout; longer waits are split into several calls.
+CHUNK_SECONDS = 20
+
+# Safety net for changes that do not mutate the DOM (CSS transitions,
+# layout-only visibility changes). Runs in the page, not over the wire.
+FALLBACK_POLL_MS = 100
+
+# An obscured target is clicked anyway after this long, like the old
+# JS-click fallback on ElementClickInterceptedException.
+OBSCURED_GRACE_MS = 1000
+
+# Shared by the in-page scripts: resolve(), isVisible(). Expects a
+# ``spec`` object with the Selenium locator as {by, value}.
+LOCATOR_JS = """
+const resolve = () => {
+    switch (spec.by) {
+        case 'xpath': {
+            const snap = document.evaluate(
+                spec.value, document, null,
+                XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null
+            );
+            const out = [];
+            for (let i = 0; i < snap.snapshotLength; i++) out.push(snap.snapshotItem(i));
+            return out;
+        }
+        case 'css selector': return Array.from(document.querySelectorAll(spec.value));
+        case 'id': {
+            const el = document.getElementById(spec.value);
+            return el ? [el] : [];
+        }
+        case 'name': return Array.from(document.getElementsByName(spec.value));
+        case 'class name': return Array.from(document.getElementsByClassName(spec.value));
+        case 'tag name': return Array.from(document.getElementsByTagName(spec.value));
+    }
+    throw new Error('Unsupported locator strategy: ' + spec.by);
+};
+
+const isVisible = (el) => {
+    if (el.checkVisibility && !el.checkVisibility({checkOpacity: true, checkVisibilityCSS: true})) {
+        return false;
+    }
+    const rect = el.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+};
+"""
+
+_OBSERVER_SCRIPT = """
+const spec = arguments[0];
+const timeoutMs = arguments[1];
+const pollMs = arguments[2];
+const done = arguments[arguments.length - 1];
+""" + LOCATOR_JS + """
+const compare = (actual) => {
+    switch (spec.op) {
+        case '>': return actual > spec.n;
+        case '>=': return actual >= spec.n;
+        case '<': return actual < spec.n;
+        case '<=': return actual <= spec.n;
+        default: return actual === spec.n;
+    }
+};
+
+const isEnabled = (el) => !el.disabled && el.getAttribute('aria-disabled') !== 'true';
+
+// Focus, caret placement and file choosers only follow trusted input
+const needsTrustedEvent = (el) => spec.trusted || el.matches(
+    'input, textarea, select, [contenteditable=""], [contenteditable="true"]'
+);
+
+const centerOf = (el) => {
+    const rect = el.getBoundingClientRect();
+    return {x: rect.left + rect.width / 2, y: rect.top + rect.height / 2};
+};
+
+const isHitTarget = (el) => {
+    const {x, y} = centerOf(el);
+    const hit = document.elementFromPoint(x, y);
+    return hit !== null && (hit === el || el.contains(hit));
+};
+
+// Same event sequence as a mouse click, so mousedown-driven
+// widgets (MUI Select, Autocomplete popups) react as well
+const dispatchClick = (el) => {
+    const {x, y} = centerOf(el);
+    const init = {
+        bubbles: true, cancelable: true, composed: true, view: window,
+        clientX: x, clientY: y, button: 0,
+    };
+    const pointer = {...init, pointerId: 1, pointerType: 'mouse', isPrimary: true};
+    el.dispatchEvent(new PointerEvent('pointerdown', pointer));
+    el.dispatchEvent(new MouseEvent('mousedown', {...init, buttons: 1}));
+    if (el.focus) el.focus({preventScroll: true});
+    el.dispatchEvent(new PointerEvent('pointerup', pointer));
+    el.dispatchEvent(new MouseEvent('mouseup', init));
+    el.click();
+};
+
+let obscuredSince = null;
+
+const largestNumber = (text) => {
+    const numbers = (text.match(/\\d[\\d,]*/g) || []).map(n => parseInt(n.replace(/,/g, ''), 10));
+    return numbers.length ? Math.max(...numbers) : null;
+};
+
+// Returns {ok: true, value} once satisfied, otherwise null
+const evaluate = () => {
+    const els = resolve();
+    switch (spec.condition) {
+        case 'presence':
+            return els.length ? {ok: true, value: els[0]} : null;
+        case 'visible': {
+            const el = els.find(isVisible);
+            return el ? {ok: true, value: el} : null;
+        }
+        case 'hidden':
+            return els.some(isVisible) ? null : {ok: true, value: true};
+        case 'text': {
+            const el = els.find(e => (e.innerText || e.textContent || '').includes(spec.text));
+            return el ? {ok: true, value: el} : null;
+        }
+        case 'attribute': {
+            const el = els.find(e => e.getAttribute(spec.name) === spec.expected);
+            return el ? {ok: true, value: el} : null;
+        }
+        case 'attribute_number': {
+            const el = els.find(e => e.hasAttribute(spec.name));
+            const number = el ? Number(el.getAttribute(spec.name)) : NaN;
+            return !Number.isNaN(number) && compare(number) ? {ok: true, value: number} : null;
+        }
+        case 'count':
+            return compare(els.length) ? {ok: true, value: els.length} : null;
+        case 'number': {
+            const el = els.find(isVisible);
+            const number = el ? largestNumber(el.innerText || '') : null;
+            return number !== null && compare(number) ? {ok: true, value: number} : null;
+        }
+        case 'click': {
+            const el = els.find(e => isVisible(e) && isEnabled(e));
+            if (!el) return null;
+            el.scrollIntoView({block: 'center', behavior: 'instant'});
+            if (!needsTrustedEvent(el) && !isHitTarget(el)) {
+                obscuredSince = obscuredSince === null ? Date.now() : obscuredSince;
+                if (Date.now() - obscuredSince < spec.graceMs) return null;
+            }
+            if (spec.mark) {
+                performance.clearMarks(spec.mark);
+                performance.mark(spec.mark);
+            }
+            if (needsTrustedEvent(el)) return {ok: true, value: el};
+            dispatchClick(el);
+            return {ok: true, value: true};
+        }
+    }
+    throw new Error('Unsupported wait condition: ' + spec.condition);
+};
+
+let finished = false;
+let observer = null;
+let poller = null;
+let timer = null;
+
+const finish = (result) => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearInterval(poller);
+    clearTimeout(timer);
+    done(result);
+};
+
+const check = () => {
+    try {
+        const result = evaluate();
+        if (result) finish(result);
+    } catch (err) {
+        finish({ok: false, error: String(err && err.message || err)});
+    }
+};
+
+check();
+if (!finished) {
+    observer = new MutationObserver(check);
+    observer.observe(document, {
+        subtree: true, childList: true, attributes: true, characterData: true
+    });
+    poller = setInterval(check, pollMs);
+    timer = setTimeout(() => finish({ok: false}), timeoutMs);
+}
+"""
+
+
+class DomWait:
+    """
+    Waits that are evaluated inside the page by a MutationObserver,
+    so they resolve as soon as the DOM changes instead of polling
+    over the WebDriver wire.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    @staticmethod
+    def supports(locator):
+        return locator[0] in SUPPORTED_BY
+
+    def until(self, locator, condition, timeout, **params):
+        spec = {
+            "by": locator[0],
+            "value": locator[1],
+            "condition": condition,
+            **params,
+        }
+
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+
+            if remaining <= 0:
+                raise TimeoutException(
+                    f"Timed out after {timeout}s waiting for "
+                    f"{condition} of {locator} {params or ''}".rstrip()
+                )
+
+            try:
+                result = self.driver.execute_async_script(
+                    _OBSERVER_SCRIPT,
+                    spec,
+                    int(min(remaining, CHUNK_SECONDS) * 1000),
+                    FALLBACK_POLL_MS,
+                )
+
+            except TimeoutException:
+                continue
+
+            except JavascriptException as err:
+                # Document unloaded mid-wait (navigation / reload):
+                # install the observer again on the new page.
+                if "unloaded" in (err.msg or ""):
+                    continue
+                raise
+
+            if result.get("ok"):
+                return result.get("value")
+
+            if result.get("error"):
+                raise InvalidSelectorException(
+                    f"{locator}: {result['error']}"
+                )
+
+    # ---------------------------------------------------
+    # Conditions
+    # ---------------------------------------------------
+
+    def presence(self, locator, timeout):
+        return self.until(locator, "presence", timeout)
+
+    def visible(self, locator, timeout):
+        return self.until(locator, "visible", timeout)
+
+    def hidden(self, locator, timeout):
+        return self.until(locator, "hidden", timeout)
+
+    def text_contains(self, locator, text, timeout):
+        return self.until(locator, "text", timeout, text=text)
+
+    def attribute_equals(self, locator, name, expected, timeout):
+        return self.until(
+            locator, "attribute", timeout, name=name, expected=expected
+        )
+
+    def attribute_number(self, locator, name, op, n, timeout):
+        return self.until(
+            locator, "attribute_number", timeout, name=name, op=op, n=n
+        )
+
+    def count(self, locator, op, n, timeout):
+        return self.until(locator, "count", timeout, op=op, n=n)
+
+    def number(self, locator, op, n, timeout):
+        """Largest integer in the first visible match's text, compared to n."""
+        return self.until(locator, "number", timeout, op=op, n=n)
+
+    def click(self, locator, timeout, trusted=False, mark=None):
+        """
+        Wait for a visible, enabled match, scroll it into view, hit-test
+        it and click it, all inside the page. Returns True once clicked,
+        or the element when the click needs a trusted (native) event.
+        ``mark`` names a performance mark left right before the click.
+        """
+        return self.until(
+            locator, "click", timeout,
+            trusted=trusted, graceMs=OBSCURED_GRACE_MS, mark=mark
+        )
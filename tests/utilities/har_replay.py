@@ -0,0 +1,633 @@
+import base64
+import json
+import queue
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import requests
+import websocket
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from tests.utilities.network_capture import endpoint_of, is_api_call
+
+
+HAR_MODES = ("record", "replay")
+
+HAR_SUFFIX = ".har"
+
+# Fetch.enable patterns: every data-api prefix ends in /api/
+FETCH_PATTERN = "*/api/*"
+
+# Procedures whose responses depend on earlier writes: replayed strictly
+# in recorded order even when the same body is sent again
+MUTATING_ENDPOINTS = (
+    "/checkout-general-items",
+    "/checkout-welcome-basket",
+    "/process-inventory-change",
+    "/process-inventory-reset-quantity",
+)
+
+# Response headers that describe the wire encoding, not the stored body
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+_GUID = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+_DATETIME = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(:\d{2}(\.\d+)?)?(Z|[+-]\d{2}:?\d{2})?")
+
+CDP_TIMEOUT_SECONDS = 10
+
+
+class HarError(Exception):
+    pass
+
+
+def har_path(directory, nodeid):
+    """One file per test: tests/test/test_history.py::test_x -> tests_test_test_history.py__test_x.har"""
+    name = re.sub(r"[^\w.-]+", "_", nodeid).strip("_")
+    return Path(directory) / f"{name}{HAR_SUFFIX}"
+
+
+# ---------------------------------------------------
+# Request Matching
+# ---------------------------------------------------
+
+class _Normalizer:
+    """
+    Replaces what changes from run to run: new_transaction_id and other
+    GUIDs become <guid:n> in order of first appearance (the same GUID
+    keeps its number), timestamps such as History's "today" range
+    become <datetime>.
+    """
+
+    def __init__(self):
+        self.guids = {}
+
+    def text(self, value):
+        value = _GUID.sub(self._guid, value)
+        return _DATETIME.sub("<datetime>", value)
+
+    def _guid(self, match):
+        guid = match.group(0).lower()
+        return self.guids.setdefault(guid, f"<guid:{len(self.guids)}>")
+
+    def value(self, value):
+        if isinstance(value, str):
+            return self.text(value)
+
+        if isinstance(value, list):
+            return [self.value(item) for item in value]
+
+        if isinstance(value, dict):
+            # Keys in sorted order, so the GUID numbering does not
+            # depend on how the caller built the object
+            return {key: self.value(value[key]) for key in sorted(value)}
+
+        return value
+
+
+def request_key(method, url, body):
+    """(method, endpoint, normalized JSON body) a recorded response is served for."""
+    return _normalize_request(method, url, body)[0]
+
+
+def _normalize_request(method, url, body):
+    """request_key() plus the GUIDs it replaced: {guid: "<guid:n>"}"""
+    normalizer = _Normalizer()
+    endpoint = normalizer.text(endpoint_of(url))
+
+    if not body:
+        return (method, endpoint, None), normalizer.guids
+
+    try:
+        normalized = json.dumps(normalizer.value(json.loads(body)), sort_keys=True)
+    except ValueError:
+        normalized = normalizer.text(body)
+
+    return (method, endpoint, normalized), normalizer.guids
+
+
+def rewrite_guids(data, guids):
+    """Response bytes with every GUID in ``guids`` replaced by its value."""
+    if not guids:
+        return data
+
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data
+
+    text = _GUID.sub(lambda match: guids.get(match.group(0).lower(), match.group(0)), text)
+    return text.encode("utf-8")
+
+
+def is_mutating(endpoint):
+    return endpoint.split("?", 1)[0] in MUTATING_ENDPOINTS
+
+
+# ---------------------------------------------------
+# Cassette
+# ---------------------------------------------------
+
+class HarCassette:
+    """
+    Data-api exchanges of one test, stored as a HAR 1.2 log.
+
+    Replay serves each key's responses in the order they were recorded
+    (the last one repeats once they run out), so a flow that reads
+    /items, checks out and reads /items again gets the quantities it
+    saw while recording. Checkout and inventory calls are matched on
+    their normalized body, which also has to come in recorded order:
+    a mutating call that was not recorded at that point is a miss.
+
+    GUIDs the test generates (new_transaction_id) differ from the
+    recorded ones. Each matched request maps the recorded GUIDs to the
+    live ones in the same <guid:n> slots, and replayed responses are
+    rewritten through that map, so a checkout seeded with a fresh id
+    shows up under that id in the history read after it.
+
+    Browser (CDP) and api_client (requests) traffic share the cassette;
+    both may use it at the same time.
+    """
+
+    def __init__(self, path, mode):
+        if mode not in HAR_MODES:
+            raise HarError(f"Unknown HAR mode {mode!r}")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.entries = []
+        self.misses = []
+        self._queues = {}
+        self._mutations = []
+        # Recorded GUID -> the live one sent in its place
+        self._live_guids = {}
+        self._lock = threading.Lock()
+
+        if mode == "replay":
+            self._load()
+
+    @property
+    def exists(self):
+        return self.path.exists()
+
+    def _load(self):
+        if not self.exists:
+            return
+
+        self.entries = json.loads(self.path.read_text())["log"]["entries"]
+
+        for entry in self.entries:
+            request = entry["request"]
+            key = request_key(
+                request["method"], request["url"], (request.get("postData") or {}).get("text")
+            )
+            self._queues.setdefault(key, []).append(entry)
+
+            if is_mutating(key[1]):
+                self._mutations.append(key)
+
+    # ---------------------------------------------------
+    # Record
+    # ---------------------------------------------------
+
+    def record(self, method, url, body, status, headers, content, started, base64_encoded=False):
+        """headers: [(name, value)]; content: response text (or base64)."""
+        entry = {
+            "startedDateTime": datetime.fromtimestamp(started, timezone.utc).isoformat(),
+            "time": round((time.time() - started) * 1000, 1),
+            "request": {
+                "method": method,
+                "url": url,
+                "httpVersion": "HTTP/1.1",
+                "headers": [],
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": len(body or ""),
+            },
+            "response": {
+                "status": status,
+                "statusText": "",
+                "httpVersion": "HTTP/1.1",
+                "headers": [
+                    {"name": name, "value": value}
+                    for name, value in headers
+                    if name.lower() not in _HOP_HEADERS
+                ],
+                "cookies": [],
+                "content": {
+                    "size": len(content or ""),
+                    "mimeType": _header(headers, "content-type") or "application/json",
+                    "text": content or "",
+                },
+                "redirectURL": "",
+                "headersSize": -1,
+                "bodySize": -1,
+            },
+            "cache": {},
+            "timings": {"send": 0, "wait": -1, "receive": 0},
+        }
+
+        if body:
+            entry["request"]["postData"] = {"mimeType": "application/json", "text": body}
+
+        if base64_encoded:
+            entry["response"]["content"]["encoding"] = "base64"
+
+        with self._lock:
+            self.entries.append(entry)
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self.path.write_text(json.dumps({
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "plymouth-housing e2e", "version": "1"},
+                # In the order the responses arrived, which replay follows
+                "entries": self.entries,
+            }
+        }, indent=2))
+
+    # ---------------------------------------------------
+    # Replay
+    # ---------------------------------------------------
+
+    def respond(self, method, url, body):
+        """
+        Recorded (status, headers, body bytes) for a request, or None
+        (kept in ``misses``).
+        """
+        key, live_guids = _normalize_request(method, url, body)
+
+        with self._lock:
+            entry = self._next(key)
+
+            if entry is None:
+                self.misses.append({"method": method, "endpoint": key[1], "body": key[2]})
+                return None
+
+            self._map_guids(entry["request"], live_guids)
+            guids = dict(self._live_guids)
+
+        response = entry["response"]
+        content = response["content"]
+        text = content.get("text") or ""
+
+        if content.get("encoding") == "base64":
+            data = base64.b64decode(text)
+        else:
+            data = text.encode("utf-8")
+
+        headers = [(header["name"], header["value"]) for header in response["headers"]]
+        return response["status"], headers, rewrite_guids(data, guids)
+
+    def _map_guids(self, recorded_request, live_guids):
+        """Pair the recorded request's GUIDs with the live ones in the same slots."""
+        if not live_guids:
+            return
+
+        _, recorded_guids = _normalize_request(
+            recorded_request["method"],
+            recorded_request["url"],
+            (recorded_request.get("postData") or {}).get("text"),
+        )
+        live_by_slot = {slot: guid for guid, slot in live_guids.items()}
+
+        for guid, slot in recorded_guids.items():
+            live = live_by_slot.get(slot)
+
+            if live is not None and live != guid:
+                self._live_guids.setdefault(guid, live)
+
+    def _next(self, key):
+        if is_mutating(key[1]):
+            if not self._mutations or self._mutations[0] != key:
+                return None
+
+            self._mutations.pop(0)
+
+        entries = self._queues.get(key)
+
+        if not entries:
+            return None
+
+        return entries.pop(0) if len(entries) > 1 else entries[0]
+
+
+def _header(headers, name):
+    return next((value for key, value in headers if key.lower() == name), None)
+
+
+# ---------------------------------------------------
+# Browser Traffic (CDP Fetch)
+# ---------------------------------------------------
+
+class FetchInterceptor:
+    """
+    Pauses the page's data-api requests with the CDP Fetch domain over
+    its own DevTools websocket (Selenium's execute_cdp_cmd cannot
+    receive events):
+
+    - record: paused at the response stage, the body is read with
+      Fetch.getResponseBody and stored before the request continues;
+    - replay: paused before it is sent and answered with
+      Fetch.fulfillRequest, so the request never reaches the network.
+
+    Attach after the browser is on its test tab (pooled browsers get
+    a new one per test); the Fetch domain goes away with the socket.
+    """
+
+    def __init__(self, driver, cassette):
+        self.cassette = cassette
+        self._socket = websocket.create_connection(
+            _page_websocket_url(driver), timeout=CDP_TIMEOUT_SECONDS, suppress_origin=True
+        )
+        self._ids = iter(range(1, 1 << 31))
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._events = queue.Queue()
+
+        self._reader = threading.Thread(target=self._read, name="har-cdp-reader", daemon=True)
+        self._handler = threading.Thread(target=self._handle, name="har-cdp-handler", daemon=True)
+        self._reader.start()
+        self._handler.start()
+
+        stage = "Response" if cassette.mode == "record" else "Request"
+        self.send("Fetch.enable", {"patterns": [{"urlPattern": FETCH_PATTERN, "requestStage": stage}]})
+
+    def close(self):
+        try:
+            self.send("Fetch.disable")
+        except HarError:
+            pass
+
+        self._socket.close()
+        self._events.put(None)
+        self._handler.join(CDP_TIMEOUT_SECONDS)
+
+    # ---------------------------------------------------
+    # DevTools Protocol
+    # ---------------------------------------------------
+
+    def send(self, method, params=None):
+        message_id = next(self._ids)
+        waiter = {"done": threading.Event(), "message": None}
+
+        with self._pending_lock:
+            self._pending[message_id] = waiter
+
+        try:
+            self._socket.send(json.dumps({"id": message_id, "method": method, "params": params or {}}))
+        except (websocket.WebSocketException, OSError) as err:
+            raise HarError(f"{method}: {err}")
+
+        if not waiter["done"].wait(CDP_TIMEOUT_SECONDS):
+            raise HarError(f"{method}: no reply from Chrome")
+
+        message = waiter["message"]
+
+        if "error" in message:
+            raise HarError(f"{method}: {message['error'].get('message')}")
+
+        return message.get("result", {})
+
+    def _read(self):
+        while True:
+            try:
+                message = json.loads(self._socket.recv())
+            except (websocket.WebSocketException, OSError, ValueError):
+                break
+
+            if "id" in message:
+                with self._pending_lock:
+                    waiter = self._pending.pop(message["id"], None)
+
+                if waiter is not None:
+                    waiter["message"] = message
+                    waiter["done"].set()
+
+            elif message.get("method") == "Fetch.requestPaused":
+                self._events.put(message["params"])
+
+        # Unblock callers waiting on a closed socket
+        with self._pending_lock:
+            for waiter in self._pending.values():
+                waiter["message"] = {"error": {"message": "DevTools socket closed"}}
+                waiter["done"].set()
+
+            self._pending.clear()
+
+    def _handle(self):
+        # Not on the reader thread: handlers wait for replies it delivers
+        while True:
+            params = self._events.get()
+
+            if params is None:
+                return
+
+            try:
+                self._paused(params)
+            except HarError as err:
+                print(f"[WARN] HAR {self.cassette.mode} failed: {err}")
+
+    def _paused(self, params):
+        request = params["request"]
+        request_id = params["requestId"]
+
+        if request["method"] == "OPTIONS" or not is_api_call(request["url"]):
+            self.send("Fetch.continueRequest", {"requestId": request_id})
+            return
+
+        if self.cassette.mode == "record":
+            self._record(params)
+        else:
+            self._replay(params)
+
+    def _record(self, params):
+        request = params["request"]
+        request_id = params["requestId"]
+
+        # Network errors have no response to store
+        if "responseErrorReason" in params or "responseStatusCode" not in params:
+            self.send("Fetch.continueRequest", {"requestId": request_id})
+            return
+
+        started = time.time()
+        body = self.send("Fetch.getResponseBody", {"requestId": request_id})
+
+        self.cassette.record(
+            request["method"],
+            request["url"],
+            _post_data(request),
+            params["responseStatusCode"],
+            [(header["name"], header["value"]) for header in params.get("responseHeaders", [])],
+            body.get("body", ""),
+            started,
+            base64_encoded=body.get("base64Encoded", False),
+        )
+
+        self.send("Fetch.continueRequest", {"requestId": request_id})
+
+    def _replay(self, params):
+        request = params["request"]
+        response = self.cassette.respond(request["method"], request["url"], _post_data(request))
+
+        if response is None:
+            status, headers, data = _miss_response(request["method"], request["url"])
+        else:
+            status, headers, data = response
+
+        self.send("Fetch.fulfillRequest", {
+            "requestId": params["requestId"],
+            "responseCode": status,
+            "responseHeaders": [{"name": name, "value": value} for name, value in headers],
+            "body": base64.b64encode(data).decode("ascii"),
+        })
+
+
+def _page_websocket_url(driver):
+    """DevTools websocket of the tab the driver is on (its handle is the target id)."""
+    address = driver.capabilities.get("goog:chromeOptions", {}).get("debuggerAddress")
+
+    if not address:
+        raise HarError("Chrome did not report a debuggerAddress")
+
+    targets = requests.get(f"http://{address}/json/list", timeout=CDP_TIMEOUT_SECONDS).json()
+    handle = driver.current_window_handle
+
+    for target in targets:
+        if target.get("id") == handle and target.get("webSocketDebuggerUrl"):
+            return target["webSocketDebuggerUrl"]
+
+    raise HarError(f"No DevTools target for window {handle}")
+
+
+def _post_data(request):
+    if "postData" in request:
+        return request["postData"]
+
+    # Newer Chrome versions send the body only as base64 entries
+    entries = request.get("postDataEntries") or []
+
+    if not entries:
+        return None
+
+    return b"".join(base64.b64decode(entry.get("bytes", "")) for entry in entries).decode("utf-8")
+
+
+def _miss_response(method, url):
+    # DAB's error body, so the app shows its usual error handling
+    body = {"error": {
+        "code": "HarEntryNotFound",
+        "message": f"No recorded response for {method} {endpoint_of(url)}",
+        "status": 404,
+    }}
+    return 404, [("Content-Type", "application/json")], json.dumps(body).encode("utf-8")
+
+
+# ---------------------------------------------------
+# api_client Traffic (requests)
+# ---------------------------------------------------
+
+class HarAdapter(HTTPAdapter):
+    """
+    Transport adapter for ApiSession: records the data-api calls the
+    test makes through api_client next to the browser's, and replays
+    them without a network connection.
+    """
+
+    def __init__(self, cassette, **kwargs):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+
+    def send(self, request, **kwargs):
+        if not is_api_call(request.url):
+            return super().send(request, **kwargs)
+
+        body = request.body.decode("utf-8") if isinstance(request.body, bytes) else request.body
+
+        if self.cassette.mode == "record":
+            started = time.time()
+            response = super().send(request, **kwargs)
+
+            self.cassette.record(
+                request.method,
+                request.url,
+                body,
+                response.status_code,
+                list(response.headers.items()),
+                response.text,
+                started,
+            )
+            return response
+
+        recorded = self.cassette.respond(request.method, request.url, body)
+
+        if recorded is None:
+            recorded = _miss_response(request.method, request.url)
+
+        status, headers, data = recorded
+
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response._content = data
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.reason = "Replayed"
+
+        return response
+
+
+# ---------------------------------------------------
+# Per-test Sessions
+# ---------------------------------------------------
+
+class HarStore:
+    """
+    --har-record / --har-replay for one worker: a cassette per test in
+    ``directory``, attached to the test's browser by the driver fixture.
+    """
+
+    def __init__(self, directory, mode):
+        self.directory = Path(directory)
+        self.mode = mode
+        self.cassette = None
+        self._interceptor = None
+
+    def has_recording(self, nodeid):
+        return self.mode == "record" or har_path(self.directory, nodeid).exists()
+
+    def start_test(self, driver, nodeid):
+        self.cassette = HarCassette(har_path(self.directory, nodeid), self.mode)
+        self._interceptor = FetchInterceptor(driver, self.cassette)
+
+    def reattach(self, driver):
+        """Follow the test to the tab the driver switched to."""
+        if self.cassette is None:
+            return
+
+        self._interceptor.close()
+        self._interceptor = FetchInterceptor(driver, self.cassette)
+
+    def finish_test(self):
+        """Closes the interception; returns what the run of the test should report."""
+        cassette, self.cassette = self.cassette, None
+
+        if cassette is None:
+            return None
+
+        if self._interceptor is not None:
+            self._interceptor.close()
+            self._interceptor = None
+
+        if self.mode == "record":
+            cassette.save()
+            return {"recorded": len(cassette.entries), "path": str(cassette.path)}
+
+        return {"replayed": str(cassette.path), "misses": cassette.misses}
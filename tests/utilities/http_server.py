@@ -0,0 +1,203 @@
+import asyncio
+import json
+import threading
+from http import HTTPStatus
+
+
+MAX_BODY_BYTES = 1024 * 1024
+
+
+class Request:
+    def __init__(self, method, target, version, headers, raw_headers, body):
+        self.method = method
+        self.target = target
+        self.version = version
+        # Lower-cased names for lookups; raw_headers keeps names and order
+        self.headers = headers
+        self.raw_headers = raw_headers
+        self.body = body
+
+    @property
+    def keep_alive(self):
+        connection = self.headers.get("connection", "").lower()
+
+        if "close" in connection:
+            return False
+
+        return self.version == "HTTP/1.1" or "keep-alive" in connection
+
+
+class Response:
+    def __init__(self, status, body=None, headers=None, content_type="application/json; charset=utf-8"):
+        self.status = status
+        self.body = body
+        self.headers = headers or {}
+        self.content_type = content_type
+
+    def payload(self):
+        if self.body is None:
+            return b""
+
+        if isinstance(self.body, bytes):
+            return self.body
+
+        if isinstance(self.body, str):
+            return self.body.encode()
+
+        return json.dumps(self.body).encode()
+
+    def encode(self, keep_alive):
+        payload = self.payload()
+        reason = HTTPStatus(self.status).phrase
+
+        headers = {
+            "Content-Type": self.content_type,
+            "Content-Length": str(len(payload)),
+            "Connection": "keep-alive" if keep_alive else "close",
+            **self.headers,
+        }
+
+        head = f"HTTP/1.1 {self.status} {reason}\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in headers.items()
+        )
+
+        return head.encode("latin-1") + b"\r\n" + payload
+
+
+async def read_request(reader):
+    """Next request on a keep-alive connection, or None at EOF."""
+    line = await reader.readline()
+
+    if not line.strip():
+        return None
+
+    method, target, version = line.decode("latin-1").split()
+    headers = {}
+    raw_headers = []
+
+    while True:
+        line = await reader.readline()
+
+        if line in (b"\r\n", b"\n", b""):
+            break
+
+        name, _, value = line.decode("latin-1").partition(":")
+        raw_headers.append((name.strip(), value.strip()))
+        headers[name.strip().lower()] = value.strip()
+
+    length = int(headers.get("content-length", "0"))
+
+    if length > MAX_BODY_BYTES:
+        raise ValueError("request body too large")
+
+    body = await reader.readexactly(length) if length else b""
+
+    return Request(method.upper(), target, version, headers, raw_headers, body)
+
+
+class BackgroundServer:
+    """
+    asyncio HTTP/1.1 server that can run in the foreground (serve())
+    or on a daemon thread (start() / stop()) next to pytest.
+
+    Subclasses implement ``respond(request, reader, writer)``, which
+    returns a Response, or None once it has written to / taken over
+    the connection itself.
+    """
+
+    thread_name = "http-server"
+
+    def __init__(self, host, port):
+        self.host = host
+        self.port = port
+        self._loop = None
+        self._server = None
+        self._thread = None
+        self._connections = set()
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    async def respond(self, request, reader, writer):
+        raise NotImplementedError
+
+    async def serve(self):
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        # Port 0 picks a free port
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self._server
+
+    def start(self):
+        """Serve on a daemon thread; returns once the port is bound."""
+        ready = threading.Event()
+        failure = []
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+
+            try:
+                self._loop.run_until_complete(self.serve())
+            except OSError as error:
+                failure.append(error)
+                ready.set()
+                return
+
+            ready.set()
+            self._loop.run_forever()
+
+        self._thread = threading.Thread(target=run, name=self.thread_name, daemon=True)
+        self._thread.start()
+        ready.wait()
+
+        if failure:
+            raise failure[0]
+
+        return self
+
+    def stop(self):
+        if self._loop is None:
+            return
+
+        async def shutdown():
+            self._server.close()
+
+            # Idle keep-alive connections would otherwise hold wait_closed()
+            for writer in list(self._connections):
+                writer.close()
+
+            await self._server.wait_closed()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=5)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+        self._loop = None
+
+    async def _handle_connection(self, reader, writer):
+        self._connections.add(writer)
+
+        try:
+            while True:
+                request = await read_request(reader)
+
+                if request is None:
+                    break
+
+                response = await self.respond(request, reader, writer)
+
+                if response is None:
+                    break
+
+                writer.write(response.encode(request.keep_alive))
+                await writer.drain()
+
+                if not request.keep_alive:
+                    break
+
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+
+        finally:
+            self._connections.discard(writer)
+            writer.close()
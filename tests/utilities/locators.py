@@ -8,11 +8,26 @@ class CommonLocators:
     WELCOME_MENU_BUTTON = (By.XPATH, "//h6[normalize-space()='Welcome basket']/ancestor::a")
     HISTORY_MENU_BUTTON = (By.XPATH, "//a[@href='/history']")
 
+class ReadinessSignals:
+    # Published on <html> by src/utils/e2eReadiness.ts
+    ROOT = (By.CSS_SELECTOR, "html[data-ph-readiness]")
+    CART_VERSION = "data-ph-cart-version"
+    SEARCH_TERM = "data-ph-search-term"
+    HISTORY_LOADED_SEQ = "data-ph-history-seq"
+
 class HistoryPageLocators:
     HISTORY_HEADER = (By.XPATH,"//h6[normalize-space()='History']")
     RECORD_COUNT_TEXT = (By.XPATH,"//span[contains(.,'record')]")
     HISTORY_CARDS = (By.XPATH,"//div[.//p[contains(text(),'Created')] and .//text()[contains(.,'/')]]")
     NO_TRANSACTIONS_MESSAGE = (By.XPATH, "//*[contains(text(),'No transactions found')]")
+    CHECKOUT_CARDS = (By.CSS_SELECTOR, "[id^='checkout-card-']")
+    # Shown below the cards while later pages remain (disabled while one loads)
+    LOAD_MORE_BUTTON = (By.XPATH, "//button[normalize-space()='Load more' or normalize-space()='Loading more...']")
+
+    @staticmethod
+    def get_checkout_card_locator(transaction_id):
+        # GeneralCheckoutCard's id="checkout-card-<transaction_id>"
+        return (By.ID, f"checkout-card-{str(transaction_id).lower()}")
 
 class HomePageLocators:
     # ---- Sections ----
@@ -136,6 +151,15 @@ class CheckoutPageLocators:
             f"/button[1]"
         )
 
+    @staticmethod
+    def get_quantity_locator(item_name):
+        # ItemQuantityButton's count, only rendered while the item is in the cart
+        return (
+            By.XPATH,
+            f"//div[contains(@class,'MuiCard-root')][.//*[contains(.,'{item_name}')]]"
+            f"//*[@data-testid='test-id-quantity']"
+        )
+
 class AddItemPageLocators:
     SUBMIT_BUTTON = (By.XPATH, "//button[text()='Submit' or contains(., 'Submit')]")
     CLOSE_MODAL_BUTTON = (By.XPATH, "//button[@aria-label='close']")
@@ -0,0 +1,250 @@
+import hashlib
+import json
+import re
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+
+# Data API calls made by src/services/apiRequest.ts ("/data-api/api/..."
+# in dev, "/api/..." once deployed)
+API_PATH_PATTERN = re.compile(r"/(data-api/)?api/")
+
+# Same endpoint called this many times with different ids in one test
+N_PLUS_ONE_MIN_CALLS = 3
+
+RUN_NETWORK_NAME = "network.json"
+WORKER_NETWORK_GLOB = "network-*.json"
+
+HOT_FLOW_LIMIT = 10
+
+_ID_PATTERNS = (
+    # GUIDs first so their digit groups are not replaced one by one
+    re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}"),
+    re.compile(r"'[^']*'"),
+    re.compile(r"\b\d+\b"),
+)
+
+
+def enable_performance_log(options):
+    """Let Chrome record DevTools Network events in its performance log."""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def is_api_call(url):
+    return bool(API_PATH_PATTERN.search(urlsplit(url).path))
+
+
+def endpoint_of(url):
+    """Path + query of an API call, relative to the API prefix."""
+    parts = urlsplit(url)
+    path = API_PATH_PATTERN.split(parts.path, maxsplit=1)[-1]
+    query = unquote(parts.query)
+
+    return "/" + path + (f"?{query}" if query else "")
+
+
+def template_of(endpoint):
+    """Endpoint with ids and literals replaced, e.g. /units?$filter=building_id eq {id}"""
+    for pattern in _ID_PATTERNS:
+        endpoint = pattern.sub("{id}", endpoint)
+
+    return endpoint
+
+
+def body_hash(post_data):
+    if not post_data:
+        return None
+
+    return hashlib.sha1(post_data.encode("utf-8")).hexdigest()[:12]
+
+
+def read_network_events(driver):
+    """Drain Chrome's performance log, keeping Network.* events."""
+    events = []
+
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+
+        if message["method"].startswith("Network."):
+            events.append(message)
+
+    return events
+
+
+def api_requests(events):
+    """One record per data-api request, in the order they were sent."""
+    requests = {}
+
+    for event in events:
+        params = event["params"]
+        request_id = params.get("requestId")
+        method = event["method"]
+
+        if method == "Network.requestWillBeSent":
+            request = params["request"]
+
+            if not is_api_call(request["url"]):
+                continue
+
+            # Redirects reuse the request id: the last hop wins
+            requests[request_id] = {
+                "url": request["url"],
+                "endpoint": endpoint_of(request["url"]),
+                "method": request["method"],
+                "body_hash": body_hash(request.get("postData")),
+                "started": params["timestamp"],
+                "status": None,
+                "bytes": 0,
+                "duration_ms": None,
+                "failed": False,
+            }
+            continue
+
+        record = requests.get(request_id)
+
+        if record is None:
+            continue
+
+        if method == "Network.responseReceived":
+            record["status"] = params["response"]["status"]
+
+        elif method == "Network.loadingFinished":
+            record["bytes"] = params.get("encodedDataLength", 0)
+            record["duration_ms"] = round((params["timestamp"] - record["started"]) * 1000, 1)
+
+        elif method == "Network.loadingFailed":
+            record["failed"] = True
+            record["duration_ms"] = round((params["timestamp"] - record["started"]) * 1000, 1)
+
+    ordered = sorted(requests.values(), key=lambda r: r["started"])
+
+    if ordered:
+        first = ordered[0]["started"]
+
+        for record in ordered:
+            record["start_ms"] = round((record.pop("started") - first) * 1000, 1)
+
+    return ordered
+
+
+def find_duplicates(requests):
+    """Identical calls (method, endpoint and body) made more than once."""
+    counts = {}
+
+    for record in requests:
+        if record["method"] == "OPTIONS":
+            continue
+
+        key = (record["method"], record["endpoint"], record["body_hash"])
+        counts[key] = counts.get(key, 0) + 1
+
+    return [
+        {"method": method, "endpoint": endpoint, "calls": calls}
+        for (method, endpoint, _), calls in counts.items()
+        if calls > 1
+    ]
+
+
+def find_n_plus_one(requests):
+    """One endpoint called per id (e.g. unit numbers per building)."""
+    groups = {}
+
+    for record in requests:
+        if record["method"] == "OPTIONS":
+            continue
+
+        key = (record["method"], template_of(record["endpoint"]))
+        groups.setdefault(key, set()).add(record["endpoint"])
+
+    return [
+        {"method": method, "template": template, "distinct_calls": len(endpoints)}
+        for (method, template), endpoints in groups.items()
+        if len(endpoints) >= N_PLUS_ONE_MIN_CALLS
+    ]
+
+
+class NetworkCapture:
+    """
+    Per-test waterfall of data-api requests, read from Chrome's
+    performance log (see enable_performance_log).
+    """
+
+    def __init__(self):
+        self.flows = []
+
+    def start_test(self, driver):
+        # Pooled browsers still hold the previous test's events
+        read_network_events(driver)
+
+    def finish_test(self, driver, nodeid):
+        requests = api_requests(read_network_events(driver))
+
+        flow = {
+            "nodeid": nodeid,
+            "requests": len(requests),
+            "bytes": sum(record["bytes"] for record in requests),
+            "failed": sum(1 for record in requests if record["failed"]),
+            "duplicates": find_duplicates(requests),
+            "n_plus_one": find_n_plus_one(requests),
+            "waterfall": requests,
+        }
+
+        self.flows.append(flow)
+        return flow
+
+    def write(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.flows, indent=2))
+
+
+def summarize(flows):
+    """Bytes per flow and the patterns flagged across the run."""
+    patterns = {}
+
+    for flow in flows:
+        for duplicate in flow["duplicates"]:
+            key = ("duplicate", duplicate["method"], duplicate["endpoint"])
+            patterns.setdefault(key, []).append(flow["nodeid"])
+
+        for n_plus_one in flow["n_plus_one"]:
+            key = ("n+1", n_plus_one["method"], n_plus_one["template"])
+            patterns.setdefault(key, []).append(flow["nodeid"])
+
+    return {
+        "totals": {
+            "flows": len(flows),
+            "requests": sum(flow["requests"] for flow in flows),
+            "bytes": sum(flow["bytes"] for flow in flows),
+        },
+        "flows_by_bytes": [
+            {"nodeid": flow["nodeid"], "requests": flow["requests"], "bytes": flow["bytes"]}
+            for flow in sorted(flows, key=lambda f: f["bytes"], reverse=True)
+        ],
+        "patterns": [
+            {"kind": kind, "method": method, "endpoint": endpoint, "tests": sorted(set(tests))}
+            for (kind, method, endpoint), tests in sorted(
+                patterns.items(), key=lambda item: len(item[1]), reverse=True
+            )
+        ],
+    }
+
+
+def write_run_network(directory):
+    """Combine the worker files in ``directory`` into RUN_NETWORK_NAME."""
+    directory = Path(directory)
+    worker_files = sorted(directory.glob(WORKER_NETWORK_GLOB))
+
+    if not worker_files:
+        return None
+
+    flows = []
+
+    for path in worker_files:
+        flows.extend(json.loads(path.read_text()))
+        path.unlink()
+
+    report = {**summarize(flows), "flows": flows}
+    (directory / RUN_NETWORK_NAME).write_text(json.dumps(report, indent=2))
+
+    return report
@@ -0,0 +1,267 @@
+import json
+import statistics
+import warnings
+from pathlib import Path
+
+
+# Performance mark BasePage.click leaves right before clicking, so a
+# page's time-to-usable runs from the action that opened it.
+ACTION_MARK = "ph:action"
+
+BUDGET_MODES = ("warn", "fail", "off")
+
+RUN_METRICS_NAME = "page-metrics.json"
+WORKER_METRICS_GLOB = "page-metrics-*.json"
+
+SLOWEST_RESOURCES = 5
+
+# Budget keys and the harvested value each one limits
+BUDGET_METRICS = {
+    "time_to_usable_ms": lambda record: record["time_to_usable_ms"],
+    "lcp_ms": lambda record: record["vitals"]["lcp_ms"],
+    "cls": lambda record: record["vitals"]["cls"],
+    "inp_ms": lambda record: record["vitals"]["inp_ms"],
+    "resource_count": lambda record: record["resources"]["count"],
+    "transfer_bytes": lambda record: record["resources"]["transfer_bytes"],
+}
+
+_HARVEST_SCRIPT = """
+const startedAt = arguments[0];
+const actionMark = arguments[1];
+const slowest = arguments[2];
+const done = arguments[arguments.length - 1];
+
+// A start taken before a full page load belongs to the old document's clock
+const marks = performance.getEntriesByName(actionMark, 'mark');
+const since = startedAt !== null && startedAt <= performance.now() ? startedAt
+    : marks.length ? marks[marks.length - 1].startTime : 0;
+
+const buffers = {lcp: [], shift: [], event: []};
+const observers = [];
+
+const watch = (type, list, options) => {
+    try {
+        const observer = new PerformanceObserver(l => list.push(...l.getEntries()));
+        observer.observe({type: type, buffered: true, ...options});
+        observers.push([observer, list]);
+    } catch (err) {
+        // Entry type not supported by this browser
+    }
+};
+
+watch('largest-contentful-paint', buffers.lcp, {});
+watch('layout-shift', buffers.shift, {});
+watch('event', buffers.event, {durationThreshold: 16});
+
+const round = (n) => n === null ? null : Math.round(n * 10) / 10;
+
+// CLS: largest session window (gaps < 1s, window < 5s)
+const layoutShift = (shifts) => {
+    let worst = 0, current = 0, first = 0, last = 0;
+    shifts.forEach(s => {
+        if (current && (s.startTime - last > 1000 || s.startTime - first > 5000)) {
+            current = 0;
+        }
+        if (!current) first = s.startTime;
+        current += s.value;
+        last = s.startTime;
+        worst = Math.max(worst, current);
+    });
+    return Math.round(worst * 10000) / 10000;
+};
+
+// INP: slowest interaction, ignoring one outlier per 50 interactions
+const interactionToNextPaint = (events) => {
+    const byInteraction = new Map();
+    events.filter(e => e.interactionId).forEach(e => {
+        byInteraction.set(e.interactionId, Math.max(byInteraction.get(e.interactionId) || 0, e.duration));
+    });
+    const durations = [...byInteraction.values()].sort((a, b) => b - a);
+    if (!durations.length) return null;
+    return durations[Math.min(durations.length - 1, Math.floor(durations.length / 50))];
+};
+
+setTimeout(() => {
+    observers.forEach(([observer, list]) => {
+        list.push(...observer.takeRecords());
+        observer.disconnect();
+    });
+
+    const now = performance.now();
+    const nav = performance.getEntriesByType('navigation')[0];
+    const resources = performance.getEntriesByType('resource').filter(r => r.startTime >= since);
+    const lcp = buffers.lcp.filter(e => e.startTime >= since).pop();
+
+    done({
+        url: location.pathname + location.search,
+        started_ms: round(since),
+        time_to_usable_ms: round(now - since),
+        navigation: since === 0 && nav ? {
+            type: nav.type,
+            response_end_ms: round(nav.responseEnd),
+            dom_content_loaded_ms: round(nav.domContentLoadedEventEnd),
+            load_event_ms: round(nav.loadEventEnd),
+            transfer_bytes: nav.transferSize,
+        } : null,
+        resources: {
+            count: resources.length,
+            api_count: resources.filter(r => r.name.includes('/api/')).length,
+            transfer_bytes: resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+            slowest: resources
+                .sort((a, b) => b.duration - a.duration)
+                .slice(0, slowest)
+                .map(r => ({name: r.name, initiator: r.initiatorType, duration_ms: round(r.duration)})),
+        },
+        vitals: {
+            lcp_ms: lcp ? round(lcp.startTime) : null,
+            cls: layoutShift(buffers.shift.filter(s => !s.hadRecentInput && s.startTime >= since)),
+            inp_ms: round(interactionToNextPaint(buffers.event.filter(e => e.startTime >= since))),
+        },
+    });
+}, 0);
+"""
+
+
+class PerformanceBudgetWarning(UserWarning):
+    pass
+
+
+def harvest_page_metrics(driver, started_at=None):
+    """
+    Navigation/Resource Timing and Web Vitals for the page as it is
+    now. ``started_at`` (performance.now() of the triggering action)
+    defaults to the last ACTION_MARK, or the document's navigation.
+    """
+    return driver.execute_async_script(
+        _HARVEST_SCRIPT, started_at, ACTION_MARK, SLOWEST_RESOURCES
+    )
+
+
+class PageMetrics:
+    """
+    Collects harvested page metrics for the run and checks them
+    against the per-page budgets.
+
+    Budget file format:
+        {"checkout": {"mode": "warn", "time_to_usable_ms": 6000, ...}}
+
+    Overruns are raised from the page-object call that measured them,
+    so "fail" is for opted-in runs (--perf-budget-mode=fail), not the
+    shipped budgets: a cold database must not abort functional tests.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.budgets = {}
+        self.mode_override = None
+        self.current_test = None
+
+    def configure(self, budgets_file=None, mode_override=None):
+        self.mode_override = mode_override
+        self.budgets = {}
+
+        if budgets_file and Path(budgets_file).exists():
+            self.budgets = json.loads(Path(budgets_file).read_text())
+
+    def record(self, page, metrics):
+        record = {"page": page, "test": self.current_test, **metrics}
+        record["violations"] = self.check_budget(record)
+        self.records.append(record)
+
+        self.enforce(record)
+        return record
+
+    # ---------------------------------------------------
+    # Budgets
+    # ---------------------------------------------------
+
+    def mode_for(self, page):
+        if self.mode_override:
+            return self.mode_override
+
+        return self.budgets.get(page, {}).get("mode", "warn")
+
+    def check_budget(self, record):
+        budget = self.budgets.get(record["page"], {})
+        violations = []
+
+        for key, value_of in BUDGET_METRICS.items():
+            limit = budget.get(key)
+            value = value_of(record)
+
+            if limit is not None and value is not None and value > limit:
+                violations.append(f"{key}={value} > {limit}")
+
+        return violations
+
+    def enforce(self, record):
+        mode = self.mode_for(record["page"])
+
+        if not record["violations"] or mode == "off":
+            return
+
+        message = (
+            f"Performance budget exceeded on {record['page']} "
+            f"({record['url']}): {', '.join(record['violations'])}"
+        )
+
+        if mode == "fail":
+            raise AssertionError(message)
+
+        warnings.warn(message, PerformanceBudgetWarning, stacklevel=3)
+
+    # ---------------------------------------------------
+    # Files
+    # ---------------------------------------------------
+
+    def write(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.records, indent=2))
+
+
+def summarize(records):
+    """Per-page time-to-usable distribution and budget violations."""
+    pages = {}
+
+    for record in records:
+        pages.setdefault(record["page"], []).append(record)
+
+    summary = {}
+
+    for page, page_records in sorted(pages.items()):
+        times = sorted(r["time_to_usable_ms"] for r in page_records)
+
+        summary[page] = {
+            "samples": len(times),
+            "median_ms": round(statistics.median(times), 1),
+            "p90_ms": times[min(len(times) - 1, int(len(times) * 0.9))],
+            "max_ms": times[-1],
+            "violations": sum(1 for r in page_records if r["violations"]),
+        }
+
+    return summary
+
+
+def write_run_metrics(directory):
+    """Combine the worker files in ``directory`` into RUN_METRICS_NAME."""
+    directory = Path(directory)
+    worker_files = sorted(directory.glob(WORKER_METRICS_GLOB))
+
+    if not worker_files:
+        return None
+
+    records = []
+
+    for path in worker_files:
+        records.extend(json.loads(path.read_text()))
+        path.unlink()
+
+    report = {"pages": summarize(records), "records": records}
+    (directory / RUN_METRICS_NAME).write_text(json.dumps(report, indent=2))
+
+    return report
+
+
+# Collected for the whole pytest (worker) session
+PAGE_METRICS = PageMetrics()
@@ -0,0 +1,68 @@
+class RoundTripCounter:
+    """
+    Counts WebDriver wire commands issued while the block runs.
+
+        with RoundTripCounter(driver) as trips:
+            page.click(locator)
+        print(trips.count)
+
+    Counters nest: an inner counter sees only its own commands,
+    the outer one sees both.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.count = 0
+        self._outer = None
+
+    def __enter__(self):
+        # Shadow the bound method on this instance only; WebElement
+        # commands go through driver.execute as well.
+        self._outer = self.driver.__dict__.get("execute")
+        execute = self._outer or type(self.driver).execute.__get__(self.driver)
+
+        def counted_execute(*args, **kwargs):
+            self.count += 1
+            return execute(*args, **kwargs)
+
+        self.driver.execute = counted_execute
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._outer is None:
+            del self.driver.execute
+        else:
+            self.driver.execute = self._outer
+
+        return False
+
+
+class RoundTripStats:
+    """Running totals of round trips per page-object action"""
+
+    def __init__(self):
+        self.calls = {}
+        self.round_trips = {}
+
+    def record(self, action, count):
+        self.calls[action] = self.calls.get(action, 0) + 1
+        self.round_trips[action] = self.round_trips.get(action, 0) + count
+
+    def merge(self, calls, round_trips):
+        """Add another process's totals (an xdist worker's ``as_dict()``)."""
+        for action, count in calls.items():
+            self.calls[action] = self.calls.get(action, 0) + count
+
+        for action, count in round_trips.items():
+            self.round_trips[action] = self.round_trips.get(action, 0) + count
+
+    def as_dict(self):
+        return {"calls": dict(self.calls), "round_trips": dict(self.round_trips)}
+
+    def average(self, action):
+        calls = self.calls.get(action, 0)
+        return self.round_trips.get(action, 0) / calls if calls else 0.0
+
+
+# Collected for the whole pytest (worker) session
+ROUND_TRIP_STATS = RoundTripStats()
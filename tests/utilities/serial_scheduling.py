@@ -0,0 +1,193 @@
+from xdist.scheduler import LoadScheduling
+
+
+# Appended to the node id of ``serial`` tests on the workers, the same
+# way xdist itself tags ``xdist_group`` tests, so the controller (which
+# never collects) can tell them apart.
+SERIAL_SUFFIX = "@serial"
+
+SERIAL_MODES = ("after", "isolated", "off")
+
+
+def tag_serial_items(items):
+    for item in items:
+        if item.get_closest_marker("serial") is not None:
+            item._nodeid = f"{item.nodeid}{SERIAL_SUFFIX}"
+
+
+def is_serial(nodeid):
+    return nodeid.endswith(SERIAL_SUFFIX)
+
+
+class SerialAwareScheduling(LoadScheduling):
+    """
+    Load scheduling that keeps every ``serial`` test on one worker.
+
+    Non-serial tests are load balanced exactly like ``--dist load``.
+    Serial tests are held back and sent, in collection order, to a
+    single dedicated worker:
+
+    after:    once every parallel test has finished, so serial tests
+              never overlap with anything else
+    isolated: straight away, to a worker that gets no parallel tests
+              (falls back to "after" when there is only one worker)
+    """
+
+    def __init__(self, config, log=None, mode="after"):
+        super().__init__(config, log)
+        self.mode = mode
+        self.serial_pending = []
+        self.serial_node = None
+
+    @property
+    def tests_finished(self):
+        return super().tests_finished and not self.serial_pending
+
+    @property
+    def has_pending(self):
+        return super().has_pending or bool(self.serial_pending)
+
+    # ---------------------------------------------------
+    # Scheduling
+    # ---------------------------------------------------
+
+    def schedule(self):
+        assert self.collection_is_completed
+
+        # Initial distribution already happened, reschedule on all nodes
+        if self.collection is not None:
+            for node in self.nodes:
+                self.check_schedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+
+        self.serial_pending = [
+            index for index, nodeid in enumerate(self.collection)
+            if is_serial(nodeid)
+        ]
+        self.pending[:] = [
+            index for index, nodeid in enumerate(self.collection)
+            if not is_serial(nodeid)
+        ]
+
+        if not self.collection:
+            return
+
+        if self.maxschedchunk is None:
+            self.maxschedchunk = len(self.collection)
+
+        if self.serial_pending:
+            self.serial_node = self.nodes[0]
+
+        if self._is_isolated(self.serial_node):
+            self._send_serial_tests(self.serial_node)
+
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def check_schedule(self, node, duration=0):
+        if node.shutting_down:
+            return
+
+        if self._is_isolated(node):
+            # Dedicated worker: received its serial batch up front
+            node.shutdown()
+            return
+
+        if self.pending:
+            super().check_schedule(node, duration=duration)
+            return
+
+        self._release_serial_tests()
+
+        if node is not self.serial_node or not self.serial_pending:
+            node.shutdown()
+
+    def mark_test_pending(self, item):
+        assert self.collection is not None
+
+        index = self.collection.index(item)
+
+        if is_serial(item):
+            self.serial_pending.insert(0, index)
+        else:
+            self.pending.insert(0, index)
+
+        for node in self.nodes:
+            self.check_schedule(node)
+
+    def remove_node(self, node):
+        pending = self.node2pending.pop(node)
+
+        if node is self.serial_node:
+            self.serial_node = None
+
+        crashitem = None
+
+        if pending:
+            # The node crashed, reassign pending items to their own queues
+            assert self.collection is not None
+            crashitem = self.collection[pending.pop(0)]
+
+            for index in pending:
+                if is_serial(self.collection[index]):
+                    self.serial_pending.append(index)
+                else:
+                    self.pending.append(index)
+
+        for other in self.nodes:
+            self.check_schedule(other)
+
+        return crashitem
+
+    # ---------------------------------------------------
+    # Serial Queue
+    # ---------------------------------------------------
+
+    def _is_isolated(self, node):
+        return (
+            self.mode == "isolated"
+            and node is self.serial_node
+            and len(self.node2pending) > 1
+        )
+
+    def _release_serial_tests(self):
+        if not self.serial_pending or self.pending:
+            return
+
+        if self.serial_node is None or self.serial_node.shutting_down:
+            self.serial_node = next(
+                (node for node in self.nodes if not node.shutting_down),
+                None
+            )
+
+        if self.serial_node is None:
+            self.log("no worker left to run serial tests")
+            return
+
+        # Wait until the parallel pool has fully drained. A worker only
+        # runs its last item once it gets more work or a shutdown, so
+        # the serial node may still hold one unstarted parallel test.
+        for node, pending in self.node2pending.items():
+            if node is self.serial_node:
+                if len(pending) > 1:
+                    return
+            elif pending:
+                return
+
+        self._send_serial_tests(self.serial_node)
+
+    def _send_serial_tests(self, node):
+        tests = self.serial_pending
+        self.serial_pending = []
+
+        if tests:
+            self.node2pending[node].extend(tests)
+            node.send_runtest_some(tests)
+
+        self.log("serial items sent to", node.gateway.id, ":", len(tests))